@@ -14,9 +14,12 @@ indexing files. These are not intended for direct use.
 import collections.abc
 import contextlib
 import itertools
+import multiprocessing
 import os
+import queue
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     import sqlite3
@@ -81,7 +84,9 @@ def _open_for_random_access(filename):
     This functionality is used by the Bio.SeqIO and Bio.SearchIO index
     and index_db functions.
 
-    If the file is gzipped but not BGZF, a specific ValueError is raised.
+    If the file is gzipped but not BGZF, it is opened using seek points for
+    random access (see the Bio.gzindex module), using an existing index file
+    (the filename plus ".gzindex") if found.
     """
     handle = open(filename, "rb")
     magic = handle.read(2)
@@ -98,10 +103,9 @@ def _open_for_random_access(filename):
             assert "BGZF" in str(e)
             # Not a BGZF file after all,
             handle.close()
-            raise ValueError(
-                "Gzipped files are not suitable for indexing, "
-                "please use BGZF (blocked gzip format) instead."
-            ) from None
+            from . import gzindex
+
+            return gzindex.open(filename)
 
     return handle
 
@@ -264,6 +268,38 @@ class _IndexedSeqFileDict(collections.abc.Mapping):
         self._proxy._handle.close()
 
 
+def _index_file_offsets(
+    proxy_factory, fmt, filename, file_number, key_function, offsets_queue
+):
+    """Send batches of (key, file_number, offset, length) for a file (PRIVATE).
+
+    This is run in worker processes by _SQLiteManySeqFilesDict, so all the
+    arguments must be picklable (e.g. module level functions, and a queue
+    from a multiprocessing manager). The batches are followed by None once
+    the whole file has been scanned.
+    """
+    random_access_proxy = proxy_factory(fmt, filename)
+    try:
+        if key_function:
+            offset_iter = (
+                (key_function(key), file_number, offset, length)
+                for (key, offset, length) in random_access_proxy
+            )
+        else:
+            offset_iter = (
+                (key, file_number, offset, length)
+                for (key, offset, length) in random_access_proxy
+            )
+        while True:
+            batch = list(itertools.islice(offset_iter, 100))
+            if not batch:
+                break
+            offsets_queue.put(batch)
+    finally:
+        random_access_proxy._handle.close()
+    offsets_queue.put(None)
+
+
 class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
     """Read only dictionary interface to many sequential record files.
 
@@ -277,6 +313,12 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
     There are OS limits on the number of files that can be open at once,
     so a pool are kept. If a record is required from a closed file, then
     one of the open handles is closed first.
+
+    When building a new index with processes greater than one, the files are
+    scanned in a pool of worker processes, which send the offsets for each
+    file in batches through a bounded queue, to be inserted into the database
+    in file order. This requires the proxy_factory and key_function to be
+    picklable.
     """
 
     def __init__(
@@ -288,6 +330,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         key_function,
         repr,
         max_open=10,
+        processes=1,
     ):
         """Initialize the class."""
         # TODO? - Don't keep filename list in memory (just in DB)?
@@ -302,6 +345,8 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             raise MissingPythonDependencyError(
                 "Python was compiled without the sqlite3 module"
             )
+        if processes < 1:
+            raise ValueError("Use processes with a minimum of 1")
         if filenames is not None:
             filenames = list(filenames)  # In case it was a generator
 
@@ -313,6 +358,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         self._proxy_factory = proxy_factory
         self._repr = repr
         self._max_open = max_open
+        self._processes = processes
         self._proxies = {}
 
         # Note if using SQLite :memory: trick index filename, this will
@@ -435,6 +481,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         key_function = self._key_function
         proxy_factory = self._proxy_factory
         max_open = self._max_open
+        processes = min(self._processes, len(filenames or ()))
         random_access_proxies = self._proxies
 
         if not fmt or not filenames:
@@ -450,6 +497,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         # Sqlite PRAGMA settings for speed
         con.execute("PRAGMA synchronous=OFF")
         con.execute("PRAGMA locking_mode=EXCLUSIVE")
+        con.execute("PRAGMA journal_mode=WAL")
         # Don't index the key column until the end (faster)
         # con.execute("CREATE TABLE offset_data (key TEXT PRIMARY KEY, "
         #             "offset INTEGER);")
@@ -466,6 +514,9 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             "CREATE TABLE offset_data (key TEXT, "
             "file_number INTEGER, offset INTEGER, length INTEGER);"
         )
+        insert = (
+            "INSERT INTO offset_data (key,file_number,offset,length) VALUES (?,?,?,?);"
+        )
         count = 0
         for file_index, filename in enumerate(filenames):
             # Default to storing as an absolute path,
@@ -489,6 +540,8 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
                 "INSERT INTO file_data (file_number, name) VALUES (?,?);",
                 (file_index, f),
             )
+            if processes > 1:
+                continue
             random_access_proxy = proxy_factory(fmt, filename)
             if key_function:
                 offset_iter = (
@@ -506,16 +559,55 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
                     break
                 # print("Inserting batch of %i offsets, %s ... %s"
                 #       % (len(batch), batch[0][0], batch[-1][0]))
-                con.executemany(
-                    "INSERT INTO offset_data (key,file_number,offset,length) VALUES (?,?,?,?);",
-                    batch,
-                )
-                con.commit()
+                con.executemany(insert, batch)
                 count += len(batch)
+            con.commit()
             if len(random_access_proxies) < max_open:
                 random_access_proxies[file_index] = random_access_proxy
             else:
                 random_access_proxy._handle.close()
+        if processes > 1:
+            # Scan the files in parallel, but insert their offsets here in
+            # file order, so the database is the same as from a serial scan.
+            # Each file has a bounded queue, so workers scanning later files
+            # wait while the current file is inserted, rather than holding
+            # all their offsets in memory. The manager is shut down first on
+            # leaving the with statement, so that waiting workers fail rather
+            # than block forever if an error occurs here.
+            # The proxies are opened again on demand when records are used.
+            with (
+                ProcessPoolExecutor(processes) as executor,
+                multiprocessing.Manager() as manager,
+            ):
+                queues = [manager.Queue(10) for filename in filenames]
+                futures = [
+                    executor.submit(
+                        _index_file_offsets,
+                        proxy_factory,
+                        fmt,
+                        filename,
+                        file_index,
+                        key_function,
+                        offsets_queue,
+                    )
+                    for file_index, (filename, offsets_queue) in enumerate(
+                        zip(filenames, queues)
+                    )
+                ]
+                for future, offsets_queue in zip(futures, queues):
+                    while True:
+                        try:
+                            batch = offsets_queue.get(timeout=1)
+                        except queue.Empty:
+                            if future.done():
+                                # Raise any error from the worker process
+                                future.result()
+                            continue
+                        if batch is None:
+                            break
+                        con.executemany(insert, batch)
+                        count += len(batch)
+                    con.commit()
         self._length = count
         # print("About to index %i entries" % count)
         try:
@@ -527,6 +619,8 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             self.close()
             con.close()
             raise ValueError(f"Duplicate key? {err}") from None
+        # Return to a self contained database file, as readers expect
+        con.execute("PRAGMA journal_mode=DELETE")
         con.execute("PRAGMA locking_mode=NORMAL")
         con.execute("UPDATE meta_data SET value = ? WHERE key = ?;", (count, "count"))
         con.commit()
@@ -38,6 +38,127 @@ from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 
 
+class _LazyFeatureList(list):
+    """List of SeqFeature objects parsed from a feature table on demand (PRIVATE).
+
+    The lines of the feature table are kept together with the index of the
+    first line of each feature, and each SeqFeature is only created the
+    first time it is used, by indexing or iterating over the list. Any other
+    list operation (such as modifying or comparing the list) first creates
+    all remaining features, after which this behaves as a normal list.
+    """
+
+    def __init__(self, scanner, consumer, lines, offsets):
+        list.__init__(self, [None] * len(offsets))
+        self._scanner = scanner
+        self._consumer = consumer
+        self._lines = lines
+        self._offsets = offsets
+        self._pending = len(offsets)
+
+    def _parse(self, index):
+        """Create the feature with the given (non-negative) index (PRIVATE)."""
+        feature = list.__getitem__(self, index)
+        if feature is None:
+            start = self._offsets[index]
+            if index + 1 < len(self._offsets):
+                end = self._offsets[index + 1]
+            else:
+                end = len(self._lines)
+            feature_tuple = self._scanner._parse_feature_lines(self._lines[start:end])
+            feature = self._consumer._make_feature(*feature_tuple)
+            list.__setitem__(self, index, feature)
+            self._pending -= 1
+            if not self._pending:
+                # Nothing left to parse, so drop the feature table
+                self._scanner = self._consumer = self._lines = self._offsets = None
+        return feature
+
+    def _parse_all(self):
+        """Create all features not created yet (PRIVATE)."""
+        for index in range(len(self)):
+            if not self._pending:
+                break
+            self._parse(index)
+
+    def __getitem__(self, index):
+        if self._pending:
+            if isinstance(index, slice):
+                for i in range(*index.indices(len(self))):
+                    self._parse(i)
+            else:
+                if index < 0:
+                    index += len(self)
+                if 0 <= index < len(self):
+                    return self._parse(index)
+        return list.__getitem__(self, index)
+
+    def __iter__(self):
+        if not self._pending:
+            return list.__iter__(self)
+        return (self[index] for index in range(len(self)))
+
+    def __reversed__(self):
+        if not self._pending:
+            return list.__reversed__(self)
+        return (self[index] for index in range(len(self) - 1, -1, -1))
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are plain lists
+        return list, (list(self),)
+
+    def __copy__(self):
+        return list(self)
+
+    def __radd__(self, other):
+        # Used for list + _LazyFeatureList, as the subclass takes precedence
+        return other + list(self)
+
+
+def _parse_all_first(name):
+    """Return a list method which first creates all pending features (PRIVATE)."""
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        if self._pending:
+            self._parse_all()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    "__add__",
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__ge__",
+    "__gt__",
+    "__iadd__",
+    "__imul__",
+    "__le__",
+    "__lt__",
+    "__mul__",
+    "__ne__",
+    "__repr__",
+    "__rmul__",
+    "__setitem__",
+    "copy",
+    "count",
+    "index",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+    "clear",
+):
+    setattr(_LazyFeatureList, _name, _parse_all_first(_name))
+del _name
+
+
 class InsdcScanner:
     """Basic functions for breaking up a GenBank/EMBL file into sub sections.
 
@@ -153,6 +274,14 @@ class InsdcScanner:
 
         Assumes you have already read to the start of the features table.
         """
+        if not skip:
+            lines, offsets = self._read_feature_table()
+            ends = offsets[1:] + [len(lines)]
+            return [
+                self._parse_feature_lines(lines[start:end])
+                for start, end in zip(offsets, ends)
+            ]
+
         if self.line.rstrip() not in self.FEATURE_START_MARKERS:
             if self.debug:
                 print("Didn't find any feature table")
@@ -161,7 +290,6 @@ class InsdcScanner:
         while self.line.rstrip() in self.FEATURE_START_MARKERS:
             self.line = self.handle.readline()
 
-        features = []
         line = self.line
         while True:
             if not line:
@@ -191,44 +319,104 @@ class InsdcScanner:
                 line = self.handle.readline()
                 continue
 
-            if skip:
+            line = self.handle.readline()
+            while (
+                line[: self.FEATURE_QUALIFIER_INDENT] == self.FEATURE_QUALIFIER_SPACER
+            ):
                 line = self.handle.readline()
-                while (
-                    line[: self.FEATURE_QUALIFIER_INDENT]
-                    == self.FEATURE_QUALIFIER_SPACER
-                ):
-                    line = self.handle.readline()
+        self.line = line
+        return []
+
+    def _read_feature_table(self):
+        """Read the lines of the feature table without parsing them (PRIVATE).
+
+        Returns a list of the lines (with trailing white space removed), and
+        a list with the index of the first line of each feature in it. Lines
+        which cannot start a feature are left out, together with any
+        qualifier lines following them.
+
+        Assumes you have already read to the start of the features table.
+        """
+        if self.line.rstrip() not in self.FEATURE_START_MARKERS:
+            if self.debug:
+                print("Didn't find any feature table")
+            return [], []
+
+        while self.line.rstrip() in self.FEATURE_START_MARKERS:
+            self.line = self.handle.readline()
+
+        indent = self.FEATURE_QUALIFIER_INDENT
+        spacer = self.FEATURE_QUALIFIER_SPACER
+        readline = self.handle.readline
+        lines = []
+        offsets = []
+        in_feature = False
+        line = self.line
+        while True:
+            if not line:
+                raise ValueError("Premature end of line during features table")
+            if line[:indent] == spacer or line.isspace():
+                # Qualifiers, or a blank line in the midst of a feature
+                if in_feature:
+                    lines.append(line.rstrip())
+                line = readline()
+                continue
+            if line[: self.HEADER_WIDTH].rstrip() in self.SEQUENCE_HEADERS:
+                if self.debug:
+                    print("Found start of sequence")
+                break
+            line = line.rstrip()
+            if line == "//":
+                raise ValueError("Premature end of features table, marker '//' found")
+            if line in self.FEATURE_END_MARKERS:
+                if self.debug:
+                    print("Found end of features")
+                line = readline()
+                break
+            if line[2:indent].strip() == "":
+                # This is an empty feature line between qualifiers.
+                in_feature = False
+            elif len(line) < indent:
+                warnings.warn(
+                    f"line too short to contain a feature: {line!r}",
+                    BiopythonParserWarning,
+                )
+                in_feature = False
             else:
-                # Build up a list of the lines making up this feature:
-                if (
-                    line[self.FEATURE_QUALIFIER_INDENT] != " "
-                    and " " in line[self.FEATURE_QUALIFIER_INDENT :]
-                ):
-                    # The feature table design enforces a length limit on the feature keys.
-                    # Some third party files (e.g. IGMT's EMBL like files) solve this by
-                    # over indenting the location and qualifiers.
-                    feature_key, line = line[2:].strip().split(None, 1)
-                    feature_lines = [line]
-                    warnings.warn(
-                        f"Over indented {feature_key} feature?",
-                        BiopythonParserWarning,
-                    )
-                else:
-                    feature_key = line[2 : self.FEATURE_QUALIFIER_INDENT].strip()
-                    feature_lines = [line[self.FEATURE_QUALIFIER_INDENT :]]
-                line = self.handle.readline()
-                while line[
-                    : self.FEATURE_QUALIFIER_INDENT
-                ] == self.FEATURE_QUALIFIER_SPACER or (
-                    line != "" and line.rstrip() == ""
-                ):  # cope with blank lines in the midst of a feature
-                    # Use strip to remove any harmless trailing white space AND and leading
-                    # white space (e.g. out of spec files with too much indentation)
-                    feature_lines.append(line[self.FEATURE_QUALIFIER_INDENT :].strip())
-                    line = self.handle.readline()
-                features.append(self.parse_feature(feature_key, feature_lines))
+                offsets.append(len(lines))
+                lines.append(line)
+                in_feature = True
+            line = readline()
         self.line = line
-        return features
+        return lines, offsets
+
+    def _parse_feature_lines(self, lines):
+        """Parse the lines of one feature from the feature table (PRIVATE).
+
+        Returns a tuple (key, location, qualifiers) as for parse_feature.
+        """
+        line = lines[0]
+        if (
+            line[self.FEATURE_QUALIFIER_INDENT] != " "
+            and " " in line[self.FEATURE_QUALIFIER_INDENT :]
+        ):
+            # The feature table design enforces a length limit on the feature keys.
+            # Some third party files (e.g. IGMT's EMBL like files) solve this by
+            # over indenting the location and qualifiers.
+            feature_key, line = line[2:].strip().split(None, 1)
+            feature_lines = [line]
+            warnings.warn(
+                f"Over indented {feature_key} feature?",
+                BiopythonParserWarning,
+            )
+        else:
+            feature_key = line[2 : self.FEATURE_QUALIFIER_INDENT].strip()
+            feature_lines = [line[self.FEATURE_QUALIFIER_INDENT :]]
+        # Use strip to remove any harmless trailing white space AND and leading
+        # white space (e.g. out of spec files with too much indentation)
+        for line in lines[1:]:
+            feature_lines.append(line[self.FEATURE_QUALIFIER_INDENT :].strip())
+        return self.parse_feature(feature_key, feature_lines)
 
     def parse_feature(self, feature_key, lines):
         r"""Parse a feature given as a list of strings into a tuple.
@@ -429,7 +617,7 @@ class InsdcScanner:
         Used by the parse_records() and parse() methods.
         """
 
-    def feed(self, handle, consumer, do_features=True):
+    def feed(self, handle, consumer, do_features=True, lazy_features=False):
         """Feed a set of data into the consumer.
 
         This method is intended for use with the "old" code in Bio.GenBank
@@ -439,6 +627,8 @@ class InsdcScanner:
          - consumer - The consumer that should be informed of events.
          - do_features - Boolean, should the features be parsed?
            Skipping the features can be much faster.
+         - lazy_features - Boolean, should the features be parsed only when
+           used? This requires a consumer creating SeqRecord objects.
 
         Return values:
          - true  - Passed a record
@@ -462,7 +652,11 @@ class InsdcScanner:
         self._feed_header_lines(consumer, self.parse_header())
 
         # Features (common to both EMBL and GenBank):
-        if do_features:
+        if do_features and lazy_features:
+            lines, offsets = self._read_feature_table()
+            consumer.start_feature_table()
+            consumer.data.features = _LazyFeatureList(self, consumer, lines, offsets)
+        elif do_features:
             self._feed_feature_table(consumer, self.parse_features(skip=False))
         else:
             self.parse_features(skip=True)  # ignore the data
@@ -480,9 +674,14 @@ class InsdcScanner:
         # And we are done
         return True
 
-    def parse(self, handle, do_features=True):
+    def parse(self, handle, do_features=True, lazy_features=False):
         """Return a SeqRecord (with SeqFeatures if do_features=True).
 
+        With lazy_features=True, the feature table is read but each SeqFeature
+        (with its location and qualifiers) is only created when it is first
+        used, which is much faster if only some or none of the features are
+        needed. Any warnings about the features are then also given later.
+
         See also the method parse_records() for use on multi-record files.
         """
         from Bio.GenBank import _FeatureConsumer
@@ -492,24 +691,25 @@ class InsdcScanner:
             use_fuzziness=1, feature_cleaner=FeatureValueCleaner()
         )
 
-        if self.feed(handle, consumer, do_features):
+        if self.feed(handle, consumer, do_features, lazy_features):
             return consumer.data
         else:
             return None
 
-    def parse_records(self, handle, do_features=True):
+    def parse_records(self, handle, do_features=True, lazy_features=False):
         """Parse records, return a SeqRecord object iterator.
 
         Each record (from the ID/LOCUS line to the // line) becomes a SeqRecord
 
-        The SeqRecord objects include SeqFeatures if do_features=True
+        The SeqRecord objects include SeqFeatures if do_features=True, which
+        are only parsed when used if lazy_features=True (see the parse method).
 
         This method is intended for use in Bio.SeqIO
         """
         # This is a generator function
         with as_handle(handle) as handle:
             while True:
-                record = self.parse(handle, do_features)
+                record = self.parse(handle, do_features, lazy_features)
                 if record is None:
                     break
                 if record.id is None:
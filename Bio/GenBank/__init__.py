@@ -767,6 +767,24 @@ class _FeatureConsumer(_BaseGenBankConsumer):
         else:
             self._cur_feature.qualifiers[key] = [value]
 
+    def _make_feature(self, feature_key, location, qualifiers):
+        """Return a SeqFeature from the key, location and qualifiers (PRIVATE).
+
+        This is used for feature tables parsed on demand, and creates the
+        feature in the same way as the feature_key, location and
+        feature_qualifier methods.
+        """
+        self._cur_feature = SeqFeature()
+        self._cur_feature.type = feature_key
+        self.location(location)
+        for key, value in qualifiers:
+            if value is not None:
+                value = value.replace("\n", " ")
+            self.feature_qualifier(key, value)
+        feature = self._cur_feature
+        self._cur_feature = None
+        return feature
+
     def feature_qualifier_name(self, content_list):
         """Use feature_qualifier instead (OBSOLETE)."""
         raise NotImplementedError("Use the feature_qualifier method instead.")
@@ -832,6 +850,7 @@ class _FeatureConsumer(_BaseGenBankConsumer):
         # add the sequence information
 
         sequence = "".join(self._seq_data)
+        self._seq_data = []
 
         if (
             self._expected_size is not None
@@ -193,6 +193,8 @@ of the format's documentation.
 
 """
 
+import functools
+
 from Bio.File import as_handle
 from Bio.SearchIO._model import Hit
 from Bio.SearchIO._model import HSP
@@ -446,7 +448,8 @@ def index(filename, format=None, key_function=None, **kwargs):
     >>> search_idx.close()
 
     If the file is BGZF compressed, this is detected automatically. Ordinary
-    GZIP files are not supported:
+    GZIP files are also supported, using seek points from the Bio.gzindex
+    module, but BGZF is much faster to index and to access:
 
     >>> from Bio import SearchIO
     >>> search_idx = SearchIO.index('Blast/wnts.xml.bgz', 'blast-xml')
@@ -487,7 +490,25 @@ def index(filename, format=None, key_function=None, **kwargs):
     )
 
 
-def index_db(index_filename, filenames=None, format=None, key_function=None, **kwargs):
+def _index_db_proxy_factory(format, filename=None, **kwargs):
+    """Given a filename returns proxy object, else boolean if format OK (PRIVATE).
+
+    Used by index_db, and defined at module level so it can be pickled.
+    """
+    if filename:
+        return get_processor(format, _INDEXER_MAP)(filename, **kwargs)
+    else:
+        return format in _INDEXER_MAP
+
+
+def index_db(
+    index_filename,
+    filenames=None,
+    format=None,
+    key_function=None,
+    processes=1,
+    **kwargs,
+):
     """Indexes several search output files into an SQLite database.
 
      - index_filename - The SQLite filename.
@@ -499,6 +520,9 @@ def index_db(index_filename, filenames=None, format=None, key_function=None, **k
      - key_function - Optional callback function which when given a
                       QueryResult identifier string should return a unique
                       key for the dictionary.
+     - processes    - Number of worker processes used to scan the files when
+                      building a new index (default 1). Any key_function must
+                      then be picklable (i.e. not a lambda).
      - kwargs       - Format-specific keyword arguments.
 
     The ``index_db`` function is similar to ``index`` in that it indexes the start
@@ -542,7 +566,7 @@ def index_db(index_filename, filenames=None, format=None, key_function=None, **k
     the Bio.SearchIO.index(...) function instead would use less memory.
 
     BGZF compressed files are supported, and detected automatically. Ordinary
-    GZIP compressed files are not supported.
+    GZIP compressed files are also supported via Bio.gzindex, but are slower.
 
     See also Bio.SearchIO.index(), Bio.SearchIO.to_dict(), and the Python module
     glob which is useful for building lists of files.
@@ -556,15 +580,16 @@ def index_db(index_filename, filenames=None, format=None, key_function=None, **k
 
     repr = f"SearchIO.index_db({index_filename!r}, filenames={filenames!r}, {format!r}, key_function={key_function!r})"
 
-    def proxy_factory(format, filename=None):
-        """Given a filename returns proxy object, else boolean if format OK."""
-        if filename:
-            return get_processor(format, _INDEXER_MAP)(filename, **kwargs)
-        else:
-            return format in _INDEXER_MAP
+    proxy_factory = functools.partial(_index_db_proxy_factory, **kwargs)
 
     return _SQLiteManySeqFilesDict(
-        index_filename, filenames, proxy_factory, format, key_function, repr
+        index_filename,
+        filenames,
+        proxy_factory,
+        format,
+        key_function,
+        repr,
+        processes=processes,
     )
 
 
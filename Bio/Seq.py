@@ -20,9 +20,15 @@ See also the Seq_ wiki and the chapter in our tutorial:
 
 """
 
+import array
+import bisect
 import collections
+import heapq
+import itertools
 import numbers
+import operator
 import warnings
+import weakref
 from abc import ABC
 from abc import abstractmethod
 from typing import Optional
@@ -68,7 +74,8 @@ class SequenceDataAbstractBaseClass(ABC):
 
     Most users will not need to use this class. It is used internally as a base
     class for sequence content provider classes such as _UndefinedSequenceData
-    defined in this module, and _TwoBitSequenceData in Bio.SeqIO.TwoBitIO.
+    defined in this module, _TwoBitSequenceData in Bio.SeqIO.TwoBitIO, and
+    _FaidxSequenceData in Bio.SeqIO.FastaIO.
     Instances of these classes can be used instead of a ``bytes`` object as the
     data argument when creating a Seq object, and provide the sequence content
     only when requested via ``__getitem__``. This allows lazy parsers to load
@@ -339,6 +346,16 @@ class SequenceDataAbstractBaseClass(ABC):
         """
         return bytes(self).translate(table, delete)
 
+    def _translate_codons(self, table, stop_symbol, to_stop, gap):
+        """Translate the sequence, or return None to use _translate_str (PRIVATE).
+
+        Subclasses holding nucleotides in a suitable encoding may override this
+        to translate the codons directly, returning the protein as a string.
+        The table argument is as for Seq.translate, and the cds option is
+        always handled by _translate_str instead.
+        """
+        return None
+
     @property
     def defined(self):
         """Return True if the sequence is defined, False if undefined or partially defined.
@@ -522,9 +539,14 @@ class _SeqAbstractBaseClass(ABC):
         if isinstance(index, numbers.Integral):
             # Return a single letter as a string
             return chr(self._data[index])
-        else:
-            # Return the (sub)sequence as another Seq/MutableSeq object
-            return self.__class__(self._data[index])
+        data = self._data
+        if isinstance(data, bytes) and isinstance(index, slice):
+            # Avoid copying long slices of a Seq object
+            start, end, step = index.indices(len(data))
+            if step == 1 and _SequenceDataView.minimum <= end - start < len(data):
+                return self.__class__(_SequenceDataView(data, start, end))
+        # Return the (sub)sequence as another Seq/MutableSeq object
+        return self.__class__(data[index])
 
     def __add__(self, other):
         """Add a sequence or string to this sequence.
@@ -969,7 +991,8 @@ class _SeqAbstractBaseClass(ABC):
 
         Arguments:
          - subs - a list of strings, Seq, MutableSeq, bytes, or bytearray
-           objects containing the substrings to search for.
+           objects containing the substrings to search for, or a
+           SubstringSearcher object.
 
         >>> from Bio.Seq import Seq
         >>> dna = Seq("GTCATGGCCATTGTAATGGGCCGCTGAAAGGGTGCCCGATAGTTG")
@@ -983,27 +1006,16 @@ class _SeqAbstractBaseClass(ABC):
         34 CC
         34 CCC
         35 CC
+
+        The matches are found in a single pass over the sequence, however
+        many substrings are given. To search many sequences for the same
+        substrings, create a SubstringSearcher object once and pass that
+        instead; this also lets you search the reverse complement strand,
+        or use ambiguous nucleotides in the substrings.
         """
-        subdict = collections.defaultdict(set)
-        for index, sub in enumerate(subs):
-            if isinstance(sub, (_SeqAbstractBaseClass, bytearray)):
-                sub = bytes(sub)
-            elif isinstance(sub, str):
-                sub = sub.encode("ASCII")
-            elif not isinstance(sub, bytes):
-                raise TypeError(
-                    "subs[%d]: a Seq, MutableSeq, str, bytes, or bytearray object is required, not '%s'"
-                    % (index, type(sub))
-                )
-            length = len(sub)
-            subdict[length].add(sub)
-        for start in range(len(self) - 1):
-            for length, subs in subdict.items():
-                stop = start + length
-                for sub in subs:
-                    if self._data[start:stop] == sub:
-                        yield (start, sub.decode())
-                        break
+        if not isinstance(subs, SubstringSearcher):
+            subs = SubstringSearcher(subs)
+        return subs.search(self)
 
     def startswith(self, prefix, start=None, end=None):
         """Return True if the sequence starts with the given prefix, False otherwise.
@@ -1602,6 +1614,11 @@ class _SeqAbstractBaseClass(ABC):
         NOTE - This does NOT behave like the python string's translate
         method.  For that use str(my_seq).translate(...) instead
         """
+        if not cds and isinstance(self._data, SequenceDataAbstractBaseClass):
+            # Some sequence data classes can translate without decoding
+            protein = self._data._translate_codons(table, stop_symbol, to_stop, gap)
+            if protein is not None:
+                return self.__class__(protein)
         try:
             data = str(self)
         except UndefinedSequenceError:
@@ -2172,6 +2189,30 @@ class Seq(_SeqAbstractBaseClass):
         """
         return hash(self._data)
 
+    def compact(self):
+        """Return a Seq object which does not keep a longer sequence in memory.
+
+        To save time and memory, taking a long slice of a Seq object does not
+        copy the sequence contents, but refers to the memory of the original
+        sequence instead. This means the complete original sequence is kept
+        in memory for as long as the slice exists. If you no longer need the
+        original sequence (e.g. you have extracted a gene from a chromosome),
+        this method returns a copy which only holds its own sequence:
+
+        >>> from Bio.Seq import Seq
+        >>> chromosome = Seq("ACGT" * 25000)
+        >>> gene = chromosome[2000:7000].compact()
+        >>> del chromosome
+        >>> len(gene)
+        5000
+
+        If the sequence contents is not referring to a longer sequence, the
+        Seq object itself is returned.
+        """
+        if isinstance(self._data, _SequenceDataView):
+            return Seq(bytes(self._data))
+        return self
+
 
 class MutableSeq(_SeqAbstractBaseClass):
     """An editable sequence object.
@@ -2348,6 +2389,257 @@ class MutableSeq(_SeqAbstractBaseClass):
             raise TypeError("expected a string, Seq or MutableSeq")
 
 
+class SubstringSearcher:
+    """Search sequences for many substrings at once.
+
+    The substrings are compiled into an Aho-Corasick automaton, which finds
+    all occurrences of all the substrings in a single pass over a sequence,
+    taking time proportional to the length of the sequence (plus the number
+    of matches) regardless of the number of substrings. Once created, the
+    searcher can be reused to search any number of sequences:
+
+    >>> from Bio.Seq import Seq, SubstringSearcher
+    >>> searcher = SubstringSearcher(["CC", Seq("ATTG"), "ATTG", Seq("CCC")])
+    >>> dna = Seq("GTCATGGCCATTGTAATGGGCCGCTGAAAGGGTGCCCGATAGTTG")
+    >>> for index, substring in searcher.search(dna):
+    ...     print(index, substring)
+    ...
+    7 CC
+    9 ATTG
+    20 CC
+    34 CC
+    34 CCC
+    35 CC
+
+    Matches are found lazily, and are returned in order of their start
+    position, as ``Seq.search`` does. With ``reverse_complement=True``, the
+    reverse complement of each substring is also searched for, and the
+    matches are returned as (index, substring, strand) tuples, where the
+    strand is -1 if the reverse complement of the substring was found:
+
+    >>> searcher = SubstringSearcher(["CATG", "GGCC"], reverse_complement=True)
+    >>> for index, substring, strand in searcher.search(dna):
+    ...     print(index, substring, strand)
+    ...
+    2 CATG 1
+    2 CATG -1
+    5 GGCC 1
+    5 GGCC -1
+    18 GGCC 1
+    18 GGCC -1
+
+    As these are palindromic, they are found on both strands. With
+    ``ambiguous=True``, any IUPAC ambiguity codes in the substrings (e.g. N)
+    match any of the nucleotides they represent in the sequence:
+
+    >>> searcher = SubstringSearcher(["GGNCC", "TRAT"], ambiguous=True)
+    >>> for index, substring in searcher.search(dna):
+    ...     print(index, substring)
+    ...
+    13 TRAT
+    17 GGNCC
+
+    The search is case sensitive.
+    """
+
+    def __init__(self, subs, reverse_complement=False, ambiguous=False):
+        """Create the automaton to search for the substrings subs.
+
+        Arguments:
+         - subs - a list of strings, Seq, MutableSeq, bytes, or bytearray
+           objects containing the substrings to search for.
+         - reverse_complement - if True, also search for the reverse
+           complement of each substring (default False).
+         - ambiguous - if True, IUPAC nucleotide ambiguity codes in the
+           substrings match any of the corresponding nucleotides (default
+           False).
+
+        """
+        from Bio import _seqsearch
+
+        self.reverse_complement = reverse_complement
+        self.ambiguous = ambiguous
+        # Each output of the automaton is a (substring, strand) combination,
+        # numbered in the order in which they should be reported for the
+        # same start position
+        outputs = {}
+        lengths = {}
+        self._subs = []
+        for index, sub in enumerate(subs):
+            if isinstance(sub, (_SeqAbstractBaseClass, bytearray)):
+                sub = bytes(sub)
+            elif isinstance(sub, str):
+                sub = sub.encode("ASCII")
+            elif not isinstance(sub, bytes):
+                raise TypeError(
+                    "subs[%d]: a Seq, MutableSeq, str, bytes, or bytearray object is required, not '%s'"
+                    % (index, type(sub))
+                )
+            if not sub:
+                raise ValueError(
+                    "subs[%d]: empty substrings cannot be searched" % index
+                )
+            lengths.setdefault(len(sub), len(lengths))
+            if (sub, 1) not in outputs:
+                self._subs.append(sub)
+            outputs.setdefault((sub, 1), index)
+            if reverse_complement:
+                outputs.setdefault((sub, -1), index)
+        self._outputs = sorted(
+            outputs, key=lambda output: (lengths[len(output[0])], outputs[output])
+        )
+        self._maxlen = max(lengths, default=0)
+        # Build the trie of all sequences matched by the substrings
+        letters = {}
+        children = [{}]
+        found = [[]]
+        for number, (sub, strand) in enumerate(self._outputs):
+            if strand == -1:
+                if b"U" in sub.upper() and b"T" not in sub.upper():
+                    sub = sub.translate(_rna_complement_table)[::-1]
+                else:
+                    sub = sub.translate(_dna_complement_table)[::-1]
+            for word in self._expand(sub):
+                node = 0
+                for letter in word:
+                    column = letters.setdefault(letter, len(letters) + 1)
+                    child = children[node].get(column)
+                    if child is None:
+                        child = len(children)
+                        children[node][column] = child
+                        children.append({})
+                        found.append([])
+                    node = child
+                if number not in found[node]:
+                    found[node].append(number)
+        if len(letters) > 255:
+            raise ValueError("substrings contain too many different letters")
+        classes = bytearray(256)
+        for letter, column in letters.items():
+            classes[letter] = column
+        classes = bytes(classes)
+        # Fill in the table of transitions in breadth-first order, taking
+        # each missing transition from the state we would fall back to
+        # after a mismatch (the longest proper suffix in the trie)
+        width = len(letters) + 1
+        rows = [None] * len(children)
+        rows[0] = [0] * width
+        for column, child in children[0].items():
+            rows[0][column] = child
+        fallback = [0] * len(children)
+        queue = collections.deque(children[0].values())
+        while queue:
+            node = queue.popleft()
+            row = rows[fallback[node]][:]
+            for column, child in children[node].items():
+                fallback[child] = row[column]
+                row[column] = child
+                queue.append(child)
+            rows[node] = row
+            for number in found[fallback[node]]:
+                if number not in found[node]:
+                    found[node].append(number)
+        transitions = array.array("i", itertools.chain.from_iterable(rows))
+        offsets = [0]
+        for numbers in found:
+            offsets.append(offsets[-1] + len(numbers))
+        offsets = array.array("i", offsets)
+        numbers = array.array("i", itertools.chain.from_iterable(found))
+        self._automaton = _seqsearch.Automaton(classes, transitions, offsets, numbers)
+        # The values reported for each output, and the substring lengths
+        if reverse_complement:
+            self._results = [(sub.decode(), strand) for sub, strand in self._outputs]
+        else:
+            self._results = [(sub.decode(),) for sub, strand in self._outputs]
+        self._lengths = [len(sub) for sub, strand in self._outputs]
+
+    def _expand(self, sub):
+        """Return the sequences of letters matched by a substring (PRIVATE)."""
+        if not self.ambiguous:
+            return [sub]
+        if b"U" in sub.upper() and b"T" not in sub.upper():
+            values = IUPACData.ambiguous_rna_values
+        else:
+            values = IUPACData.ambiguous_dna_values
+        choices = []
+        count = 1
+        for letter in sub.decode("ASCII"):
+            if letter.islower():
+                choice = values.get(letter.upper(), letter).lower()
+            else:
+                choice = values.get(letter, letter)
+            choices.append(choice.encode("ASCII"))
+            count *= len(choice)
+        if count > 100000:
+            raise ValueError(
+                "substring %s matches more than 100000 sequences" % sub.decode()
+            )
+        return [bytes(word) for word in itertools.product(*choices)]
+
+    def __repr__(self):
+        """Return a representation of the searcher for debugging."""
+        subs = [sub.decode() for sub in self._subs]
+        return "%s(%r, reverse_complement=%r, ambiguous=%r)" % (
+            self.__class__.__name__,
+            subs,
+            self.reverse_complement,
+            self.ambiguous,
+        )
+
+    def __reduce__(self):
+        """Create the automaton again when unpickling (PRIVATE)."""
+        return (
+            self.__class__,
+            (self._subs, self.reverse_complement, self.ambiguous),
+        )
+
+    def search(self, sequence):
+        """Search the sequence, and yield the index and substring found.
+
+        The sequence can be a Seq or MutableSeq object, a string, or a bytes
+        or bytearray object. For each match, a tuple with the start index and
+        the substring is returned; if searching the reverse complement, the
+        strand (1 or -1) is included as the third element of the tuple.
+        """
+        if isinstance(sequence, _SeqAbstractBaseClass):
+            data = sequence._data
+        elif isinstance(sequence, str):
+            data = sequence.encode("ASCII")
+        else:
+            data = sequence
+        scan = self._automaton.scan
+        outputs = self._results
+        lengths = self._lengths
+        maxlen = self._maxlen
+        state = 0
+        pending = []
+        # Search the sequence in chunks, to avoid loading lazily loaded
+        # sequences in full, and sort the matches by their start position
+        length = len(data)
+        size = 1048576
+        for offset in range(0, length, size):
+            end = min(offset + size, length)
+            if isinstance(data, (bytes, bytearray)):
+                chunk, start, stop, shift = data, offset, end, 0
+            elif isinstance(data, _SequenceDataView):
+                # Search the original bytes object in place
+                chunk, shift = data._parent, -data._start
+                start, stop = offset - shift, end - shift
+            else:
+                chunk = bytes(data[offset:end])
+                start, stop, shift = 0, end - offset, offset
+            state, matches = scan(chunk, start, stop, state)
+            for position, number in matches:
+                index = shift + position - lengths[number]
+                heapq.heappush(pending, (index, number))
+            while pending and pending[0][0] <= end - maxlen:
+                index, number = heapq.heappop(pending)
+                yield (index,) + outputs[number]
+        while pending:
+            index, number = heapq.heappop(pending)
+            yield (index,) + outputs[number]
+
+
 class UndefinedSequenceError(ValueError):
     """Sequence contents is undefined."""
 
@@ -2469,18 +2761,32 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
     Calling __len__ returns the sequence length, calling __getitem__ returns
     the sequence contents if known, otherwise an UndefinedSequenceError is
     raised.
+
+    The defined segments are stored in a dictionary mapping their start
+    position to their sequence contents, in order of their start position.
+    Their start and end positions are also kept as sorted lists, allowing
+    the segments overlapping a position or region to be found by bisection.
     """
 
-    __slots__ = ("_length", "_data")
+    __slots__ = ("_length", "_data", "_starts", "_ends")
 
-    def __init__(self, length, data):
+    def __init__(self, length, data, starts=None, ends=None):
         """Initialize with the sequence length and defined sequence segments.
 
         The calling function is responsible for ensuring that the length is
-        greater than zero.
+        greater than zero, and that the segments are sorted by their start
+        position, non-overlapping, and within the sequence length. If already
+        known, the lists of start and end positions of the segments can be
+        given to avoid calculating them again.
         """
         self._length = length
         self._data = data
+        if starts is None:
+            starts = list(data)
+        if ends is None:
+            ends = list(map(operator.add, starts, map(len, data.values())))
+        self._starts = starts
+        self._ends = ends
         super().__init__()
 
     def __getitem__(self, key: slice | int) -> bytes | SequenceDataAbstractBaseClass:
@@ -2489,8 +2795,15 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
             size = len(range(start, end, step))
             if size == 0:
                 return b""
+            # Only consider the segments overlapping the region spanned
+            last = start + (size - 1) * step
+            if step < 0:
+                start, last = last, start
+            first = bisect.bisect_right(self._ends, start)
+            last = bisect.bisect_right(self._starts, last)
             data = {}
-            for s, d in self._data.items():
+            for s in self._starts[first:last]:
+                d = self._data[s]
                 indices = range(-s, -s + self._length)[key]
                 e: int | None = indices.stop
                 assert e is not None
@@ -2517,6 +2830,8 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
                     data[start] = d
             if len(data) == 0:  # Fully undefined sequence
                 return _UndefinedSequenceData(size)
+            if step < 0:
+                data = {start: data[start] for start in reversed(data)}
             # merge adjacent sequence segments
             end = -1
             previous = 0  # not needed here, but it keeps flake happy
@@ -2533,18 +2848,16 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
                 seq = data.get(0)
                 if seq is not None and len(seq) == size:
                     return seq  # Fully defined sequence; return bytes
-            if step < 0:
-                # use this after we drop Python 3.7:
-                # data = {start: data[start] for start in reversed(data)}
-                # use this as long as we support Python 3.7:
-                data = {start: data[start] for start in reversed(list(data.keys()))}
             return _PartiallyDefinedSequenceData(size, data)
         elif self._length <= key:
             raise IndexError("sequence index out of range")
         else:
-            for start, seq in self._data.items():
-                if start <= key and key < start + len(seq):
-                    return seq[key - start]
+            if key < 0:
+                key += self._length
+            index = bisect.bisect_right(self._starts, key) - 1
+            if index >= 0 and key < self._ends[index]:
+                start = self._starts[index]
+                return self._data[start][key - start]
             raise UndefinedSequenceError("Sequence at position %d is undefined" % key)
 
     def __len__(self):
@@ -2555,16 +2868,21 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
 
     def __add__(self, other):
         length = len(self) + len(other)
+        # The new object needs its own copy of the segments, so concatenation
+        # takes time proportional to the number of segments; only recalculating
+        # the lists of start and end positions is avoided.
         data = dict(self._data)
-        items = list(self._data.items())
-        start, seq = items[-1]
-        end = start + len(seq)
+        starts = self._starts[:]
+        ends = self._ends[:]
+        start = starts[-1]
+        end = ends[-1]
         try:
             other = bytes(other)
         except UndefinedSequenceError:
             if isinstance(other, _UndefinedSequenceData):
                 pass
             elif isinstance(other, _PartiallyDefinedSequenceData):
+                starts = ends = None
                 other_items = list(other._data.items())
                 if end == len(self):
                     other_start, other_seq = other_items.pop(0)
@@ -2577,9 +2895,12 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
         else:
             if end == len(self):
                 data[start] += other
+                ends[-1] += len(other)
             else:
                 data[len(self)] = other
-        return _PartiallyDefinedSequenceData(length, data)
+                starts.append(len(self))
+                ends.append(length)
+        return _PartiallyDefinedSequenceData(length, data, starts, ends)
 
     def __radd__(self, other):
         length = len(other) + len(self)
@@ -2589,8 +2910,8 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
             data = {len(other) + start: seq for start, seq in self._data.items()}
         else:
             data = {0: other}
-            items = list(self._data.items())
-            start, seq = items.pop(0)
+            items = iter(self._data.items())
+            start, seq = next(items)
             if start == 0:
                 data[0] += seq
             else:
@@ -2619,12 +2940,16 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
     def upper(self):
         """Return an upper case copy of the sequence."""
         data = {start: seq.upper() for start, seq in self._data.items()}
-        return _PartiallyDefinedSequenceData(self._length, data)
+        return _PartiallyDefinedSequenceData(
+            self._length, data, self._starts, self._ends
+        )
 
     def lower(self):
         """Return a lower case copy of the sequence."""
         data = {start: seq.lower() for start, seq in self._data.items()}
-        return _PartiallyDefinedSequenceData(self._length, data)
+        return _PartiallyDefinedSequenceData(
+            self._length, data, self._starts, self._ends
+        )
 
     def isupper(self):
         """Return True if all ASCII characters in data are uppercase.
@@ -2668,7 +2993,9 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
             )
         items = self._data.items()
         data = {start: seq.replace(old, new) for start, seq in items}
-        return _PartiallyDefinedSequenceData(self._length, data)
+        return _PartiallyDefinedSequenceData(
+            self._length, data, self._starts, self._ends
+        )
 
     @property
     def defined(self):
@@ -2681,7 +3008,123 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
 
         The return value has the format ((start1, end1), (start2, end2), ...).
         """
-        return tuple((start, start + len(seq)) for start, seq in self._data.items())
+        return tuple(zip(self._starts, self._ends))
+
+
+class _SequenceDataView(SequenceDataAbstractBaseClass):
+    """Stores part of a bytes object without copying it (PRIVATE).
+
+    Slices of a Seq object of at least _SequenceDataView.minimum letters use
+    this instead of a copy of the bytes, holding a reference to the original
+    bytes object together with the start and end of the slice. Slicing a
+    view gives a view of the original bytes object, so nested slices do not
+    chain. Searching and counting methods work on the original bytes object
+    directly; the letters are only copied when needed, for example by
+    ``bytes()``, for hashing, or by methods returning a modified sequence.
+
+    As a view keeps the whole of the original bytes object in memory, use
+    ``Seq.compact`` to replace it by a copy if the original is not needed.
+    """
+
+    __slots__ = ("_parent", "_start", "_end")
+
+    # Shorter slices are simply copied
+    minimum = 4096
+
+    def __init__(self, parent, start, end):
+        """Initialize with the parent bytes object and the slice start and end."""
+        self._parent = parent
+        self._start = start
+        self._end = end
+        super().__init__()
+
+    def __reduce__(self):
+        # Pickle a copy of the letters only, not the parent
+        return (bytes, (bytes(self),))
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, key):
+        parent = self._parent
+        start = self._start
+        if isinstance(key, slice):
+            indices = range(start, self._end)[key]
+            if indices.step != 1:
+                return bytes(memoryview(parent)[start : self._end][key])
+            start, end = indices.start, indices.stop
+            if end - start < self.minimum:
+                return parent[start:end]
+            return _SequenceDataView(parent, start, end)
+        length = self._end - start
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("index out of range")
+        return parent[start + key]
+
+    def __bytes__(self):
+        return self._parent[self._start : self._end]
+
+    def __contains__(self, item):
+        return self.find(item) != -1
+
+    def _adjust(self, start, end):
+        """Return start and end, as used by bytes methods, in the parent (PRIVATE)."""
+        length = self._end - self._start
+        if start is None:
+            start = 0
+        else:
+            start = operator.index(start)
+            if start < 0:
+                start = max(start + length, 0)
+        if end is None:
+            end = length
+        else:
+            end = operator.index(end)
+            if end < 0:
+                end = max(end + length, 0)
+            elif end > length:
+                end = length
+        return self._start + start, self._start + end
+
+    def decode(self, encoding="utf-8"):
+        """Decode the data as bytes using the codec registered for encoding."""
+        return str(memoryview(self._parent)[self._start : self._end], encoding)
+
+    def count(self, sub, start=None, end=None):
+        """Return the number of non-overlapping occurrences of sub."""
+        return self._parent.count(sub, *self._adjust(start, end))
+
+    def find(self, sub, start=None, end=None):
+        """Return the lowest index in data where subsection sub is found."""
+        index = self._parent.find(sub, *self._adjust(start, end))
+        if index != -1:
+            index -= self._start
+        return index
+
+    def rfind(self, sub, start=None, end=None):
+        """Return the highest index in data where subsection sub is found."""
+        index = self._parent.rfind(sub, *self._adjust(start, end))
+        if index != -1:
+            index -= self._start
+        return index
+
+    def index(self, sub, start=None, end=None):
+        """Return the lowest index in data where subsection sub is found."""
+        return self._parent.index(sub, *self._adjust(start, end)) - self._start
+
+    def rindex(self, sub, start=None, end=None):
+        """Return the highest index in data where subsection sub is found."""
+        return self._parent.rindex(sub, *self._adjust(start, end)) - self._start
+
+    def startswith(self, prefix, start=None, end=None):
+        """Return True if data starts with the specified prefix, False otherwise."""
+        return self._parent.startswith(prefix, *self._adjust(start, end))
+
+    def endswith(self, suffix, start=None, end=None):
+        """Return True if data ends with the specified suffix, False otherwise."""
+        return self._parent.endswith(suffix, *self._adjust(start, end))
 
 
 # The transcribe, backward_transcribe, and translate functions are
@@ -2733,6 +3176,37 @@ def back_transcribe(rna):
         return rna.replace("U", "T").replace("u", "t")
 
 
+def _get_codon_table(table):
+    """Return the CodonTable for a table name, NCBI identifier or object (PRIVATE)."""
+    try:
+        table_id = int(table)
+    except ValueError:
+        # Assume it's a table name
+        # The same table can be used for RNA or DNA
+        try:
+            return CodonTable.ambiguous_generic_by_name[table]
+        except KeyError:
+            if isinstance(table, str):
+                raise ValueError(
+                    "The Bio.Seq translate methods and function DO NOT "
+                    "take a character string mapping table like the python "
+                    "string object's translate method. "
+                    "Use str(my_seq).translate(...) instead."
+                ) from None
+            else:
+                raise TypeError("table argument must be integer or string") from None
+    except (AttributeError, TypeError):
+        # Assume it's a CodonTable object
+        if isinstance(table, CodonTable.CodonTable):
+            return table
+        else:
+            raise ValueError("Bad table argument") from None
+    else:
+        # Assume it's a table ID
+        # The same table can be used for RNA or DNA
+        return CodonTable.ambiguous_generic_by_id[table_id]
+
+
 def _translate_str(
     sequence, table, stop_symbol="*", to_stop=False, cds=False, pos_stop="X", gap=None
 ):
@@ -2798,35 +3272,86 @@ def _translate_str(
        ...
     Bio.Data.CodonTable.TranslationError: Extra in frame stop codon 'TAG' found.
     """
+    return _translate_strs(
+        [sequence], table, stop_symbol, to_stop, cds, pos_stop, gap
+    )[0]
+
+
+def _translate_codon(codon, codon_table, valid_letters, pos_stop, gap):
+    """Translate a single codon, returning None for a stop codon (PRIVATE)."""
     try:
-        table_id = int(table)
-    except ValueError:
-        # Assume it's a table name
-        # The same table can be used for RNA or DNA
+        return codon_table.forward_table[codon]
+    except (KeyError, CodonTable.TranslationError):
+        if codon in codon_table.stop_codons:
+            return None
+        elif valid_letters.issuperset(set(codon)):
+            # Possible stop codon (e.g. NNN or TAN)
+            return pos_stop
+        elif gap is not None and codon == gap * 3:
+            # Gapped translation
+            return gap
+        else:
+            raise CodonTable.TranslationError(f"Codon '{codon}' is invalid") from None
+
+
+# Codes used to look up unambiguous codons, see _codon_lookup
+_codon_codes = bytearray([5] * 256)
+for _code, _letter in enumerate(b"TCAGU"):
+    _codon_codes[_letter] = _code
+_codon_codes = bytes(_codon_codes)
+del _code, _letter
+
+_codon_lookups = weakref.WeakKeyDictionary()
+
+
+def _codon_lookup(codon_table):
+    """Return a lookup table of the unambiguous codons of a codon table (PRIVATE).
+
+    The table is a NumPy array indexed by 36 times the code of the first
+    nucleotide, plus 6 times the code of the second, plus the code of the
+    third, where the codes are 0 to 4 for T, C, A, G, U and 5 for any other
+    letter. It gives the amino acid as an ASCII value, or 1 for a stop codon,
+    or 0 for codons which have to be translated by _translate_codon.
+    """
+    import numpy as np
+
+    try:
+        return _codon_lookups[codon_table]
+    except KeyError:
+        pass
+    lookup = np.zeros(216, np.uint8)
+    for index, codon in enumerate(itertools.product("TCAGU?", repeat=3)):
+        codon = "".join(codon)
         try:
-            codon_table = CodonTable.ambiguous_generic_by_name[table]
-        except KeyError:
-            if isinstance(table, str):
-                raise ValueError(
-                    "The Bio.Seq translate methods and function DO NOT "
-                    "take a character string mapping table like the python "
-                    "string object's translate method. "
-                    "Use str(my_seq).translate(...) instead."
-                ) from None
-            else:
-                raise TypeError("table argument must be integer or string") from None
-    except (AttributeError, TypeError):
-        # Assume it's a CodonTable object
-        if isinstance(table, CodonTable.CodonTable):
-            codon_table = table
+            amino_acid = codon_table.forward_table[codon]
+        except (KeyError, CodonTable.TranslationError):
+            if codon in codon_table.stop_codons:
+                lookup[index] = 1
         else:
-            raise ValueError("Bad table argument") from None
-    else:
-        # Assume it's a table ID
-        # The same table can be used for RNA or DNA
-        codon_table = CodonTable.ambiguous_generic_by_id[table_id]
-    sequence = sequence.upper()
-    amino_acids = []
+            if len(amino_acid) == 1 and "A" <= amino_acid <= "Z":
+                lookup[index] = ord(amino_acid)
+    _codon_lookups[codon_table] = lookup
+    return lookup
+
+
+def _translate_strs(
+    sequences,
+    table,
+    stop_symbol="*",
+    to_stop=False,
+    cds=False,
+    pos_stop="X",
+    gap=None,
+):
+    """Translate a list of nucleotide strings into a list of protein strings (PRIVATE).
+
+    Takes the same arguments as _translate_str, but for a list of sequences.
+    Long or many sequences are concatenated and translated together using
+    NumPy, looking up the amino acid of each unambiguous codon by its index
+    from _codon_lookup. Stop codons and any other codons (e.g. ambiguous
+    or gapped codons) are then translated one by one by _translate_codon.
+    """
+    codon_table = _get_codon_table(table)
     forward_table = codon_table.forward_table
     stop_codons = codon_table.stop_codons
     if codon_table.nucleotide_alphabet is not None:
@@ -2837,7 +3362,6 @@ def _translate_str(
             IUPACData.ambiguous_dna_letters.upper()
             + IUPACData.ambiguous_rna_letters.upper()
         )
-    n = len(sequence)
 
     # Check for tables with 'ambiguous' (dual-coding) stop codons:
     dual_coding = [c for c in stop_codons if c in forward_table]
@@ -2856,60 +3380,107 @@ def _translate_str(
             BiopythonWarning,
         )
 
-    if cds:
-        if str(sequence[:3]).upper() not in codon_table.start_codons:
-            raise CodonTable.TranslationError(
-                f"First codon '{sequence[:3]}' is not a start codon"
-            )
-        if n % 3 != 0:
-            raise CodonTable.TranslationError(
-                f"Sequence length {n} is not a multiple of three"
-            )
-        if str(sequence[-3:]).upper() not in stop_codons:
-            raise CodonTable.TranslationError(
-                f"Final codon '{sequence[-3:]}' is not a stop codon"
+    codons = []
+    for sequence in sequences:
+        sequence = sequence.upper()
+        n = len(sequence)
+        if cds:
+            if str(sequence[:3]).upper() not in codon_table.start_codons:
+                raise CodonTable.TranslationError(
+                    f"First codon '{sequence[:3]}' is not a start codon"
+                )
+            if n % 3 != 0:
+                raise CodonTable.TranslationError(
+                    f"Sequence length {n} is not a multiple of three"
+                )
+            if str(sequence[-3:]).upper() not in stop_codons:
+                raise CodonTable.TranslationError(
+                    f"Final codon '{sequence[-3:]}' is not a stop codon"
+                )
+            # Don't translate the stop symbol, and manually translate the M
+            sequence = sequence[3:-3]
+            n -= 6
+        elif n % 3 != 0:
+            warnings.warn(
+                "Partial codon, len(sequence) not a multiple of three. "
+                "Explicitly trim the sequence or add trailing N before "
+                "translation. This may become an error in future.",
+                BiopythonWarning,
             )
-        # Don't translate the stop symbol, and manually translate the M
-        sequence = sequence[3:-3]
-        n -= 6
-        amino_acids = ["M"]
-    elif n % 3 != 0:
-        warnings.warn(
-            "Partial codon, len(sequence) not a multiple of three. "
-            "Explicitly trim the sequence or add trailing N before "
-            "translation. This may become an error in future.",
-            BiopythonWarning,
-        )
+        codons.append(sequence[: n - n % 3])
     if gap is not None:
         if not isinstance(gap, str):
             raise TypeError("Gap character should be a single character string.")
         elif len(gap) > 1:
             raise ValueError("Gap character should be a single character string.")
-
-    for i in range(0, n - n % 3, 3):
-        codon = sequence[i : i + 3]
-        try:
-            amino_acids.append(forward_table[codon])
-        except (KeyError, CodonTable.TranslationError):
-            if codon in codon_table.stop_codons:
-                if cds:
-                    raise CodonTable.TranslationError(
-                        f"Extra in frame stop codon '{codon}' found."
-                    ) from None
-                if to_stop:
-                    break
-                amino_acids.append(stop_symbol)
-            elif valid_letters.issuperset(set(codon)):
-                # Possible stop codon (e.g. NNN or TAN)
-                amino_acids.append(pos_stop)
-            elif gap is not None and codon == gap * 3:
-                # Gapped translation
-                amino_acids.append(gap)
-            else:
+    prefix = "M" if cds else ""
+
+    text = "".join(codons)
+    symbols = (stop_symbol, pos_stop) if gap is None else (stop_symbol, pos_stop, gap)
+    if (
+        (len(sequences) == 1 and len(text) < 300)
+        or not text.isascii()
+        or not all(isinstance(s, str) and len(s) == 1 and s.isascii() for s in symbols)
+    ):
+        # Translate one codon at a time
+        proteins = []
+        for sequence in codons:
+            amino_acids = [prefix]
+            for i in range(0, len(sequence), 3):
+                codon = sequence[i : i + 3]
+                amino_acid = _translate_codon(
+                    codon, codon_table, valid_letters, pos_stop, gap
+                )
+                if amino_acid is None:
+                    if cds:
+                        raise CodonTable.TranslationError(
+                            f"Extra in frame stop codon '{codon}' found."
+                        )
+                    if to_stop:
+                        break
+                    amino_acid = stop_symbol
+                amino_acids.append(amino_acid)
+            proteins.append("".join(amino_acids))
+        return proteins
+
+    import numpy as np
+
+    data = np.frombuffer(text.encode("ASCII"), np.uint8)
+    codes = np.frombuffer(_codon_codes, np.uint8)[data].reshape(-1, 3)
+    indices = 36 * codes[:, 0].astype(np.intp) + 6 * codes[:, 1] + codes[:, 2]
+    protein = _codon_lookup(codon_table)[indices]
+    ends = np.cumsum([len(sequence) // 3 for sequence in codons]).tolist()
+    starts = [0] + ends[:-1]
+    stops = ends[:]
+    if not (cds or to_stop):
+        # Any stop codon can be translated directly
+        protein[protein == 1] = ord(stop_symbol)
+    special = np.flatnonzero(protein < 2)
+    # Find which sequence each of these codons is in
+    numbers = np.searchsorted(ends, special, side="right").tolist()
+    for number, i in zip(numbers, special.tolist()):
+        if i >= stops[number]:
+            # Translation of this sequence was stopped earlier
+            continue
+        codon = text[3 * i : 3 * i + 3]
+        if protein[i] == 1:
+            amino_acid = None
+        else:
+            amino_acid = _translate_codon(
+                codon, codon_table, valid_letters, pos_stop, gap
+            )
+        if amino_acid is None:
+            if cds:
                 raise CodonTable.TranslationError(
-                    f"Codon '{codon}' is invalid"
-                ) from None
-    return "".join(amino_acids)
+                    f"Extra in frame stop codon '{codon}' found."
+                )
+            if to_stop:
+                stops[number] = i
+                continue
+            amino_acid = stop_symbol
+        protein[i] = ord(amino_acid)
+    text = protein.tobytes().decode("ASCII")
+    return [prefix + text[start:stop] for start, stop in zip(starts, stops)]
 
 
 def translate(
@@ -3016,6 +3587,53 @@ def translate(
         return _translate_str(sequence, table, stop_symbol, to_stop, cds, gap=gap)
 
 
+def translate_many(
+    sequences, table="Standard", stop_symbol="*", to_stop=False, cds=False, gap=None
+):
+    """Translate many nucleotide sequences into amino acids, returning a list.
+
+    This gives the same results as calling the ``translate`` function on each
+    sequence in turn, with the same arguments, but is much faster for many
+    sequences (e.g. all the CDS features of a genome) as they are translated
+    together. Strings are translated into strings, while Seq and MutableSeq
+    objects are translated into Seq objects:
+
+    >>> from Bio.Seq import Seq, translate_many
+    >>> cds = ["ATGGCCATTGTAATGGGCCGCTGA", Seq("GTGAAAGGGTGCCCGTAG")]
+    >>> translate_many(cds)
+    ['MAIVMGR*', Seq('VKGCP*')]
+    >>> translate_many(cds, table=11, cds=True)
+    ['MAIVMGR', Seq('MKGCP')]
+
+    If the translation fails (e.g. an invalid codon, or with ``cds=True`` a
+    sequence which is not a valid CDS), an exception is raised as for the
+    ``translate`` function.
+    """
+    sequences = list(sequences)
+    results = [None] * len(sequences)
+    numbers = []
+    strings = []
+    for number, sequence in enumerate(sequences):
+        if isinstance(sequence, (Seq, MutableSeq)):
+            try:
+                strings.append(str(sequence))
+            except UndefinedSequenceError:
+                results[number] = sequence.translate(
+                    table, stop_symbol, to_stop, cds, gap
+                )
+                continue
+        else:
+            # Assume it's a string
+            strings.append(sequence)
+        numbers.append(number)
+    proteins = _translate_strs(strings, table, stop_symbol, to_stop, cds, gap=gap)
+    for number, protein in zip(numbers, proteins):
+        if isinstance(sequences[number], (Seq, MutableSeq)):
+            protein = Seq(protein)
+        results[number] = protein
+    return results
+
+
 def reverse_complement(sequence, inplace=False):
     """Return the reverse complement as a DNA sequence.
 
@@ -620,6 +620,27 @@ class Reference:
 class Location(ABC):
     """Abstract base class representing a location."""
 
+    __slots__ = ()
+
+    def __getstate__(self):
+        """Return the attributes of the location for pickling or copying (PRIVATE).
+
+        The locations use __slots__ to save memory, so there is no instance
+        dictionary (unless defined by a subclass), but the state is returned
+        as a dictionary of the attributes as in older versions of Biopython.
+        """
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        """Restore the attributes of an unpickled or copied location (PRIVATE)."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @abstractmethod
     def __repr__(self):
         """Represent the Location object as a string for debugging."""
@@ -812,6 +833,8 @@ class SimpleLocation(Location):
     would use a BeforePosition object for the start.
     """
 
+    __slots__ = ("_start", "_end", "_strand", "ref", "ref_db")
+
     def __init__(self, start, end, strand=None, ref=None, ref_db=None):
         """Initialize the class.
 
@@ -881,13 +904,13 @@ class SimpleLocation(Location):
         else:
             raise TypeError(f"end={end!r} {type(end)}")
         if (
-            isinstance(self.start, int)
-            and isinstance(self.end, int)
-            and self.start > self.end
+            isinstance(self._start, int)
+            and isinstance(self._end, int)
+            and self._start > self._end
         ):
             raise ValueError(
-                f"End location ({self.end}) must be greater than "
-                f"or equal to start location ({self.start})"
+                f"End location ({self._end}) must be greater than "
+                f"or equal to start location ({self._start})"
             )
         self.strand = strand
         self.ref = ref
@@ -1312,6 +1335,8 @@ FeatureLocation = SimpleLocation  # OBSOLETE; for backward compatibility only.
 class CompoundLocation(Location):
     """For handling joins etc where a feature location has several parts."""
 
+    __slots__ = ("operator", "parts")
+
     def __init__(self, parts, operator="join"):
         """Initialize the class.
 
@@ -1712,6 +1737,8 @@ class CompoundLocation(Location):
 class Position(ABC):
     """Abstract base class representing a position."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __repr__(self):
         """Represent the Position object as a string for debugging."""
@@ -1847,6 +1874,8 @@ class ExactPosition(int, Position):
 
     """
 
+    __slots__ = ()
+
     def __new__(cls, position, extension=0):
         """Create an ExactPosition object."""
         if extension != 0:
@@ -1880,6 +1909,8 @@ class UncertainPosition(ExactPosition):
     XML format explicitly marked as uncertain. Does not apply to GenBank/EMBL.
     """
 
+    __slots__ = ()
+
 
 class UnknownPosition(Position):
     """Specify a specific position which is unknown (has no position).
@@ -1887,6 +1918,8 @@ class UnknownPosition(Position):
     This is used in UniProt, e.g. ? or in the XML as unknown.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         """Represent the UnknownPosition object as a string for debugging."""
         return f"{self.__class__.__name__}()"
@@ -2152,6 +2185,8 @@ class BeforePosition(int, Position):
     like integers.
     """
 
+    __slots__ = ()
+
     # Subclasses int so can't use __init__
     def __new__(cls, position, extension=0):
         """Create a new instance in BeforePosition object."""
@@ -2216,6 +2251,8 @@ class AfterPosition(int, Position):
     like integers.
     """
 
+    __slots__ = ()
+
     # Subclasses int so can't use __init__
     def __new__(cls, position, extension=0):
         """Create a new instance of the AfterPosition object."""
@@ -13,9 +13,20 @@
 You are expected to use this module via the Bio.SeqIO functions.
 """
 
+import io
+import mmap
+import os
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from Bio.bgzf import BgzfReader
+from Bio.File import _open_for_random_access
+from Bio.File import as_handle
 from Bio.Seq import Seq
+from Bio.Seq import SequenceDataAbstractBaseClass
 from Bio.SeqRecord import SeqRecord
 from Bio import BiopythonDeprecationWarning
+from Bio import StreamModeError
 
 
 from .Interfaces import _clean
@@ -560,8 +571,8 @@ class FastaWriter(SequenceWriter):
 
         return "".join(lines)
 
-    def write_record(self, record):
-        """Write a single Fasta record to the file."""
+    def _title(self, record):
+        """Return the title line of the record, without the ">" (PRIVATE)."""
         if self.record2title:
             title = self.clean(self.record2title(record))
         else:
@@ -577,6 +588,11 @@ class FastaWriter(SequenceWriter):
 
         assert "\n" not in title
         assert "\r" not in title
+        return title
+
+    def write_record(self, record):
+        """Write a single Fasta record to the file."""
+        title = self._title(record)
         self.handle.write(f">{title}\n")
 
         data = _get_seq_string(record)  # Catches sequence being None
@@ -590,6 +606,136 @@ class FastaWriter(SequenceWriter):
         else:
             self.handle.write(data + "\n")
 
+    def write_records(self, records):
+        """Write records to the output file, and return the number of records.
+
+        records - A list or iterator returning SeqRecord objects
+
+        Rather than writing each record line by line, the records are collected
+        in blocks of about 4 MB of sequence, which are formatted together using
+        NumPy and written out with a single call each.
+        """
+        if type(self).write_record is not FastaWriter.write_record:
+            # A subclass writing each record in its own way
+            return super().write_records(records)
+        return self._write_blocks(
+            (self._title(record), _get_seq_string(record)) for record in records
+        )
+
+    def write_columns(self, titles, sequences):
+        """Write records given as columns, and return the number of records.
+
+        Arguments:
+         - titles - iterable of title lines as strings, without the ">"
+         - sequences - iterable of the sequences as bytes (or strings)
+
+        This avoids creating SeqRecord objects for data held in other ways,
+        such as the rows of a table. Each title is used as is, apart from
+        replacing any newlines by spaces, as the record2title function is
+        not applicable here:
+
+        >>> import sys
+        >>> writer = FastaWriter(sys.stdout, wrap=4)
+        >>> writer.write_columns(["alpha", "beta test"], [b"ACGTACGTAC", b"TTG"])
+        >alpha
+        ACGT
+        ACGT
+        AC
+        >beta test
+        TTG
+        2
+        """
+        if type(self).write_record is not FastaWriter.write_record:
+            raise TypeError(
+                f"{type(self).__name__} writes each record in its own way, "
+                "use write_records instead"
+            )
+        return self._write_blocks(
+            (self.clean(title), data) for title, data in zip(titles, sequences)
+        )
+
+    def _write_blocks(self, entries):
+        """Write (title, sequence) pairs in blocks, and return the count (PRIVATE)."""
+        count = 0
+        titles = []
+        sequences = []
+        size = 0
+        for title, data in entries:
+            titles.append(title)
+            sequences.append(data)
+            size += len(data)
+            count += 1
+            if size >= self._block_size:
+                self.handle.write(_format_fasta_block(titles, sequences, self.wrap))
+                titles = []
+                sequences = []
+                size = 0
+        if titles:
+            self.handle.write(_format_fasta_block(titles, sequences, self.wrap))
+        return count
+
+    # Number of sequence letters to collect before formatting and writing them
+    _block_size = 4194304
+
+
+def _format_fasta_block(titles, sequences, wrap):
+    r"""Return FASTA records as a string, wrapping the sequences using NumPy (PRIVATE).
+
+    Arguments:
+     - titles - list of title lines as strings, without the leading ">"
+     - sequences - list of the sequences, either all bytes or all strings
+     - wrap - line length used to wrap the sequences, or zero/None for none
+
+    The records are laid out in a single buffer, which starts out filled with
+    newlines. The title lines are copied into their positions, and then the
+    sequence letters fill all the positions which are not a title or the
+    newline at the end of a line, in one step.
+
+    >>> _format_fasta_block(["a", "b"], [b"ACGTA", b""], 2)
+    '>a\nAC\nGT\nA\n>b\n'
+    >>> _format_fasta_block(["a", "b"], ["ACGTA", ""], None)
+    '>a\nACGTA\n>b\n\n'
+    """
+    import numpy as np
+
+    count = len(titles)
+    titles = [f">{title}".encode() for title in titles]
+    if sequences and isinstance(sequences[0], str):
+        data = "".join(sequences).encode("ascii")
+    else:
+        data = b"".join(sequences)
+    assert b"\n" not in data
+    assert b"\r" not in data
+    title_lengths = np.fromiter(map(len, titles), np.int64, count)
+    lengths = np.fromiter(map(len, sequences), np.int64, count)
+    if wrap:
+        lines = -(-lengths // wrap)
+    else:
+        # Always a single line, even if empty
+        lines = np.ones(count, np.int64)
+        wrap = 0
+    sizes = title_lengths + 1 + lengths + lines
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    buffer = np.full(ends[-1], 10, np.uint8)  # "\n"
+    letters = np.ones(len(buffer), bool)
+    title_offsets = np.cumsum(title_lengths) - title_lengths
+    positions = np.arange(title_offsets[-1] + title_lengths[-1])
+    positions += np.repeat(starts - title_offsets, title_lengths)
+    buffer[positions] = np.frombuffer(b"".join(titles), np.uint8)
+    letters[positions] = False
+    letters[starts + title_lengths] = False
+    # Each full line of sequence ends at a fixed distance from the title,
+    # the last line of each record at the end of the record:
+    line_ends = np.cumsum(lines)
+    line_numbers = np.arange(line_ends[-1]) - np.repeat(line_ends - lines, lines)
+    newlines = np.repeat(starts + title_lengths + wrap + 1, lines)
+    newlines += line_numbers * (wrap + 1)
+    newlines[line_ends[lines > 0] - 1] = ends[lines > 0] - 1
+    letters[newlines] = False
+    buffer[letters] = np.frombuffer(data, np.uint8)
+    return buffer.tobytes().decode()
+
 
 class FastaTwoLineWriter(FastaWriter):
     """Class to write 2-line per record Fasta format files.
@@ -652,6 +798,481 @@ class FastaTwoLineWriter(FastaWriter):
         return f">{title}\n{data}\n"
 
 
+class FaidxEntry(NamedTuple):
+    """One line of a samtools faidx style FASTA index (.fai file).
+
+    The attributes follow the columns of the .fai file:
+
+     - name       - sequence name, the title line up to the first white space
+     - length     - number of bases in the sequence
+     - offset     - byte offset in the file of the first base of the sequence
+     - line_bases - number of bases on each full line of sequence
+     - line_width - number of bytes in each full line, including the line
+                    ending (one byte more for "\\r\\n" than for "\\n")
+    """
+
+    name: str
+    length: int
+    offset: int
+    line_bases: int
+    line_width: int
+
+
+def build_faidx(source) -> list[FaidxEntry]:
+    r"""Scan a FASTA file and return its samtools faidx style index entries.
+
+    Arguments:
+     - source - input stream opened in binary mode, or a path to a file
+
+    As with ``samtools faidx``, all the sequence lines of a record apart
+    from the last must have the same length, otherwise a ValueError is
+    raised as the file cannot be indexed in this way.
+
+    >>> for entry in build_faidx("GenBank/NC_005816.fna"):
+    ...     print(entry)
+    FaidxEntry(name='gi|45478711|ref|NC_005816.1|', length=9609, offset=106, line_bases=70, line_width=71)
+
+    Use write_faidx to save the entries as a .fai file.
+    """
+    entries = []
+    names = set()
+    with as_handle(source, "rb") as handle:
+        if handle.read(0) != b"":
+            raise StreamModeError("Indexing FASTA requires a binary handle") from None
+        position = 0
+        name = None
+        for line in handle:
+            size = len(line)
+            if line.startswith(b">"):
+                if name is not None:
+                    entries.append(
+                        FaidxEntry(name, length, offset, line_bases, line_width)
+                    )
+                try:
+                    name = line[1:].split(None, 1)[0].decode()
+                except IndexError:
+                    raise ValueError(
+                        "Found a FASTA record with an empty title line at byte "
+                        "offset %i" % position
+                    ) from None
+                if name in names:
+                    raise ValueError(f"Duplicate key '{name}'")
+                names.add(name)
+                offset = position + size
+                length = line_bases = line_width = 0
+                short_line = False
+            elif name is None:
+                # Allow blank lines or comments before the first record
+                if line.strip() and not line.startswith(b";"):
+                    raise ValueError(
+                        "FASTA files should start with a '>' line (after any "
+                        "blank lines or comments)"
+                    )
+            else:
+                bases = len(line.rstrip(b"\r\n"))
+                if short_line and bases:
+                    raise ValueError(
+                        f"Different line length in sequence '{name}', "
+                        "cannot index this FASTA file"
+                    )
+                if line_width == 0:
+                    line_bases = bases
+                    line_width = size
+                elif bases != line_bases or size != line_width:
+                    if bases > line_bases:
+                        raise ValueError(
+                            f"Different line length in sequence '{name}', "
+                            "cannot index this FASTA file"
+                        )
+                    short_line = True
+                length += bases
+            position += size
+        if name is not None:
+            entries.append(FaidxEntry(name, length, offset, line_bases, line_width))
+    return entries
+
+
+def read_faidx(source) -> list[FaidxEntry]:
+    """Read a samtools faidx style index (.fai file), returning its entries.
+
+    Arguments:
+     - source - input stream opened in text mode, or a path to a file
+
+    Any sixth column (used by samtools for the quality offset of indexed
+    FASTQ files) is ignored.
+    """
+    entries = []
+    with as_handle(source) as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            fields = line.rstrip("\r\n").split("\t")
+            if len(fields) not in (5, 6):
+                raise ValueError(
+                    f"Expected 5 or 6 tab separated columns, got: {line!r}"
+                )
+            name, length, offset, line_bases, line_width = fields[:5]
+            entries.append(
+                FaidxEntry(
+                    name, int(length), int(offset), int(line_bases), int(line_width)
+                )
+            )
+    return entries
+
+
+def write_faidx(entries, target) -> None:
+    """Write samtools faidx style index entries as a .fai file.
+
+    Arguments:
+     - entries - iterable of FaidxEntry objects (or equivalent tuples)
+     - target - output stream opened in text mode, or a path to a file
+    """
+    with as_handle(target, "w") as handle:
+        for name, length, offset, line_bases, line_width in entries:
+            handle.write(f"{name}\t{length}\t{offset}\t{line_bases}\t{line_width}\n")
+
+
+class _FaidxSequenceData(SequenceDataAbstractBaseClass):
+    """Retrieves sequence data from a line wrapped FASTA file on demand (PRIVATE).
+
+    Objects of this class store the file position of the first base, the
+    sequence length, and the line layout taken from a faidx index. Requesting
+    a region seeks to the first line holding it, and reads only the bytes
+    needed (removing the line endings). The full sequence of a record is
+    loaded only if explicitly requested.
+    """
+
+    __slots__ = ("stream", "offset", "length", "line_bases", "line_width")
+
+    def __init__(self, stream, offset, length, line_bases, line_width):
+        """Initialize the file stream, and the file layout of the sequence data."""
+        self.stream = stream
+        self.offset = offset
+        self.length = length
+        self.line_bases = line_bases
+        self.line_width = line_width
+        super().__init__()
+
+    def _position(self, index):
+        """Return the file offset of the base at the given position (PRIVATE)."""
+        line, column = divmod(index, self.line_bases)
+        return self.offset + line * self.line_width + column
+
+    def __getitem__(self, key):
+        """Return the sequence contents (as a bytes object) for the requested region."""
+        length = self.length
+        if isinstance(key, slice):
+            start, end, step = key.indices(length)
+            size = len(range(start, end, step))
+            if size == 0:
+                return b""
+            if step < 0:
+                start, end = start + (size - 1) * step, start + 1
+        else:
+            if key < 0:
+                key += length
+            if not 0 <= key < length:
+                raise IndexError("index out of range")
+            start = key
+            end = key + 1
+            step = 1
+        data = self._read(start, end)
+        if isinstance(key, slice):
+            if step != 1:
+                if step < 0:
+                    data = data[::-1]
+                data = data[::abs(step)]
+            return data
+        else:  # single letter
+            return data[0]
+
+    def _read(self, start, end):
+        """Return the sequence from start to end, without line endings (PRIVATE)."""
+        position = self._position(start)
+        stream = self.stream
+        try:
+            if isinstance(stream, BgzfReader):
+                # The index holds offsets in the decompressed data
+                stream.seek_uncompressed(position)
+            else:
+                stream.seek(position)
+        except ValueError as exception:
+            if str(exception) == "seek of closed file":
+                raise ValueError("cannot retrieve sequence: file is closed") from None
+            raise
+        data = stream.read(self._position(end - 1) + 1 - position)
+        data = data.translate(None, b"\r\n")
+        if len(data) != end - start:
+            raise ValueError(
+                "Unexpected sequence data in file, the FASTA index may be out of date"
+            )
+        return data
+
+    def __len__(self):
+        """Get the sequence length."""
+        return self.length
+
+
+class _MappedFaidxSequenceData(_FaidxSequenceData):
+    """Retrieves sequence data from a memory mapped FASTA file (PRIVATE).
+
+    This is used by IndexedFasta for uncompressed files, with the stream
+    attribute holding an mmap object for the file. Regions are sliced straight
+    from the mapping without seeking, so processes using the same file share
+    the operating system's cached copy of it. Counting and searching for a
+    single letter, or for any substring if the sequence is on one line, scan
+    the mapped file in place rather than copying the sequence.
+    """
+
+    __slots__ = ()
+
+    def _mapping(self):
+        """Return the mmap object, checking it is still open (PRIVATE)."""
+        mapping = self.stream
+        if mapping.closed:
+            raise ValueError("cannot retrieve sequence: file is closed")
+        return mapping
+
+    def _read(self, start, end):
+        """Return the sequence from start to end, without line endings (PRIVATE)."""
+        mapping = self._mapping()
+        position = self._position(start)
+        data = mapping[position : self._position(end - 1) + 1]
+        if self.length > self.line_bases:
+            data = data.translate(None, b"\r\n")
+        if len(data) != end - start:
+            raise ValueError(
+                "Unexpected sequence data in file, the FASTA index may be out of date"
+            )
+        return data
+
+    def _region(self, sub, start, end):
+        """Return file offsets to scan for sub in data[start:end], or None (PRIVATE).
+
+        Returns None if the mapped file cannot be scanned in place, because
+        the sequence is line wrapped and sub could span a line ending.
+        """
+        if not isinstance(sub, (bytes, bytearray)) or len(sub) == 0:
+            return None
+        if self.length > self.line_bases and (len(sub) > 1 or sub in b"\r\n"):
+            return None
+        start, end, step = slice(start, end).indices(self.length)
+        if end - start < len(sub):
+            return self.offset, self.offset
+        return self._position(start), self._position(end - 1) + 1
+
+    def _index(self, position):
+        """Return the sequence index of the base at the given file offset (PRIVATE)."""
+        line, column = divmod(position - self.offset, self.line_width)
+        return line * self.line_bases + column
+
+    def count(self, sub, start=None, end=None):
+        """Return the number of non-overlapping occurrences of sub in data[start:end].
+
+        Optional arguments start and end are interpreted as in slice notation.
+        This method behaves as the count method of Python strings.
+        """
+        region = self._region(sub, start, end)
+        if region is None:
+            return super().count(sub, start, end)
+        mapping = self._mapping()
+        start, end = region
+        count = 0
+        if len(sub) == 1:
+            # Count in chunks, to avoid copying the whole sequence at once
+            for position in range(start, end, 1048576):
+                count += mapping[position : min(position + 1048576, end)].count(sub)
+        else:
+            size = len(sub)
+            position = mapping.find(sub, start, end)
+            while position != -1:
+                count += 1
+                position = mapping.find(sub, position + size, end)
+        return count
+
+    def find(self, sub, start=None, end=None):
+        """Return the lowest index in data where subsection sub is found.
+
+        Return the lowest index in data where subsection sub is found,
+        such that sub is contained within data[start,end].  Optional
+        arguments start and end are interpreted as in slice notation.
+
+        Return -1 on failure.
+        """
+        region = self._region(sub, start, end)
+        if region is None:
+            return super().find(sub, start, end)
+        position = self._mapping().find(sub, *region)
+        if position == -1:
+            return -1
+        return self._index(position)
+
+    def rfind(self, sub, start=None, end=None):
+        """Return the highest index in data where subsection sub is found.
+
+        Return the highest index in data where subsection sub is found,
+        such that sub is contained within data[start,end].  Optional
+        arguments start and end are interpreted as in slice notation.
+
+        Return -1 on failure.
+        """
+        region = self._region(sub, start, end)
+        if region is None:
+            return super().rfind(sub, start, end)
+        position = self._mapping().rfind(sub, *region)
+        if position == -1:
+            return -1
+        return self._index(position)
+
+    def index(self, sub, start=None, end=None):
+        """Return the lowest index in data where subsection sub is found.
+
+        Raises ValueError when the subsection is not found.
+        """
+        index = self.find(sub, start, end)
+        if index == -1:
+            raise ValueError("subsection not found")
+        return index
+
+    def rindex(self, sub, start=None, end=None):
+        """Return the highest index in data where subsection sub is found.
+
+        Raises ValueError when the subsection is not found.
+        """
+        index = self.rfind(sub, start, end)
+        if index == -1:
+            raise ValueError("subsection not found")
+        return index
+
+    def __contains__(self, item):
+        if self._region(item, None, None) is None:
+            return super().__contains__(item)
+        return self.find(item) != -1
+
+
+class IndexedFasta(Mapping):
+    """Read-only dictionary like access to a FASTA file using a faidx index.
+
+    This uses the same index format as ``samtools faidx``, so the sequence
+    records can be fetched in part without loading the whole record. This is
+    intended for large sequences such as chromosomes, where Bio.SeqIO.index
+    would read and parse the entire record just to extract a short region:
+
+    >>> from Bio.SeqIO.FastaIO import IndexedFasta
+    >>> with IndexedFasta("GenBank/NC_005816.fna") as fasta:
+    ...     print(len(fasta))
+    ...     record = fasta["gi|45478711|ref|NC_005816.1|"]
+    ...     print(len(record))
+    ...     print(record.seq[65:75])
+    1
+    9609
+    TCTCCTGATT
+
+    The sequence of each record is only read from the file when (and as far
+    as) it is used, so the file must still be open then. Only the name and
+    sequence are available, the remainder of the title line is not recorded in
+    the index.
+
+    Uncompressed FASTA files are memory mapped, so that several processes
+    using the same (e.g. reference genome) file share the operating system's
+    cached copy, rather than each holding the sequences in memory. Counting
+    and searching for a single letter scans the mapped file in place:
+
+    >>> with IndexedFasta("GenBank/NC_005816.fna") as fasta:
+    ...     seq = fasta["gi|45478711|ref|NC_005816.1|"].seq
+    ...     print(seq.count("G"), seq.find("G", 100), seq.rfind("TTG"))
+    2099 100 9575
+
+    An existing index (e.g. made by samtools) is used if found, by default
+    with the name of the FASTA file plus ".fai". Otherwise the index is built
+    in memory by scanning the file; use build_faidx and write_faidx to save it.
+
+    As with samtools, the FASTA file may be BGZF compressed (e.g. using
+    ``bgzip``), in which case the ".fai" offsets refer to the decompressed
+    data, and the BGZF blocks are located using a ".gzi" index (see the
+    Bio.bgzf module).
+    """
+
+    def __init__(self, filename, fai=None):
+        """Open the FASTA file, and load or build its index.
+
+        Arguments:
+         - filename - path to the FASTA file
+         - fai - optional path to the faidx index, by default filename plus
+           ".fai". If it does not exist, the FASTA file is scanned instead.
+        """
+        handle = _open_for_random_access(filename)
+        mapping = None
+        if isinstance(handle, io.BufferedReader) and isinstance(handle.raw, io.FileIO):
+            # Uncompressed, so memory map the file if possible
+            try:
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError, OverflowError):
+                # e.g. an empty file, or too large for a 32-bit system
+                pass
+        if fai is None:
+            fai = os.fspath(filename) + ".fai"
+        try:
+            if os.path.isfile(fai):
+                entries = read_faidx(fai)
+            else:
+                entries = build_faidx(handle)
+        except Exception:
+            if mapping is not None:
+                mapping.close()
+            handle.close()
+            raise
+        self._entries = {entry.name: entry for entry in entries}
+        self._filename = os.fspath(filename)
+        self._handle = handle
+        self._mapping = mapping
+
+    def __getitem__(self, name):
+        """Return the record with the given name as a SeqRecord object."""
+        entry = self._entries[name]
+        if self._mapping is None:
+            data_class, stream = _FaidxSequenceData, self._handle
+        else:
+            data_class, stream = _MappedFaidxSequenceData, self._mapping
+        data = data_class(
+            stream,
+            entry.offset,
+            entry.length,
+            entry.line_bases,
+            entry.line_width,
+        )
+        return SeqRecord(Seq(data), id=name, name=name)
+
+    def __iter__(self):
+        """Iterate over the record names."""
+        return iter(self._entries)
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self._entries)
+
+    def __repr__(self):
+        """Return a short description of the indexed file."""
+        name = self.__class__.__name__
+        return f"<{name} {self._filename!r} with {len(self)} records>"
+
+    def lengths(self):
+        """Return a dictionary of the sequence lengths, keyed by record name."""
+        return {name: entry.length for name, entry in self._entries.items()}
+
+    def close(self):
+        """Close the FASTA file."""
+        if self._mapping is not None:
+            self._mapping.close()
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 def as_fasta(record):
     """Turn a SeqRecord into a FASTA formatted string."""
     warnings.warn(
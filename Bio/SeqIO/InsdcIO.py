@@ -64,13 +64,18 @@ class GenBankIterator(SequenceIterator):
 
     modes = "t"
 
-    def __init__(self, source):
+    def __init__(self, source, lazy_features=False):
         """Break up a Genbank file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
+        With lazy_features=True, each SeqFeature is only created when it is
+        first used (for example by iterating over or indexing the features
+        list), which is much faster when few or none of the features are
+        needed.
+
         Note that for genomes or chromosomes, there is typically only
         one record.
 
@@ -102,7 +107,9 @@ class GenBankIterator(SequenceIterator):
 
         """
         super().__init__(source, fmt="GenBank")
-        self.records = GenBankScanner(debug=0).parse_records(self.stream)
+        self.records = GenBankScanner(debug=0).parse_records(
+            self.stream, lazy_features=lazy_features
+        )
 
     def __next__(self):
         """Return the next SeqRecord."""
@@ -114,13 +121,16 @@ class EmblIterator(SequenceIterator):
 
     modes = "t"
 
-    def __init__(self, source):
+    def __init__(self, source, lazy_features=False):
         """Break up an EMBL file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
+        With lazy_features=True, each SeqFeature is only created when it is
+        first used, as for the GenBankIterator.
+
         Note that for genomes or chromosomes, there is typically only
         one record.
 
@@ -158,7 +168,9 @@ class EmblIterator(SequenceIterator):
 
         """
         super().__init__(source, fmt="EMBL")
-        self.records = EmblScanner(debug=0).parse_records(self.stream)
+        self.records = EmblScanner(debug=0).parse_records(
+            self.stream, lazy_features=lazy_features
+        )
 
     def __next__(self):
         """Return the next SeqRecord."""
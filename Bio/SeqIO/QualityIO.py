@@ -372,8 +372,20 @@ from collections.abc import Sequence
 from typing import Union
 from collections.abc import Iterable
 import array
+import io
+import itertools
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Install NumPy if you want to use Bio.SeqIO with FASTQ files. "
+        "See http://www.numpy.org/"
+    ) from None
+
 from Bio import BiopythonParserWarning
 from Bio import BiopythonWarning
 from Bio import BiopythonDeprecationWarning
@@ -571,6 +583,40 @@ _solexa_to_sanger_quality_str = {
 }
 
 
+def _quality_table(mapping: Mapping[int, str]) -> tuple[int, Any]:
+    """Turn a quality to letter mapping into a NumPy lookup table (PRIVATE).
+
+    Returns the lowest quality in the mapping, and a uint8 array of the ASCII
+    codes for each quality value starting from it.
+    """
+    low = min(mapping)
+    letters = "".join(mapping[q] for q in range(low, max(mapping) + 1))
+    return low, np.frombuffer(letters.encode("ascii"), np.uint8)
+
+
+def _map_quality_str(
+    qualities: Any, mapping: Mapping[int, str], table: tuple[int, Any]
+) -> str:
+    """Encode quality values using a precomputed mapping (PRIVATE).
+
+    Integer NumPy arrays are encoded in one go using the lookup table from
+    _quality_table, while other sequences are mapped value by value. Raises
+    a KeyError if any value is not in the mapping (e.g. a float, None, or a
+    high value), so that the caller can fall back on the slower code.
+    """
+    if isinstance(qualities, np.ndarray) and qualities.dtype.kind in "iu":
+        low, letters = table
+        indices = qualities.astype(np.intp) - low
+        if len(indices) and (indices.min() < 0 or indices.max() >= len(letters)):
+            raise KeyError("Quality value outside the precomputed mapping")
+        return letters[indices].tobytes().decode("ascii")
+    return "".join(mapping[q] for q in qualities)
+
+
+_phred_to_sanger_quality_table = _quality_table(_phred_to_sanger_quality_str)
+_solexa_to_sanger_quality_table = _quality_table(_solexa_to_sanger_quality_str)
+
+
 def _get_sanger_quality_str(record: SeqRecord) -> str:
     """Return a Sanger FASTQ encoded quality string (PRIVATE).
 
@@ -642,7 +688,9 @@ def _get_sanger_quality_str(record: SeqRecord) -> str:
     else:
         # Try and use the precomputed mapping:
         try:
-            return "".join(_phred_to_sanger_quality_str[qp] for qp in qualities)
+            return _map_quality_str(
+                qualities, _phred_to_sanger_quality_str, _phred_to_sanger_quality_table
+            )
         except KeyError:
             # Could be a float, or a None in the list, or a high value.
             pass
@@ -666,7 +714,9 @@ def _get_sanger_quality_str(record: SeqRecord) -> str:
         ) from None
     # Try and use the precomputed mapping:
     try:
-        return "".join(_solexa_to_sanger_quality_str[qs] for qs in qualities)
+        return _map_quality_str(
+            qualities, _solexa_to_sanger_quality_str, _solexa_to_sanger_quality_table
+        )
     except KeyError:
         # Either no PHRED scores, or something odd like a float or None
         pass
@@ -695,6 +745,8 @@ _solexa_to_illumina_quality_str = {
     qs: chr(int(round(phred_quality_from_solexa(qs))) + SOLEXA_SCORE_OFFSET)
     for qs in range(-5, 62 + 1)
 }
+_phred_to_illumina_quality_table = _quality_table(_phred_to_illumina_quality_str)
+_solexa_to_illumina_quality_table = _quality_table(_solexa_to_illumina_quality_str)
 
 
 def _get_illumina_quality_str(record: SeqRecord) -> str:
@@ -717,7 +769,11 @@ def _get_illumina_quality_str(record: SeqRecord) -> str:
     else:
         # Try and use the precomputed mapping:
         try:
-            return "".join(_phred_to_illumina_quality_str[qp] for qp in qualities)
+            return _map_quality_str(
+                qualities,
+                _phred_to_illumina_quality_str,
+                _phred_to_illumina_quality_table,
+            )
         except KeyError:
             # Could be a float, or a None in the list, or a high value.
             pass
@@ -741,7 +797,11 @@ def _get_illumina_quality_str(record: SeqRecord) -> str:
         ) from None
     # Try and use the precomputed mapping:
     try:
-        return "".join(_solexa_to_illumina_quality_str[qs] for qs in qualities)
+        return _map_quality_str(
+            qualities,
+            _solexa_to_illumina_quality_str,
+            _solexa_to_illumina_quality_table,
+        )
     except KeyError:
         # Either no PHRED scores, or something odd like a float or None
         pass
@@ -770,6 +830,8 @@ _phred_to_solexa_quality_str = {
     qp: chr(min(126, int(round(solexa_quality_from_phred(qp))) + SOLEXA_SCORE_OFFSET))
     for qp in range(62 + 1)
 }
+_solexa_to_solexa_quality_table = _quality_table(_solexa_to_solexa_quality_str)
+_phred_to_solexa_quality_table = _quality_table(_phred_to_solexa_quality_str)
 
 
 def _get_solexa_quality_str(record: SeqRecord) -> str:
@@ -792,7 +854,11 @@ def _get_solexa_quality_str(record: SeqRecord) -> str:
     else:
         # Try and use the precomputed mapping:
         try:
-            return "".join(_solexa_to_solexa_quality_str[qs] for qs in qualities)
+            return _map_quality_str(
+                qualities,
+                _solexa_to_solexa_quality_str,
+                _solexa_to_solexa_quality_table,
+            )
         except KeyError:
             # Could be a float, or a None in the list, or a high value.
             pass
@@ -816,7 +882,9 @@ def _get_solexa_quality_str(record: SeqRecord) -> str:
         ) from None
     # Try and use the precomputed mapping:
     try:
-        return "".join(_phred_to_solexa_quality_str[qp] for qp in qualities)
+        return _map_quality_str(
+            qualities, _phred_to_solexa_quality_str, _phred_to_solexa_quality_table
+        )
     except KeyError:
         # Either no PHRED scores, or something odd like a float or None
         # or too big to be in the cache
@@ -1017,17 +1085,23 @@ class FastqIteratorAbstractBaseClass(SequenceIterator[str]):
         """Key name (string) of the quality values in record.letter_annotations."""
         pass
 
-    def __init__(self, source):
+    # NumPy data type used for the qualities if as_array=True
+    q_dtype: Any = np.uint8
+
+    def __init__(self, source, as_array=False):
         """Iterate over FASTQ records as SeqRecord objects.
 
         Arguments:
          - source - input stream opened in text mode, or a path to a file
+         - as_array - if True, store the qualities as a NumPy array of type
+           `q_dtype` instead of a list of integers.
 
         The quality values are stored in the `letter_annotations` dictionary
         attribute under the key `q_key`.
         """
         super().__init__(source, fmt="Fastq")
         self.line = None
+        self.as_array = as_array
 
     def __next__(self) -> SeqRecord:
         """Parse the file and generate SeqRecord objects."""
@@ -1116,8 +1190,12 @@ class FastqIteratorAbstractBaseClass(SequenceIterator[str]):
             details = "not in correct range (are you sure you're using the right QualityIO parser?)"
             raise InvalidCharError(quality_string, invalid_index, details)
 
-        # Pass through (standard library) array to handle negative scores from old quality formats
-        qualities = array.array("b", byte_scores).tolist()
+        if self.as_array:
+            # Using a bytearray gives a writable array, at one byte per letter
+            qualities = np.frombuffer(bytearray(byte_scores), self.q_dtype)
+        else:
+            # Pass through (standard library) array to handle negative scores from old quality formats
+            qualities = array.array("b", byte_scores).tolist()
 
         # SeqRecord._from_validated avoids length/type checking
         # .encode isn't strictly necessary (Seq init can handle a string), but it is faster to pre-encode
@@ -1155,12 +1233,15 @@ class FastqPhredIterator(FastqIteratorAbstractBaseClass):
         self,
         source: _TextIOSource,
         alphabet: None = None,
+        as_array: bool = False,
     ):
         """Iterate over FASTQ records as SeqRecord objects.
 
         Arguments:
          - source - input stream opened in text mode, or a path to a file
          - alphabet - optional alphabet, no longer used. Leave as None.
+         - as_array - store the qualities as NumPy arrays rather than lists
+           (uint8 for PHRED scores, int8 for Solexa scores).
 
         For each sequence in a (Sanger style) FASTQ file there is a matching string
         encoding the PHRED qualities (integers between 0 and about 90) using ASCII
@@ -1211,6 +1292,25 @@ class FastqPhredIterator(FastqIteratorAbstractBaseClass):
         >>> print(record.letter_annotations["phred_quality"])
         [26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 24, 26, 22, 26, 26, 13, 22, 26, 18, 24, 18, 18, 18, 18]
 
+        For large files, a list of Python integers takes a lot of memory. Use
+        as_array=True to store the qualities as NumPy uint8 arrays instead:
+
+        >>> with open("Quality/example.fastq") as handle:
+        ...     records = list(FastqPhredIterator(handle, as_array=True))
+        >>> records[-1].letter_annotations["phred_quality"]
+        array([26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 24, 26, 22, 26, 26, 13,
+               22, 26, 18, 24, 18, 18, 18, 18], dtype=uint8)
+
+        These arrays are sliced along with the record, and are used directly
+        when writing the record out again:
+
+        >>> print(records[-1][5:15].format("fastq"))
+        @EAS54_6_R1_2_1_443_348
+        TTCTGGCGTG
+        +
+        ;;;;;;9;7;
+        <BLANKLINE>
+
         To modify the records returned by the parser, you can use a generator
         function. For example, to store the mean PHRED quality in the record
         description, use
@@ -1232,7 +1332,7 @@ class FastqPhredIterator(FastqIteratorAbstractBaseClass):
         """
         if alphabet is not None:
             raise ValueError("The alphabet argument is no longer supported")
-        super().__init__(source)
+        super().__init__(source, as_array=as_array)
 
 
 class FastqSolexaIterator(FastqIteratorAbstractBaseClass):
@@ -1253,16 +1353,21 @@ class FastqSolexaIterator(FastqIteratorAbstractBaseClass):
 
     q_key = "solexa_quality"
 
+    q_dtype = np.int8
+
     def __init__(
         self,
         source: _TextIOSource,
         alphabet: None = None,
+        as_array: bool = False,
     ):
         r"""Iterate over FASTQ records as SeqRecord objects.
 
         Arguments:
          - source - input stream opened in text mode, or a path to a file
          - alphabet - optional alphabet, no longer used. Leave as None.
+         - as_array - store the qualities as NumPy arrays rather than lists
+           (uint8 for PHRED scores, int8 for Solexa scores).
 
         For each sequence in Solexa/Illumina FASTQ files there is a matching
         string encoding the Solexa integer qualities using ASCII values with an
@@ -1397,7 +1502,7 @@ class FastqSolexaIterator(FastqIteratorAbstractBaseClass):
         """
         if alphabet is not None:
             raise ValueError("The alphabet argument is no longer supported")
-        super().__init__(source)
+        super().__init__(source, as_array=as_array)
 
 
 class FastqIlluminaIterator(FastqIteratorAbstractBaseClass):
@@ -1421,12 +1526,15 @@ class FastqIlluminaIterator(FastqIteratorAbstractBaseClass):
         self,
         source: _TextIOSource,
         alphabet: None = None,
+        as_array: bool = False,
     ):
         """Iterate over FASTQ records as SeqRecord objects.
 
         Arguments:
          - source - input stream opened in text mode, or a path to a file
          - alphabet - optional alphabet, no longer used. Leave as None.
+         - as_array - store the qualities as NumPy arrays rather than lists
+           (uint8 for PHRED scores, int8 for Solexa scores).
 
         For each sequence in Illumina 1.3+ FASTQ files there is a matching
         string encoding PHRED integer qualities using ASCII values with an
@@ -1457,7 +1565,445 @@ class FastqIlluminaIterator(FastqIteratorAbstractBaseClass):
         """
         if alphabet is not None:
             raise ValueError("The alphabet argument is no longer supported")
-        super().__init__(source)
+        super().__init__(source, as_array=as_array)
+
+
+class FastqBatch:
+    """A batch of FASTQ reads held in contiguous NumPy arrays.
+
+    Rather than one Python object per read, all the reads in a batch share a
+    handful of flat arrays:
+
+     - titles        - uint8 array with the concatenated title lines (without
+                       the leading "@")
+     - title_offsets - int64 array of length n + 1, title i is held in
+                       titles[title_offsets[i]:title_offsets[i + 1]]
+     - sequences     - uint8 array with the concatenated sequences (as ASCII)
+     - offsets       - int64 array of length n + 1, the sequence of read i is
+                       held in sequences[offsets[i]:offsets[i + 1]]
+     - qualities     - uint8 array of PHRED qualities, using the same offsets
+                       as the sequences
+
+    Python objects for an individual read are only created on request, either
+    by indexing the batch with an integer (giving a SeqRecord) or by iterating
+    over it. Slicing a batch gives another FastqBatch.
+
+    >>> with open("Quality/example.fastq", "rb") as handle:
+    ...     batch = next(FastqBatchIterator(handle))
+    >>> len(batch)
+    3
+    >>> batch.offsets
+    array([ 0, 25, 50, 75])
+    >>> batch.qualities[:5]
+    array([26, 26, 18, 26, 26], dtype=uint8)
+    >>> print(batch[2].id, batch[2].seq)
+    EAS54_6_R1_2_1_443_348 GTTGCTTCTGGCGTGGGTGGGGGGG
+    """
+
+    def __init__(self, titles, title_offsets, sequences, offsets, qualities):
+        """Create a FastqBatch from its arrays (see the class docstring)."""
+        self.titles = titles
+        self.title_offsets = title_offsets
+        self.sequences = sequences
+        self.offsets = offsets
+        self.qualities = qualities
+
+    def __len__(self) -> int:
+        """Return the number of reads in the batch."""
+        return len(self.offsets) - 1
+
+    def __repr__(self) -> str:
+        """Return a concise summary of the batch."""
+        return f"<{self.__class__.__name__} with {len(self)} reads>"
+
+    @property
+    def lengths(self):
+        """Read lengths as an integer array."""
+        return np.diff(self.offsets)
+
+    def title(self, index: int) -> str:
+        """Return the title line of read number index as a string."""
+        start, end = self.title_offsets[index], self.title_offsets[index + 1]
+        return self.titles[start:end].tobytes().decode()
+
+    def sequence(self, index: int) -> bytes:
+        """Return the sequence of read number index as bytes."""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.sequences[start:end].tobytes()
+
+    def quality(self, index: int):
+        """Return the PHRED qualities of read number index as a uint8 array view."""
+        return self.qualities[self.offsets[index] : self.offsets[index + 1]]
+
+    def __getitem__(self, index):
+        """Return a read as a SeqRecord, or a slice of reads as a FastqBatch."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("FastqBatch only supports slices with step 1")
+            stop = max(start, stop)
+            offsets = self.offsets[start : stop + 1]
+            title_offsets = self.title_offsets[start : stop + 1]
+            return FastqBatch(
+                self.titles[title_offsets[0] : title_offsets[-1]],
+                title_offsets - title_offsets[0],
+                self.sequences[offsets[0] : offsets[-1]],
+                offsets - offsets[0],
+                self.qualities[offsets[0] : offsets[-1]],
+            )
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("read index out of range")
+        descr = self.title(index)
+        id = descr.split()[0]
+        return SeqRecord._from_validated(
+            Seq(self.sequence(index)),
+            id=id,
+            name=id,
+            description=descr,
+            letter_annotations={"phred_quality": self.quality(index).tolist()},
+        )
+
+    def __iter__(self) -> Iterator[SeqRecord]:
+        """Iterate over the reads in the batch as SeqRecord objects."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def tuples(
+        self, offset: int = SANGER_SCORE_OFFSET
+    ) -> Iterator[tuple[str, str, str]]:
+        """Iterate over the reads as (title, sequence, quality) string tuples.
+
+        This gives the same tuples as FastqGeneralIterator, with the quality
+        string re-encoded using the given ASCII offset (default 33).
+        """
+        encoded = (self.qualities + offset).tobytes()
+        for index in range(len(self)):
+            start, end = self.offsets[index], self.offsets[index + 1]
+            yield (
+                self.title(index),
+                self.sequences[start:end].tobytes().decode(),
+                encoded[start:end].decode(),
+            )
+
+    @classmethod
+    def _concatenate(cls, batches):
+        """Combine a list of FastqBatch objects into one (PRIVATE)."""
+        if len(batches) == 1:
+            return batches[0]
+        offsets = [np.zeros(1, np.int64)]
+        title_offsets = [np.zeros(1, np.int64)]
+        total = title_total = 0
+        for batch in batches:
+            offsets.append(batch.offsets[1:] + total)
+            title_offsets.append(batch.title_offsets[1:] + title_total)
+            total += batch.offsets[-1]
+            title_total += batch.title_offsets[-1]
+        return cls(
+            np.concatenate([batch.titles for batch in batches]),
+            np.concatenate(title_offsets),
+            np.concatenate([batch.sequences for batch in batches]),
+            np.concatenate(offsets),
+            np.concatenate([batch.qualities for batch in batches]),
+        )
+
+
+def _offsets_from_lengths(lengths):
+    """Return an int64 offsets array of length n + 1 from n lengths (PRIVATE)."""
+    offsets = np.zeros(len(lengths) + 1, np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _encode_fastq_batch(titles, title_offsets, sequences, offsets, letters, offset):
+    """Validate the raw arrays and convert quality letters to scores (PRIVATE)."""
+    # Note that ASCII characters 0-32 and 127 are not printable
+    bad = (sequences <= 32) | (sequences >= 127)
+    if bad.any():
+        raise ValueError("Whitespace is not allowed in the sequence.")
+    bad = (letters < offset) | (letters > min(126, offset + 93))
+    if bad.any():
+        position = int(np.argmax(bad))
+        index = int(np.searchsorted(offsets, position, side="right")) - 1
+        start, end = offsets[index], offsets[index + 1]
+        quality_string = letters[start:end].tobytes().decode("latin-1")
+        position -= start
+        if letters[start + position] > 127:
+            details = "is not an ASCII character"
+        else:
+            details = "not in correct range (are you sure you're using the right QualityIO parser?)"
+        raise InvalidCharError(quality_string, position, details)
+    qualities = letters - np.uint8(offset)
+    return FastqBatch(titles, title_offsets, sequences, offsets, qualities)
+
+
+# The ASCII white space characters removed by bytes.rstrip
+_whitespace = np.zeros(256, bool)
+_whitespace[list(b" \t\n\r\x0b\x0c")] = True
+
+
+def _parse_fastq_block(data, offset):
+    """Parse FASTQ records with one line each for sequence and quality (PRIVATE).
+
+    The uint8 array data must hold complete records, and end with a newline.
+    Returns a FastqBatch, or None if the data does not follow the simple four
+    line layout (e.g. if the sequences or qualities are line wrapped) so that
+    the caller can fall back on a line based parser.
+    """
+    ends = np.flatnonzero(data == 10)
+    if len(ends) % 4:
+        return None
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    # Remove trailing white space from each line as FastqGeneralIterator does,
+    # usually just the "\r" of Windows style \r\n line endings:
+    stops = ends.copy()
+    while True:
+        trailing = stops > starts
+        trailing[trailing] = _whitespace[data[stops[trailing] - 1]]
+        if not trailing.any():
+            break
+        stops -= trailing
+    starts = starts.reshape(-1, 4)
+    stops = stops.reshape(-1, 4)
+    if not (data[starts[:, 0]] == 64).all():  # "@"
+        return None
+    if not (data[starts[:, 2]] == 43).all():  # "+"
+        return None
+    lengths = stops[:, 1] - starts[:, 1]
+    if not np.array_equal(lengths, stops[:, 3] - starts[:, 3]):
+        return None
+    title_starts = starts[:, 0] + 1
+    # The title on the "+" line is optional, but if present must match:
+    plus_lengths = stops[:, 2] - starts[:, 2] - 1
+    for index in np.flatnonzero(plus_lengths):
+        title = data[title_starts[index] : stops[index, 0]]
+        second_title = data[starts[index, 2] + 1 : stops[index, 2]]
+        if not np.array_equal(title, second_title):
+            raise ValueError("Sequence and quality captions differ.")
+    # Label each byte with the line it belongs to within its record (0 for
+    # the title, 1 for the sequence, 2 for the "+" line, 3 for the quality),
+    # using 4 for the "@", any trailing white space, and the newline
+    # characters. Then a boolean mask extracts all the sequences (or
+    # qualities) in one go.
+    runs = np.empty((len(ends), 2), np.int64)
+    runs[:, 0] = stops.ravel() - starts.ravel()
+    runs[:, 1] = ends + 1 - stops.ravel()
+    kinds = np.tile(np.array([0, 4, 1, 4, 2, 4, 3, 4], np.uint8), len(starts))
+    kinds = np.repeat(kinds, runs.ravel())
+    kinds[starts[:, 0]] = 4
+    titles = data[kinds == 0]
+    title_offsets = _offsets_from_lengths(stops[:, 0] - title_starts)
+    sequences = data[kinds == 1]
+    letters = data[kinds == 3]
+    offsets = _offsets_from_lengths(lengths)
+    return _encode_fastq_batch(
+        titles, title_offsets, sequences, offsets, letters, offset
+    )
+
+
+def _fastq_batch_from_tuples(records, offset):
+    """Build a FastqBatch from a list of (title, seq, qual) bytes tuples (PRIVATE)."""
+    arrays = []
+    for values in zip(*records):
+        lengths = np.fromiter((len(value) for value in values), np.int64, len(values))
+        offsets = _offsets_from_lengths(lengths)
+        arrays.append((np.frombuffer(b"".join(values), np.uint8), offsets))
+    (titles, title_offsets), (sequences, offsets), (letters, _) = arrays
+    return _encode_fastq_batch(
+        titles, title_offsets, sequences, offsets, letters, offset
+    )
+
+
+def _fastq_batch_from_columns(records):
+    """Build a FastqBatch from (title, seq, PHRED qualities) bytes tuples (PRIVATE).
+
+    Unlike _fastq_batch_from_tuples, the qualities are the scores themselves
+    (not encoded as letters), and nothing is validated.
+    """
+    arrays = []
+    for values in zip(*records):
+        lengths = np.fromiter(map(len, values), np.int64, len(values))
+        offsets = _offsets_from_lengths(lengths)
+        arrays.append((np.frombuffer(b"".join(values), np.uint8), offsets))
+    (titles, title_offsets), (sequences, offsets), (qualities, _) = arrays
+    return FastqBatch(titles, title_offsets, sequences, offsets, qualities)
+
+
+def _fastq_bytes_tuples(lines, continuing=False):
+    """Iterate over FASTQ lines as (title, seq, qual) bytes tuples (PRIVATE).
+
+    This follows the same rules as FastqGeneralIterator, including support for
+    line wrapped sequences and qualities, but works on lines of bytes. Use
+    continuing=True if the lines follow on from complete records, in which
+    case any leading blank lines are ignored (as FastqGeneralIterator would
+    have treated them as empty lines of quality data for the previous record).
+    """
+    try:
+        line = next(lines)
+        while continuing and not line.rstrip():
+            line = next(lines)
+    except StopIteration:
+        return
+    while True:
+        if line[:1] != b"@":
+            raise ValueError("Records in Fastq files should start with '@' character")
+        title_line = line[1:].rstrip()
+        seq_string = b""
+        for line in lines:
+            if line[:1] == b"+":
+                break
+            seq_string += line.rstrip()
+        else:
+            if seq_string:
+                raise ValueError("End of file without quality information.")
+            else:
+                raise ValueError("Unexpected end of file")
+        second_title = line[1:].rstrip()
+        if second_title and second_title != title_line:
+            raise ValueError("Sequence and quality captions differ.")
+        seq_len = len(seq_string)
+        line = None
+        quality_string = b""
+        for line in lines:
+            if line[:1] == b"@" and len(quality_string) >= seq_len:
+                break
+            quality_string += line.rstrip()
+        else:
+            if line is None:
+                raise ValueError("Unexpected end of file")
+            line = None
+        if seq_len != len(quality_string):
+            raise ValueError(
+                "Lengths of sequence and quality values differs for %s (%i and %i)."
+                % (title_line.decode(), seq_len, len(quality_string))
+            )
+        yield (title_line, seq_string, quality_string)
+        if line is None:
+            break
+
+
+def FastqBatchIterator(
+    source,
+    batch_size: int = 65536,
+    offset: int = SANGER_SCORE_OFFSET,
+    chunk_size: int = 4194304,
+) -> Iterator[FastqBatch]:
+    """Iterate over FASTQ reads in batches held as NumPy arrays.
+
+    Arguments:
+     - source - input stream opened in binary mode, or a path to a file
+     - batch_size - number of reads in each batch (the final batch may be
+       smaller)
+     - offset - ASCII offset of the quality scores, 33 (the default) for
+       Sanger style FASTQ files or 64 for Illumina 1.3 to 1.7 files. Old
+       Solexa files using Solexa scores are not supported.
+     - chunk_size - number of bytes to read from the file at a time
+
+    Unlike FastqGeneralIterator and the SeqRecord based FASTQ parsers which
+    create Python objects for every read, this function reads the file in
+    large chunks and parses these using vectorized NumPy operations, giving
+    FastqBatch objects. These hold the reads in a few contiguous arrays (the
+    concatenated sequences, their offsets, and the PHRED qualities as uint8),
+    which can be passed directly to NumPy based quality control code:
+
+    >>> import numpy as np
+    >>> for batch in FastqBatchIterator("Quality/example.fastq", batch_size=2):
+    ...     totals = np.add.reduceat(batch.qualities, batch.offsets[:-1], dtype=int)
+    ...     print(len(batch), batch.lengths, totals)
+    2 [25 25] [632 613]
+    1 [25] [585]
+
+    Files using the common layout of four lines per read are parsed fastest;
+    line wrapped sequences and qualities are supported by falling back on a
+    slower line based parser:
+
+    >>> for batch in FastqBatchIterator("Quality/tricky.fastq"):
+    ...     for title, seq, qual in batch.tuples():
+    ...         print(title)
+    ...         print(seq, qual)
+    071113_EAS56_0053:1:1:998:236
+    TTTCTTGCCCCCATAGACTGAGACCTTCCCTAAATA IIIIIIIIIIIIIIIIIIIIIIIIIIIIICII+III
+    071113_EAS56_0053:1:1:182:712
+    ACCCAGCTAATTTTTGTATTTTTGTTAGAGACAGTG @IIIIIIIIIIIIIIICDIIIII<%<6&-*).(*%+
+    071113_EAS56_0053:1:1:153:10
+    TGTTCTGAAGGAAGGTGTGCGTGCGTGTGTGTGTGT IIIIIIIIIIIICIIGIIIII>IAIIIE65I=II:6
+    071113_EAS56_0053:1:3:990:501
+    TGGGAGGTTTTATGTGGAAAGCAGCAATGTACAAGA IIIIIII.IIIIII1@44@-7.%<&+/$/%4(++(%
+
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    with as_handle(source, "rb") as handle:
+        if handle.read(0) != b"":
+            raise StreamModeError(
+                "FastqBatchIterator requires a file opened in binary mode"
+            ) from None
+        pending: list[FastqBatch] = []
+        count = 0
+        for piece in _fastq_batch_pieces(handle, offset, chunk_size, batch_size):
+            pending.append(piece)
+            count += len(piece)
+            if count >= batch_size:
+                batch = FastqBatch._concatenate(pending)
+                full = count - count % batch_size
+                for start in range(0, full, batch_size):
+                    yield batch[start : start + batch_size]
+                count -= full
+                pending = [batch[full:]] if count else []
+        if count:
+            yield FastqBatch._concatenate(pending)
+
+
+def _fastq_batch_pieces(handle, offset, chunk_size, batch_size):
+    """Parse a binary FASTQ handle chunk by chunk into FastqBatch objects (PRIVATE).
+
+    The pieces returned have arbitrary sizes, FastqBatchIterator combines and
+    splits them to give batches of the requested size.
+    """
+    buffer = b""
+    continuing = False
+    while True:
+        chunk = handle.read(chunk_size)
+        buffer += chunk
+        if chunk:
+            data = np.frombuffer(buffer, np.uint8)
+            ends = np.flatnonzero(data == 10)
+            n = len(ends) - len(ends) % 4
+            if n == 0:
+                continue
+            end = ends[n - 1] + 1
+            data = data[:end]
+            buffer = buffer[end:]
+        elif buffer:
+            if not buffer.endswith(b"\n"):
+                buffer += b"\n"
+            data = np.frombuffer(buffer, np.uint8)
+            buffer = b""
+        else:
+            return
+        batch = _parse_fastq_block(data, offset)
+        if batch is None:
+            break
+        continuing = True
+        yield batch
+    # These are not simple four line records, use the slower line based parser
+    # on everything left in the file:
+    remaining = data.tobytes() + buffer
+    if not remaining.endswith(b"\n"):
+        remaining += handle.readline()
+    lines = itertools.chain(io.BytesIO(remaining), handle)
+    records = []
+    for record in _fastq_bytes_tuples(lines, continuing):
+        records.append(record)
+        if len(records) == batch_size:
+            yield _fastq_batch_from_tuples(records, offset)
+            records = []
+    if records:
+        yield _fastq_batch_from_tuples(records, offset)
 
 
 class QualPhredIterator(SequenceIterator):
@@ -1469,6 +2015,7 @@ class QualPhredIterator(SequenceIterator):
         self,
         source: _TextIOSource,
         alphabet: None = None,
+        as_array: bool = False,
     ) -> None:
         """For QUAL files which include PHRED quality scores, but no sequence.
 
@@ -1522,10 +2069,19 @@ class QualPhredIterator(SequenceIterator):
         As of Biopython 1.59, this parser will accept files with negatives quality
         scores but will replace them with the lowest possible PHRED score of zero.
         This will trigger a warning, previously it raised a ValueError exception.
+
+        To reduce memory usage, use as_array=True to store the qualities as
+        NumPy uint8 arrays (one byte per score) instead of lists of integers:
+
+        >>> with open("Quality/example.qual") as handle:
+        ...     record = next(QualPhredIterator(handle, as_array=True))
+        >>> record.letter_annotations["phred_quality"][:5]
+        array([26, 26, 18, 26, 26], dtype=uint8)
         """
         if alphabet is not None:
             raise ValueError("The alphabet argument is no longer supported")
         super().__init__(source, fmt="QUAL")
+        self.as_array = as_array
         # Skip any text before the first record (e.g. blank lines, comments)
         for line in self.stream:
             if line[0] == ">":
@@ -1561,6 +2117,8 @@ class QualPhredIterator(SequenceIterator):
                     BiopythonParserWarning,
                 )
                 qualities = [max(0, q) for q in qualities]
+            if self.as_array:
+                qualities = np.array(qualities, np.uint8)  # type: ignore
 
             # Return the record and then continue...
             sequence = Seq(None, length=len(qualities))
@@ -1579,6 +2137,79 @@ class QualPhredIterator(SequenceIterator):
 assert SANGER_SCORE_OFFSET == ord("!")
 
 
+def _phred_quality_bytes(qualities: Any) -> Optional[bytes]:
+    """Return integer PHRED qualities as bytes, or None if not possible (PRIVATE).
+
+    This accepts a list or tuple of integers, or an integer NumPy array, with
+    values from 0 to 255. Anything else (e.g. floats or None) gives None, so
+    that the caller can fall back on the slower code.
+    """
+    if isinstance(qualities, np.ndarray):
+        if qualities.dtype == np.uint8:
+            return qualities.tobytes()
+        if qualities.dtype.kind in "iu" and (
+            len(qualities) == 0 or (qualities.min() >= 0 and qualities.max() <= 255)
+        ):
+            return qualities.astype(np.uint8).tobytes()
+    elif isinstance(qualities, (list, tuple)):
+        try:
+            return bytes(qualities)
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+# Maps the Sanger FASTQ letters back to the PHRED qualities
+_sanger_to_phred_bytes = bytes((i - SANGER_SCORE_OFFSET) % 256 for i in range(256))
+
+
+def _format_fastq_batch(batch: FastqBatch) -> bytes:
+    r"""Return the reads of a FastqBatch in Sanger FASTQ format (PRIVATE).
+
+    The reads are laid out in a single buffer, which starts out filled with
+    newlines. As in _parse_fastq_block, each byte is labelled with the part
+    of its read it belongs to, and the titles, sequences, and quality letters
+    are then each copied into their positions in one step. Any PHRED
+    qualities above 93 are truncated, with a warning.
+
+    >>> with open("Quality/example.fastq", "rb") as handle:
+    ...     batch = next(FastqBatchIterator(handle))
+    >>> data = _format_fastq_batch(batch[:1])
+    >>> print(data.decode(), end="")
+    @EAS54_6_R1_2_1_413_324
+    CCCTTCTTGTCTTCAGCGTTTCTCC
+    +
+    ;;3;;;;;;;;;;;;7;;;;;;;88
+    """
+    count = len(batch)
+    if count == 0:
+        return b""
+    # Each read is written as nine runs of bytes: "@", the title, "\n", the
+    # sequence, "\n", "+", "\n", the quality letters, and "\n". Label these
+    # as 4 for "@", 1 for the title, 2 for the sequence, 5 for "+", 3 for the
+    # quality, and 0 for the newlines:
+    lengths = np.diff(batch.offsets)
+    runs = np.ones((count, 9), np.int64)
+    runs[:, 1] = np.diff(batch.title_offsets)
+    runs[:, 3] = lengths
+    runs[:, 7] = lengths
+    kinds = np.tile(np.array([4, 1, 0, 2, 0, 5, 0, 3, 0], np.uint8), count)
+    kinds = np.repeat(kinds, runs.ravel())
+    buffer = np.full(len(kinds), 10, np.uint8)  # "\n"
+    buffer[kinds == 4] = 64  # "@"
+    buffer[kinds == 5] = 43  # "+"
+    buffer[kinds == 1] = batch.titles[: batch.title_offsets[-1]]
+    buffer[kinds == 2] = batch.sequences[: batch.offsets[-1]]
+    qualities = batch.qualities[: batch.offsets[-1]]
+    if len(qualities) and qualities.max() > 93:
+        warnings.warn(
+            "Data loss - max PHRED quality 93 in Sanger FASTQ", BiopythonWarning
+        )
+        qualities = np.minimum(qualities, 93)
+    buffer[kinds == 3] = qualities + np.uint8(SANGER_SCORE_OFFSET)
+    return buffer.tobytes()
+
+
 class FastqPhredWriter(SequenceWriter):
     """Class to write standard FASTQ format files (using PHRED quality scores).
 
@@ -1627,6 +2258,21 @@ class FastqPhredWriter(SequenceWriter):
 
     modes = "t"
 
+    # Number of sequence letters to collect before formatting and writing them
+    _block_size = 4194304
+
+    @staticmethod
+    def _title(record: SeqRecord) -> str:
+        """Return the title line of the record, without the "@" (PRIVATE)."""
+        id_ = _clean(record.id) if record.id else ""
+        description = _clean(record.description)
+        if description and description.split(None, 1)[0] == id_:
+            return description
+        elif description:
+            return f"{id_} {description}"
+        else:
+            return id_
+
     @classmethod
     def to_string(cls, record):
         """Turn a SeqRecord into a Sanger FASTQ formatted string, and return it."""
@@ -1638,20 +2284,160 @@ class FastqPhredWriter(SequenceWriter):
                 "Record %s has sequence length %i but %i quality scores"
                 % (record.id, len(seq_str), len(qualities_str))
             )
-        id_ = _clean(record.id) if record.id else ""
-        description = _clean(record.description)
-        if description and description.split(None, 1)[0] == id_:
-            title = description
-        elif description:
-            title = f"{id_} {description}"
-        else:
-            title = id_
+        title = cls._title(record)
         return f"@{title}\n{seq_str}\n+\n{qualities_str}\n"
 
     def write_record(self, record: SeqRecord) -> None:
         """Write a single FASTQ record to the file."""
         self.handle.write(self.to_string(record))
 
+    def _is_bulk_writer(self) -> bool:
+        """Check the records are formatted as by this class (PRIVATE)."""
+        cls = type(self)
+        return (
+            cls.write_record is FastqPhredWriter.write_record
+            and cls.to_string.__func__ is FastqPhredWriter.to_string.__func__
+        )
+
+    def write_records(self, records: Iterable[SeqRecord]) -> int:
+        """Write records to the output file, and return the number of records.
+
+        records - A list or iterator returning SeqRecord objects
+
+        Rather than formatting each record as a string, the records are
+        collected in blocks of about 4 MB of sequence, which are formatted
+        together using NumPy and written out with a single call each. Integer
+        PHRED qualities are converted to letters for the whole block at once.
+        """
+        if not self._is_bulk_writer():
+            # A subclass writing each record in its own way
+            return super().write_records(records)
+
+        def entries():
+            for record in records:
+                seq_str = _get_seq_string(record)
+                qualities = _phred_quality_bytes(
+                    record.letter_annotations.get("phred_quality")
+                )
+                if qualities is None:
+                    # e.g. float or Solexa scores, converted record by record
+                    qualities = _get_sanger_quality_str(record).encode("ascii")
+                    qualities = qualities.translate(_sanger_to_phred_bytes)
+                if len(qualities) != len(seq_str):
+                    raise ValueError(
+                        "Record %s has sequence length %i but %i quality scores"
+                        % (record.id, len(seq_str), len(qualities))
+                    )
+                yield self._title(record).encode(), seq_str.encode("ascii"), qualities
+
+        return self._write_blocks(entries())
+
+    def write_columns(
+        self,
+        titles: Iterable[str],
+        sequences: Iterable[bytes],
+        qualities: Iterable[Any],
+    ) -> int:
+        """Write reads given as columns, and return the number of reads.
+
+        Arguments:
+         - titles - iterable of title lines as strings, without the "@"
+         - sequences - iterable of the sequences as bytes
+         - qualities - iterable of the PHRED qualities of each read, as
+           integer NumPy arrays (ideally uint8) or lists of integers
+
+        This avoids creating SeqRecord objects for reads held in other ways,
+        for example after trimming them with NumPy. Any newlines in the titles
+        are replaced by spaces:
+
+        >>> import sys
+        >>> import numpy as np
+        >>> writer = FastqPhredWriter(sys.stdout)
+        >>> writer.write_columns(
+        ...     ["read1", "read2 sample A"],
+        ...     [b"ACGT", b"TTG"],
+        ...     [np.array([40, 40, 30, 20], np.uint8), [0, 10, 93]],
+        ... )
+        @read1
+        ACGT
+        +
+        II?5
+        @read2 sample A
+        TTG
+        +
+        !+~
+        2
+        """
+        if not self._is_bulk_writer():
+            raise TypeError(
+                f"{type(self).__name__} writes each record in its own way, "
+                "use write_records instead"
+            )
+
+        def entries():
+            for title, seq, scores in zip(titles, sequences, qualities):
+                quality_bytes = _phred_quality_bytes(scores)
+                if quality_bytes is None:
+                    raise ValueError(
+                        f"Read {title} does not have integer PHRED qualities "
+                        "from 0 to 255"
+                    )
+                if len(quality_bytes) != len(seq):
+                    raise ValueError(
+                        "Record %s has sequence length %i but %i quality scores"
+                        % (title, len(seq), len(quality_bytes))
+                    )
+                yield _clean(title).encode(), seq, quality_bytes
+
+        return self._write_blocks(entries())
+
+    def write_batch(self, batch: FastqBatch) -> int:
+        """Write the reads of a FastqBatch, and return the number of reads.
+
+        The whole batch is formatted using NumPy, and written out in one go:
+
+        >>> import sys
+        >>> with open("Quality/example.fastq", "rb") as handle:
+        ...     batch = next(FastqBatchIterator(handle))
+        >>> FastqPhredWriter(sys.stdout).write_batch(batch[1:])
+        @EAS54_6_R1_2_1_540_792
+        TTGGCAGGCCAAGGCCGATGGATCA
+        +
+        ;;;;;;;;;;;7;;;;;-;;;3;83
+        @EAS54_6_R1_2_1_443_348
+        GTTGCTTCTGGCGTGGGTGGGGGGG
+        +
+        ;;;;;;;;;;;9;7;;.7;393333
+        2
+        """
+        if not self._is_bulk_writer():
+            raise TypeError(
+                f"{type(self).__name__} writes each record in its own way, "
+                "use write_records instead"
+            )
+        self.handle.write(_format_fastq_batch(batch).decode())
+        return len(batch)
+
+    def _write_blocks(self, entries: Iterator[tuple[bytes, bytes, bytes]]) -> int:
+        """Write (title, sequence, qualities) bytes in blocks (PRIVATE).
+
+        Returns the number of reads written.
+        """
+        count = 0
+        block: list[tuple[bytes, bytes, bytes]] = []
+        size = 0
+        for entry in entries:
+            block.append(entry)
+            size += len(entry[1])
+            count += 1
+            if size >= self._block_size:
+                self.write_batch(_fastq_batch_from_columns(block))
+                block = []
+                size = 0
+        if block:
+            self.write_batch(_fastq_batch_from_columns(block))
+        return count
+
 
 def as_fastq(record: SeqRecord) -> str:
     """Turn a SeqRecord into a Sanger FASTQ formatted string, and return it."""
@@ -1746,9 +2532,12 @@ class QualPhredWriter(SequenceWriter):
 
         qualities = _get_phred_quality(record)
         try:
-            # This rounds to the nearest integer.
-            # TODO - can we record a float in a qual file?
-            qualities_strs = [("%i" % round(q, 0)) for q in qualities]
+            if isinstance(qualities, np.ndarray) and qualities.dtype.kind in "iu":
+                qualities_strs = [str(q) for q in qualities.tolist()]
+            else:
+                # This rounds to the nearest integer.
+                # TODO - can we record a float in a qual file?
+                qualities_strs = [("%i" % round(q, 0)) for q in qualities]
         except TypeError:
             if None in qualities:
                 raise TypeError("A quality value of None was found") from None
@@ -1784,9 +2573,12 @@ class QualPhredWriter(SequenceWriter):
 
         qualities = _get_phred_quality(record)
         try:
-            # This rounds to the nearest integer.
-            # TODO - can we record a float in a qual file?
-            qualities_strs = [("%i" % round(q, 0)) for q in qualities]
+            if isinstance(qualities, np.ndarray) and qualities.dtype.kind in "iu":
+                qualities_strs = [str(q) for q in qualities.tolist()]
+            else:
+                # This rounds to the nearest integer.
+                # TODO - can we record a float in a qual file?
+                qualities_strs = [("%i" % round(q, 0)) for q in qualities]
         except TypeError:
             if None in qualities:
                 raise TypeError("A quality value of None was found") from None
@@ -18,7 +18,10 @@ sequence region. Note that the full sequence of a record is loaded only if
 specifically requested, making the parser memory-efficient.
 
 The TwoBitIterator object implements the __getitem__, keys, and __len__
-methods that allow it to be used as a dictionary.
+methods that allow it to be used as a dictionary. With packed=True, it instead
+loads each sequence into memory still packed to two bits per base (as
+_PackedSequenceData objects), which can also be used for other nucleotide
+sequences via the pack function.
 """
 
 # The .2bit file format is defined by UCSC as follows
@@ -72,6 +75,11 @@ methods that allow it to be used as a dictionary.
 #             T - 00, C - 01, A - 10, G - 11. The first base is in the most
 #             significant 2-bit byte; the last base is in the least significant
 #             2 bits. For example, the sequence TCAG is represented as 00011011.
+import io
+import itertools
+import mmap
+import warnings
+
 try:
     import numpy as np
 except ImportError:
@@ -82,6 +90,10 @@ except ImportError:
         "See http://www.numpy.org/"
     ) from None
 
+from Bio import BiopythonWarning
+from Bio.Data import CodonTable
+from Bio.Seq import _get_codon_table
+from Bio.Seq import _translate_str
 from Bio.Seq import Seq
 from Bio.Seq import SequenceDataAbstractBaseClass
 from Bio.SeqRecord import SeqRecord
@@ -89,6 +101,22 @@ from Bio.SeqRecord import SeqRecord
 from . import _twoBitIO  # type: ignore
 from .Interfaces import SequenceIterator
 
+# Lookup tables for the two bit encoding T=00, C=01, A=10, G=11:
+_CODES = np.zeros(256, dtype="uint8")
+_CODES[np.frombuffer(b"TCAGtcag", dtype="uint8")] = [0, 1, 2, 3, 0, 1, 2, 3]
+_NUCLEOTIDES = np.zeros(256, dtype=bool)
+_NUCLEOTIDES[np.frombuffer(b"TCAGtcag", dtype="uint8")] = True
+_LOWERCASE = np.zeros(256, dtype=bool)
+_LOWERCASE[ord("a") : ord("z") + 1] = True
+# The four codes in each byte, with the first base in the most significant bits
+_SHIFTS = np.array([6, 4, 2, 0], dtype="uint8")
+_FIELDS = (np.arange(256, dtype="uint8")[:, None] >> _SHIFTS) & 3
+# Number of times each code occurs in each byte
+_COUNTS = np.array([(_FIELDS == code).sum(axis=1) for code in range(4)])
+# Each byte with its four codes in reverse order
+_REVERSED = (_FIELDS[:, ::-1] << _SHIFTS).sum(axis=1).astype("uint8")
+_NO_BLOCKS = np.empty((0, 2), dtype="uint32")
+
 
 class _TwoBitSequenceData(SequenceDataAbstractBaseClass):
     """Stores information needed to retrieve sequence data from a .2bit file (PRIVATE).
@@ -101,15 +129,21 @@ class _TwoBitSequenceData(SequenceDataAbstractBaseClass):
     return the length of the sequence, while the latter returns the sequence
     (as a bytes object) for the requested region. The full sequence of a record
     is loaded only if explicitly requested.
+
+    If the file is memory mapped, the packed sequence data is decoded directly
+    from the mapping, which is shared between processes using the same file.
+    The mapping is closed once the file is found to be closed; if the mapping
+    was closed while the file is still open, the data are read from the file.
     """
 
-    __slots__ = ("stream", "offset", "length", "nBlocks", "maskBlocks")
+    __slots__ = ("stream", "offset", "length", "nBlocks", "maskBlocks", "mapping")
 
-    def __init__(self, stream, offset, length):
+    def __init__(self, stream, offset, length, mapping=None):
         """Initialize the file stream and file position of the sequence data."""
         self.stream = stream
         self.offset = offset
         self.length = length
+        self.mapping = mapping
         super().__init__()
 
     def __getitem__(self, key):
@@ -133,13 +167,27 @@ class _TwoBitSequenceData(SequenceDataAbstractBaseClass):
         byteEnd = (end + 3) // 4
         byteSize = byteEnd - byteStart
         stream = self.stream
-        try:
-            stream.seek(self.offset + byteStart)
-        except ValueError as exception:
-            if str(exception) == "seek of closed file":
-                raise ValueError("cannot retrieve sequence: file is closed") from None
-            raise
-        data = np.fromfile(stream, dtype="uint8", count=byteSize)
+        mapping = self.mapping
+        if mapping is not None and stream.closed:
+            # Release the mapping, which holds its own file descriptor
+            mapping.close()
+        if mapping is None or mapping.closed:
+            try:
+                stream.seek(self.offset + byteStart)
+            except ValueError as exception:
+                if str(exception) == "seek of closed file":
+                    raise ValueError(
+                        "cannot retrieve sequence: file is closed"
+                    ) from None
+                raise
+            data = np.fromfile(stream, dtype="uint8", count=byteSize)
+        else:
+            data = np.frombuffer(
+                mapping,
+                dtype="uint8",
+                count=byteSize,
+                offset=self.offset + byteStart,
+            )
         sequence = _twoBitIO.convert(
             data, start, end, step, self.nBlocks, self.maskBlocks
         )
@@ -154,26 +202,404 @@ class _TwoBitSequenceData(SequenceDataAbstractBaseClass):
 
     def upper(self):
         """Remove the sequence mask."""
-        data = _TwoBitSequenceData(self.stream, self.offset, self.length)
+        data = _TwoBitSequenceData(self.stream, self.offset, self.length, self.mapping)
         data.nBlocks = self.nBlocks[:, :]
         data.maskBlocks = np.empty((0, 2), dtype="uint32")
         return data
 
     def lower(self):
         """Extend the sequence mask to the full sequence."""
-        data = _TwoBitSequenceData(self.stream, self.offset, self.length)
+        data = _TwoBitSequenceData(self.stream, self.offset, self.length, self.mapping)
         data.nBlocks = self.nBlocks[:, :]
         data.maskBlocks = np.array([[0, self.length]], dtype="uint32")
         return data
 
 
+def _find_blocks(flags):
+    """Return the start and end of each run of True values in a boolean array (PRIVATE).
+
+    The runs are returned as an array of unsigned 32-bit integers with two
+    columns, as used for the nBlocks and maskBlocks of a .2bit file.
+    """
+    edges = np.flatnonzero(np.diff(flags, prepend=False, append=False))
+    return edges.reshape(-1, 2).astype("uint32")
+
+
+def _overlapping_blocks(blocks, start, end):
+    """Return the index range of the blocks overlapping start to end (PRIVATE)."""
+    first = int(np.searchsorted(blocks[:, 1], start, side="right"))
+    last = int(np.searchsorted(blocks[:, 0], end, side="left"))
+    return first, max(first, last)
+
+
+class _PackedSequenceData(SequenceDataAbstractBaseClass):
+    """Stores a nucleotide sequence in memory, packed to two bits per base (PRIVATE).
+
+    The bases are packed as in a .2bit file, four per byte, in a NumPy array of
+    unsigned 8-bit integers. The sequence starts at the given offset (in bases)
+    into this array, so that slices can share the array. Any letters other than
+    A, C, G and T are stored like the N blocks of a .2bit file, together with
+    the letters themselves unless they are all N, and lower case letters are
+    stored like the masked blocks. The blocks use the same coordinates as the
+    packed array.
+
+    Slicing, taking the complement and reverse complement, counting a single
+    nucleotide, and translation work directly on the packed array. Use the
+    pack function to create a Seq object using this class.
+    """
+
+    __slots__ = ("packed", "offset", "length", "nBlocks", "maskBlocks", "letters")
+
+    def __init__(self, packed, offset, length, nBlocks, maskBlocks, letters=None):
+        """Initialize with the packed array and the blocks of N and masked letters."""
+        self.packed = packed
+        self.offset = offset
+        self.length = length
+        self.nBlocks = np.ascontiguousarray(nBlocks, dtype="uint32")
+        self.maskBlocks = np.ascontiguousarray(maskBlocks, dtype="uint32")
+        self.letters = letters
+        super().__init__()
+
+    def __len__(self):
+        """Get the sequence length."""
+        return self.length
+
+    def _letters(self, first, last, start, end):
+        """Return the letters in the N blocks from start to end (PRIVATE).
+
+        Returns a list of (block start, block end, letters) tuples, for the N
+        blocks first to last clipped to the region from start to end.
+        """
+        nBlocks = self.nBlocks
+        sizes = (nBlocks[:, 1] - nBlocks[:, 0]).astype(np.int64)
+        offsets = (np.cumsum(sizes) - sizes)[first:last].tolist()
+        letters = self.letters
+        result = []
+        for (blockStart, blockEnd), offset in zip(
+            nBlocks[first:last].tolist(), offsets
+        ):
+            offset -= blockStart
+            blockStart = max(blockStart, start)
+            blockEnd = min(blockEnd, end)
+            result.append(
+                (blockStart, blockEnd, letters[offset + blockStart : offset + blockEnd])
+            )
+        return result
+
+    def _convert(self, start, end):
+        """Return the sequence from start to end as a bytes object (PRIVATE)."""
+        if start >= end:
+            return b""
+        start += self.offset
+        end += self.offset
+        data = self.packed[start // 4 : (end + 3) // 4]
+        sequence = _twoBitIO.convert(
+            data, start, end, 1, self.nBlocks, self.maskBlocks
+        )
+        if self.letters is None:
+            return sequence
+        # Replace the Ns by the actual letters
+        first, last = _overlapping_blocks(self.nBlocks, start, end)
+        if first == last:
+            return sequence
+        sequence = bytearray(sequence)
+        for blockStart, blockEnd, letters in self._letters(first, last, start, end):
+            sequence[blockStart - start : blockEnd - start] = letters
+        return bytes(sequence)
+
+    def _codes(self, start, end):
+        """Return the two bit codes from start to end, one per byte (PRIVATE)."""
+        start += self.offset
+        end += self.offset
+        codes = _FIELDS[self.packed[start // 4 : (end + 3) // 4]].ravel()
+        return codes[start % 4 : start % 4 + end - start]
+
+    def _slice(self, start, end):
+        """Return the sequence from start to end, sharing the packed array (PRIVATE)."""
+        start += self.offset
+        end += self.offset
+        shift = 4 * (start // 4)
+        packed = self.packed[start // 4 : (end + 3) // 4]
+        first, last = _overlapping_blocks(self.nBlocks, start, end)
+        nBlocks = np.clip(self.nBlocks[first:last], start, end)
+        letters = self.letters
+        if letters is not None:
+            letters = b"".join(
+                letters for blockStart, blockEnd, letters in self._letters(
+                    first, last, start, end
+                )
+            )
+        first, last = _overlapping_blocks(self.maskBlocks, start, end)
+        maskBlocks = np.clip(self.maskBlocks[first:last], start, end)
+        return _PackedSequenceData(
+            packed,
+            start - shift,
+            end - start,
+            nBlocks - shift,
+            maskBlocks - shift,
+            letters,
+        )
+
+    def _reverse(self):
+        """Return the reversed sequence (PRIVATE)."""
+        total = 4 * len(self.packed)
+        nBlocks = total - self.nBlocks[::-1, ::-1].astype(np.int64)
+        maskBlocks = total - self.maskBlocks[::-1, ::-1].astype(np.int64)
+        letters = self.letters
+        if letters is not None:
+            letters = letters[::-1]
+        return _PackedSequenceData(
+            _REVERSED[self.packed[::-1]],
+            total - self.offset - self.length,
+            self.length,
+            nBlocks,
+            maskBlocks,
+            letters,
+        )
+
+    def __getitem__(self, key):
+        """Return the letter or the subsequence for the requested region.
+
+        Slices with a step of 1 or -1 return another packed sequence data object,
+        other slices return a bytes object.
+        """
+        length = self.length
+        if isinstance(key, slice):
+            start, end, step = key.indices(length)
+            size = len(range(start, end, step))
+            if size == 0:
+                return b""
+            if step == 1:
+                return self._slice(start, end)
+            if step == -1:
+                return self._slice(end + 1, start + 1)._reverse()
+            if step > 0:
+                return self._convert(start, start + (size - 1) * step + 1)[::step]
+            return self._convert(start + (size - 1) * step, start + 1)[::step]
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("index out of range")
+        return self._convert(key, key + 1)[0]
+
+    def __bytes__(self):
+        return self._convert(0, self.length)
+
+    def upper(self):
+        """Remove the sequence mask."""
+        letters = self.letters
+        if letters is not None:
+            letters = letters.upper()
+        return _PackedSequenceData(
+            self.packed, self.offset, self.length, self.nBlocks, _NO_BLOCKS, letters
+        )
+
+    def lower(self):
+        """Extend the sequence mask to the full sequence."""
+        letters = self.letters
+        if letters is not None:
+            letters = letters.lower()
+        maskBlocks = np.array([[self.offset, self.offset + self.length]])
+        return _PackedSequenceData(
+            self.packed, self.offset, self.length, self.nBlocks, maskBlocks, letters
+        )
+
+    def translate(self, table, delete=b""):
+        """Return a copy with each character mapped by the given translation table.
+
+        If the table maps the nucleotides to nucleotides, as for taking the
+        complement, the packed array is translated directly.
+        """
+        if not delete and len(table) == 256:
+            nucleotides = bytes(table[letter] for letter in b"TCAG")
+            if (
+                nucleotides.strip(b"TCAG") == b""
+                and bytes(table[letter] for letter in b"tcag") == nucleotides.lower()
+                and (
+                    self.letters is not None
+                    or (table[ord("N")] == ord("N") and table[ord("n")] == ord("n"))
+                )
+            ):
+                codes = _CODES[np.frombuffer(nucleotides, dtype="uint8")]
+                lookup = (codes[_FIELDS] << _SHIFTS).sum(axis=1).astype("uint8")
+                letters = self.letters
+                if letters is not None:
+                    letters = letters.translate(table)
+                return _PackedSequenceData(
+                    lookup[self.packed],
+                    self.offset,
+                    self.length,
+                    self.nBlocks,
+                    self.maskBlocks,
+                    letters,
+                )
+        return super().translate(table, delete)
+
+    def count(self, sub, start=None, end=None):
+        """Return the number of non-overlapping occurrences of sub in data[start:end].
+
+        Optional arguments start and end are interpreted as in slice notation.
+        This method behaves as the count method of Python strings.
+        """
+        if not isinstance(sub, (bytes, bytearray)) or len(sub) != 1:
+            return super().count(sub, start, end)
+        start, end, step = slice(start, end).indices(self.length)
+        if start >= end:
+            return 0
+        first = start + self.offset
+        last = end + self.offset
+        if (
+            sub in b"ACGT"
+            and len(set(_overlapping_blocks(self.nBlocks, first, last))) == 1
+            and len(set(_overlapping_blocks(self.maskBlocks, first, last))) == 1
+        ):
+            # Count the code in each byte, less those outside the region
+            code = _CODES[sub[0]]
+            packed = self.packed[first // 4 : (last + 3) // 4]
+            count = _COUNTS[code][packed].sum()
+            count -= np.count_nonzero(_FIELDS[packed[0], : first % 4] == code)
+            count -= np.count_nonzero(_FIELDS[packed[-1], (last - 1) % 4 + 1 :] == code)
+            return int(count)
+        # Otherwise decode and count in chunks
+        count = 0
+        for position in range(start, end, 1048576):
+            count += self._convert(position, min(position + 1048576, end)).count(sub)
+        return count
+
+    def _translate_codons(self, table, stop_symbol, to_stop, gap):
+        """Translate the codons using a lookup table of the packed codes (PRIVATE)."""
+        codon_table = _get_codon_table(table)
+        forward_table = codon_table.forward_table
+        stop_codons = codon_table.stop_codons
+        if not (isinstance(stop_symbol, str) and len(stop_symbol) == 1):
+            return None
+        amino_acids = np.zeros(64, dtype="S1")
+        stops = np.zeros(64, dtype=bool)
+        for index, codon in enumerate(itertools.product("TCAG", repeat=3)):
+            codon = "".join(codon)
+            if codon in stop_codons:
+                if codon in forward_table:
+                    # Dual coding stop codon, leave this to _translate_str
+                    return None
+                amino_acids[index] = stop_symbol
+                stops[index] = True
+            else:
+                try:
+                    amino_acids[index] = forward_table[codon]
+                except (KeyError, CodonTable.TranslationError):
+                    return None
+        if self.length % 3 != 0:
+            warnings.warn(
+                "Partial codon, len(sequence) not a multiple of three. "
+                "Explicitly trim the sequence or add trailing N before "
+                "translation. This may become an error in future.",
+                BiopythonWarning,
+            )
+        n = self.length - self.length % 3
+        protein = np.empty(n // 3, dtype="S1")
+        is_stop = np.empty(n // 3, dtype=bool)
+        for start in range(0, n, 3145728):
+            end = min(start + 3145728, n)
+            codes = self._codes(start, end).reshape(-1, 3)
+            indices = (codes[:, 0] << 4) | (codes[:, 1] << 2) | codes[:, 2]
+            protein[start // 3 : end // 3] = amino_acids[indices]
+            is_stop[start // 3 : end // 3] = stops[indices]
+        # Translate any codons including other letters (e.g. N) as usual
+        error = None
+        offset = self.offset
+        first, last = _overlapping_blocks(self.nBlocks, offset, offset + n)
+        for blockStart, blockEnd in self.nBlocks[first:last].tolist():
+            blockStart = max(blockStart - offset, 0)
+            blockEnd = min(blockEnd - offset, n)
+            start = blockStart // 3
+            end = (blockEnd + 2) // 3
+            if self.letters is None and end - start > 2:
+                # The codons entirely within the block are all NNN
+                inner = slice((blockStart + 2) // 3, blockEnd // 3)
+                protein[inner] = _translate_str("NNN", codon_table, gap=gap)
+                is_stop[inner] = False
+                indices = [start, end - 1]
+            else:
+                indices = range(start, end)
+            for index in indices:
+                codon = self._convert(3 * index, 3 * index + 3).decode().upper()
+                try:
+                    protein[index] = _translate_str(
+                        codon, codon_table, stop_symbol, gap=gap
+                    )
+                except CodonTable.TranslationError as exception:
+                    # Only an error if not after a stop codon when using to_stop
+                    if error is None:
+                        error = (index, exception)
+                    break
+                is_stop[index] = codon in stop_codons
+            if error is not None:
+                break
+        if error is not None:
+            index, exception = error
+            if not (to_stop and is_stop[:index].any()):
+                raise exception
+        if to_stop and is_stop.any():
+            protein = protein[: np.argmax(is_stop)]
+        return protein.tobytes().decode("ASCII")
+
+
+def pack(sequence):
+    """Return a Seq object with the nucleotide sequence packed to two bits per base.
+
+    Storing four bases per byte, as in a .2bit file, uses a quarter of the
+    memory of a plain Seq object for (mostly) unambiguous DNA sequences. Any
+    other letters (e.g. N or other IUPAC ambiguity codes) are stored
+    separately in blocks, as are lower case (masked) regions. The sequence
+    can be a string, bytes, or Seq object:
+
+    >>> from Bio.SeqIO.TwoBitIO import pack
+    >>> seq = pack("ATGGCCNNNNNNattgtaATGGGCCGCTGAAAGGGTGCCCGATAG")
+    >>> seq
+    Seq('ATGGCCNNNNNNattgtaATGGGCCGCTGAAAGGGTGCCCGATAG')
+    >>> seq.reverse_complement()
+    Seq('CTATCGGGCACCCTTTCAGCGGCCCATtacaatNNNNNNGGCCAT')
+    >>> seq.count("G")
+    13
+    >>> seq.translate()
+    Seq('MAXXIVMGR*KGAR*')
+
+    Slicing, taking the complement or reverse complement, counting a single
+    nucleotide, and translation work directly on the packed data.
+    """
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ASCII")
+    data = np.frombuffer(bytes(sequence), dtype="uint8")
+    length = len(data)
+    if length >= 2**32:
+        raise ValueError("Sequences of 2**32 letters or more cannot be packed")
+    codes = np.zeros(4 * ((length + 3) // 4), dtype="uint8")
+    codes[:length] = _CODES[data]
+    packed = (codes[0::4] << 6) | (codes[1::4] << 4) | (codes[2::4] << 2) | codes[3::4]
+    others = ~_NUCLEOTIDES[data]
+    nBlocks = _find_blocks(others)
+    maskBlocks = _find_blocks(_LOWERCASE[data])
+    letters = data[others].tobytes()
+    if not letters.translate(None, b"Nn"):
+        # All N (or n in masked blocks), which need not be stored
+        letters = None
+    return Seq(_PackedSequenceData(packed, 0, length, nBlocks, maskBlocks, letters))
+
+
 class TwoBitIterator(SequenceIterator):
     """Parser for UCSC twoBit (.2bit) files."""
 
     modes = "b"
 
-    def __init__(self, source):
-        """Read the file index."""
+    def __init__(self, source, packed=False):
+        """Read the file index.
+
+        Arguments:
+         - source - input file stream, or path to input file
+         - packed - if True, load each sequence into memory as it is stored in
+           the file, packed to two bits per base (see the pack function),
+           rather than reading it from the file on demand.
+        """
         super().__init__(source, fmt="twoBit")
         stream = self.stream
         data = stream.read(4)
@@ -212,11 +638,18 @@ class TwoBitIterator(SequenceIterator):
             offset = int.from_bytes(data, byteorder, signed=False)
             sequences[name] = (stream, offset)
         self.sequences = sequences
+        mapping = None
+        if isinstance(stream, io.BufferedReader) and isinstance(stream.raw, io.FileIO):
+            # Memory map the file if possible, to share it between processes
+            try:
+                mapping = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError, OverflowError):
+                pass
         for name, (stream, offset) in sequences.items():
             stream.seek(offset)
             data = stream.read(4)
             dnaSize = int.from_bytes(data, byteorder, signed=False)
-            sequence = _TwoBitSequenceData(stream, offset, dnaSize)
+            sequence = _TwoBitSequenceData(stream, offset, dnaSize, mapping)
             data = stream.read(4)
             nBlockCount = int.from_bytes(data, byteorder, signed=False)
             nBlockStarts = np.fromfile(stream, dtype=dtype, count=nBlockCount)
@@ -236,10 +669,22 @@ class TwoBitIterator(SequenceIterator):
             if reserved != 0:
                 raise ValueError("Found non-zero reserved field %u" % reserved)
             sequence.offset = stream.tell()
+            if packed:
+                data = np.fromfile(stream, dtype="uint8", count=(dnaSize + 3) // 4)
+                sequence = _PackedSequenceData(
+                    data, 0, dnaSize, sequence.nBlocks, sequence.maskBlocks
+                )
             sequence = Seq(sequence)
             sequences[name] = sequence
+        self._mapping = mapping
         self._names = iter(self.sequences)
 
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Close the memory mapping of the file, if any, and the file."""
+        if self._mapping is not None:
+            self._mapping.close()
+        return super().__exit__(exc_type, exc_value, exc_traceback)
+
     def __next__(self):
         """Return the next entry."""
         name = next(self._names)
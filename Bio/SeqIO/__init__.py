@@ -729,6 +729,50 @@ def read(handle, format, alphabet=None):
     return record
 
 
+def parse_parallel(source, format, function=None, processes=None, block_size=4194304):
+    """Parse a large GenBank, EMBL or SwissProt file using several processes.
+
+    Arguments:
+     - source     - the filename, or a handle to the file (opened in text or
+       binary mode). Files compressed with gzip or BGZF are decompressed
+       automatically when given as a filename.
+     - format     - lower case string describing the file format, one of
+       "genbank" (or "gb"), "embl", "imgt" or "swiss".
+     - function   - optional function applied to each SeqRecord in the
+       worker processes, its results are returned instead of the records.
+       This must be defined at module level, so that it can be pickled.
+     - processes  - the number of worker processes to use, by default the
+       number of CPUs. With one process the file is parsed without starting
+       any worker processes.
+     - block_size - the approximate number of bytes (or characters for a
+       handle in text mode) read at a time.
+
+    The file is split into blocks of complete records (ending with a // line),
+    which are parsed in parallel. The records (or the results of the function)
+    are returned in the same order as by Bio.SeqIO.parse, while only reading
+    a few blocks ahead of them. For example,
+
+    >>> from Bio import SeqIO
+    >>> records = SeqIO.parse_parallel("GenBank/cor6_6.gb", "genbank", processes=1)
+    >>> for record in records:
+    ...     print(record.id, len(record.features))
+    ...
+    X55053.1 3
+    X62281.1 15
+    M81224.1 6
+    AJ237582.1 7
+    L31939.1 3
+    AF297471.1 4
+
+    As each record is copied from the worker processes, this is most useful
+    with a function reducing each record to the values you need, or when
+    parsing the features takes most of the time.
+    """
+    from ._parallel import parse_parallel  # Lazy import
+
+    return parse_parallel(source, format, function, processes, block_size)
+
+
 def to_dict(sequences, key_function=None):
     """Turn a sequence iterator or list into a dictionary.
 
@@ -837,7 +881,8 @@ def index(filename, format, alphabet=None, key_function=None):
     >>> records.close()
 
     If the file is BGZF compressed, this is detected automatically. Ordinary
-    GZIP files are not supported:
+    GZIP files are also supported, using seek points from the Bio.gzindex
+    module, but BGZF is much faster to index and to access:
 
     >>> from Bio import SeqIO
     >>> records = SeqIO.index("Quality/example.fastq.bgz", "fastq")
@@ -946,8 +991,26 @@ def index(filename, format, alphabet=None, key_function=None):
     return _IndexedSeqFileDict(random_access_proxy, key_function, repr, "SeqRecord")
 
 
+def _index_db_proxy_factory(format, filename=None):
+    """Given a filename returns proxy object, else boolean if format OK (PRIVATE).
+
+    Used by index_db, and defined at module level so it can be pickled.
+    """
+    from ._index import _FormatToRandomAccess  # Lazy import
+
+    if filename:
+        return _FormatToRandomAccess[format](filename, format)
+    else:
+        return format in _FormatToRandomAccess
+
+
 def index_db(
-    index_filename, filenames=None, format=None, alphabet=None, key_function=None
+    index_filename,
+    filenames=None,
+    format=None,
+    alphabet=None,
+    key_function=None,
+    processes=1,
 ):
     """Index several sequence files and return a dictionary like object.
 
@@ -965,6 +1028,8 @@ def index_db(
      - key_function - Optional callback function which when given a
        SeqRecord identifier string should return a unique
        key for the dictionary.
+     - processes - Number of worker processes used to scan the files when
+       building a new index (default 1, scanning them in this process).
 
     This indexing function will return a dictionary like object, giving the
     SeqRecord objects as values:
@@ -988,8 +1053,13 @@ def index_db(
 
     In this example the two files contain 85 and 10 records respectively.
 
+    When indexing many files, using processes greater than one will scan them
+    in parallel, while the offsets are still written to the database by this
+    process in file order. Any key_function must then be picklable, i.e. a
+    function defined at the top level of a module rather than a lambda.
+
     BGZF compressed files are supported, and detected automatically. Ordinary
-    GZIP compressed files are not supported.
+    GZIP compressed files are also supported via Bio.gzindex, but are slower.
 
     See Also: Bio.SeqIO.index() and Bio.SeqIO.to_dict(), and the Python module
     glob which is useful for building lists of files.
@@ -1027,8 +1097,6 @@ def index_db(
     # Map the file format to a sequence iterator:
     from Bio.File import _SQLiteManySeqFilesDict
 
-    from ._index import _FormatToRandomAccess  # Lazy import
-
     repr = "SeqIO.index_db(%r, filenames=%r, format=%r, key_function=%r)" % (
         index_filename,
         filenames,
@@ -1036,15 +1104,14 @@ def index_db(
         key_function,
     )
 
-    def proxy_factory(format, filename=None):
-        """Given a filename returns proxy object, else boolean if format OK."""
-        if filename:
-            return _FormatToRandomAccess[format](filename, format)
-        else:
-            return format in _FormatToRandomAccess
-
     return _SQLiteManySeqFilesDict(
-        index_filename, filenames, proxy_factory, format, key_function, repr
+        index_filename,
+        filenames,
+        _index_db_proxy_factory,
+        format,
+        key_function,
+        repr,
+        processes=processes,
     )
 
 
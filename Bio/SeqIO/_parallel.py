@@ -0,0 +1,128 @@
+# Copyright 2025 by the Biopython contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Parsing sequence files in parallel (PRIVATE).
+
+You are not expected to access this module, or any of its code, directly. This
+is all handled internally by the Bio.SeqIO.parse_parallel(...) function which
+is the public interface for this functionality.
+
+The file is read in blocks which are extended up to the end of the last
+record in them (a line containing only //), so that each block holds complete
+records. The blocks are then parsed in a pool of worker processes, and the
+results are returned in the original order. Only a limited number of blocks
+are read ahead, so the memory needed does not depend on the file size.
+"""
+
+import gzip
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from io import StringIO
+
+from Bio import SeqIO
+
+# File formats where each record ends with a // line
+_formats = ("embl", "genbank", "gb", "imgt", "swiss")
+_terminator = re.compile(r"^//.*\n?", re.MULTILINE)
+_terminator_bytes = re.compile(rb"^//.*\n?", re.MULTILINE)
+
+
+def _record_end(data):
+    """Return the end of the last // line in the data, or -1 if none (PRIVATE)."""
+    if isinstance(data, str):
+        pattern = _terminator
+    else:
+        pattern = _terminator_bytes
+    end = -1
+    for match in pattern.finditer(data):
+        end = match.end()
+    return end
+
+
+def _blocks(handle, size):
+    """Split the file contents into blocks of complete records (PRIVATE)."""
+    pieces = []
+    while True:
+        data = handle.read(size)
+        if not data:
+            break
+        # finish the last line, so that a // line is not split
+        data += handle.readline()
+        end = _record_end(data)
+        if end < 0:
+            pieces.append(data)
+            continue
+        pieces.append(data[:end])
+        yield data[:0].join(pieces)
+        pieces = [data[end:]]
+    if pieces:
+        data = pieces[0][:0].join(pieces)
+        if data.strip():
+            yield data
+
+
+def _parse_block(data, format, function):
+    """Parse a block of records, and apply the function to them (PRIVATE).
+
+    This is run in the worker processes.
+    """
+    if isinstance(data, bytes):
+        data = data.decode()
+    records = SeqIO.parse(StringIO(data), format)
+    if function is None:
+        return list(records)
+    return [function(record) for record in records]
+
+
+def _open(source):
+    """Open a file in binary mode, decompressing gzip and BGZF files (PRIVATE)."""
+    handle = open(source, "rb")
+    if handle.peek(2)[:2] == b"\x1f\x8b":
+        handle.close()
+        handle = gzip.open(source, "rb")
+    return handle
+
+
+def _parse(source, format, function, processes, block_size):
+    """Iterate over the results of parsing the blocks (PRIVATE)."""
+    if isinstance(source, (str, os.PathLike)):
+        context = _open(source)
+    else:
+        context = nullcontext(source)
+    with context as handle:
+        if processes == 1:
+            for data in _blocks(handle, block_size):
+                yield from _parse_block(data, format, function)
+            return
+        executor = ProcessPoolExecutor(processes)
+        try:
+            pending = deque()
+            for data in _blocks(handle, block_size):
+                pending.append(executor.submit(_parse_block, data, format, function))
+                if len(pending) >= 2 * processes:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def parse_parallel(source, format, function, processes, block_size):
+    """Parse the records in parallel, see Bio.SeqIO.parse_parallel (PRIVATE)."""
+    if not isinstance(format, str):
+        raise TypeError("Need a string for the file format (lower case)")
+    if format not in _formats:
+        raise ValueError(f"Parsing format {format!r} in parallel is not supported")
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes < 1:
+        raise ValueError("Use processes with a minimum of 1")
+    if block_size < 1:
+        raise ValueError("block_size must be positive")
+    return _parse(source, format, function, processes, block_size)
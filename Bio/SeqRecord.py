@@ -12,7 +12,10 @@
 # NEEDS TO BE SYNCH WITH THE REST OF BIOPYTHON AND BIOPERL
 # In particular, the SeqRecord and BioSQL.BioSeq.DBSeqRecord classes
 # need to be in sync (this is the BioSQL "Database SeqRecord").
+import math
 import numbers
+from operator import attrgetter
+from operator import itemgetter
 from typing import Any
 from typing import cast
 from collections.abc import Iterator
@@ -111,6 +114,148 @@ class _RestrictedDict(dict[str, Sequence[Any]]):
             self[key] = value
 
 
+def _concatenate_letter_annotation(left: Any, right: Any) -> Any:
+    """Join two per-letter-annotation values end to end (PRIVATE).
+
+    Usually this is just left + right, but for NumPy arrays (e.g. PHRED
+    qualities stored as uint8) addition is element-wise, so these are joined
+    using numpy.concatenate instead.
+    """
+    if hasattr(left, "__array__") or hasattr(right, "__array__"):
+        import numpy as np
+
+        return np.concatenate([left, right])
+    return left + right
+
+
+class _FeatureIndex:
+    """Interval index of the feature locations of a SeqRecord (PRIVATE).
+
+    Each part of each feature location is stored as an interval, sorted by
+    start position, as an implicit binary tree where each node also holds the
+    maximum end position of its subtree. Finding the intervals overlapping a
+    region then takes O(log n + k) steps for k results.
+
+    The tree is padded to 2**levels - 1 nodes, so that the node at position
+    i on level k (counting the leaves as level 0) has its children at
+    positions i - 2**(k - 1) and i + 2**(k - 1), and the root is in the
+    middle. The padding nodes start after and end before any interval.
+
+    The index keeps a copy of the list of features it was built from, and
+    remembers the list object itself and its length, so that it can be
+    checked quickly if it still applies to a record.
+    """
+
+    def __init__(self, features: list["SeqFeature"]) -> None:
+        self.source = features
+        self.count = len(features)
+        self.features = list(features)
+        # Features on other sequences (e.g. in segmented GenBank records)
+        self.references = []
+        starts = []
+        ends = []
+        indices = []
+        strands = []
+        for index, location in enumerate(map(attrgetter("location"), self.features)):
+            if location is None:
+                continue
+            if location.ref or location.ref_db:
+                self.references.append(index)
+                continue
+            for part in location.parts:
+                if part.ref or part.ref_db:
+                    continue
+                try:
+                    start = int(part.start)
+                    end = int(part.end)
+                except TypeError:
+                    # Will fail on UnknownPosition
+                    continue
+                starts.append(start)
+                ends.append(end)
+                indices.append(index)
+                strands.append(part.strand)
+        self.size = len(starts)
+        levels = self.size.bit_length()
+        padding = (1 << levels) - 1 - self.size
+        if self.size > 1:
+            order = sorted(range(self.size), key=starts.__getitem__)
+            reorder = itemgetter(*order)
+            starts = list(reorder(starts))
+            ends = list(reorder(ends))
+            indices = list(reorder(indices))
+            strands = list(reorder(strands))
+        self.starts = starts + [math.inf] * padding
+        self.ends = ends
+        self.indices = indices
+        self.strands = strands
+        max_ends = ends + [-math.inf] * padding
+        for level in range(1, levels):
+            first = (1 << level) - 1
+            step = 1 << (level + 1)
+            half = 1 << (level - 1)
+            max_ends[first::step] = map(
+                max,
+                max_ends[first::step],
+                max_ends[first - half :: step],
+                max_ends[first + half :: step],
+            )
+        self.max_ends = max_ends
+        self.levels = levels
+
+    def is_valid(self, features: list["SeqFeature"]) -> bool:
+        """Check if the index applies to the list of features (PRIVATE).
+
+        This takes constant time, checking the list is the same object with
+        the same length, which catches a new list being assigned as well as
+        features being added or removed. Features replaced or reordered in
+        place, or changes to their locations, are not noticed.
+        """
+        return features is self.source and len(features) == self.count
+
+    def overlapping(
+        self,
+        start: int,
+        end: int,
+        strand: int | None = None,
+        inclusive: bool = False,
+    ) -> list[int]:
+        """Return the indices of the features overlapping start to end (PRIVATE).
+
+        If inclusive is True, intervals touching the region are included too.
+        """
+        if inclusive:
+            start -= 1
+            end += 1
+        if not self.size:
+            return []
+        size = self.size
+        starts = self.starts
+        ends = self.ends
+        max_ends = self.max_ends
+        found = set()
+        level = self.levels - 1
+        stack = [((1 << level) - 1, level)]
+        while stack:
+            node, level = stack.pop()
+            if max_ends[node] <= start:
+                # Nothing in this subtree reaches the region
+                continue
+            if level:
+                half = 1 << (level - 1)
+                stack.append((node - half, level - 1))
+            if starts[node] < end:
+                if level:
+                    stack.append((node + half, level - 1))
+                if (
+                    node < size
+                    and ends[node] > start
+                    and (strand is None or self.strands[node] == strand)
+                ):
+                    found.add(self.indices[node])
+        return sorted(found)
+
+
 class SeqRecord:
     """A SeqRecord object holds a sequence and information about it.
 
@@ -257,6 +402,7 @@ class SeqRecord:
                 "features argument should be a list (of SeqFeature objects)"
             )
         self.features = features
+        self._feature_index: _FeatureIndex | None = None
 
     @property
     def letter_annotations(self) -> dict[str, Sequence[Any]]:
@@ -396,6 +542,7 @@ class SeqRecord:
         if features is None:
             features = []
         inst.features = features
+        inst._feature_index = None
         if annotations is None:
             annotations = {}
         inst.annotations = annotations
@@ -601,6 +748,79 @@ class SeqRecord:
             return answer
         raise ValueError("Invalid index")
 
+    def _get_feature_index(self) -> _FeatureIndex:
+        """Return the interval index of the features, building it if needed (PRIVATE).
+
+        The index is cached, and built again if a new list of features was
+        assigned, or any features were added or removed, since it was built.
+        """
+        features = self.features
+        feature_index = getattr(self, "_feature_index", None)
+        if feature_index is None or not feature_index.is_valid(features):
+            feature_index = _FeatureIndex(features)
+            self._feature_index = feature_index
+        return feature_index
+
+    def features_overlapping(
+        self, start: int, end: int, strand: int | None = None
+    ) -> list["SeqFeature"]:
+        """Return the features overlapping the region from start to end.
+
+        Arguments:
+         - start  - start of the region (zero based, like Python slicing)
+         - end    - end of the region (exclusive, like Python slicing)
+         - strand - if +1 or -1, only consider feature parts on that strand.
+           The default of None considers all feature parts.
+
+        For features with a CompoundLocation (e.g. a CDS joining several
+        exons), each part is considered separately, so a region falling
+        within an intron does not overlap the feature. Features referencing
+        other sequences, or with unknown positions, are ignored. The features
+        are returned in the order of the record's features list.
+
+        The features are found using an interval index, which is built the
+        first time it is needed and kept until features are added or removed,
+        making repeated queries on records with many features much faster
+        than looping over all the features. If you replace or reorder the
+        features in place, or change their locations, assign a new list to
+        rebuild the index, e.g. ``record.features = record.features[:]``:
+
+        >>> from Bio import SeqIO
+        >>> record = SeqIO.read("GenBank/NC_005816.gb", "genbank")
+        >>> for feature in record.features_overlapping(4500, 5000):
+        ...     print(feature.type, feature.location)
+        ...
+        source [0:9609](+)
+        gene [4342:4780](+)
+        CDS [4342:4780](+)
+        gene [4814:5888](-)
+        CDS [4814:5888](-)
+        >>> for feature in record.features_overlapping(4500, 5000, strand=-1):
+        ...     print(feature.type, feature.location)
+        ...
+        gene [4814:5888](-)
+        CDS [4814:5888](-)
+        """
+        feature_index = self._get_feature_index()
+        features = feature_index.features
+        return [features[i] for i in feature_index.overlapping(start, end, strand)]
+
+    def features_at(
+        self, position: int, strand: int | None = None
+    ) -> list["SeqFeature"]:
+        """Return the features covering the given position (zero based).
+
+        This is the same as features_overlapping(position, position + 1, strand):
+
+        >>> from Bio import SeqIO
+        >>> record = SeqIO.read("GenBank/NC_005816.gb", "genbank")
+        >>> for feature in record.features_at(4000):
+        ...     print(feature.type, feature.location)
+        ...
+        source [0:9609](+)
+        """
+        return self.features_overlapping(position, position + 1, strand)
+
     def __iter__(self) -> Iterator[str]:
         """Iterate over the letters in the sequence.
 
@@ -1030,7 +1250,7 @@ class SeqRecord:
             for k, v in self.letter_annotations.items():  # type: ignore
                 if k in other.letter_annotations:
                     # avoid length checks, but otherwise equivalent to answer.letter_annotations[k] = v + other.letter_annotations[k]
-                    dict.__setitem__(answer.letter_annotations, k, v + other.letter_annotations[k])  # type: ignore
+                    dict.__setitem__(answer.letter_annotations, k, _concatenate_letter_annotation(v, other.letter_annotations[k]))  # type: ignore
         except TypeError:
             print("Failed while try to concatenate letter annotations")
             raise
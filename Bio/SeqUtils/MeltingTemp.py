@@ -152,6 +152,7 @@ by '1':
 """
 
 import math
+import numbers
 import warnings
 
 from Bio import BiopythonWarning
@@ -375,6 +376,15 @@ RNA_DE1 = {
 # Turn black code style on
 # fmt: on
 
+# For Tm_NN_many, to remove whitespace and non-base characters like _check,
+# and to give the index of each base
+_nn_check_table = str.maketrans(
+    "acgtiuU",
+    "ACGTITT",
+    "".join(chr(i) for i in range(128) if chr(i) not in "ACGTIacgtiuU"),
+)
+_nn_codes = bytes(5 if i >= 128 else "ACGTI".find(chr(i)) % 6 for i in range(256))
+
 
 def make_table(oldtable=None, values=None):
     """Return a table with thermodynamic parameters (as dictionary).
@@ -525,6 +535,20 @@ def salt_correction(Na=0, K=0, Tris=0, Mg=0, dNTPs=0, method=1, seq=None):
         raise ValueError(
             "sequence is missing (is needed to calculate GC content or sequence length)."
         )
+    if method in (6, 7):
+        gc = SeqUtils.gc_fraction(seq, "ignore")
+    else:
+        gc = None
+    length = len(seq) if seq else None
+    return _salt_correction(Na, K, Tris, Mg, dNTPs, method, gc, length)
+
+
+def _salt_correction(Na, K, Tris, Mg, dNTPs, method, gc, length):
+    """Calculate the salt correction term from the GC content and length (PRIVATE).
+
+    The GC content (as a fraction) and length may be NumPy arrays, to correct
+    many sequences at once.
+    """
     corr = 0
     if not method:
         return corr
@@ -550,10 +574,10 @@ def salt_correction(Na=0, K=0, Tris=0, Mg=0, dNTPs=0, method=1, seq=None):
     if method == 4:
         corr = 11.7 * math.log10(mon)
     if method == 5:
-        corr = 0.368 * (len(seq) - 1) * math.log(mon)
+        corr = 0.368 * (length - 1) * math.log(mon)
     if method == 6:
         corr = (
-            (4.29 * SeqUtils.gc_fraction(seq, "ignore") - 3.95) * 1e-5 * math.log(mon)
+            (4.29 * gc - 3.95) * 1e-5 * math.log(mon)
         ) + 9.40e-6 * math.log(mon) ** 2
     # Turn black code style off
     # fmt: off
@@ -570,8 +594,8 @@ def salt_correction(Na=0, K=0, Tris=0, Mg=0, dNTPs=0, method=1, seq=None):
         if Mon > 0:
             R = math.sqrt(mg) / mon
             if R < 0.22:
-                corr = (4.29 * SeqUtils.gc_fraction(seq, "ignore") - 3.95) * \
-                    1e-5 * math.log(mon) + 9.40e-6 * math.log(mon) ** 2
+                corr = (4.29 * gc - 3.95) * 1e-5 * math.log(mon) \
+                    + 9.40e-6 * math.log(mon) ** 2
                 return corr
             elif R < 6.0:
                 a = 3.92 * (0.843 - 0.352 * math.sqrt(mon) * math.log(mon))
@@ -579,8 +603,8 @@ def salt_correction(Na=0, K=0, Tris=0, Mg=0, dNTPs=0, method=1, seq=None):
                             - 8.03e-3 * math.log(mon) ** 2)
                 g = 8.31 * (0.486 - 0.258 * math.log(mon)
                             + 5.25e-3 * math.log(mon) ** 3)
-        corr = (a + b * math.log(mg) + (SeqUtils.gc_fraction(seq, "ignore"))
-                * (c + d * math.log(mg)) + (1 / (2.0 * (len(seq) - 1)))
+        corr = (a + b * math.log(mg) + gc * (c + d * math.log(mg))
+                + (1 / (2.0 * (length - 1)))
                 * (e + f * math.log(mg) + g * math.log(mg) ** 2)) * 1e-5
     # Turn black code style on
     # fmt: on
@@ -614,6 +638,9 @@ def chem_correction(
        while in fmdmethod=2 it is given in molar.
      - GC: GC content in percent.
 
+    The melting temperature and GC content may also be NumPy arrays (e.g. from
+    Tm_NN_many), giving an array of corrected melting temperatures.
+
     Examples:
         >>> from Bio.SeqUtils import MeltingTemp as mt
         >>> mt.chem_correction(70)
@@ -627,19 +654,24 @@ def chem_correction(
         66.68
 
     """
+    # Not using augmented assignments, which would modify arrays in place
     if DMSO:
-        melting_temp -= DMSOfactor * DMSO
+        melting_temp = melting_temp - DMSOfactor * DMSO
     if fmd:
         # McConaughy et al. (1969), Biochemistry 8: 3289-3295
         if fmdmethod == 1:
             # Note: Here fmd is given in percent
-            melting_temp -= fmdfactor * fmd
+            melting_temp = melting_temp - fmdfactor * fmd
         # Blake & Delcourt (1996), Nucl Acids Res 11: 2095-2103
         if fmdmethod == 2:
-            if GC is None or GC < 0:
+            if isinstance(GC, numbers.Real):
+                negative = GC < 0
+            else:
+                negative = GC is None or any(value < 0 for value in GC)
+            if negative:
                 raise ValueError("'GC' is missing or negative")
             # Note: Here fmd is given in molar
-            melting_temp += (0.453 * (GC / 100.0) - 2.88) * fmd
+            melting_temp = melting_temp + (0.453 * (GC / 100.0) - 2.88) * fmd
         if fmdmethod not in (1, 2):
             raise ValueError("'fmdmethod' must be 1 or 2")
     return melting_temp
@@ -913,6 +945,52 @@ def Tm_NN(
        K=0, Tris=0, Mg=0, dNTPs=0.
      - saltcorr: See method 'Tm_GC'. Default=5. 0 means no salt correction.
 
+    """
+    return _Tm_NN(
+        seq,
+        check,
+        strict,
+        c_seq,
+        shift,
+        nn_table,
+        tmm_table,
+        imm_table,
+        de_table,
+        dnac1,
+        dnac2,
+        selfcomp,
+        Na,
+        K,
+        Tris,
+        Mg,
+        dNTPs,
+        saltcorr,
+    )[0]
+
+
+def _Tm_NN(
+    seq,
+    check,
+    strict,
+    c_seq,
+    shift,
+    nn_table,
+    tmm_table,
+    imm_table,
+    de_table,
+    dnac1,
+    dnac2,
+    selfcomp,
+    Na,
+    K,
+    Tris,
+    Mg,
+    dNTPs,
+    saltcorr,
+):
+    """Return the Tm, enthalpy and entropy of a duplex (PRIVATE).
+
+    See Tm_NN for the arguments.
     """
     # Set defaults
     if not nn_table:
@@ -1067,7 +1145,193 @@ def Tm_NN(
         # Tm = 1/(1/Tm + corr)
         melting_temp = 1 / (1 / (melting_temp + 273.15) + corr) - 273.15
 
-    return melting_temp
+    return melting_temp, delta_h, delta_s
+
+
+def Tm_NN_many(
+    seqs,
+    check=True,
+    strict=True,
+    nn_table=None,
+    tmm_table=None,
+    imm_table=None,
+    dnac1=25,
+    dnac2=25,
+    selfcomp=False,
+    Na=50,
+    K=0,
+    Tris=0,
+    Mg=0,
+    dNTPs=0,
+    saltcorr=5,
+):
+    """Return the Tm, enthalpy and entropy of many perfectly matched duplexes.
+
+    This takes a list (or other iterable) of primer/probe sequences, as strings
+    or Biopython sequence objects, and returns a tuple of three NumPy arrays
+    with the melting temperature, delta H (kcal/mol) and delta S (cal/mol K)
+    of each sequence hybridized to its perfect complement. The melting
+    temperatures are exactly the same as calculated by Tm_NN with the same
+    arguments, but the nearest neighbor values are looked up for all
+    sequences at once, which is much faster for many sequences. The entropy
+    includes the salt correction if saltcorr=5. Use Tm_NN for mismatches and
+    dangling ends. See Tm_NN for the other arguments.
+
+    >>> from Bio.SeqUtils import MeltingTemp as mt
+    >>> primers = ['CGTTCCAAAGATGTGGGCATGAGCTTAC', 'AGCTGATTACGAT', 'ACGTUacgtu']
+    >>> tm, dh, ds = mt.Tm_NN_many(primers)
+    >>> print(", ".join("%0.2f" % value for value in tm))
+    60.32, 32.11, 22.51
+    >>> print("%0.2f" % mt.Tm_NN(primers[1]))
+    32.11
+    >>> print("%0.1f %0.2f" % (dh[1], ds[1]))
+    -94.2 -272.43
+
+    The melting temperatures can be corrected for DMSO and formamide at once:
+
+    >>> print(mt.chem_correction(tm, DMSO=3).round(2))
+    [58.07 29.86 20.26]
+    """
+    import numpy as np
+
+    if not nn_table:
+        nn_table = DNA_NN3
+    if not tmm_table:
+        tmm_table = DNA_TMM1
+    if not imm_table:
+        imm_table = DNA_IMM1
+    seqs = [str(seq) for seq in seqs]
+    sequences = seqs
+    if check:
+        sequences = [
+            seq.translate(_nn_check_table) if seq.isascii() else "" for seq in seqs
+        ]
+    lengths = np.array([len(seq) for seq in sequences], np.intp)
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    data = "".join(sequences).encode("ASCII", "replace").translate(_nn_codes)
+    codes = np.frombuffer(data, np.uint8)
+    gc_cumulative = np.cumsum((codes == 1) | (codes == 2))
+    # Look up the values for each pair of neighbors in the same way as Tm_NN,
+    # with index 36 for padding.
+    pair_dh = np.zeros(37)
+    pair_ds = np.zeros(37)
+    pair_known = np.zeros(37, bool)
+    left_tmm = np.zeros(37, bool)
+    right_tmm = np.zeros(37, bool)
+    for i, (base1, c_base1) in enumerate(zip("ACGTI", "TGCAI")):
+        for j, (base2, c_base2) in enumerate(zip("ACGTI", "TGCAI")):
+            pair = 6 * i + j
+            neighbors = base1 + base2 + "/" + c_base1 + c_base2
+            for table, key in (
+                (imm_table, neighbors),
+                (imm_table, neighbors[::-1]),
+                (nn_table, neighbors),
+                (nn_table, neighbors[::-1]),
+            ):
+                if key in table:
+                    pair_dh[pair], pair_ds[pair] = table[key]
+                    pair_known[pair] = True
+                    break
+            left_tmm[pair] = c_base2 + c_base1 + "/" + base2 + base1 in tmm_table
+            right_tmm[pair] = neighbors in tmm_table
+    pairs = np.append(codes[:-1] * 6 + codes[1:], 36).astype(np.intp)
+    # Anything unusual is left to Tm_NN
+    unusual = np.zeros(len(codes) + 1, np.intp)
+    np.cumsum(codes == 5, out=unusual[1:])
+    unknown = np.zeros(len(pairs) + 1, np.intp)
+    np.cumsum(~pair_known[pairs], out=unknown[1:])
+    fast = lengths >= 2
+    fast[fast] = (
+        (unusual[ends[fast]] == unusual[starts[fast]])
+        & (unknown[ends[fast] - 1] == unknown[starts[fast]])
+        & ~left_tmm[pairs[starts[fast]]]
+        & ~right_tmm[pairs[ends[fast] - 2]]
+    )
+    if check:
+        fast &= np.array([seq.isascii() for seq in seqs], bool)
+
+    melting_temps = np.zeros(len(seqs))
+    delta_hs = np.zeros(len(seqs))
+    delta_ss = np.zeros(len(seqs))
+    k = (dnac1 - (dnac2 / 2.0)) * 1e-9
+    if selfcomp:
+        k = dnac1 * 1e-9
+    R = 1.987  # universal gas constant in Cal/degrees C*Mol
+    indices = np.flatnonzero(fast)
+    for block in range(0, len(indices), 65536):
+        selected = indices[block : block + 65536]
+        first = starts[selected]
+        last = ends[selected] - 1
+        length = lengths[selected]
+        gc = gc_cumulative[last] - gc_cumulative[first]
+        gc += (codes[first] == 1) | (codes[first] == 2)
+        # Add the same terms in the same order as Tm_NN
+        delta_h = np.zeros(len(selected))
+        delta_s = np.zeros(len(selected))
+        delta_h += nn_table["init"][0]
+        delta_s += nn_table["init"][1]
+        delta_h += np.where(
+            gc == 0, nn_table["init_allA/T"][0], nn_table["init_oneG/C"][0]
+        )
+        delta_s += np.where(
+            gc == 0, nn_table["init_allA/T"][1], nn_table["init_oneG/C"][1]
+        )
+        delta_h += np.where(codes[first] == 3, nn_table["init_5T/A"][0], 0.0)
+        delta_s += np.where(codes[first] == 3, nn_table["init_5T/A"][1], 0.0)
+        delta_h += np.where(codes[last] == 0, nn_table["init_5T/A"][0], 0.0)
+        delta_s += np.where(codes[last] == 0, nn_table["init_5T/A"][1], 0.0)
+        AT = (codes[first] % 3 == 0).astype(int) + (codes[last] % 3 == 0)
+        GC = ((codes[first] == 1) | (codes[first] == 2)).astype(int)
+        GC += (codes[last] == 1) | (codes[last] == 2)
+        delta_h += nn_table["init_A/T"][0] * AT
+        delta_s += nn_table["init_A/T"][1] * AT
+        delta_h += nn_table["init_G/C"][0] * GC
+        delta_s += nn_table["init_G/C"][1] * GC
+        # The 'zipping', one position at a time
+        for position in range(length.max() - 1):
+            neighbors = np.where(position < length - 1, first + position, -1)
+            delta_h += pair_dh[pairs[neighbors]]
+            delta_s += pair_ds[pairs[neighbors]]
+        if selfcomp:
+            delta_h += nn_table["sym"][0]
+            delta_s += nn_table["sym"][1]
+        if saltcorr:
+            corr = _salt_correction(
+                Na, K, Tris, Mg, dNTPs, saltcorr, gc / length, length
+            )
+        if saltcorr == 5:
+            delta_s += corr
+        melting_temp = (1000 * delta_h) / (delta_s + (R * (math.log(k)))) - 273.15
+        if saltcorr in (1, 2, 3, 4):
+            melting_temp += corr
+        if saltcorr in (6, 7):
+            melting_temp = 1 / (1 / (melting_temp + 273.15) + corr) - 273.15
+        melting_temps[selected] = melting_temp
+        delta_hs[selected] = delta_h
+        delta_ss[selected] = delta_s
+    for index in np.flatnonzero(~fast):
+        melting_temps[index], delta_hs[index], delta_ss[index] = _Tm_NN(
+            seqs[index],
+            check,
+            strict,
+            None,
+            0,
+            nn_table,
+            tmm_table,
+            imm_table,
+            None,
+            dnac1,
+            dnac2,
+            selfcomp,
+            Na,
+            K,
+            Tris,
+            Mg,
+            dNTPs,
+            saltcorr,
+        )
+    return melting_temps, delta_hs, delta_ss
 
 
 if __name__ == "__main__":
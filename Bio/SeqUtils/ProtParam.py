@@ -59,6 +59,7 @@ from Bio.Seq import Seq
 from Bio.SeqUtils import IsoelectricPoint  # Local
 from Bio.SeqUtils import molecular_weight
 from Bio.SeqUtils import ProtParamData  # Local
+from Bio.SeqUtils.IsoelectricPoint import charged_aas
 
 
 class ProteinAnalysis:
@@ -359,6 +360,280 @@ class ProteinAnalysis:
         return (mec_reduced, mec_cystines)
 
 
+class ProteomeAnalysis:
+    """Protein analysis of many sequences at once, using NumPy.
+
+    The constructor takes a list (or other iterable) of protein sequences as
+    strings, Seq or SeqRecord objects, such as the records of a proteome read
+    with Bio.SeqIO, and the optional monoisotopic argument as for
+    ProteinAnalysis. All residues are stored in a single array, and the
+    methods return NumPy arrays with one value for each protein instead of a
+    single value, calculated for all proteins at once:
+
+    >>> from Bio.SeqUtils.ProtParam import ProteomeAnalysis
+    >>> proteome = ProteomeAnalysis(["MKWVTFISLLFLFSSAYS", "PETER", "INGAR"])
+    >>> print(proteome.isoelectric_point().round(2))
+    [8.34 4.53 9.75]
+    >>> print(proteome.gravy().round(3))
+    [ 1.233 -2.76  -0.42 ]
+    >>> print(proteome.molar_extinction_coefficient()[0])
+    [6990    0    0]
+
+    The values agree with those of ProteinAnalysis for each sequence, except
+    that proteins with letters missing from the tables used (such as X, or a
+    stop codon *) get NaN, where ProteinAnalysis would raise an exception.
+    """
+
+    def __init__(self, sequences, monoisotopic=False):
+        """Initialize the class."""
+        import numpy as np
+
+        data = []
+        for sequence in sequences:
+            if isinstance(sequence, str):
+                data.append(sequence.encode("ASCII"))
+            else:
+                data.append(bytes(sequence))
+        self.lengths = np.array([len(sequence) for sequence in data], np.intp)
+        self.starts = np.cumsum(self.lengths) - self.lengths
+        # Residues A-Z (regardless of case) are stored as 0-25, anything else
+        # as 26.
+        codes = b"".join(data).translate(_residue_codes)
+        self._codes = np.frombuffer(codes, np.uint8).astype(np.intp)
+        self.monoisotopic = monoisotopic
+
+    def __len__(self):
+        """Return the number of proteins."""
+        return len(self.lengths)
+
+    def _table(self, values, default=float("nan")):
+        """Return an array of the values for each residue code (PRIVATE)."""
+        import numpy as np
+
+        table = np.full(27, default)
+        for letter, value in values.items():
+            if len(letter) == 1 and "A" <= letter <= "Z":
+                table[ord(letter) - 65] = value
+        return table
+
+    def _sums(self, values):
+        """Return the sum of the residue values for each protein (PRIVATE).
+
+        Residues are added one by one, as in ProteinAnalysis.
+        """
+        import numpy as np
+
+        sums = np.zeros(len(self.lengths))
+        nonempty = self.lengths > 0
+        if len(values):
+            sums[nonempty] = np.add.reduceat(values, self.starts[nonempty])
+        return sums
+
+    @functools.cached_property
+    def _counts(self):
+        """Count of each residue code in each protein (PRIVATE)."""
+        import numpy as np
+
+        proteins = np.repeat(np.arange(len(self.lengths)), self.lengths)
+        counts = np.bincount(proteins * 27 + self._codes, minlength=27 * len(self))
+        return counts.reshape(len(self), 27)
+
+    def count_amino_acids(self):
+        """Count standard amino acids, return a dict of arrays."""
+        return {
+            aa: self._counts[:, ord(aa) - 65] for aa in IUPACData.protein_letters
+        }
+
+    @functools.cached_property
+    def amino_acids_percent(self):
+        """Get the amino acid content in percentages, as a dict of arrays."""
+        import numpy as np
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                aa: (count * 100 / self.lengths)
+                for aa, count in self.count_amino_acids().items()
+            }
+
+    def molecular_weight(self):
+        """Calculate the molecular weight of each protein."""
+        if self.monoisotopic:
+            weights = IUPACData.monoisotopic_protein_weights
+            water = 18.010565
+        else:
+            weights = IUPACData.protein_weights
+            water = 18.0153
+        weights = self._table(weights)
+        return self._sums(weights[self._codes]) - (self.lengths - 1) * water
+
+    def aromaticity(self):
+        """Calculate the aromaticity according to Lobry, 1994."""
+        aa_percentages = self.amino_acids_percent
+        return sum(aa_percentages[aa] / 100 for aa in "YWF")
+
+    def instability_index(self):
+        """Calculate the instability index according to Guruprasad et al 1990."""
+        import numpy as np
+
+        index = np.full((27, 27), float("nan"))
+        for this, values in ProtParamData.DIWV.items():
+            index[ord(this) - 65] = self._table(values)
+        # the value of each dipeptide, at the position of its first residue
+        values = np.zeros(len(self._codes))
+        values[:-1] = index[self._codes[:-1], self._codes[1:]]
+        ends = self.starts + self.lengths
+        values[ends[self.lengths > 0] - 1] = 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (10.0 / self.lengths) * self._sums(values)
+
+    def gravy(self, scale="KyteDoolitle"):
+        """Calculate the GRAVY according to Kyte and Doolitle, 1982.
+
+        See ProteinAnalysis.gravy for the hydrophobicity scales available.
+        """
+        import numpy as np
+
+        selected_scale = ProtParamData.gravy_scales.get(scale, -1)
+
+        if selected_scale == -1:
+            raise ValueError(f"scale: {scale} not known")
+
+        values = self._table(selected_scale)[self._codes]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._sums(values) / self.lengths
+
+    def protein_scale(self, param_dict, window, edge=1.0):
+        """Compute a profile by any amino acid scale for each protein.
+
+        Returns a list with an array of scores for each protein, calculated as
+        by ProteinAnalysis.protein_scale except that letters missing from
+        param_dict count as zero.
+        """
+        import numpy as np
+
+        half = ProteinAnalysis._weight_list(self, window, edge)
+        weights = np.zeros(window)
+        for j in range(window // 2):
+            weights[j] += half[j]
+            weights[window - j - 1] += half[j]
+        weights[window // 2] += 1
+        sum_of_weights = sum(half) * 2 + 1
+        values = self._table(param_dict, 0.0)[self._codes]
+        if len(values) >= window:
+            scores = np.convolve(values, weights[::-1], "valid") / sum_of_weights
+        else:
+            scores = np.zeros(0)
+        return [
+            scores[start : start + max(length - window + 1, 0)]
+            for start, length in zip(self.starts, self.lengths)
+        ]
+
+    def _charged(self):
+        """Return the counts and terminal pK values for each protein (PRIVATE)."""
+        import numpy as np
+
+        content = {aa: self._counts[:, ord(aa) - 65] * 1.0 for aa in charged_aas}
+        pos_pKs = {
+            aa: np.full(len(self), pK)
+            for aa, pK in IsoelectricPoint.positive_pKs.items()
+        }
+        neg_pKs = {
+            aa: np.full(len(self), pK)
+            for aa, pK in IsoelectricPoint.negative_pKs.items()
+        }
+        nonempty = self.lengths > 0
+        first = np.full(len(self), 26)
+        first[nonempty] = self._codes[self.starts[nonempty]]
+        last = np.full(len(self), 26)
+        last[nonempty] = self._codes[self.starts[nonempty] + self.lengths[nonempty] - 1]
+        pKs = self._table(
+            IsoelectricPoint.pKnterminal, IsoelectricPoint.positive_pKs["Nterm"]
+        )
+        pos_pKs["Nterm"] = np.where(nonempty, pKs[first], float("nan"))
+        pKs = self._table(
+            IsoelectricPoint.pKcterminal, IsoelectricPoint.negative_pKs["Cterm"]
+        )
+        neg_pKs["Cterm"] = np.where(nonempty, pKs[last], float("nan"))
+        content["Nterm"] = np.ones(len(self))
+        content["Cterm"] = np.ones(len(self))
+        return content, pos_pKs, neg_pKs
+
+    def _charge_at_pH(self, pH, content, pos_pKs, neg_pKs):
+        """Calculate the charges in the same way as IsoelectricPoint (PRIVATE)."""
+        positive_charge = 0.0
+        for aa, pK in pos_pKs.items():
+            partial_charge = 1.0 / (10 ** (pH - pK) + 1.0)
+            positive_charge += content[aa] * partial_charge
+
+        negative_charge = 0.0
+        for aa, pK in neg_pKs.items():
+            partial_charge = 1.0 / (10 ** (pK - pH) + 1.0)
+            negative_charge += content[aa] * partial_charge
+
+        return positive_charge - negative_charge
+
+    def isoelectric_point(self):
+        """Calculate the isoelectric point of each protein.
+
+        This uses the same bisection as IsoelectricPoint, for all proteins
+        at once.
+        """
+        import numpy as np
+
+        content, pos_pKs, neg_pKs = self._charged()
+        pH = np.full(len(self), 7.775)
+        min_ = np.full(len(self), 4.05)
+        max_ = np.full(len(self), 12.0)
+        active = np.flatnonzero(max_ - min_ > 0.0001)
+        while len(active):
+            charge = self._charge_at_pH(
+                pH[active],
+                {aa: count[active] for aa, count in content.items()},
+                {aa: pK[active] for aa, pK in pos_pKs.items()},
+                {aa: pK[active] for aa, pK in neg_pKs.items()},
+            )
+            positive = charge > 0.0
+            min_[active[positive]] = pH[active[positive]]
+            max_[active[~positive]] = pH[active[~positive]]
+            pH[active] = (min_[active] + max_[active]) / 2
+            active = active[max_[active] - min_[active] > 0.0001]
+        pH[self.lengths == 0] = float("nan")
+        return pH
+
+    def charge_at_pH(self, pH):
+        """Calculate the charge of each protein at given pH."""
+        return self._charge_at_pH(pH, *self._charged())
+
+    def secondary_structure_fraction(self):
+        """Calculate fraction of helix, turn and sheet, as arrays.
+
+        See ProteinAnalysis.secondary_structure_fraction for details.
+        """
+        aa_percentages = self.amino_acids_percent
+
+        helix = sum(aa_percentages[r] / 100 for r in "EMALK")
+        turn = sum(aa_percentages[r] / 100 for r in "NPGSD")
+        sheet = sum(aa_percentages[r] / 100 for r in "VIYFWLT")
+
+        return helix, turn, sheet
+
+    def molar_extinction_coefficient(self):
+        """Calculate the molar extinction coefficients, as arrays.
+
+        Returns the coefficients assuming reduced cysteines, and assuming
+        cystines residues (Cys-Cys-bond).
+        """
+        num_aa = self.count_amino_acids()
+        mec_reduced = num_aa["W"] * 5500 + num_aa["Y"] * 1490
+        mec_cystines = mec_reduced + (num_aa["C"] // 2) * 125
+        return (mec_reduced, mec_cystines)
+
+
+_residue_codes = bytes(
+    (i & 0xDF) - 65 if 65 <= (i & 0xDF) <= 90 else 26 for i in range(256)
+)
+
+
 if __name__ == "__main__":
     from Bio._utils import run_doctest
 
@@ -198,6 +198,9 @@ def GC_skew(seq, window=100):
     Returns 0 for windows without any G/C by handling zero division errors.
 
     Does NOT look at any ambiguous nucleotides.
+
+    See also Bio.SeqUtils.windows, which calculates the GC skew and other
+    window statistics for long sequences and FASTA files much faster.
     """
     # 8/19/03: Iddo: added lowercase
     values = []
@@ -0,0 +1,413 @@
+# Copyright 2025 by the Biopython contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Counting k-mers in nucleotide sequences.
+
+Each k-mer is stored as an integer using two bits per nucleotide (A=0, C=1,
+G=2, T=3, with U treated as T), so that k-mers of up to 31 letters fit in a
+64-bit word, and the numerical order of the codes is the alphabetical order of
+the k-mers. Windows containing any other letter (such as N, or a gap) are
+skipped.
+
+>>> from Bio.SeqUtils.kmers import encode, decode
+>>> positions, codes = encode("ACGTNACG", 3)
+>>> positions
+array([0, 1, 5])
+>>> [decode(code, 3) for code in codes]
+['ACG', 'CGT', 'ACG']
+
+For canonical k-mers, each k-mer is replaced by its reverse complement if that
+comes first alphabetically, so that both strands give the same counts:
+
+>>> positions, codes = encode("ACGTNACG", 3, canonical=True)
+>>> [decode(code, 3) for code in codes]
+['ACG', 'ACG', 'ACG']
+
+Use a KmerCounter to count k-mers, possibly over many records:
+
+>>> from Bio import SeqIO
+>>> from Bio.SeqUtils.kmers import KmerCounter
+>>> counter = KmerCounter(5)
+>>> counter.update(SeqIO.parse("Fasta/f002", "fasta"))
+>>> counter.total
+1174
+>>> counter.most_common(3)
+[('GGGGG', 9), ('AGAGA', 7), ('CCTTT', 7)]
+
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Please install NumPy if you want to use Bio.SeqUtils.kmers. "
+        "See http://www.numpy.org/"
+    ) from None
+
+
+_values = np.full(256, 4, np.uint8)
+for _letter, _value in zip(b"ACGTUacgtu", b"\x00\x01\x02\x03\x03" * 2):
+    _values[_letter] = _value
+del _letter, _value
+
+_profile_limit = 1 << 27  # counts in a profile array (1 GiB)
+
+
+def _as_bytes(sequence):
+    """Return the sequence contents as bytes (PRIVATE)."""
+    if isinstance(sequence, str):
+        return sequence.encode("ASCII")
+    return bytes(sequence)
+
+
+def _batches(sequences, size):
+    """Yield the contents of a sequence, or of an iterable of sequences (PRIVATE).
+
+    Sequences are joined with a zero byte into batches of about the given size
+    in bytes. A zero byte is not a nucleotide, so no k-mer spans two sequences.
+    """
+    if isinstance(sequences, (str, bytes, bytearray)) or hasattr(
+        sequences, "__bytes__"
+    ):
+        yield _as_bytes(sequences)
+        return
+    batch = []
+    total = 0
+    for sequence in sequences:
+        data = _as_bytes(sequence)
+        batch.append(data)
+        total += len(data) + 1
+        if total >= size:
+            yield b"\0".join(batch)
+            batch = []
+            total = 0
+    if batch:
+        yield b"\0".join(batch)
+
+
+def _rolling(values, k):
+    """Return the codes of all k letter windows of the values (PRIVATE).
+
+    The codes for windows of length 2*m are calculated from those for windows
+    of length m, so only about 2*log2(k) operations on the full array are
+    needed. The values array should have at least k elements.
+    """
+    values = values.astype(np.uint64)
+    result = None
+    length = 0
+    size = 1
+    power = values  # the codes of the windows of length size
+    while True:
+        if k & size:
+            if result is None:
+                result = power
+            else:
+                n = len(power) - length
+                result = (result[:n] << np.uint64(2 * size)) | power[length:]
+            length += size
+        if 2 * size > k:
+            return result
+        power = (power[:-size] << np.uint64(2 * size)) | power[size:]
+        size *= 2
+
+
+def _encode(data, k, canonical):
+    """Return the positions and codes of the k-mers in the bytes data (PRIVATE)."""
+    values = _values[np.frombuffer(data, np.uint8)]
+    if len(values) < k:
+        return np.zeros(0, np.intp), np.zeros(0, np.uint64)
+    invalid = np.zeros(len(values) + 1, np.intp)
+    np.cumsum(values > 3, out=invalid[1:])
+    valid = invalid[k:] == invalid[:-k]
+    values &= 3
+    codes = _rolling(values, k)
+    if canonical:
+        complements = _rolling(3 - values[::-1], k)[::-1]
+        np.minimum(codes, complements, out=codes)
+    positions = np.flatnonzero(valid)
+    return positions, codes[positions]
+
+
+def _check_k(k):
+    """Raise a ValueError if the k-mer length is not supported (PRIVATE)."""
+    if not 1 <= k <= 31:
+        raise ValueError("k must be between 1 and 31, not %r" % k)
+
+
+def encode(sequence, k, canonical=False):
+    """Return the positions and integer codes of the k-mers in the sequence.
+
+    Arguments:
+     - sequence - a nucleotide sequence (string, Seq, MutableSeq or SeqRecord)
+     - k - the k-mer length, between 1 and 31
+     - canonical - if True, use the smaller of the codes of each k-mer and
+       its reverse complement
+
+    Returns two NumPy arrays, with the start position of each k-mer and its
+    code as a 64-bit unsigned integer. Windows with letters other than A, C,
+    G, T and U (in upper or lower case) are skipped.
+
+    >>> positions, codes = encode("GATTACA", 4)
+    >>> positions
+    array([0, 1, 2, 3])
+    >>> codes
+    array([143,  60, 241, 196], dtype=uint64)
+    """
+    _check_k(k)
+    return _encode(_as_bytes(sequence), k, canonical)
+
+
+def decode(code, k):
+    """Return the k-mer of length k with the given integer code as a string.
+
+    >>> decode(143, 4)
+    'GATT'
+    """
+    code = int(code)
+    letters = []
+    for i in range(k):
+        letters.append("ACGT"[code & 3])
+        code >>= 2
+    return "".join(reversed(letters))
+
+
+class KmerCounter:
+    """Count the k-mers in one or more nucleotide sequences.
+
+    Arguments:
+     - k - the k-mer length, between 1 and 31
+     - canonical - if True, count each k-mer together with its reverse
+       complement, using whichever of the two comes first alphabetically
+     - dense - if True, keep the counts in an array with one element for
+       each of the 4**k possible k-mers; if False, keep only the k-mers
+       seen. The default is to use dense counts for k up to 10.
+
+    >>> from Bio.Seq import Seq
+    >>> counter = KmerCounter(2)
+    >>> counter.update(Seq("GATTACA"))
+    >>> counter.update(["ACNAC", "TTT"])
+    >>> counter["AC"]
+    3
+    >>> counter.total
+    10
+    >>> len(counter)
+    6
+    >>> counter.most_common(2)
+    [('AC', 3), ('TT', 3)]
+    >>> list(counter.items())
+    [('AC', 3), ('AT', 1), ('CA', 1), ('GA', 1), ('TA', 1), ('TT', 3)]
+
+    The spectrum gives the number of distinct k-mers seen once, twice, etc:
+
+    >>> counter.spectrum()
+    array([0, 4, 0, 2])
+    """
+
+    _batch = 1 << 20  # bytes of sequence to encode at once
+    _pending_limit = 1 << 22  # codes to collect before merging sparse counts
+
+    def __init__(self, k, canonical=False, dense=None):
+        """Initialize an empty counter."""
+        _check_k(k)
+        if dense is None:
+            dense = k <= 10
+        self.k = k
+        self.canonical = canonical
+        self.dense = dense
+        self.total = 0
+        if dense:
+            self._counts = np.zeros(4**k, np.int64)
+        else:
+            self._codes = np.zeros(0, np.uint64)
+            self._counts = np.zeros(0, np.int64)
+            self._pending = []
+            self._npending = 0
+
+    def __repr__(self):
+        """Return a representation of the counter."""
+        return "%s(%i, canonical=%r, dense=%r)" % (
+            self.__class__.__name__,
+            self.k,
+            self.canonical,
+            self.dense,
+        )
+
+    def update(self, sequences):
+        """Count the k-mers in a sequence, or in each of an iterable of sequences.
+
+        The sequences can be strings, Seq or MutableSeq objects, or SeqRecord
+        objects, for example from Bio.SeqIO.parse. Short sequences are joined
+        into larger batches (without counting k-mers spanning two sequences)
+        so that reads are counted about as fast as complete genomes.
+        """
+        for data in _batches(sequences, self._batch):
+            self._add(data)
+
+    def _add(self, data):
+        """Count the k-mers in the bytes data (PRIVATE)."""
+        positions, codes = _encode(data, self.k, self.canonical)
+        self.total += len(codes)
+        if self.dense:
+            self._counts += np.bincount(codes.astype(np.intp), minlength=4**self.k)
+        else:
+            self._pending.append(codes)
+            self._npending += len(codes)
+            if self._npending >= self._pending_limit:
+                self._merge()
+
+    def _merge(self):
+        """Merge the pending codes into the sparse counts (PRIVATE)."""
+        if not self._npending:
+            return
+        pending = np.concatenate(self._pending)
+        pending, counts = np.unique(pending, return_counts=True)
+        codes = np.concatenate([self._codes, pending])
+        counts = np.concatenate([self._counts, counts])
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        counts = counts[order]
+        starts = np.flatnonzero(np.diff(codes, prepend=codes[:1] + 1) != 0)
+        self._codes = codes[starts]
+        self._counts = np.add.reduceat(counts, starts)
+        self._pending = []
+        self._npending = 0
+
+    def sparse(self):
+        """Return the codes of the k-mers seen and their counts as NumPy arrays.
+
+        The codes are in increasing order, which is alphabetical order.
+        """
+        if self.dense:
+            codes = np.flatnonzero(self._counts)
+            return codes.astype(np.uint64), self._counts[codes]
+        self._merge()
+        return self._codes.copy(), self._counts.copy()
+
+    def counts(self):
+        """Return a NumPy array with the count of each of the 4**k possible k-mers.
+
+        The element at index i is the count of the k-mer with code i.
+        """
+        if self.dense:
+            return self._counts.copy()
+        self._merge()
+        counts = np.zeros(4**self.k, np.int64)
+        counts[self._codes.astype(np.intp)] = self._counts
+        return counts
+
+    def spectrum(self):
+        """Return the k-mer spectrum as a NumPy array.
+
+        Element i is the number of distinct k-mers seen exactly i times.
+        """
+        codes, counts = self.sparse()
+        return np.bincount(counts, minlength=1)
+
+    def __len__(self):
+        """Return the number of distinct k-mers seen."""
+        if self.dense:
+            return int(np.count_nonzero(self._counts))
+        self._merge()
+        return len(self._codes)
+
+    def __getitem__(self, kmer):
+        """Return the count of the given k-mer, as a string or Seq."""
+        if len(kmer) == self.k:
+            positions, codes = encode(kmer, self.k, self.canonical)
+        if len(kmer) != self.k or len(codes) != 1:
+            raise ValueError("expected a k-mer of %i unambiguous nucleotides" % self.k)
+        code = codes[0]
+        if self.dense:
+            return int(self._counts[code])
+        self._merge()
+        index = np.searchsorted(self._codes, code)
+        if index < len(self._codes) and self._codes[index] == code:
+            return int(self._counts[index])
+        return 0
+
+    def items(self):
+        """Iterate over the k-mers seen and their counts, in alphabetical order."""
+        codes, counts = self.sparse()
+        for code, count in zip(codes.tolist(), counts.tolist()):
+            yield decode(code, self.k), count
+
+    def most_common(self, n=None):
+        """Return a list of the n most common k-mers and their counts.
+
+        Ties are listed in alphabetical order. If n is None, all k-mers seen
+        are returned.
+        """
+        codes, counts = self.sparse()
+        order = np.argsort(-counts, kind="stable")[:n]
+        return [
+            (decode(code, self.k), count)
+            for code, count in zip(codes[order].tolist(), counts[order].tolist())
+        ]
+
+
+def profile(sequence, k, window, step=None, canonical=False):
+    """Return the k-mer counts in sliding windows along the sequence.
+
+    Arguments:
+     - sequence - a nucleotide sequence (string, Seq, MutableSeq or SeqRecord)
+     - k - the k-mer length, between 1 and 31
+     - window - the window size, at least k
+     - step - the distance between the start of consecutive windows, by
+       default the window size (non-overlapping windows)
+     - canonical - if True, count canonical k-mers
+
+    Returns a two-dimensional NumPy array, with one row for each window
+    (starting at positions 0, step, 2*step, ... while the window fits in the
+    sequence) and one column for each of the 4**k possible k-mers. Only the
+    k-mers entirely within a window are counted. As the array grows quickly
+    with k, a ValueError is raised if it would hold more than 2**27 counts;
+    for larger k, count the k-mers in each window with a sparse KmerCounter
+    instead.
+
+    >>> profile("AACCGGTTAA", 1, window=4, step=3)
+    array([[2, 2, 0, 0],
+           [0, 1, 2, 1],
+           [2, 0, 0, 2]])
+    """
+    _check_k(k)
+    if window < k:
+        raise ValueError("window must be at least k")
+    if step is None:
+        step = window
+    elif step < 1:
+        raise ValueError("step must be positive")
+    size = 4**k
+    nwindows = len(range(0, len(sequence) - window + 1, step))
+    if nwindows * size > _profile_limit:
+        raise ValueError(
+            "profile of %i windows for k=%i would hold %i counts; use a smaller "
+            "k, fewer windows, or a sparse KmerCounter for each window"
+            % (nwindows, k, nwindows * size)
+        )
+    positions, codes = _encode(_as_bytes(sequence), k, canonical)
+    codes = codes.astype(np.intp)
+    starts = np.arange(0, len(sequence) - window + 1, step)
+    if step >= window:
+        # Each k-mer is in at most one window, so count them all at once
+        rows = positions // step
+        inside = (positions - rows * step + k <= window) & (rows < len(starts))
+        indices = rows[inside] * size + codes[inside]
+        counts = np.bincount(indices, minlength=len(starts) * size)
+        return counts.reshape(len(starts), size).astype(np.int64)
+    lows = np.searchsorted(positions, starts)
+    highs = np.searchsorted(positions, starts + window - k + 1)
+    result = np.zeros((len(starts), size), np.int64)
+    for row, low, high in zip(result, lows, highs):
+        row += np.bincount(codes[low:high], minlength=size)
+    return result
+
+
+if __name__ == "__main__":
+    from Bio._utils import run_doctest
+
+    run_doctest()
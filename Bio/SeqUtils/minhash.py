@@ -0,0 +1,379 @@
+# Copyright 2025 by the Biopython contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""MinHash sketches for estimating the similarity of nucleotide sequences.
+
+A sketch keeps a small sample of the hash values of the (by default canonical)
+k-mers in one or more sequences, which is enough to estimate the Jaccard index
+of the k-mer sets of two genomes, and from that their Mash distance, which
+approximates the mutation rate between them (Ondov et al. 2016,
+https://doi.org/10.1186/s13059-016-0997-x). Two kinds of sketch are supported:
+
+ - bottom-k sketches (the default), keeping the ``size`` smallest hash values;
+ - FracMinHash sketches, keeping all hash values below 2**64/``scaled``, so
+   that the size of the sketch is proportional to the number of distinct
+   k-mers.
+
+>>> from Bio import SeqIO
+>>> from Bio.SeqUtils.minhash import Sketch
+>>> record = SeqIO.read("GenBank/NC_005816.fna", "fasta")
+>>> whole = Sketch(k=15, size=500, name="whole")
+>>> whole.update(record)
+>>> half = Sketch(k=15, size=500, name="half")
+>>> half.update(record.seq[:4800])
+>>> len(whole), len(half)
+(500, 500)
+>>> print(f"{whole.jaccard(half):.2f} {half.containment(whole):.2f}")
+0.48 1.00
+>>> print(f"{whole.distance(half):.3f}")
+0.029
+
+The distances between many sketches can be used to build a tree:
+
+>>> from Bio.SeqUtils.minhash import distance_matrix
+>>> from Bio.Phylo.TreeConstruction import DistanceTreeConstructor
+>>> dm = distance_matrix([whole, half])
+>>> dm.names
+['whole', 'half']
+>>> tree = DistanceTreeConstructor().nj(dm)
+
+"""
+
+import math
+
+from Bio.SeqUtils.kmers import _batches
+from Bio.SeqUtils.kmers import _check_k
+from Bio.SeqUtils.kmers import _encode
+from Bio.SeqUtils.kmers import np
+
+
+def _hash(codes, seed):
+    """Return 64-bit hash values of the k-mer codes (PRIVATE).
+
+    This is the SplitMix64 mixing function, a bijection, applied to the codes
+    offset by a multiple of the seed.
+    """
+    offset = np.uint64(seed * 0x9E3779B97F4A7C15 % 2**64)
+    z = codes + offset
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+class Sketch:
+    """MinHash sketch of the k-mers in one or more nucleotide sequences.
+
+    Arguments:
+     - k - the k-mer length, between 1 and 31
+     - size - the number of hash values to keep in a bottom-k sketch
+       (default 1000 unless scaled is given)
+     - scaled - for a FracMinHash sketch, keep the hash values below
+       2**64/scaled, about one in every scaled distinct k-mers
+     - seed - seed of the hash function
+     - canonical - if True (default), sketch each k-mer together with its
+       reverse complement, so that both strands give the same sketch
+     - name - optional name of the sketch, e.g. the name of the genome
+
+    The sorted hash values kept are available as the NumPy array ``hashes``.
+    Only sketches with the same parameters can be compared.
+    """
+
+    _batch = 1 << 22  # bytes of sequence to hash at once
+
+    def __init__(
+        self, k=21, size=None, scaled=None, seed=42, canonical=True, name=None
+    ):
+        """Initialize an empty sketch."""
+        _check_k(k)
+        if size is None and scaled is None:
+            size = 1000
+        elif size is not None and scaled is not None:
+            raise ValueError("size and scaled cannot both be given")
+        elif size is not None and size < 1:
+            raise ValueError("size must be positive")
+        elif scaled is not None and scaled < 1:
+            raise ValueError("scaled must be positive")
+        self.k = k
+        self.size = size
+        self.scaled = scaled
+        self.seed = seed
+        self.canonical = canonical
+        self.name = name
+        self.hashes = np.zeros(0, np.uint64)
+
+    def __repr__(self):
+        """Return a representation of the sketch."""
+        if self.scaled is None:
+            kind = "size=%i" % self.size
+        else:
+            kind = "scaled=%i" % self.scaled
+        return "%s(k=%i, %s, seed=%i, canonical=%r, name=%r)" % (
+            self.__class__.__name__,
+            self.k,
+            kind,
+            self.seed,
+            self.canonical,
+            self.name,
+        )
+
+    def __len__(self):
+        """Return the number of hash values in the sketch."""
+        return len(self.hashes)
+
+    @property
+    def parameters(self):
+        """Parameters of the sketch, as a tuple (k, size, scaled, seed, canonical)."""
+        return (self.k, self.size, self.scaled, self.seed, self.canonical)
+
+    def update(self, sequences):
+        """Add the k-mers in a sequence, or in each of an iterable of sequences.
+
+        The sequences can be strings, Seq or MutableSeq objects, or SeqRecord
+        objects, for example from Bio.SeqIO.parse. K-mers with letters other
+        than A, C, G, T and U are skipped.
+        """
+        for data in _batches(sequences, self._batch):
+            positions, codes = _encode(data, self.k, self.canonical)
+            hashes = _hash(codes, self.seed)
+            if self.scaled is not None:
+                # With scaled=1 all the hash values are kept (and the bound of
+                # 2**64 would not fit in a uint64)
+                if self.scaled > 1:
+                    hashes = hashes[hashes < np.uint64(2**64 // self.scaled)]
+            elif len(self.hashes) == self.size:
+                hashes = hashes[hashes < self.hashes[-1]]
+            hashes = np.union1d(self.hashes, hashes)
+            if self.size is not None:
+                hashes = hashes[: self.size]
+            self.hashes = hashes
+
+    def _check(self, other):
+        """Raise a ValueError if the sketches cannot be compared (PRIVATE)."""
+        if self.parameters != other.parameters:
+            raise ValueError(
+                "sketches with different parameters cannot be compared "
+                "(%r and %r)" % (self.parameters, other.parameters)
+            )
+
+    def _counts(self, other):
+        """Return the number of shared and compared hash values (PRIVATE).
+
+        For bottom-k sketches only hash values up to the smaller of the
+        largest values in the two sketches are compared, as both sketches
+        include all hash values of their k-mers up to there.
+        """
+        self._check(other)
+        hashes1 = self.hashes
+        hashes2 = other.hashes
+        if self.scaled is None and len(hashes1) and len(hashes2):
+            threshold = min(hashes1[-1], hashes2[-1])
+            hashes1 = hashes1[: np.searchsorted(hashes1, threshold, "right")]
+            hashes2 = hashes2[: np.searchsorted(hashes2, threshold, "right")]
+        elif self.scaled is None:
+            return 0, 0, 0
+        shared = len(np.intersect1d(hashes1, hashes2, assume_unique=True))
+        return shared, len(hashes1), len(hashes2)
+
+    def jaccard(self, other):
+        """Estimate the Jaccard index of the k-mers in the two sketches."""
+        shared, count1, count2 = self._counts(other)
+        union = count1 + count2 - shared
+        if union == 0:
+            return 0.0
+        return shared / union
+
+    def containment(self, other):
+        """Estimate the fraction of the k-mers in this sketch found in the other."""
+        shared, count1, count2 = self._counts(other)
+        if count1 == 0:
+            return 0.0
+        return shared / count1
+
+    def distance(self, other):
+        """Estimate the Mash distance between the sequences of the two sketches.
+
+        This is -log(2*j/(1+j))/k for Jaccard index j, or 1.0 if no hash values
+        are shared.
+        """
+        return _mash_distance(self.jaccard(other), self.k)
+
+
+def _mash_distance(jaccard, k):
+    """Return the Mash distance for the given Jaccard index (PRIVATE)."""
+    if jaccard == 0:
+        return 1.0
+    return min(1.0, -math.log(2 * jaccard / (1 + jaccard)) / k)
+
+
+def _shared_counts(sketches):
+    """Return an array with the numbers of hash values shared by sketches (PRIVATE).
+
+    All hash values are sorted together, so that the sketches sharing a hash
+    value are next to each other. Pairs of sketches sharing a hash value are
+    then counted directly, without comparing the sketches that share nothing.
+    Hash values shared by a large fraction of the sketches (as in a collection
+    of closely related genomes) would give too many such pairs, and these are
+    instead counted by multiplying a matrix showing which sketches include
+    them by its transpose.
+    """
+    n = len(sketches)
+    lengths = [len(sketch.hashes) for sketch in sketches]
+    hashes = np.concatenate([np.zeros(0, np.uint64)] + [s.hashes for s in sketches])
+    indices = np.repeat(np.arange(n, dtype=np.intp), lengths)
+    order = np.argsort(hashes, kind="stable")
+    hashes = hashes[order]
+    indices = indices[order]
+    starts = np.flatnonzero(np.diff(hashes, prepend=hashes[:1] + 1) != 0)
+    sizes = np.diff(starts, append=len(hashes))
+    groups = np.repeat(np.arange(len(starts)), sizes)
+    large = (sizes > 1) & (sizes * 32 > n)
+    # the number of later entries with the same hash value
+    remaining = starts[groups] + sizes[groups] - np.arange(len(hashes)) - 1
+    remaining[large[groups]] = 0
+    shared = np.zeros(n * n, np.int64)
+    candidates = np.flatnonzero(remaining > 0)
+    pairs = []
+    npairs = 0
+    step = 1
+    while len(candidates):
+        pairs.append(indices[candidates] * n + indices[candidates + step])
+        npairs += len(candidates)
+        if npairs > 1 << 24:
+            shared += np.bincount(np.concatenate(pairs), minlength=n * n)
+            pairs = []
+            npairs = 0
+        candidates = candidates[remaining[candidates] > step]
+        step += 1
+    if pairs:
+        shared += np.bincount(np.concatenate(pairs), minlength=n * n)
+    shared = shared.reshape(n, n)
+    shared += shared.T
+    # Single precision sums of up to 4096 ones are exact
+    large = np.flatnonzero(large)
+    columns = min(4096, max(1, (1 << 26) // max(n, 1)))
+    for start in range(0, len(large), columns):
+        selected = large[start : start + columns]
+        matrix = np.zeros((n, len(selected)), np.float32)
+        for column, group in enumerate(selected):
+            members = indices[starts[group] : starts[group] + sizes[group]]
+            matrix[members, column] = 1
+        shared += np.rint(matrix @ matrix.T).astype(np.int64)
+    shared[np.diag_indices(n)] = lengths
+    return shared
+
+
+def _pairwise_counts(sketches):
+    """Return arrays of shared and compared hash values for all pairs (PRIVATE)."""
+    sketches = list(sketches)
+    for sketch in sketches[1:]:
+        sketches[0]._check(sketch)
+    shared = _shared_counts(sketches)
+    if sketches and sketches[0].scaled is None:
+        maxima = np.array([sketch.hashes[-1:].sum() for sketch in sketches])
+        empty = np.array([len(sketch) == 0 for sketch in sketches])
+        counts = np.array(
+            [np.searchsorted(sketch.hashes, maxima, "right") for sketch in sketches]
+        ).reshape(len(sketches), len(sketches))
+        counts[:, empty] = 0
+    else:
+        lengths = np.array([len(sketch) for sketch in sketches])
+        counts = np.repeat(lengths[:, None], len(sketches), axis=1)
+    return shared, counts
+
+
+def jaccard_matrix(sketches):
+    """Return a NumPy array with the estimated Jaccard index of each pair of sketches.
+
+    This gives the same values as calling the jaccard method of each pair of
+    sketches, but is much faster for many sketches.
+    """
+    shared, counts = _pairwise_counts(sketches)
+    union = counts + counts.T - shared
+    return np.divide(shared, union, out=np.zeros(shared.shape), where=union > 0)
+
+
+def containment_matrix(sketches):
+    """Return a NumPy array with the estimated containment of each pair of sketches.
+
+    The element at row i and column j is the fraction of the k-mers of sketch
+    i found in sketch j, as given by the containment method.
+    """
+    shared, counts = _pairwise_counts(sketches)
+    return np.divide(shared, counts, out=np.zeros(shared.shape), where=counts > 0)
+
+
+def distance_matrix(sketches):
+    """Return a DistanceMatrix with the Mash distances between the sketches.
+
+    The sketches must have unique names, which are used as the names in the
+    Bio.Phylo.TreeConstruction.DistanceMatrix, for example to build a tree.
+    """
+    from Bio.Phylo.TreeConstruction import DistanceMatrix
+
+    sketches = list(sketches)
+    jaccard = jaccard_matrix(sketches)
+    k = sketches[0].k if sketches else 1
+    with np.errstate(divide="ignore"):
+        distances = -np.log(2 * jaccard / (1 + jaccard)) / k
+    distances = np.minimum(distances, 1.0)
+    np.fill_diagonal(distances, 0.0)
+    names = [sketch.name for sketch in sketches]
+    matrix = [row[: i + 1].tolist() for i, row in enumerate(distances)]
+    return DistanceMatrix(names, matrix)
+
+
+def save(sketches, file):
+    """Save the sketches in NumPy's binary .npz format.
+
+    Arguments:
+     - sketches - a list of sketches, which must have the same parameters
+     - file - a filename or a binary file handle
+
+    The hash values are stored as 64-bit integers, about 8 bytes per hash
+    value in total.
+    """
+    sketches = list(sketches)
+    for sketch in sketches[1:]:
+        sketches[0]._check(sketch)
+    if sketches:
+        k, size, scaled, seed, canonical = sketches[0].parameters
+    else:
+        k, size, scaled, seed, canonical = Sketch().parameters
+    np.savez(
+        file,
+        parameters=np.array([k, size or 0, scaled or 0, seed, canonical], np.int64),
+        names=np.array(["" if s.name is None else s.name for s in sketches], str),
+        lengths=np.array([len(sketch) for sketch in sketches], np.int64),
+        hashes=np.concatenate([np.zeros(0, np.uint64)] + [s.hashes for s in sketches]),
+    )
+
+
+def load(file):
+    """Load a list of sketches saved by the save function.
+
+    Arguments:
+     - file - a filename or a binary file handle
+
+    Empty names are loaded as None.
+    """
+    with np.load(file, allow_pickle=False) as data:
+        k, size, scaled, seed, canonical = data["parameters"].tolist()
+        names = data["names"].tolist()
+        lengths = data["lengths"]
+        hashes = data["hashes"]
+    sketches = []
+    for name, values in zip(names, np.split(hashes, np.cumsum(lengths)[:-1])):
+        sketch = Sketch(k, size or None, scaled or None, seed, bool(canonical))
+        sketch.name = name or None
+        sketch.hashes = values
+        sketches.append(sketch)
+    return sketches
+
+
+if __name__ == "__main__":
+    from Bio._utils import run_doctest
+
+    run_doctest()
@@ -0,0 +1,309 @@
+# Copyright 2025 by the Biopython contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Finding open reading frames (ORFs) in nucleotide sequences.
+
+The start and stop codons in all six reading frames are located using NumPy,
+for any NCBI genetic code including its alternative start codons. By default
+an ORF runs from the first start codon after an in-frame stop codon, up to and
+including the next stop codon:
+
+>>> from Bio.SeqUtils import orfs
+>>> result = orfs.find("CCATGAAATTTTAGCCCTTACATCATGGC", min_length=9)
+>>> result.starts
+array([ 2, 17])
+>>> result.ends
+array([14, 26])
+>>> result.strands
+array([ 1, -1])
+
+The ORFs can be converted into SeqFeature objects, for example to translate
+them or to add them to a SeqRecord:
+
+>>> from Bio.Seq import Seq
+>>> sequence = Seq("CCATGAAATTTTAGCCCTTACATCATGGC")
+>>> for feature in result.features():
+...     print(feature.location, feature.translate(sequence))
+...
+[2:14](+) MKF
+[17:26](-) MM
+
+Codons containing ambiguous letters (such as N) are neither start nor stop
+codons. Use the parse function to find the ORFs in each record of a file,
+such as a multi-record genome, one record at a time.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Please install NumPy if you want to use Bio.SeqUtils.orfs. "
+        "See http://www.numpy.org/"
+    ) from None
+
+from Bio import SeqIO
+from Bio.Seq import _get_codon_table
+from Bio.SeqFeature import SeqFeature
+from Bio.SeqFeature import SimpleLocation
+
+# Nucleotides are stored as 0-3 (ACGT, with U as T), anything else as 4,
+# and codons as 25 * first + 5 * second + third.
+_values = bytes(
+    "ACGT".find(chr(i).upper().replace("U", "T")) % 5 if i < 128 else 4
+    for i in range(256)
+)
+
+
+class ORFs:
+    """Open reading frames found in a nucleotide sequence.
+
+    Attributes:
+     - id - the identifier of the sequence, if known
+     - description - the description of the sequence, if known
+     - length - the length of the sequence
+     - table - the CodonTable used
+     - starts - the start of each ORF, as a NumPy array
+     - ends - the end of each ORF, as a NumPy array
+     - strands - the strand of each ORF (+1 or -1), as a NumPy array
+
+    The start and end are given as Python slice coordinates on the forward
+    strand, so on the reverse strand the stop codon is at the start. The ORFs
+    are sorted by their start position.
+    """
+
+    def __init__(self, length, table, starts, ends, strands):
+        """Initialize the class."""
+        self.id = None
+        self.description = None
+        self.length = length
+        self.table = table
+        self.starts = starts
+        self.ends = ends
+        self.strands = strands
+
+    def __repr__(self):
+        """Return a representation of the ORFs."""
+        return "<%s for %s with %i ORFs using table %i>" % (
+            self.__class__.__name__,
+            self.id,
+            len(self.starts),
+            self.table.id,
+        )
+
+    def __len__(self):
+        """Return the number of ORFs."""
+        return len(self.starts)
+
+    @property
+    def frames(self):
+        """Return the reading frame of each ORF, as +1, +2, +3, -1, -2 or -3."""
+        return np.where(
+            self.strands > 0,
+            self.starts % 3 + 1,
+            -((self.length - self.ends) % 3 + 1),
+        )
+
+    def features(self, type="CDS"):
+        """Return a list of SeqFeature objects for the ORFs.
+
+        Each feature has a SimpleLocation and the transl_table qualifier, so
+        that its translate method uses the same genetic code.
+        """
+        return [
+            SeqFeature(
+                SimpleLocation(start, end, strand),
+                type=type,
+                qualifiers={"transl_table": [self.table.id]},
+            )
+            for start, end, strand in zip(
+                self.starts.tolist(), self.ends.tolist(), self.strands.tolist()
+            )
+        ]
+
+
+def _codon_kinds(start_codons, stop_codons):
+    """Return lookup tables for the codons on the forward and reverse strand (PRIVATE).
+
+    Both tables are indexed by the codon value on the forward strand, giving
+    1 for a start codon, 2 for a stop codon, 3 for both, and 0 otherwise.
+    """
+    forward = np.zeros(125, np.uint8)
+    reverse = np.zeros(125, np.uint8)
+    for kind, codons in ((1, start_codons), (2, stop_codons)):
+        for codon in codons:
+            codon = codon.upper().replace("U", "T")
+            if len(codon) == 3 and set(codon) <= set("ACGT"):
+                first, second, third = ("ACGT".index(letter) for letter in codon)
+                forward[25 * first + 5 * second + third] |= kind
+                reverse[25 * (3 - third) + 5 * (3 - second) + (3 - first)] |= kind
+    return forward, reverse
+
+
+def _scan(positions, kinds, length, min_length, require_start, partial):
+    """Find the ORFs on one strand from its start and stop codons (PRIVATE).
+
+    The positions of the start and stop codons are given in increasing order
+    along the strand. Returns arrays with the start and end of each ORF.
+    """
+    frames = positions % 3
+    orf_starts = []
+    orf_ends = []
+    for frame in range(3):
+        in_frame = frames == frame
+        ends = positions[in_frame & (kinds & 2 != 0)] + 3
+        # Each stop codon ends the region starting after the previous one.
+        begins = np.empty(len(ends), np.intp)
+        begins[0:1] = frame
+        begins[1:] = ends[:-1]
+        limits = ends - 3  # the start codon must be before the stop codon
+        if partial:
+            last = frame + (length - frame) // 3 * 3
+            begin = ends[-1] if len(ends) else frame
+            if last > begin:
+                begins = np.append(begins, begin)
+                ends = np.append(ends, last)
+                limits = np.append(limits, last - 2)
+        if require_start:
+            candidates = positions[in_frame & (kinds & 1 != 0)]
+            if len(candidates) == 0:
+                continue
+            indices = np.searchsorted(candidates, begins)
+            found = indices < len(candidates)
+            begins = candidates[np.minimum(indices, len(candidates) - 1)]
+            found &= begins < limits
+        else:
+            found = begins < limits
+        found &= ends - begins >= min_length
+        orf_starts.append(begins[found])
+        orf_ends.append(ends[found])
+    if not orf_starts:
+        return np.zeros(0, np.intp), np.zeros(0, np.intp)
+    return np.concatenate(orf_starts), np.concatenate(orf_ends)
+
+
+def find(
+    sequence,
+    table=1,
+    min_length=30,
+    start_codons=None,
+    require_start=True,
+    partial=False,
+    strand=None,
+):
+    """Find the open reading frames in all six frames of a nucleotide sequence.
+
+    Arguments:
+     - sequence - a string, Seq, MutableSeq or SeqRecord object
+     - table - the genetic code, as an NCBI table identifier, a table name, or
+       a CodonTable object (default 1, the standard code)
+     - min_length - the minimum length of an ORF in nucleotides, including
+       the stop codon (default 30)
+     - start_codons - a list of start codons to use instead of those of the
+       table, for example ["ATG"] to ignore the alternative start codons
+     - require_start - if True (default), an ORF starts at the first start
+       codon after the previous stop codon in the same frame. If False, it
+       starts directly after the previous stop codon (or at the start of the
+       sequence), giving the longest possible stop to stop ORFs.
+     - partial - if True, also include ORFs running to the end of the sequence
+       without a stop codon (default False)
+     - strand - +1 or -1 to search only one strand, or None (default) for both
+
+    Returns an ORFs object, with the id and description of a SeqRecord copied
+    to it.
+    """
+    if strand not in (None, +1, -1):
+        raise ValueError("strand should be +1, -1 or None")
+    table = _get_codon_table(table)
+    if start_codons is None:
+        start_codons = table.start_codons
+    forward, reverse = _codon_kinds(start_codons, table.stop_codons)
+    try:
+        data = sequence.seq
+    except AttributeError:
+        data = sequence
+    if isinstance(data, str):
+        data = data.encode("ASCII")
+    else:
+        data = bytes(data)
+    length = len(data)
+    values = np.frombuffer(data.translate(_values), np.uint8)
+    codons = values[:-2] * 25 + values[1:-1] * 5 + values[2:]
+    del values
+    results = []
+    if strand != -1 and length >= 3:
+        kinds = forward[codons]
+        positions = np.flatnonzero(kinds)
+        starts, ends = _scan(
+            positions, kinds[positions], length, min_length, require_start, partial
+        )
+        results.append((starts, ends, np.ones(len(starts), np.intp)))
+    if strand != +1 and length >= 3:
+        kinds = reverse[codons]
+        positions = np.flatnonzero(kinds)
+        kinds = kinds[positions[::-1]]
+        # Positions counted from the end, so the reverse strand reads forward
+        positions = length - 3 - positions[::-1]
+        starts, ends = _scan(
+            positions, kinds, length, min_length, require_start, partial
+        )
+        strands = np.full(len(starts), -1, np.intp)
+        results.append((length - ends, length - starts, strands))
+    if results:
+        starts, ends, strands = (np.concatenate(arrays) for arrays in zip(*results))
+        order = np.lexsort((strands, ends, starts))
+        starts, ends, strands = starts[order], ends[order], strands[order]
+    else:
+        starts = np.zeros(0, np.intp)
+        ends = np.zeros(0, np.intp)
+        strands = np.zeros(0, np.intp)
+    result = ORFs(length, table, starts, ends, strands)
+    result.id = getattr(sequence, "id", None)
+    result.description = getattr(sequence, "description", None)
+    return result
+
+
+def parse(
+    source,
+    format="fasta",
+    table=1,
+    min_length=30,
+    start_codons=None,
+    require_start=True,
+    partial=False,
+    strand=None,
+):
+    """Find the open reading frames in each record of a sequence file.
+
+    The source and format are as for Bio.SeqIO.parse, and the other arguments
+    as for the find function. Returns an iterator of ORFs objects, one for
+    each record, reading the records one at a time.
+
+    >>> from Bio.SeqUtils import orfs
+    >>> for result in orfs.parse("Fasta/f002", min_length=150):
+    ...     print(result.id, result.starts, result.ends, result.frames)
+    ...
+    gi|1348912|gb|G26680|G26680 [ 51 230] [210 587] [ 1 -2]
+    gi|1348917|gb|G26685|G26685 [] [] []
+    gi|1592936|gb|G29385|G29385 [174 209] [330 428] [1 3]
+    """
+    for record in SeqIO.parse(source, format):
+        yield find(
+            record,
+            table,
+            min_length,
+            start_codons,
+            require_start,
+            partial,
+            strand,
+        )
+
+
+if __name__ == "__main__":
+    from Bio._utils import run_doctest
+
+    run_doctest()
@@ -0,0 +1,324 @@
+# Copyright 2025 by the Biopython contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Nucleotide composition in sliding windows along sequences.
+
+The letters in each window are counted using NumPy, such that the time taken
+depends on the sequence length but not on the window size or the overlap
+between windows. Windows start at positions 0, step, 2*step, ... and only
+complete windows are included.
+
+>>> from Bio.SeqUtils import windows
+>>> counts = windows.count("GGGCCAATTANGCGCGTAGG", window=10, step=5)
+>>> counts.starts
+array([ 0,  5, 10])
+>>> counts.count("GC")
+array([5, 4, 7])
+>>> counts.fraction("GC")
+array([0.5, 0.4, 0.7])
+
+Ambiguous letters can be left out when calculating fractions:
+
+>>> print(counts.fraction("GC", of="ACGT").round(3))
+[0.5   0.444 0.778]
+>>> print(counts.skew("G", "C").round(3))
+[0.2   0.    0.429]
+
+Use the parse function to process the records of a FASTA file one by one,
+without holding complete records in memory, for example for whole genomes:
+
+>>> for counts in windows.parse("Fasta/f002", window=300, step=150):
+...     print(counts.id, counts.length, counts.fraction("GC", of="ACGT").round(2))
+...
+gi|1348912|gb|G26680|G26680 633 [0.44 0.44 0.48]
+gi|1348917|gb|G26685|G26685 413 [0.39]
+gi|1592936|gb|G29385|G29385 471 [0.45 0.47]
+
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Please install NumPy if you want to use Bio.SeqUtils.windows. "
+        "See http://www.numpy.org/"
+    ) from None
+
+from Bio.File import as_handle
+
+
+class WindowCounts:
+    """Counts of letters in sliding windows along a sequence.
+
+    Attributes:
+     - id - the identifier of the sequence, if known
+     - description - the description of the sequence, if known
+     - length - the length of the sequence
+     - window - the window size
+     - step - the distance between the starts of consecutive windows
+     - letters - the letters counted, as a string
+     - starts - the start positions of the windows, as a NumPy array
+     - counts - a NumPy array with one row for each window, and one column
+       for each letter counted
+
+    Letters are counted regardless of case.
+    """
+
+    def __init__(self, window, step, letters, starts, counts, length):
+        """Initialize the class."""
+        self.id = None
+        self.description = None
+        self.window = window
+        self.step = step
+        self.letters = letters
+        self.starts = starts
+        self.counts = counts
+        self.length = length
+
+    def __repr__(self):
+        """Return a representation of the window counts."""
+        return "<%s for %s with %i windows of %i (step %i) over %r>" % (
+            self.__class__.__name__,
+            self.id,
+            len(self.starts),
+            self.window,
+            self.step,
+            self.letters,
+        )
+
+    def __len__(self):
+        """Return the number of windows."""
+        return len(self.starts)
+
+    def count(self, letters):
+        """Return the total count of the given letters in each window."""
+        columns = []
+        for letter in letters:
+            column = self.letters.find(letter.upper())
+            if column < 0:
+                raise ValueError(f"letter {letter!r} was not counted")
+            columns.append(column)
+        return self.counts[:, columns].sum(axis=1)
+
+    def fraction(self, letters, of=None):
+        """Return the fraction of the given letters in each window.
+
+        By default this is relative to the window size. Otherwise, the fraction
+        is relative to the total count of the letters given in the argument of,
+        e.g. to ignore ambiguous letters; windows without any of those letters
+        get a fraction of zero.
+        """
+        counts = self.count(letters)
+        if of is None:
+            return counts / self.window
+        totals = self.count(of)
+        return np.divide(counts, totals, out=np.zeros(len(counts)), where=totals > 0)
+
+    def skew(self, first="G", second="C"):
+        """Return the skew (first-second)/(first+second) in each window.
+
+        The default is the GC skew (G-C)/(G+C). Windows without either letter
+        get a skew of zero.
+        """
+        first = self.count(first)
+        second = self.count(second)
+        totals = first + second
+        return np.divide(
+            first - second, totals, out=np.zeros(len(totals)), where=totals > 0
+        )
+
+    def cumulative_skew(self, first="G", second="C"):
+        """Return the accumulated skew over the windows, as plotted by xGC_skew."""
+        return np.cumsum(self.skew(first, second))
+
+
+class _WindowCounter:
+    """Count letters in windows over sequence data given in pieces (PRIVATE).
+
+    Each piece of data is processed by taking the cumulative count of each
+    letter, of which only the values at the window starts and ends are kept.
+    The window counts are then found as their differences, so the memory
+    needed is proportional to the number of windows.
+    """
+
+    chunk = 1 << 22
+
+    def __init__(self, window, step, letters):
+        if window < 1:
+            raise ValueError("window must be positive")
+        if step is None:
+            step = window
+        elif step < 1:
+            raise ValueError("step must be positive")
+        letters = letters.upper()
+        if len(set(letters)) != len(letters):
+            raise ValueError("letters should not be repeated")
+        if len(letters) > 255:
+            raise ValueError("too many letters")
+        self.window = window
+        self.step = step
+        self.letters = letters
+        self.table = np.full(256, len(letters), np.uint8)
+        for column, letter in enumerate(letters.encode("ASCII")):
+            self.table[letter] = column
+            self.table[bytes([letter]).lower()[0]] = column
+        self.reset()
+
+    def reset(self):
+        self.buffer = bytearray()
+        self.length = 0
+        self.offset = 0  # position of the start of the buffer
+        self.totals = np.zeros(len(self.letters), np.int64)
+        self.firsts = []  # cumulative counts at the window starts
+        self.lasts = []  # cumulative counts at the window ends
+
+    def feed(self, data):
+        self.buffer += data
+        self.length += len(data)
+        if len(self.buffer) >= self.chunk:
+            self._process()
+
+    def _process(self, final=False):
+        window = self.window
+        step = self.step
+        offset = self.offset
+        size = len(self.buffer)
+        # Positions from offset up to offset + size, which is included only
+        # at the end of the sequence, as the next piece starts there
+        end = offset + size + final
+        starts = np.arange(-(-offset // step) * step, end, step)
+        first = max(-(-(offset - window) // step), 0)
+        ends = np.arange(first * step + window, end, step)
+        codes = self.table[np.frombuffer(self.buffer, np.uint8)]
+        firsts = np.empty((len(starts), len(self.letters)), np.int64)
+        lasts = np.empty((len(ends), len(self.letters)), np.int64)
+        cumulative = np.zeros(size + 1, np.int32)
+        totals = self.totals
+        for column in range(len(self.letters)):
+            np.cumsum(codes == column, dtype=np.int32, out=cumulative[1:])
+            firsts[:, column] = cumulative[starts - offset] + totals[column]
+            lasts[:, column] = cumulative[ends - offset] + totals[column]
+            totals[column] += cumulative[-1]
+        self.firsts.append(firsts)
+        self.lasts.append(lasts)
+        del self.buffer[:]
+        self.offset += size
+
+    def finish(self):
+        self._process(final=True)
+        firsts = np.concatenate(self.firsts)
+        lasts = np.concatenate(self.lasts)
+        starts = np.arange(0, self.length - self.window + 1, self.step)
+        counts = lasts - firsts[: len(lasts)]
+        result = WindowCounts(
+            self.window, self.step, self.letters, starts, counts, self.length
+        )
+        self.reset()
+        return result
+
+
+def count(sequence, window, step=None, letters="ACGTN"):
+    """Count the letters in sliding windows along a sequence.
+
+    Arguments:
+     - sequence - a string, Seq, MutableSeq or SeqRecord object
+     - window - the window size
+     - step - the distance between the starts of consecutive windows, by
+       default the window size (non-overlapping windows)
+     - letters - a string with the letters to count (regardless of case)
+
+    Returns a WindowCounts object. The id and description of a SeqRecord are
+    copied to it.
+    """
+    counter = _WindowCounter(window, step, letters)
+    if isinstance(sequence, str):
+        data = sequence.encode("ASCII")
+    else:
+        data = bytes(sequence)
+    for start in range(0, len(data), counter.chunk):
+        counter.feed(data[start : start + counter.chunk])
+    result = counter.finish()
+    result.id = getattr(sequence, "id", None)
+    result.description = getattr(sequence, "description", None)
+    return result
+
+
+def parse(source, window, step=None, letters="ACGTN"):
+    """Count the letters in sliding windows along each record in a FASTA file.
+
+    Arguments:
+     - source - a filename or handle of a FASTA file
+     - window - the window size
+     - step - the distance between the starts of consecutive windows, by
+       default the window size (non-overlapping windows)
+     - letters - a string with the letters to count (regardless of case)
+
+    Returns an iterator of WindowCounts objects, one for each record, with
+    the id and description taken from the title line. The file is read in
+    pieces, so the memory needed depends on the number of windows rather than
+    the length of the records. Any text before the first record is ignored.
+    """
+    counter = _WindowCounter(window, step, letters)
+    title = None
+    header = None  # pieces of a title line being read
+    at_line_start = True
+    with as_handle(source, "rb") as handle:
+        while True:
+            data = handle.read(counter.chunk)
+            if not data:
+                break
+            if isinstance(data, str):
+                data = data.encode("ASCII")
+            position = 0
+            while position < len(data):
+                if header is not None:
+                    end = data.find(b"\n", position)
+                    if end < 0:
+                        header.append(data[position:])
+                        break
+                    header.append(data[position:end])
+                    title = b"".join(header).strip().decode()
+                    header = None
+                    position = end + 1
+                    at_line_start = True
+                elif at_line_start and data[position] == 62:  # ">"
+                    if title is not None:
+                        yield _finish(counter, title)
+                    else:
+                        counter.reset()
+                    header = []
+                    position += 1
+                else:
+                    end = data.find(b"\n>", position)
+                    if end < 0:
+                        end = len(data)
+                    else:
+                        end += 1
+                    counter.feed(data[position:end].translate(None, b" \t\r\n"))
+                    at_line_start = data[end - 1] == 10  # "\n"
+                    position = end
+    if header is not None:
+        title = b"".join(header).strip().decode()
+    if title is not None:
+        yield _finish(counter, title)
+
+
+def _finish(counter, title):
+    """Return the window counts for a record with the given title (PRIVATE)."""
+    result = counter.finish()
+    result.id = title.split(None, 1)[0] if title else ""
+    result.description = title
+    return result
+
+
+if __name__ == "__main__":
+    from Bio._utils import run_doctest
+
+    run_doctest()
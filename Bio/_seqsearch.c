@@ -0,0 +1,289 @@
+/* Copyright 2025 by the Biopython contributors.  All rights reserved.
+ *
+ * This file is part of the Biopython distribution and governed by your
+ * choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+ * Please see the LICENSE file that should have been included as part of this
+ * package.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t nstates;
+    Py_ssize_t width;
+    unsigned char classes[256];
+    int32_t* transitions;
+    int32_t* offsets;
+    int32_t* outputs;
+} Automaton;
+
+
+static int
+Automaton_init(Automaton* self, PyObject* args, PyObject* kwds)
+{
+    Py_buffer classes;
+    Py_buffer transitions;
+    Py_buffer offsets;
+    Py_buffer outputs;
+    Py_ssize_t i;
+    Py_ssize_t n;
+    Py_ssize_t m;
+    Py_ssize_t nstates;
+    Py_ssize_t noutputs;
+    const unsigned char* c;
+    const int32_t* table;
+    const int32_t* offset;
+    const int32_t* output;
+    int result = -1;
+
+    static char *kwlist[] = {"classes", "transitions", "offsets", "outputs",
+                             NULL};
+
+    classes.obj = NULL;
+    transitions.obj = NULL;
+    offsets.obj = NULL;
+    outputs.obj = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "y*y*y*y*:Automaton", kwlist,
+                                     &classes, &transitions, &offsets,
+                                     &outputs)) return -1;
+    if (classes.len != 256) {
+        PyErr_SetString(PyExc_ValueError, "expected 256 classes");
+        goto exit;
+    }
+    nstates = offsets.len / sizeof(int32_t) - 1;
+    noutputs = outputs.len / sizeof(int32_t);
+    if (nstates < 1) {
+        PyErr_SetString(PyExc_ValueError, "expected at least one state");
+        goto exit;
+    }
+    m = transitions.len / sizeof(int32_t) / nstates;
+    if (m * nstates * (Py_ssize_t)sizeof(int32_t) != transitions.len) {
+        PyErr_SetString(PyExc_ValueError,
+                        "size of transitions table is inconsistent");
+        goto exit;
+    }
+    c = classes.buf;
+    table = transitions.buf;
+    offset = offsets.buf;
+    output = outputs.buf;
+    for (i = 0; i < 256; i++) {
+        if (c[i] >= m) {
+            PyErr_SetString(PyExc_ValueError, "class is out of range");
+            goto exit;
+        }
+    }
+    n = nstates * m;
+    for (i = 0; i < n; i++) {
+        if (table[i] < 0 || table[i] >= nstates) {
+            PyErr_SetString(PyExc_ValueError, "transition is out of range");
+            goto exit;
+        }
+    }
+    for (i = 0; i < nstates; i++) {
+        if (offset[i] < 0 || offset[i] > offset[i + 1]) {
+            PyErr_SetString(PyExc_ValueError, "offsets are not increasing");
+            goto exit;
+        }
+    }
+    if (offset[0] != 0 || offset[nstates] > noutputs) {
+        PyErr_SetString(PyExc_ValueError, "outputs are out of range");
+        goto exit;
+    }
+    PyMem_Free(self->transitions);
+    PyMem_Free(self->offsets);
+    PyMem_Free(self->outputs);
+    self->transitions = PyMem_Malloc(transitions.len);
+    self->offsets = PyMem_Malloc(offsets.len);
+    self->outputs = PyMem_Malloc(outputs.len ? outputs.len : 1);
+    if (!self->transitions || !self->offsets || !self->outputs) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+    memcpy(self->classes, c, 256);
+    memcpy(self->transitions, table, transitions.len);
+    memcpy(self->offsets, offset, offsets.len);
+    memcpy(self->outputs, output, outputs.len);
+    self->nstates = nstates;
+    self->width = m;
+    result = 0;
+
+exit:
+    if (classes.obj) PyBuffer_Release(&classes);
+    if (transitions.obj) PyBuffer_Release(&transitions);
+    if (offsets.obj) PyBuffer_Release(&offsets);
+    if (outputs.obj) PyBuffer_Release(&outputs);
+    return result;
+}
+
+static void
+Automaton_dealloc(Automaton* self)
+{
+    PyMem_Free(self->transitions);
+    PyMem_Free(self->offsets);
+    PyMem_Free(self->outputs);
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static char Automaton_scan__doc__[] =
+"    scan(sequence, start, end, state)\n"
+"\n"
+"Run the search automaton over sequence[start:end] starting in the given\n"
+"state. Returns the final state, and a list of (end, output) tuples for\n"
+"the matches found, where end is the position just after the match.\n";
+
+static PyObject*
+Automaton_scan(Automaton* self, PyObject* args)
+{
+    Py_buffer sequence;
+    Py_ssize_t start;
+    Py_ssize_t end;
+    Py_ssize_t i;
+    Py_ssize_t j;
+    Py_ssize_t m = self->width;
+    int state;
+    int32_t first;
+    int32_t last;
+    const unsigned char* s;
+    const unsigned char* c = self->classes;
+    const int32_t* table = self->transitions;
+    const int32_t* offset = self->offsets;
+    const int32_t* output = self->outputs;
+    PyObject* matches = NULL;
+    PyObject* match;
+    PyObject* result = NULL;
+
+    if (!table) {
+        PyErr_SetString(PyExc_RuntimeError, "automaton is not initialized");
+        return NULL;
+    }
+    if (!PyArg_ParseTuple(args, "y*nni:scan", &sequence, &start, &end, &state))
+        return NULL;
+    if (start < 0 || end > sequence.len || start > end) {
+        PyErr_SetString(PyExc_ValueError, "start and end are out of range");
+        goto exit;
+    }
+    if (state < 0 || state >= self->nstates) {
+        PyErr_SetString(PyExc_ValueError, "state is out of range");
+        goto exit;
+    }
+    s = sequence.buf;
+
+    matches = PyList_New(0);
+    if (!matches) goto exit;
+    for (i = start; i < end; i++) {
+        state = table[state * m + c[s[i]]];
+        first = offset[state];
+        last = offset[state + 1];
+        for (j = first; j < last; j++) {
+            match = Py_BuildValue("(ni)", i + 1, output[j]);
+            if (!match) goto exit;
+            if (PyList_Append(matches, match) == -1) {
+                Py_DECREF(match);
+                goto exit;
+            }
+            Py_DECREF(match);
+        }
+    }
+    result = Py_BuildValue("(iO)", state, matches);
+
+exit:
+    Py_XDECREF(matches);
+    PyBuffer_Release(&sequence);
+    return result;
+}
+
+static PyMethodDef Automaton_methods[] = {
+    {"scan",
+     (PyCFunction)Automaton_scan,
+     METH_VARARGS,
+     Automaton_scan__doc__
+    },
+    {NULL}  /* Sentinel */
+};
+
+static char Automaton_doc[] =
+"Automaton(classes, transitions, offsets, outputs)\n"
+"\n"
+"Search automaton for multiple substrings. The byte string classes maps\n"
+"each byte to its column in the table of transitions (an array of 32-bit\n"
+"integers, with one row per state), and outputs[offsets[state]:\n"
+"offsets[state+1]] are the outputs found on reaching a state. The tables\n"
+"are checked and copied when the automaton is created.\n";
+
+static PyTypeObject AutomatonType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_seqsearch.Automaton",        /* tp_name */
+    sizeof(Automaton),             /* tp_basicsize */
+    0,                             /* tp_itemsize */
+    (destructor)Automaton_dealloc, /* tp_dealloc */
+    0,                             /* tp_print */
+    0,                             /* tp_getattr */
+    0,                             /* tp_setattr */
+    0,                             /* tp_reserved */
+    0,                             /* tp_repr */
+    0,                             /* tp_as_number */
+    0,                             /* tp_as_sequence */
+    0,                             /* tp_as_mapping */
+    0,                             /* tp_hash */
+    0,                             /* tp_call */
+    0,                             /* tp_str */
+    0,                             /* tp_getattro */
+    0,                             /* tp_setattro */
+    0,                             /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,            /* tp_flags */
+    Automaton_doc,                 /* tp_doc */
+    0,                             /* tp_traverse */
+    0,                             /* tp_clear */
+    0,                             /* tp_richcompare */
+    0,                             /* tp_weaklistoffset */
+    0,                             /* tp_iter */
+    0,                             /* tp_iternext */
+    Automaton_methods,             /* tp_methods */
+    0,                             /* tp_members */
+    0,                             /* tp_getset */
+    0,                             /* tp_base */
+    0,                             /* tp_dict */
+    0,                             /* tp_descr_get */
+    0,                             /* tp_descr_set */
+    0,                             /* tp_dictoffset */
+    (initproc)Automaton_init,      /* tp_init */
+};
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_seqsearch",
+    PyDoc_STR("Fast multiple substring search for sequences"),
+    -1,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyObject*
+PyInit__seqsearch(void)
+{
+    PyObject* module;
+
+    AutomatonType.tp_new = PyType_GenericNew;
+    if (PyType_Ready(&AutomatonType) < 0) return NULL;
+
+    module = PyModule_Create(&moduledef);
+    if (!module) return NULL;
+
+    Py_INCREF(&AutomatonType);
+    if (PyModule_AddObject(module,
+                           "Automaton", (PyObject*) &AutomatonType) < 0) {
+        Py_DECREF(&AutomatonType);
+        Py_DECREF(module);
+        return NULL;
+    }
+
+    return module;
+}
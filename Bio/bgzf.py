@@ -203,6 +203,20 @@ The catch with BGZF virtual offsets is while they can be compared
 them to get the size of the data between them, nor add/subtract
 a relative offset.
 
+If instead you know the decompressed position, use the handle's
+seek_uncompressed() method. This bisects a list of the block start
+offsets in both the compressed and the decompressed file, as in the
+".gzi" index files made by ``bgzip -i`` or ``samtools faidx``:
+
+>>> handle = BgzfReader("GenBank/NC_000932.gb.bgz")
+>>> print(handle.seek_uncompressed(196734))
+3609329790
+>>> handle.close()
+
+An existing ".gzi" file (the filename plus ".gzi") is used if found,
+otherwise the index is built by reading the block headers. See also the
+read_gzi, write_gzi and build_gzi functions.
+
 Of course you can parse this file with Bio.SeqIO using BgzfReader,
 although there isn't any benefit over using gzip.open(...), unless
 you want to index BGZF compressed sequence files:
@@ -248,10 +262,16 @@ binary mode, and decode the appropriate fragments yourself.
 """
 
 import io
+import os
 import struct
 import sys
 import zlib
+from bisect import bisect_right
 from builtins import open as _open
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from Bio.File import as_handle
 
 _bgzf_magic = b"\x1f\x8b\x08\x04"
 _bgzf_header = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00\x42\x43\x02\x00"
@@ -259,7 +279,7 @@ _bgzf_eof = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00\x1b\x00
 _bytes_BC = b"BC"
 
 
-def open(filename, mode="rb"):
+def open(filename, mode="rb", threads=1):
     r"""Open a BGZF file for reading, writing or appending.
 
     If text mode is requested, in order to avoid multi-byte characters, this is
@@ -268,11 +288,15 @@ def open(filename, mode="rb"):
 
     If your data is in UTF-8 or any other incompatible encoding, you must use
     binary mode, and decode the appropriate fragments yourself.
+
+    The optional threads argument sets the number of threads used to
+    decompress or compress the BGZF blocks, see the BgzfReader and
+    BgzfWriter classes.
     """
     if "r" in mode.lower():
-        return BgzfReader(filename, mode)
+        return BgzfReader(filename, mode, threads=threads)
     elif "w" in mode.lower() or "a" in mode.lower():
-        return BgzfWriter(filename, mode)
+        return BgzfWriter(filename, mode, threads=threads)
     else:
         raise ValueError(f"Bad mode {mode!r}")
 
@@ -429,11 +453,89 @@ def BgzfBlocks(handle):
         data_start += data_len
 
 
-def _load_bgzf_block(handle, text_mode=False):
-    """Load the next BGZF block of compressed data (PRIVATE).
+def build_gzi(source):
+    """Scan a BGZF file and return its block index for use as a GZI index.
 
-    Returns a tuple (block size and data), or at end of file
-    will raise StopIteration.
+    Arguments:
+     - source - a BGZF file opened in binary read mode using the builtin
+       open function, or a path to a file
+
+    Returns a list of (compressed offset, uncompressed offset) tuples giving
+    the start of each BGZF block, beginning with (0, 0) for the first block.
+    Unlike the BgzfBlocks function, this only needs to read the block headers
+    and trailers, the blocks are not decompressed.
+
+    >>> for offsets in build_gzi("SamBam/ex1_refresh.bam")[:3]:
+    ...     print(offsets)
+    (0, 0)
+    (53, 38)
+    (18248, 65472)
+    """
+    with as_handle(source, "rb") as handle:
+        if isinstance(handle, BgzfReader):
+            raise TypeError("Function build_gzi expects a binary handle")
+        index = []
+        start_offset = handle.tell()
+        data_start = 0
+        while True:
+            try:
+                block_size, _, _, data_len = _read_bgzf_block(handle)
+            except StopIteration:
+                break
+            index.append((start_offset, data_start))
+            start_offset += block_size
+            data_start += data_len
+    return index
+
+
+def read_gzi(source):
+    """Read a GZI index of a BGZF file, as made by ``bgzip -i``.
+
+    Arguments:
+     - source - input stream opened in binary mode, or a path to a file
+
+    Returns a list of (compressed offset, uncompressed offset) tuples for
+    the BGZF block starts, beginning with the implicit (0, 0) for the first
+    block, as from the build_gzi function.
+    """
+    with as_handle(source, "rb") as handle:
+        data = handle.read()
+    if len(data) < 8:
+        raise ValueError("GZI index is truncated")
+    (count,) = struct.unpack("<Q", data[:8])
+    if len(data) != 8 + 16 * count:
+        raise ValueError(
+            f"GZI index should have {8 + 16 * count} bytes for {count} blocks, "
+            f"not {len(data)}"
+        )
+    values = struct.unpack(f"<{2 * count}Q", data[8:])
+    return [(0, 0)] + list(zip(values[::2], values[1::2]))
+
+
+def write_gzi(index, target):
+    """Write the block index of a BGZF file as a GZI index.
+
+    Arguments:
+     - index - list of (compressed offset, uncompressed offset) tuples as
+       from the build_gzi or read_gzi functions
+     - target - output stream opened in binary mode, or a path to a file
+
+    As in the GZI files made by bgzip, the offsets of the first block (which
+    are always zero) are not written.
+    """
+    index = [offsets for offsets in index if offsets != (0, 0)]
+    with as_handle(target, "wb") as handle:
+        handle.write(struct.pack("<Q", len(index)))
+        for offsets in index:
+            handle.write(struct.pack("<QQ", *offsets))
+
+
+def _read_bgzf_block(handle):
+    """Read the next BGZF block of compressed data, without decompressing it (PRIVATE).
+
+    Returns a tuple (block size, deflate data, CRC, decompressed size) which
+    can be passed to _inflate_bgzf_block, or at end of file will raise
+    StopIteration.
     """
     magic = handle.read(4)
     if not magic:
@@ -468,10 +570,21 @@ def _load_bgzf_block(handle, text_mode=False):
         raise ValueError("Missing BC, this isn't a BGZF file!")
     # Now comes the compressed data, CRC, and length of uncompressed data.
     deflate_size = block_size - 1 - extra_len - 19
-    d = zlib.decompressobj(-15)  # Negative window size means no headers
-    data = d.decompress(handle.read(deflate_size)) + d.flush()
+    deflate_data = handle.read(deflate_size)
     expected_crc = handle.read(4)
     expected_size = struct.unpack("<I", handle.read(4))[0]
+    return block_size, deflate_data, expected_crc, expected_size
+
+
+def _inflate_bgzf_block(raw_block, text_mode=False):
+    """Decompress a BGZF block as returned by _read_bgzf_block (PRIVATE).
+
+    Returns a tuple (block size and data). This does not touch the file
+    handle, and zlib releases the GIL, so this can be run on another thread.
+    """
+    block_size, deflate_data, expected_crc, expected_size = raw_block
+    d = zlib.decompressobj(-15)  # Negative window size means no headers
+    data = d.decompress(deflate_data) + d.flush()
     if expected_size != len(data):
         raise RuntimeError("Decompressed to %i, not %i" % (len(data), expected_size))
     # Should cope with a mix of Python platforms...
@@ -490,6 +603,42 @@ def _load_bgzf_block(handle, text_mode=False):
         return block_size, data
 
 
+def _load_bgzf_block(handle, text_mode=False):
+    """Load the next BGZF block of compressed data (PRIVATE).
+
+    Returns a tuple (block size and data), or at end of file
+    will raise StopIteration.
+    """
+    return _inflate_bgzf_block(_read_bgzf_block(handle), text_mode)
+
+
+def _compress_bgzf_block(block, compresslevel=6):
+    """Compress data as a single BGZF block, returning it as bytes (PRIVATE).
+
+    This does not touch the file handle, and zlib releases the GIL, so this
+    can be run on another thread.
+    """
+    # Giving a negative window bits means no gzip/zlib headers,
+    # -15 used in samtools
+    c = zlib.compressobj(compresslevel, zlib.DEFLATED, -15, zlib.DEF_MEM_LEVEL, 0)
+    compressed = c.compress(block) + c.flush()
+    del c
+    if len(compressed) > 65536:
+        raise RuntimeError("TODO - Didn't compress enough, try less data in this block")
+    bsize = struct.pack("<H", len(compressed) + 25)  # includes -1
+    crc = struct.pack("<I", zlib.crc32(block) & 0xFFFFFFFF)
+    uncompressed_length = struct.pack("<I", len(block))
+    # Fixed 16 bytes,
+    # gzip magic bytes (4) mod time (4),
+    # gzip flag (1), os (1), extra length which is six (2),
+    # sub field which is BC (2), sub field length of two (2),
+    # Variable data,
+    # 2 bytes: block length as BC sub field (2)
+    # X bytes: the data
+    # 8 bytes: crc (4), uncompressed data length (4)
+    return _bgzf_header + bsize + compressed + crc + uncompressed_length
+
+
 class BgzfReader:
     r"""BGZF reader, acts like a read only handle but seek/tell differ.
 
@@ -553,9 +702,24 @@ class BgzfReader:
     block can be up to 64kb, the default cache could take up to 6MB of
     RAM. The cache is not important for reading through the file in one
     pass, but is important for improving performance of random access.
+
+    When reading through a large file, decompression is usually the
+    bottleneck. Using the threads argument, the blocks following the
+    current one are read ahead and decompressed on a pool of threads
+    while you process the current block. This gives exactly the same
+    data and virtual offsets:
+
+    >>> with BgzfReader("SamBam/ex1.bam", "rb", threads=4) as handle:
+    ...     data = handle.read(65540)
+    ...     print(handle.tell())
+    ...     print(handle.seek(2))
+    1195311108
+    2
     """
 
-    def __init__(self, filename=None, mode="r", fileobj=None, max_cache=100):
+    def __init__(
+        self, filename=None, mode="r", fileobj=None, max_cache=100, threads=1
+    ):
         r"""Initialize the class for reading a BGZF file.
 
         You would typically use the top level ``bgzf.open(...)`` function
@@ -581,11 +745,20 @@ class BgzfReader:
         cache in memory. Each can be up to 64kb thus the default of 100 blocks
         could take up to 6MB of RAM. This is important for efficient random
         access, a small value is fine for reading the file in one pass.
+
+        Argument ``threads`` controls the number of threads used to decompress
+        the BGZF blocks. With the default of one, each block is decompressed
+        when needed by the calling thread. With more threads, up to this many
+        of the following blocks are read ahead and decompressed on a thread
+        pool, taking at most that many additional blocks of RAM on top of the
+        cache. Any seek to a block not read ahead discards these.
         """
         # TODO - Assuming we can seek, check for 28 bytes EOF empty block
         # and if missing warn about possible truncation (as in samtools)?
         if max_cache < 1:
             raise ValueError("Use max_cache with a minimum of 1")
+        if threads < 1:
+            raise ValueError("Use threads with a minimum of 1")
         # Must open the BGZF file in binary mode, but we may want to
         # treat the contents as either text or binary (unicode or
         # bytes under Python 3)
@@ -613,6 +786,19 @@ class BgzfReader:
         self._buffers = {}
         self._block_start_offset = None
         self._block_raw_length = None
+        self.threads = threads
+        if threads > 1:
+            self._executor = ThreadPoolExecutor(threads)
+        else:
+            self._executor = None
+        # Blocks being decompressed on the thread pool, keyed by start offset,
+        # in file order, and the start offset of the next block to read ahead:
+        self._read_ahead = {}
+        self._read_ahead_offset = None
+        # Block start offsets in the compressed and uncompressed data,
+        # loaded by seek_uncompressed if needed:
+        self._gzi_compressed = None
+        self._gzi_uncompressed = None
         self._load_block(handle.tell())
 
     def _load_block(self, start_offset=None):
@@ -635,24 +821,76 @@ class BgzfReader:
             # TODO - Implement LRU cache removal?
             self._buffers.popitem()
         # Now load the block
-        handle = self._handle
-        if start_offset is not None:
-            handle.seek(start_offset)
-        self._block_start_offset = handle.tell()
-        try:
-            block_size, self._buffer = _load_bgzf_block(handle, self._text)
-        except StopIteration:
-            # EOF
-            block_size = 0
-            if self._text:
-                self._buffer = ""
-            else:
-                self._buffer = b""
+        if self._executor is not None:
+            block_size = self._load_block_read_ahead(start_offset)
+        else:
+            handle = self._handle
+            if start_offset is not None:
+                handle.seek(start_offset)
+            self._block_start_offset = handle.tell()
+            try:
+                block_size, self._buffer = _load_bgzf_block(handle, self._text)
+            except StopIteration:
+                # EOF
+                block_size = 0
+                if self._text:
+                    self._buffer = ""
+                else:
+                    self._buffer = b""
         self._within_block_offset = 0
         self._block_raw_length = block_size
         # Finally save the block in our cache,
         self._buffers[self._block_start_offset] = self._buffer, block_size
 
+    def _load_block_read_ahead(self, start_offset):
+        """Load a block, and decompress the next blocks on the thread pool (PRIVATE).
+
+        Only the decompression runs on the worker threads; all the reading
+        from the file handle is done here, by the calling thread. Sets the
+        buffer and block start offset, and returns the raw block size.
+        """
+        read_ahead = self._read_ahead
+        future = None
+        while read_ahead:
+            # Discard any blocks read ahead which were skipped over
+            offset, future = next(iter(read_ahead.items()))
+            del read_ahead[offset]
+            if offset == start_offset:
+                break
+            future.cancel()
+            future = None
+        handle = self._handle
+        if future is None:
+            # Not read ahead, e.g. after a seek. Decompress this block here,
+            # and start reading ahead again from the following block:
+            if start_offset is not None:
+                handle.seek(start_offset)
+            start_offset = handle.tell()
+            try:
+                raw_block = _read_bgzf_block(handle)
+            except StopIteration:
+                # EOF
+                block_size = 0
+                self._buffer = "" if self._text else b""
+            else:
+                block_size, self._buffer = _inflate_bgzf_block(raw_block, self._text)
+            self._read_ahead_offset = start_offset + block_size
+        else:
+            block_size, self._buffer = future.result()
+        self._block_start_offset = start_offset
+        if block_size:
+            handle.seek(self._read_ahead_offset)
+            while len(read_ahead) < self.threads:
+                try:
+                    raw_block = _read_bgzf_block(handle)
+                except StopIteration:
+                    break
+                read_ahead[self._read_ahead_offset] = self._executor.submit(
+                    _inflate_bgzf_block, raw_block, self._text
+                )
+                self._read_ahead_offset += raw_block[0]
+        return block_size
+
     def tell(self):
         """Return a 64-bit unsigned BGZF virtual offset."""
         if 0 < self._within_block_offset and self._within_block_offset == len(
@@ -696,6 +934,52 @@ class BgzfReader:
         #       self._within_block_offset)
         return virtual_offset
 
+    def load_gzi(self, gzi=None):
+        """Load the block index used by the seek_uncompressed method.
+
+        Argument ``gzi`` can be a GZI filename or binary handle, or a list
+        of (compressed offset, uncompressed offset) tuples as from the
+        read_gzi or build_gzi functions. By default the BGZF filename plus
+        ".gzi" is used if it exists, otherwise the block headers are read.
+        """
+        if gzi is None:
+            filename = getattr(self._handle, "name", None)
+            if isinstance(filename, str) and os.path.isfile(filename + ".gzi"):
+                gzi = filename + ".gzi"
+            else:
+                offset = self._handle.tell()
+                self._handle.seek(0)
+                gzi = build_gzi(self._handle)
+                self._handle.seek(offset)
+        if not isinstance(gzi, list):
+            gzi = read_gzi(gzi)
+        self._gzi_compressed = [offsets[0] for offsets in gzi]
+        self._gzi_uncompressed = [offsets[1] for offsets in gzi]
+
+    def seek_uncompressed(self, offset):
+        """Seek to an offset in the decompressed data, returning the virtual offset.
+
+        This uses a GZI style index of the BGZF blocks, see the load_gzi method,
+        and finds the block by bisection.
+        """
+        if self._handle.closed:
+            raise ValueError("seek of closed file")
+        if self._gzi_uncompressed is None:
+            self.load_gzi()
+        if offset < 0:
+            raise ValueError(f"Offset should be non-negative, got {offset}")
+        i = bisect_right(self._gzi_uncompressed, offset) - 1
+        start_offset = self._gzi_compressed[i]
+        within_block = offset - self._gzi_uncompressed[i]
+        if start_offset != self._block_start_offset:
+            self._load_block(start_offset)
+        if within_block > len(self._buffer):
+            raise ValueError(
+                f"Offset {offset} is beyond the end of the indexed BGZF blocks"
+            )
+        self._within_block_offset = within_block
+        return make_virtual_offset(start_offset, within_block)
+
     def read(self, size=-1):
         """Read method for the BGZF module."""
         if size < 0:
@@ -765,6 +1049,10 @@ class BgzfReader:
 
     def close(self):
         """Close BGZF file."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+            self._read_ahead = None
         self._handle.close()
         self._buffer = None
         self._block_start_offset = None
@@ -792,10 +1080,36 @@ class BgzfReader:
 
 
 class BgzfWriter:
-    """Define a BGZFWriter object."""
+    """Define a BGZFWriter object.
+
+    Using the threads argument, the BGZF blocks are compressed in parallel on
+    a pool of threads, while still being written to the file in order. At most
+    two blocks per thread are held in memory waiting to be written. As the
+    virtual offsets depend on the size of the compressed blocks, calling the
+    tell method waits for all the pending blocks to be written, as do the
+    flush and close methods:
+
+    >>> from io import BytesIO
+    >>> writer = BgzfWriter(fileobj=BytesIO(), threads=4)
+    >>> writer.write(b"ACGT" * 50000)
+    >>> writer.tell()
+    22220096
+    >>> split_virtual_offset(22220096)
+    (339, 3392)
+    >>> writer.close()
+    """
+
+    def __init__(
+        self, filename=None, mode="w", fileobj=None, compresslevel=6, threads=1
+    ):
+        """Initialize the class.
 
-    def __init__(self, filename=None, mode="w", fileobj=None, compresslevel=6):
-        """Initialize the class."""
+        Argument ``threads`` controls the number of threads used to compress
+        the BGZF blocks. With the default of one, each block is compressed
+        by the calling thread when written.
+        """
+        if threads < 1:
+            raise ValueError("Use threads with a minimum of 1")
         if filename and fileobj:
             raise ValueError("Supply either filename or fileobj, not both")
         if fileobj:
@@ -818,42 +1132,36 @@ class BgzfWriter:
         self._handle = handle
         self._buffer = b""
         self.compresslevel = compresslevel
+        self.threads = threads
+        if threads > 1:
+            self._executor = ThreadPoolExecutor(threads)
+        else:
+            self._executor = None
+        # Futures for the blocks being compressed, in file order:
+        self._pending = deque()
 
     def _write_block(self, block):
         """Write provided data to file as a single BGZF compressed block (PRIVATE)."""
         # print("Saving %i bytes" % len(block))
         if len(block) > 65536:
             raise ValueError(f"{len(block)} Block length > 65536")
-        # Giving a negative window bits means no gzip/zlib headers,
-        # -15 used in samtools
-        c = zlib.compressobj(
-            self.compresslevel, zlib.DEFLATED, -15, zlib.DEF_MEM_LEVEL, 0
+        if self._executor is None:
+            self._handle.write(_compress_bgzf_block(block, self.compresslevel))
+            return
+        pending = self._pending
+        # Write out any compressed blocks ready at the head of the queue,
+        # and if the queue is full wait for them to limit the memory used
+        while pending and (pending[0].done() or len(pending) >= 2 * self.threads):
+            self._handle.write(pending.popleft().result())
+        pending.append(
+            self._executor.submit(_compress_bgzf_block, block, self.compresslevel)
         )
-        compressed = c.compress(block) + c.flush()
-        del c
-        if len(compressed) > 65536:
-            raise RuntimeError(
-                "TODO - Didn't compress enough, try less data in this block"
-            )
-        crc = zlib.crc32(block)
-        # Should cope with a mix of Python platforms...
-        if crc < 0:
-            crc = struct.pack("<i", crc)
-        else:
-            crc = struct.pack("<I", crc)
-        bsize = struct.pack("<H", len(compressed) + 25)  # includes -1
-        crc = struct.pack("<I", zlib.crc32(block) & 0xFFFFFFFF)
-        uncompressed_length = struct.pack("<I", len(block))
-        # Fixed 16 bytes,
-        # gzip magic bytes (4) mod time (4),
-        # gzip flag (1), os (1), extra length which is six (2),
-        # sub field which is BC (2), sub field length of two (2),
-        # Variable data,
-        # 2 bytes: block length as BC sub field (2)
-        # X bytes: the data
-        # 8 bytes: crc (4), uncompressed data length (4)
-        data = _bgzf_header + bsize + compressed + crc + uncompressed_length
-        self._handle.write(data)
+
+    def _write_pending(self):
+        """Wait for the blocks being compressed, and write them in order (PRIVATE)."""
+        pending = self._pending
+        while pending:
+            self._handle.write(pending.popleft().result())
 
     def write(self, data):
         """Write method for the class."""
@@ -884,6 +1192,7 @@ class BgzfWriter:
             self._buffer = self._buffer[65535:]
         self._write_block(self._buffer)
         self._buffer = b""
+        self._write_pending()
         self._handle.flush()
 
     def close(self):
@@ -896,12 +1205,17 @@ class BgzfWriter:
         """
         if self._buffer:
             self.flush()
+        self._write_pending()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
         self._handle.write(_bgzf_eof)
         self._handle.flush()
         self._handle.close()
 
     def tell(self):
         """Return a BGZF 64-bit virtual offset."""
+        self._write_pending()
         return make_virtual_offset(self._handle.tell(), len(self._buffer))
 
     def seekable(self):
@@ -0,0 +1,633 @@
+# Copyright 2025 by the Biopython contributors.
+# All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+r"""Random access to ordinary gzip compressed files using seek points.
+
+Unlike BGZF (see the Bio.bgzf module), an ordinary gzip file is one long
+deflate stream, so reading from the middle normally requires decompressing
+everything before it. This module follows the approach of the zran.c example
+from the zlib sources: while decompressing the file once, it records "seek
+points" every so many bytes of decompressed data, each holding the position
+of a deflate block in the compressed data (in bits, as deflate blocks are not
+byte aligned) together with the preceding 32kb of decompressed data which
+that block may refer back to. Decompression can then resume from the nearest
+seek point, so reading from any position needs at most about the spacing of
+the seek points to be decompressed.
+
+>>> from Bio import gzindex
+>>> handle = gzindex.open("Quality/example.fastq.gz")
+>>> print(handle.seek(78))
+78
+>>> print(handle.readline())
+b'@EAS54_6_R1_2_1_540_792\n'
+>>> handle.close()
+
+As Python's zlib module cannot report where the deflate blocks start, the
+block headers are located by looking for a valid dynamic Huffman block
+header near each spacing interval, and confirmed by checking that
+decompressing from there gives the expected data. Files made of several
+concatenated gzip members are supported, with a seek point at the start of
+each member.
+
+The seek points can be saved to an index file with write_seek_points, which
+by default is the gzip filename plus ".gzindex". Such a file is used if found
+when opening the gzip file, rather than scanning the whole file. For large
+files the index is dominated by the saved 32kb windows (compressed), so you
+may want a larger spacing than the default of 4MB.
+
+This is used by the Bio.SeqIO and Bio.SearchIO index functions for gzip
+compressed files which are not BGZF.
+"""
+
+import io
+import os
+import struct
+import zlib
+from bisect import bisect_right
+from builtins import open as _open
+from typing import NamedTuple
+
+from Bio.File import as_handle
+
+DEFAULT_SPACING = 4194304  # 4MB of decompressed data
+
+_WINDOW = 32768  # deflate back references are at most this far
+_CHUNK = 65536  # compressed data read at a time
+_PIECE = 1048576  # maximum decompressed data produced at a time
+_SEARCH = 262144  # how far to look for a deflate block header
+_CHECK = 4096  # decompressed data compared when confirming a block header
+_MAGIC = b"GZINDEX\x00"
+_VERSION = 1
+
+# Order of the code length code lengths in a dynamic block header (RFC 1951)
+_CODE_LENGTH_ORDER = (16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15)
+# Kraft sums (scaled by 128) for four 3-bit code length code lengths, used to
+# quickly reject most bit offsets as the code length code must be complete
+_KRAFT = [
+    sum(128 >> (value >> i & 7) for i in (0, 3, 6, 9) if value >> i & 7)
+    for value in range(4096)
+]
+# Bit shifts within the first of two bytes where BFINAL is 0 and BTYPE is 2
+_SHIFTS = [
+    tuple(shift for shift in range(8) if value >> shift & 7 == 4)
+    for value in range(65536)
+]
+
+
+class GzipSeekPoint(NamedTuple):
+    """A position in a gzip file from which decompression can start.
+
+    The compressed offset and bits give the start of a deflate block, with
+    the window holding the (up to) 32kb of decompressed data before it. Seek
+    points at the start of each gzip member have an empty window and point at
+    the deflate data following the member header, while the final seek point
+    marks the end of the file (with the file size as its compressed offset).
+    """
+
+    uncompressed: int
+    compressed: int
+    bits: int
+    window: bytes
+
+
+def _skip_gzip_header(handle):
+    """Skip a gzip member header, returning False at the end of the file (PRIVATE).
+
+    Any zero padding after the last member is ignored, as by gzip.
+    """
+    header = handle.read(10)
+    if header[:2] != b"\x1f\x8b":
+        if not header.strip(b"\x00") and not handle.read().strip(b"\x00"):
+            return False
+        raise ValueError("Not a gzipped file (%r)" % header[:2])
+    if len(header) < 10:
+        raise ValueError("Truncated gzip member header")
+    if header[2] != 8:
+        raise ValueError("Unknown compression method %i" % header[2])
+    flags = header[3]
+    if flags & 4:
+        # FEXTRA
+        (extra_len,) = struct.unpack("<H", handle.read(2))
+        handle.read(extra_len)
+    for flag in (8, 16):
+        # FNAME, FCOMMENT - zero terminated strings
+        if flags & flag:
+            while handle.read(1) not in (b"\x00", b""):
+                pass
+    if flags & 2:
+        # FHCRC
+        handle.read(2)
+    return True
+
+
+def _inflate_pieces(decompressor, data):
+    """Decompress data, yielding the output in pieces of bounded size (PRIVATE)."""
+    while True:
+        piece = decompressor.decompress(data, _PIECE)
+        if piece:
+            yield piece
+        data = decompressor.unconsumed_tail
+        if decompressor.eof or (not data and len(piece) < _PIECE):
+            return
+
+
+def _complete_code(lengths, max_bits):
+    """Check if the code lengths give a usable canonical Huffman code (PRIVATE).
+
+    As in zlib, the code must be complete, unless it has a single code of
+    one bit, or no codes at all.
+    """
+    total = sum(1 << (max_bits - length) for length in lengths if length)
+    return total == 1 << max_bits or total <= 1 << (max_bits - 1) and max(lengths) <= 1
+
+
+def _decode_symbol(value, counts, symbols):
+    """Decode a Huffman coded symbol from the low bits of value (PRIVATE).
+
+    Returns the symbol and the number of bits used, or None if invalid. This
+    follows the decode function in puff.c from the zlib sources.
+    """
+    code = first = index = 0
+    for length in range(1, 8):
+        code |= value & 1
+        value >>= 1
+        count = counts[length]
+        if code - count < first:
+            return symbols[index + code - first], length
+        index += count
+        first = (first + count) << 1
+        code <<= 1
+    return None
+
+
+def _dynamic_block_header(data, bit):
+    """Check if a dynamic Huffman block header could start at this bit (PRIVATE).
+
+    This decodes the header (the Huffman code length codes and the literal,
+    length and distance code lengths), and applies the same checks as zlib.
+    """
+    byte, shift = divmod(bit, 8)
+    # The fixed fields and code length code lengths take up to 74 bits
+    value = int.from_bytes(data[byte : byte + 10], "little") >> shift
+    # Skip the BFINAL and BTYPE bits
+    value >>= 3
+    nlen = (value & 31) + 257
+    ndist = ((value >> 5) & 31) + 1
+    ncode = ((value >> 10) & 15) + 4
+    value >>= 14
+    code_lengths = [0] * 19
+    for index in _CODE_LENGTH_ORDER[:ncode]:
+        code_lengths[index] = value & 7
+        value >>= 3
+    if sum(128 >> length for length in code_lengths if length) != 128:
+        # Code length code must be complete
+        return False
+    counts = [0] * 8
+    for length in code_lengths:
+        counts[length] += 1
+    symbols = sorted(
+        (symbol for symbol in range(19) if code_lengths[symbol]),
+        key=code_lengths.__getitem__,
+    )
+    # Now decode the code lengths, which take at most 316 * 14 bits
+    value = int.from_bytes(data[byte : byte + 600], "little")
+    value >>= shift + 17 + 3 * ncode
+    total = nlen + ndist
+    lengths = []
+    while len(lengths) < total:
+        result = _decode_symbol(value, counts, symbols)
+        if result is None:
+            return False
+        symbol, used = result
+        value >>= used
+        if symbol < 16:
+            lengths.append(symbol)
+            continue
+        if symbol == 16:
+            if not lengths:
+                return False
+            repeat = lengths[-1]
+            count = 3 + (value & 3)
+            value >>= 2
+        elif symbol == 17:
+            repeat = 0
+            count = 3 + (value & 7)
+            value >>= 3
+        else:
+            repeat = 0
+            count = 11 + (value & 127)
+            value >>= 7
+        if len(lengths) + count > total:
+            return False
+        lengths.extend([repeat] * count)
+    if not lengths[256]:
+        # Missing end-of-block code
+        return False
+    return _complete_code(lengths[:nlen], 15) and _complete_code(lengths[nlen:], 15)
+
+
+def _shift_bits(data, bits):
+    """Drop the given number of bits from the start of the data (PRIVATE)."""
+    value = int.from_bytes(data, "little") >> bits
+    return value.to_bytes(len(data), "little")
+
+
+def _confirmed(found, expected, before_eof, after_eof):
+    """Check decompressing from a candidate block matched the real data (PRIVATE).
+
+    Arguments found and expected are the (up to _CHECK bytes of) data given by
+    decompressing from the candidate block header, and by continuing the real
+    decompression. These must be identical. If there are fewer than _CHECK
+    bytes, both must also agree on having reached the end of the stream, so
+    that a short (or empty) output cannot confirm a false candidate.
+
+    >>> _confirmed(b"ACGT", b"ACGT", True, True)
+    True
+    >>> _confirmed(b"AC", b"ACGT", True, True)
+    False
+    >>> _confirmed(b"ACGT", b"ACGT", True, False)
+    False
+    """
+    if found != expected:
+        return False
+    return len(found) == _CHECK or before_eof == after_eof
+
+
+def _find_seek_point(handle, decompressor, offset, position, window):
+    """Look for a deflate block to use as a seek point (PRIVATE).
+
+    Arguments:
+     - handle - the gzip file, opened in binary mode
+     - decompressor - zlib decompressor which has been given the deflate data
+       up to the compressed offset, with all its output read
+     - offset - compressed offset to start looking from
+     - position - uncompressed offset at this point
+     - window - the decompressed data before this point (up to 32kb)
+
+    Returns a GzipSeekPoint, or None if no dynamic Huffman block was found.
+    """
+    handle.seek(offset)
+    data = handle.read(_SEARCH + 2 * _CHUNK)
+    for byte in range(min(_SEARCH, len(data) - 1)):
+        # Need BFINAL 0 and BTYPE 2,
+        shifts = _SHIFTS[data[byte] | data[byte + 1] << 8]
+        if not shifts:
+            continue
+        value = int.from_bytes(data[byte : byte + 11], "little")
+        for shift in shifts:
+            header = value >> shift
+            # and at most 286 and 30 codes,
+            if (header >> 3) & 31 > 29 or (header >> 8) & 31 > 29:
+                continue
+            # and a complete code length code
+            lengths = (header >> 17) & ((1 << (12 + 3 * (header >> 13 & 15))) - 1)
+            total = 0
+            while lengths:
+                total += _KRAFT[lengths & 4095]
+                lengths >>= 12
+            if total != 128 or not _dynamic_block_header(data, 8 * byte + shift):
+                continue
+            # Get the uncompressed offset and window at the start of this block,
+            # which are given by all the bytes up to and including this one, as
+            # the header is too long for the block to give any output by then.
+            before = decompressor.copy()
+            size = 0
+            new_window = window
+            for piece in _inflate_pieces(before, data[: byte + 1]):
+                size += len(piece)
+                new_window = (new_window + piece)[-_WINDOW:]
+            if before.eof:
+                return None
+            # Confirm by comparing decompressing from this block and continuing
+            expected = before.decompress(data[byte + 1 :], _CHECK)
+            after = zlib.decompressobj(-15, zdict=new_window)
+            try:
+                found = after.decompress(_shift_bits(data[byte:], shift), _CHECK)
+            except zlib.error:
+                continue
+            if _confirmed(found, expected, before.eof, after.eof):
+                return GzipSeekPoint(position + size, offset + byte, shift, new_window)
+    return None
+
+
+def _scan_member(handle, offset, position, spacing, points):
+    """Decompress a gzip member, adding seek points, and check its trailer (PRIVATE).
+
+    Returns the compressed offset after the member, and the uncompressed offset.
+    """
+    decompressor = zlib.decompressobj(-15)
+    crc = 0
+    size = 0
+    window = b""
+    mark = position + spacing
+    while True:
+        if position >= mark:
+            point = _find_seek_point(handle, decompressor, offset, position, window)
+            if point is None:
+                mark = position + spacing
+            else:
+                points.append(point)
+                mark = point.uncompressed + spacing
+        handle.seek(offset)
+        chunk = handle.read(_CHUNK)
+        if not chunk:
+            raise ValueError(
+                "Compressed file ended before the end-of-stream marker was reached"
+            )
+        offset += len(chunk)
+        for piece in _inflate_pieces(decompressor, chunk):
+            crc = zlib.crc32(piece, crc)
+            size += len(piece)
+            position += len(piece)
+            window = (window + piece)[-_WINDOW:]
+        if decompressor.eof:
+            break
+    offset -= len(decompressor.unused_data)
+    handle.seek(offset)
+    trailer = handle.read(8)
+    if len(trailer) < 8:
+        raise ValueError("Truncated gzip member trailer")
+    expected_crc, expected_size = struct.unpack("<II", trailer)
+    if crc != expected_crc:
+        raise ValueError(f"CRC check failed {hex(crc)} != {hex(expected_crc)}")
+    if size & 0xFFFFFFFF != expected_size:
+        raise ValueError("Incorrect length of data produced")
+    return offset + 8, position
+
+
+def build_seek_points(source, spacing=DEFAULT_SPACING):
+    """Scan a gzip file and return a list of seek points for random access.
+
+    Arguments:
+     - source - gzip file opened in binary mode, or a path to a file
+     - spacing - approximate amount of decompressed data between seek points
+
+    This decompresses the whole file once (checking the CRC of each gzip
+    member). The returned list of GzipSeekPoint objects starts with the start
+    of the first gzip member, and ends with a seek point marking the end of
+    the file:
+
+    >>> points = build_seek_points("Quality/example.fastq.gz")
+    >>> for point in points:
+    ...     print(point.uncompressed, point.compressed, len(point.window))
+    0 10 0
+    234 139 0
+    """
+    if spacing < _WINDOW:
+        raise ValueError(f"Use a seek point spacing of at least {_WINDOW}")
+    with as_handle(source, "rb") as handle:
+        points = []
+        offset = 0
+        position = 0
+        while True:
+            handle.seek(offset)
+            if not _skip_gzip_header(handle):
+                break
+            offset = handle.tell()
+            points.append(GzipSeekPoint(position, offset, 0, b""))
+            offset, position = _scan_member(handle, offset, position, spacing, points)
+        if not points:
+            raise ValueError("Empty gzip file")
+        handle.seek(0, io.SEEK_END)
+        points.append(GzipSeekPoint(position, handle.tell(), 0, b""))
+    return points
+
+
+def write_seek_points(points, target):
+    """Write a list of gzip seek points to an index file.
+
+    Arguments:
+     - points - list of GzipSeekPoint objects, as from build_seek_points
+     - target - output stream opened in binary mode, or a path to a file
+
+    The windows of decompressed data are saved zlib compressed.
+    """
+    with as_handle(target, "wb") as handle:
+        handle.write(_MAGIC + struct.pack("<IQ", _VERSION, len(points)))
+        for point in points:
+            window = zlib.compress(point.window)
+            handle.write(
+                struct.pack(
+                    "<QQBI",
+                    point.uncompressed,
+                    point.compressed,
+                    point.bits,
+                    len(window),
+                )
+            )
+            handle.write(window)
+
+
+def read_seek_points(source):
+    """Read a list of gzip seek points from an index file.
+
+    Arguments:
+     - source - input stream opened in binary mode, or a path to a file
+    """
+    with as_handle(source, "rb") as handle:
+        header = handle.read(20)
+        if len(header) < 20 or header[:8] != _MAGIC:
+            raise ValueError("Not a gzip seek point index file")
+        version, count = struct.unpack("<IQ", header[8:])
+        if version != _VERSION:
+            raise ValueError(f"Unsupported gzip seek point index version {version}")
+        points = []
+        size = struct.calcsize("<QQBI")
+        for i in range(count):
+            data = handle.read(size)
+            if len(data) < size:
+                raise ValueError("Truncated gzip seek point index file")
+            uncompressed, compressed, bits, length = struct.unpack("<QQBI", data)
+            window = zlib.decompress(handle.read(length))
+            points.append(GzipSeekPoint(uncompressed, compressed, bits, window))
+    return points
+
+
+class GzipReader(io.RawIOBase):
+    """Read-only random access to the decompressed data of a gzip file.
+
+    This is a raw binary stream, whose seek and tell methods use offsets in
+    the decompressed data. Normally you would use the open function in this
+    module instead, which adds buffering (and thus a readline method).
+    """
+
+    def __init__(self, filename, points=None, spacing=DEFAULT_SPACING):
+        """Open the gzip file, and load or build its seek points.
+
+        Arguments:
+         - filename - path to the gzip file
+         - points - optional list of GzipSeekPoint objects, or path to an
+           index file. By default, the gzip filename plus ".gzindex" is used
+           if it exists, otherwise the seek points are built by scanning the
+           whole file.
+         - spacing - spacing of the seek points, if building them
+        """
+        handle = _open(filename, "rb")
+        try:
+            if points is None:
+                index = os.fspath(filename) + ".gzindex"
+                if os.path.isfile(index):
+                    points = read_seek_points(index)
+                else:
+                    points = build_seek_points(handle, spacing)
+            elif not isinstance(points, list):
+                points = read_seek_points(points)
+            handle.seek(0, io.SEEK_END)
+            if points[-1].compressed != handle.tell():
+                raise ValueError(
+                    "The gzip seek points do not match the file size, "
+                    "the index may be out of date"
+                )
+        except Exception:
+            handle.close()
+            raise
+        self.name = filename
+        self.points = points
+        self._handle = handle
+        self._uncompressed = [point.uncompressed for point in points]
+        # Seek points for the gzip member starts, and the end of the file:
+        self._members = [i for i, point in enumerate(points) if not point.window]
+        self._restart(0)
+
+    def _restart(self, index):
+        """Start decompressing from the given seek point (PRIVATE)."""
+        point = self.points[index]
+        self._position = point.uncompressed
+        self._buffer = b""
+        self._buffer_offset = 0
+        self._offset = point.compressed
+        self._bits = point.bits
+        self._carry = b""
+        self._member = bisect_right(self._members, index) - 1
+        if index == len(self.points) - 1:
+            self._decompressor = None  # at the end of the file
+        elif point.window:
+            self._decompressor = zlib.decompressobj(-15, zdict=point.window)
+        else:
+            self._decompressor = zlib.decompressobj(-15)
+
+    def _read_compressed(self):
+        """Read more compressed data, skipping bits before the seek point (PRIVATE)."""
+        handle = self._handle
+        handle.seek(self._offset)
+        data = handle.read(_CHUNK)
+        self._offset += len(data)
+        if not self._bits:
+            return data
+        # Keep the final byte, as its high bits are needed with the next chunk
+        data = self._carry + data
+        if self._offset < self.points[-1].compressed:
+            self._carry = data[-1:]
+            return _shift_bits(data, self._bits)[:-1]
+        self._carry = b""
+        return _shift_bits(data, self._bits)
+
+    def _inflate(self):
+        """Decompress more data into the buffer, False at the end (PRIVATE)."""
+        decompressor = self._decompressor
+        if decompressor is None:
+            return False
+        if decompressor.eof:
+            # Continue with the next gzip member (or the end of the file)
+            self._restart(self._members[self._member + 1])
+            return True
+        data = decompressor.unconsumed_tail or self._read_compressed()
+        self._buffer = decompressor.decompress(data, _PIECE)
+        self._buffer_offset = 0
+        if not (data or self._buffer or decompressor.eof):
+            raise ValueError(
+                "Compressed file ended before the end-of-stream marker was reached"
+            )
+        return True
+
+    def readable(self):
+        """Return True, as the file can be read."""
+        return True
+
+    def seekable(self):
+        """Return True, as the file supports random access."""
+        return True
+
+    def readinto(self, buffer):
+        """Read decompressed data into the buffer, returning the number of bytes."""
+        while self._buffer_offset >= len(self._buffer):
+            if not self._inflate():
+                return 0
+        start = self._buffer_offset
+        size = min(len(buffer), len(self._buffer) - start)
+        buffer[:size] = self._buffer[start : start + size]
+        self._buffer_offset += size
+        self._position += size
+        return size
+
+    def tell(self):
+        """Return the current offset in the decompressed data."""
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Move to an offset in the decompressed data, returning the new offset.
+
+        This starts decompressing from the nearest seek point before the
+        offset, unless continuing from the current position is quicker.
+        """
+        if self.closed:
+            raise ValueError("seek of closed file")
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._uncompressed[-1]
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence})")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        index = bisect_right(self._uncompressed, offset) - 1
+        if offset < self._position or self._uncompressed[index] > self._position:
+            self._restart(index)
+        # Decompress and discard the data up to the requested offset
+        skip = offset - self._position
+        while skip:
+            size = len(self._buffer) - self._buffer_offset
+            if not size:
+                if not self._inflate():
+                    break
+                continue
+            size = min(size, skip)
+            self._buffer_offset += size
+            self._position += size
+            skip -= size
+        return self._position
+
+    def close(self):
+        """Close the gzip file."""
+        if not self.closed:
+            self._handle.close()
+            self._buffer = b""
+            self._decompressor = None
+        super().close()
+
+
+def open(filename, mode="rb", points=None, spacing=DEFAULT_SPACING):
+    """Open a gzip file for random access, returning a buffered binary handle.
+
+    Arguments:
+     - filename - path to the gzip file
+     - mode - must be "rb", only reading in binary mode is supported
+     - points - optional list of GzipSeekPoint objects, or path to an index
+       file, see the GzipReader class
+     - spacing - spacing of the seek points, if building them
+
+    The handle's seek and tell methods use offsets in the decompressed data.
+    """
+    if mode != "rb":
+        raise ValueError(f"Only binary read mode 'rb' is supported, not {mode!r}")
+    return io.BufferedReader(GzipReader(filename, points, spacing), _CHUNK)
+
+
+if __name__ == "__main__":
+    from Bio._utils import run_doctest
+
+    run_doctest(verbose=0)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Test timing of BGZF compression and decompression using threads.
+
+Call this with an uncompressed file to use as test data, and optionally the
+numbers of threads to try, e.g.
+
+python bgzf_performance.py example.fastq 1 2 4 8
+
+Each BgzfWriter output is checked to be identical to the serial output.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from Bio import bgzf
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+with open(sys.argv[1], "rb") as handle:
+    data = handle.read()
+thread_counts = [int(arg) for arg in sys.argv[2:]] or [1, 2, 4]
+if 1 not in thread_counts:
+    thread_counts.insert(0, 1)
+
+handle, filename = tempfile.mkstemp(suffix=".bgz")
+os.close(handle)
+print(f"Using {len(data)} bytes of data from {sys.argv[1]}")
+
+try:
+    expected = None
+    for threads in thread_counts:
+        start_time = time.time()
+        with bgzf.BgzfWriter(filename, "wb", threads=threads) as handle:
+            # Write in chunks like a typical caller (not one big string)
+            for i in range(0, len(data), 10000):
+                handle.write(data[i : i + 10000])
+        elapsed_time = time.time() - start_time
+        with open(filename, "rb") as handle:
+            output = handle.read()
+        if expected is None:
+            expected = output
+        elif output != expected:
+            sys.exit(f"Output with {threads} threads differs from serial output")
+        print(
+            "Writing with %i threads took %0.2fs, %0.1f MB/s"
+            % (threads, elapsed_time, len(data) / elapsed_time / 1e6)
+        )
+
+    for threads in thread_counts:
+        start_time = time.time()
+        with bgzf.BgzfReader(filename, "rb", threads=threads) as handle:
+            while handle.read(65536):
+                pass
+        elapsed_time = time.time() - start_time
+        print(
+            "Reading with %i threads took %0.2fs, %0.1f MB/s"
+            % (threads, elapsed_time, len(data) / elapsed_time / 1e6)
+        )
+finally:
+    os.remove(filename)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Test the speed of writing FASTA and FASTQ files.
+
+This compares writing the records one by one (using write_record, as was done
+by Bio.SeqIO.write before the bulk writers) with writing them in blocks using
+write_records, and for FASTQ also writing a FastqBatch of NumPy arrays. By
+default 200000 short reads of 150 bases are used, and 200 sequences of 100000
+bases for FASTA. Optionally give the number of reads to use, e.g.
+
+python fasta_fastq_write_performance.py 1000000
+
+The output is sent to os.devnull, so only the formatting and writing is timed.
+"""
+
+import io
+import os
+import random
+import sys
+import time
+
+from Bio.Seq import Seq
+from Bio.SeqIO.FastaIO import FastaWriter
+from Bio.SeqIO.QualityIO import FastqBatchIterator
+from Bio.SeqIO.QualityIO import FastqPhredWriter
+from Bio.SeqRecord import SeqRecord
+
+if len(sys.argv) > 2:
+    sys.exit(__doc__)
+count = int(sys.argv[1]) if len(sys.argv) == 2 else 200000
+
+rng = random.Random(1234)
+bases = "".join(rng.choice("ACGT") for i in range(200000))
+scores = [rng.randint(2, 41) for i in range(200000)]
+
+
+def make_record(index, length):
+    """Return a record using part of the random sequence and qualities."""
+    start = rng.randrange(len(bases) - length)
+    return SeqRecord(
+        Seq(bases[start : start + length]),
+        id=f"read{index}",
+        description=f"read{index} sample={index % 7}",
+        letter_annotations={"phred_quality": scores[start : start + length]},
+    )
+
+
+def time_writer(label, writer_class, records, size):
+    """Time writing the records one by one, and in blocks."""
+    with open(os.devnull, "w") as handle:
+        start_time = time.time()
+        writer = writer_class(handle)
+        for record in records:
+            writer.write_record(record)
+        elapsed_time = time.time() - start_time
+    print(f"Writing {label} one by one took {elapsed_time:.2f}s")
+    with open(os.devnull, "w") as handle:
+        start_time = time.time()
+        writer_class(handle).write_records(records)
+        new_time = time.time() - start_time
+    print(
+        f"Writing {label} in blocks took {new_time:.2f}s, "
+        f"{size / new_time / 1e6:.0f} MB/s ({elapsed_time / new_time:.1f} times faster)"
+    )
+
+
+reads = [make_record(index, 150) for index in range(count)]
+size = sum(len(read) for read in reads)
+time_writer(f"{count} reads as FASTA", FastaWriter, reads, size)
+time_writer(f"{count} reads as FASTQ", FastqPhredWriter, reads, 2 * size)
+
+contigs = [make_record(index, 100000) for index in range(200)]
+contig_size = sum(len(contig) for contig in contigs)
+time_writer(
+    "200 sequences of 100000 bases as FASTA", FastaWriter, contigs, contig_size
+)
+
+titles = [read.description for read in reads]
+sequences = [bytes(read.seq) for read in reads]
+qualities = [read.letter_annotations["phred_quality"] for read in reads]
+with open(os.devnull, "w") as handle:
+    start_time = time.time()
+    FastaWriter(handle).write_columns(titles, sequences)
+    elapsed_time = time.time() - start_time
+print(f"Writing {count} reads as FASTA from columns took {elapsed_time:.2f}s")
+with open(os.devnull, "w") as handle:
+    start_time = time.time()
+    FastqPhredWriter(handle).write_columns(titles, sequences, qualities)
+    elapsed_time = time.time() - start_time
+print(f"Writing {count} reads as FASTQ from columns took {elapsed_time:.2f}s")
+
+# Load the reads as a FastqBatch, as given by FastqBatchIterator
+handle = io.StringIO()
+FastqPhredWriter(handle).write_records(reads)
+data = io.BytesIO(handle.getvalue().encode())
+(batch,) = FastqBatchIterator(data, batch_size=count)
+with open(os.devnull, "w") as handle:
+    start_time = time.time()
+    FastqPhredWriter(handle).write_batch(batch)
+    elapsed_time = time.time() - start_time
+print(
+    f"Writing {count} reads as FASTQ from a FastqBatch took {elapsed_time:.2f}s, "
+    f"{2 * size / elapsed_time / 1e6:.0f} MB/s"
+)
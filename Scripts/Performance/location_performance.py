@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Test memory use and timing of feature locations.
+
+This creates 200000 features by default, like the annotation of a large
+genome, each with a location using exact positions and a strand, and a tenth
+of them with a CompoundLocation of three parts. Optionally give the number of
+features to use, e.g.
+
+python location_performance.py 1000000
+
+The memory reported is that allocated for the locations and their positions,
+and for the features including their locations.
+"""
+
+import pickle
+import random
+import sys
+import time
+import tracemalloc
+
+from Bio.SeqFeature import CompoundLocation
+from Bio.SeqFeature import SeqFeature
+from Bio.SeqFeature import SimpleLocation
+
+if len(sys.argv) > 2:
+    sys.exit(__doc__)
+count = int(sys.argv[1]) if len(sys.argv) == 2 else 200000
+
+rng = random.Random(1234)
+coordinates = []
+for i in range(count):
+    start = rng.randrange(100000000)
+    coordinates.append((start, start + rng.randint(100, 10000), rng.choice((1, -1))))
+
+
+def make_location(start, end, strand, index):
+    """Return a simple location, or for one in ten a compound location."""
+    if index % 10:
+        return SimpleLocation(start, end, strand)
+    third = (end - start) // 3
+    return CompoundLocation(
+        [
+            SimpleLocation(start, start + third, strand),
+            SimpleLocation(start + third, end - third, strand),
+            SimpleLocation(end - third, end, strand),
+        ]
+    )
+
+
+start_time = time.time()
+locations = [
+    make_location(start, end, strand, index)
+    for index, (start, end, strand) in enumerate(coordinates)
+]
+elapsed_time = time.time() - start_time
+print(f"Creating {count} locations took {elapsed_time:.2f}s")
+
+start_time = time.time()
+features = [SeqFeature(location, type="gene") for location in locations]
+elapsed_time = time.time() - start_time
+print(f"Creating {count} features took {elapsed_time:.2f}s")
+
+# Measure the memory separately, as tracing the allocations is slow
+del features, locations
+tracemalloc.start()
+locations = [
+    make_location(start, end, strand, index)
+    for index, (start, end, strand) in enumerate(coordinates)
+]
+memory = tracemalloc.get_traced_memory()[0]
+print(f"The locations take {memory / count:.0f} bytes each")
+features = [SeqFeature(location, type="gene") for location in locations]
+memory = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+print(f"The features take {memory / count:.0f} bytes each with their locations")
+
+start_time = time.time()
+total = 0
+for location in locations:
+    total += location.end - location.start
+elapsed_time = time.time() - start_time
+print(f"Getting the start and end took {1e9 * elapsed_time / count:.0f}ns each")
+
+start_time = time.time()
+for location in locations:
+    location._shift(100)
+elapsed_time = time.time() - start_time
+print(f"Shifting the locations took {1e9 * elapsed_time / count:.0f}ns each")
+
+start_time = time.time()
+data = pickle.dumps(locations)
+pickle.loads(data)
+elapsed_time = time.time() - start_time
+print(
+    f"Pickling the locations took {elapsed_time:.2f}s, "
+    f"using {len(data) / count:.0f} bytes each"
+)
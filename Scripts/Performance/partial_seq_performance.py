@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Test timing of partially defined Seq objects with many defined segments.
+
+This simulates for example contigs placed on a scaffold, using 100000 defined
+segments by default. Optionally give the number of segments to use, e.g.
+
+python partial_seq_performance.py 1000000
+
+Slicing and indexing should take time depending on the number of segments
+involved, not the total number of segments in the sequence. Adding sequences
+copies the segments, so it takes time proportional to the number of segments.
+"""
+
+import random
+import sys
+import time
+
+from Bio.Seq import Seq
+
+if len(sys.argv) > 2:
+    sys.exit(__doc__)
+count = int(sys.argv[1]) if len(sys.argv) == 2 else 100000
+
+rng = random.Random(1234)
+data = {}
+length = 0
+for i in range(count):
+    length += rng.randint(100, 1000)
+    data[length] = "".join(rng.choices("ACGT", k=rng.randint(100, 1000)))
+    length += len(data[length])
+length += 1000
+
+start_time = time.time()
+seq = Seq(data, length=length)
+elapsed_time = time.time() - start_time
+print(
+    f"Creating a sequence of length {length} with {count} segments "
+    f"took {elapsed_time:.3f}s"
+)
+
+repeats = 10000
+starts = [rng.randrange(length - 10000) for i in range(repeats)]
+
+start_time = time.time()
+for start in starts:
+    seq[start : start + 10000]
+elapsed_time = time.time() - start_time
+print(f"Slicing 10kb regions took {1e6 * elapsed_time / repeats:.1f}us each")
+
+start_time = time.time()
+for start in starts:
+    seq[start + 10000 : start : -1]
+elapsed_time = time.time() - start_time
+print(
+    f"Slicing reversed 10kb regions took {1e6 * elapsed_time / repeats:.1f}us each"
+)
+
+start_time = time.time()
+for start in starts:
+    try:
+        seq[start]
+    except ValueError:
+        # Undefined position
+        pass
+elapsed_time = time.time() - start_time
+print(f"Indexing single letters took {1e6 * elapsed_time / repeats:.1f}us each")
+
+repeats = 100
+start_time = time.time()
+for i in range(repeats):
+    seq + "ACGT"
+elapsed_time = time.time() - start_time
+print(f"Adding a defined sequence took {1e3 * elapsed_time / repeats:.2f}ms each")
+
+start_time = time.time()
+for i in range(repeats):
+    seq + seq
+elapsed_time = time.time() - start_time
+print(f"Adding two such sequences took {1e3 * elapsed_time / repeats:.2f}ms each")
+
+start_time = time.time()
+for i in range(repeats):
+    seq.defined_ranges
+elapsed_time = time.time() - start_time
+print(f"Getting the defined ranges took {1e3 * elapsed_time / repeats:.2f}ms each")
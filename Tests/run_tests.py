@@ -39,6 +39,9 @@ try:
     import numpy as np
 except ImportError:
     np = None
+else:
+    # Some doctests change these, e.g. to show how to print less of an array
+    NUMPY_PRINT_OPTIONS = np.get_printoptions()
 
 
 # The default verbosity (not verbose)
@@ -99,6 +102,12 @@ if np is None:
             "Bio.phenotype.phen_micro",
             "Bio.phenotype.pm_fitting",
             "Bio.SeqIO.PdbIO",
+            "Bio.SeqUtils.kmers",
+            "Bio.SeqUtils.MeltingTemp",
+            "Bio.SeqUtils.minhash",
+            "Bio.SeqUtils.orfs",
+            "Bio.SeqUtils.ProtParam",
+            "Bio.SeqUtils.windows",
             "Bio.SVDSuperimposer",
         ]
     )
@@ -279,6 +288,8 @@ class TestRunner(unittest.TextTestRunner):
                     return False
                 suite = doctest.DocTestSuite(module, optionflags=doctest.ELLIPSIS)
                 del module
+                if np is not None:
+                    np.set_printoptions(**NUMPY_PRINT_OPTIONS)
             suite.run(result)
             if self.testdir != os.path.abspath("."):
                 sys.stderr.write("FAIL\n")
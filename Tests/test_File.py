@@ -12,6 +12,7 @@ from io import StringIO
 
 from Bio import bgzf
 from Bio import File
+from Bio import gzindex
 
 
 class RandomAccess(unittest.TestCase):
@@ -30,9 +31,12 @@ class RandomAccess(unittest.TestCase):
 
     def test_gzip(self):
         """Test gzip compressed file."""
-        self.assertRaises(
-            ValueError, File._open_for_random_access, "Quality/example.fastq.gz"
-        )
+        with File._open_for_random_access("Quality/example.fastq.gz") as handle:
+            self.assertIsInstance(handle.raw, gzindex.GzipReader)
+            with open("Quality/example.fastq", "rb") as plain:
+                data = plain.read()
+            handle.seek(78)
+            self.assertEqual(handle.read(), data[78:])
 
 
 class AsHandleTestCase(unittest.TestCase):
@@ -7,8 +7,14 @@
 # as part of this package.
 """Tests for Bio.SeqUtils.ProtParam and related code."""
 
+import random
 import unittest
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from Bio import BiopythonDeprecationWarning
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
@@ -266,6 +272,96 @@ class ProtParamTest(unittest.TestCase):
             )
 
 
+@unittest.skipIf(np is None, "NumPy is not installed")
+class ProteomeAnalysisTest(unittest.TestCase):
+    """Tests for ProteomeAnalysis."""
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(1234)
+        letters = "ACDEFGHIKLMNPQRSTVWY"
+        cls.sequences = [
+            "".join(rng.choices(letters, k=rng.randint(1, 300))) for i in range(200)
+        ]
+        cls.sequences += ["M", "PETER", "INGAR", "mkwvtfisll", "AD", "SE", "CC"]
+        cls.proteome = ProtParam.ProteomeAnalysis(cls.sequences)
+        cls.analyses = [ProtParam.ProteinAnalysis(seq) for seq in cls.sequences]
+
+    def test_counts(self):
+        """Check the amino acid counts and values calculated from them."""
+        proteome = self.proteome
+        self.assertEqual(len(proteome), len(self.sequences))
+        counts = proteome.count_amino_acids()
+        percent = proteome.amino_acids_percent
+        aromaticity = proteome.aromaticity()
+        fractions = proteome.secondary_structure_fraction()
+        reduced, cystines = proteome.molar_extinction_coefficient()
+        for i, analysis in enumerate(self.analyses):
+            for aa, count in analysis.count_amino_acids().items():
+                self.assertEqual(counts[aa][i], count)
+                self.assertEqual(percent[aa][i], analysis.amino_acids_percent[aa])
+            self.assertEqual(aromaticity[i], analysis.aromaticity())
+            self.assertEqual(
+                [fraction[i] for fraction in fractions],
+                list(analysis.secondary_structure_fraction()),
+            )
+            self.assertEqual(
+                (reduced[i], cystines[i]), analysis.molar_extinction_coefficient()
+            )
+
+    def test_sums(self):
+        """Check the values summed over the residues of each protein."""
+        for monoisotopic in (False, True):
+            proteome = ProtParam.ProteomeAnalysis(self.sequences, monoisotopic)
+            weights = proteome.molecular_weight()
+            for i, sequence in enumerate(self.sequences):
+                analysis = ProtParam.ProteinAnalysis(sequence, monoisotopic)
+                self.assertAlmostEqual(weights[i], analysis.molecular_weight())
+        instability = self.proteome.instability_index()
+        for scale in ("KyteDoolitle", "Eisenberg"):
+            gravy = self.proteome.gravy(scale)
+            for i, analysis in enumerate(self.analyses):
+                self.assertAlmostEqual(gravy[i], analysis.gravy(scale))
+        for i, analysis in enumerate(self.analyses):
+            self.assertAlmostEqual(instability[i], analysis.instability_index())
+        with self.assertRaises(ValueError):
+            self.proteome.gravy("Wrong Scale")
+
+    def test_charge(self):
+        """Check the isoelectric points and charges."""
+        pI = self.proteome.isoelectric_point()
+        charges = self.proteome.charge_at_pH(7.0)
+        for i, analysis in enumerate(self.analyses):
+            self.assertEqual(pI[i], analysis.isoelectric_point())
+            self.assertAlmostEqual(charges[i], analysis.charge_at_pH(7.0))
+
+    def test_protein_scale(self):
+        """Check the profiles with an amino acid scale."""
+        for window, edge in ((9, 1.0), (5, 0.4), (8, 0.5)):
+            profiles = self.proteome.protein_scale(ProtParamData.kd, window, edge)
+            self.assertEqual(len(profiles), len(self.sequences))
+            for profile, analysis in zip(profiles, self.analyses):
+                expected = analysis.protein_scale(ProtParamData.kd, window, edge)
+                self.assertTrue(np.allclose(profile, expected))
+                self.assertEqual(len(profile), len(expected))
+
+    def test_unusual(self):
+        """Check records, unknown letters and empty sequences."""
+        record = SeqRecord(Seq("MKWVTFISLL"))
+        proteome = ProtParam.ProteomeAnalysis([record, "MKX*", ""])
+        weights = proteome.molecular_weight()
+        self.assertAlmostEqual(
+            weights[0], ProtParam.ProteinAnalysis("MKWVTFISLL").molecular_weight()
+        )
+        self.assertTrue(np.isnan(weights[1]))
+        self.assertTrue(np.isnan(proteome.instability_index()[1]))
+        self.assertTrue(np.isnan(proteome.gravy()[1]))
+        self.assertTrue(np.isnan(proteome.isoelectric_point()[2]))
+        reduced, cystines = proteome.molar_extinction_coefficient()
+        self.assertEqual(reduced.tolist(), [5500, 0, 0])
+        self.assertEqual(len(proteome.protein_scale(ProtParamData.kd, 3)[2]), 0)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -7,9 +7,16 @@
 
 import unittest
 
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
 from search_tests_common import CheckIndex
 from search_tests_common import CheckRaw
 
+from Bio import SearchIO
+
 
 class BlastTabRawCases(CheckRaw):
     """Check BLAST tabular get_raw method."""
@@ -168,6 +175,24 @@ class BlastTabIndexCases(CheckIndex):
         filename = "Blast/tab_2226_tblastn_011.txt"
         self.check_index(filename, self.fmt, comments=True)
 
+    @unittest.skipIf(sqlite3 is None, "requires sqlite3")
+    def test_blasttab_index_db_processes(self):
+        """Test blast-tab index_db using worker processes, with format arguments."""
+        filenames = ["Blast/tab_2226_tblastn_007.txt", "Blast/tab_2226_tblastn_008.txt"]
+        serial = SearchIO.index_db(":memory:", filenames, self.fmt, comments=True)
+        parallel = SearchIO.index_db(
+            ":memory:", filenames, self.fmt, processes=2, comments=True
+        )
+        self.assertEqual(
+            list(parallel), ["gi|16080617|ref|NP_391444.1|", "gi|11464971:4-101"]
+        )
+        self.assertEqual(list(parallel), list(serial))
+        for key in serial:
+            self.assertEqual(parallel.get_raw(key), serial.get_raw(key))
+            self.assertEqual(len(parallel[key]), len(serial[key]))
+        serial.close()
+        parallel.close()
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
@@ -243,6 +243,54 @@ class TestLocations(unittest.TestCase):
         self.assertEqual(int(location3.start), 10)
         self.assertEqual(int(location3.end), 40)
 
+    def test_slots(self):
+        """Test locations and exact positions have no instance dictionary."""
+        location = SimpleLocation(5, 10, -1)
+        for obj in (location, location + location, location.start):
+            self.assertFalse(hasattr(obj, "__dict__"))
+            with self.assertRaises(AttributeError):
+                obj.comment = "example"
+
+    def test_pickle(self):
+        """Test pickling and copying locations."""
+        import pickle
+        from copy import copy
+
+        location = SimpleLocation(
+            BeforePosition(5),
+            WithinPosition(13, left=10, right=13),
+            strand=-1,
+            ref="X55053.1",
+            ref_db="GenBank",
+        )
+        location += SimpleLocation(20, 30, -1)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            location2 = pickle.loads(pickle.dumps(location, protocol))
+            self.assertEqual(location2, location)
+            self.assertEqual(repr(location2), repr(location))
+        location2 = copy(location)
+        self.assertEqual(location2, location)
+        self.assertIs(location2.parts, location.parts)
+        location2 = deepcopy(location)
+        self.assertEqual(location2, location)
+        self.assertIsNot(location2.parts[0], location.parts[0])
+        # The state is a dictionary of the attributes, as it was before
+        # the locations used __slots__
+        state = location.parts[0].__getstate__()
+        self.assertEqual(
+            state,
+            {
+                "_start": 5,
+                "_end": 13,
+                "_strand": -1,
+                "ref": "X55053.1",
+                "ref_db": "GenBank",
+            },
+        )
+        location2 = SimpleLocation.__new__(SimpleLocation)
+        location2.__setstate__(state)
+        self.assertEqual(location2, location.parts[0])
+
 
 class TestPositions(unittest.TestCase):
     def test_pickle(self):
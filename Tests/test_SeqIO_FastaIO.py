@@ -5,12 +5,27 @@
 # as part of this package.
 """Tests for Bio.SeqIO.FastaIO module."""
 
+import os
+import shutil
+import tempfile
 import unittest
 from io import StringIO
 
+from Bio import bgzf
 from Bio import SeqIO
+from Bio import StreamModeError
+from Bio.Seq import Seq
+from Bio.Seq import UndefinedSequenceError
+from Bio.SeqIO.FastaIO import build_faidx
+from Bio.SeqIO.FastaIO import FaidxEntry
 from Bio.SeqIO.FastaIO import FastaTwoLineParser
+from Bio.SeqIO.FastaIO import FastaTwoLineWriter
+from Bio.SeqIO.FastaIO import FastaWriter
+from Bio.SeqIO.FastaIO import IndexedFasta
+from Bio.SeqIO.FastaIO import read_faidx
 from Bio.SeqIO.FastaIO import SimpleFastaParser
+from Bio.SeqIO.FastaIO import write_faidx
+from Bio.SeqRecord import SeqRecord
 
 from Bio import BiopythonDeprecationWarning
 
@@ -80,6 +95,60 @@ class Wrapping(unittest.TestCase):
         self.assertEqual(expected.seq, record.seq)
 
 
+class TestBulkWriter(unittest.TestCase):
+    """Test writing FASTA records in blocks."""
+
+    def setUp(self):
+        self.records = list(SeqIO.parse("Fasta/f002", "fasta"))
+        self.records += [
+            SeqRecord(Seq(""), id="empty", description="empty no sequence"),
+            SeqRecord(Seq("ACGT" * 30), id="exact", description="exact\nfit"),
+            SeqRecord(Seq("MKV"), id="prot", description="prot \u00e9 non-ASCII"),
+        ]
+
+    def write_one_by_one(self, writer_class, **kwargs):
+        handle = StringIO()
+        writer = writer_class(handle, **kwargs)
+        for record in self.records:
+            writer.write_record(record)
+        return handle.getvalue()
+
+    def test_records(self):
+        """Compare writing records in blocks and one by one."""
+        for writer_class, kwargs in [
+            (FastaWriter, {}),
+            (FastaWriter, {"wrap": 7}),
+            (FastaWriter, {"wrap": 0}),
+            (FastaWriter, {"record2title": lambda record: record.id}),
+            (FastaTwoLineWriter, {}),
+        ]:
+            expected = self.write_one_by_one(writer_class, **kwargs)
+            for block_size in (1, 100, 1 << 22):
+                handle = StringIO()
+                writer = writer_class(handle, **kwargs)
+                writer._block_size = block_size
+                count = writer.write_records(self.records)
+                self.assertEqual(count, len(self.records))
+                self.assertEqual(handle.getvalue(), expected)
+
+    def test_columns(self):
+        """Write records given as columns of titles and sequences."""
+        titles = [record.description for record in self.records]
+        sequences = [bytes(record.seq) for record in self.records]
+        handle = StringIO()
+        count = FastaWriter(handle, wrap=7).write_columns(titles, sequences)
+        self.assertEqual(count, len(self.records))
+        self.assertEqual(handle.getvalue(), self.write_one_by_one(FastaWriter, wrap=7))
+
+    def test_errors(self):
+        """Check errors are raised as when writing one by one."""
+        handle = StringIO()
+        with self.assertRaises(TypeError):
+            FastaWriter(handle).write_records([SeqRecord(None, id="none")])
+        with self.assertRaises(UndefinedSequenceError):
+            FastaWriter(handle).write_records([SeqRecord(Seq(None, 4), id="undef")])
+
+
 class TitleFunctions(unittest.TestCase):
     """Test using title functions."""
 
@@ -193,6 +262,148 @@ class TestSimpleFastaParsers(unittest.TestCase):
                 list(FastaTwoLineParser(handle))
 
 
+class TestFaidx(unittest.TestCase):
+    """Test the samtools faidx compatible FASTA index."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check_sequences(self, filename, fai=None):
+        expected = {record.id: record.seq for record in SeqIO.parse(filename, "fasta")}
+        with IndexedFasta(filename, fai) as fasta:
+            self.assertEqual(list(fasta), list(expected))
+            for name, seq in expected.items():
+                record = fasta[name]
+                self.assertEqual(record.id, name)
+                self.assertEqual(len(record), len(seq))
+                self.assertEqual(record.seq, seq)
+                for start, end in [(0, 5), (65, 75), (69, 71), (-10, None)]:
+                    self.assertEqual(record.seq[start:end], seq[start:end])
+                self.assertEqual(record.seq[3:-3:7], seq[3:-3:7])
+                self.assertEqual(record.seq[::-5], seq[::-5])
+                self.assertEqual(record.seq[-1], seq[-1])
+
+    def test_build(self):
+        entries = build_faidx("Fasta/f001")
+        self.assertEqual(
+            entries,
+            [FaidxEntry("gi|3318709|pdb|1A91|", 79, 98, 70, 71)],
+        )
+        self.check_sequences("Fasta/f001")
+        self.check_sequences("Fasta/aster.pro")
+        self.check_sequences("GenBank/NC_005816.fna")
+
+    def test_round_trip(self):
+        # This file uses Windows style line endings
+        entries = build_faidx("Fasta/lupine.nu")
+        fai = os.path.join(self.directory, "lupine.nu.fai")
+        write_faidx(entries, fai)
+        with open(fai) as handle:
+            self.assertEqual(
+                handle.read(), "gi|5049839|gb|AI730987.1|AI730987\t655\t247\t70\t72\n"
+            )
+        self.assertEqual(read_faidx(fai), entries)
+        self.check_sequences("Fasta/lupine.nu", fai)
+
+    def test_bgzf(self):
+        # Use small BGZF blocks, so regions span more than one block
+        fasta = os.path.join(self.directory, "example.fasta.bgz")
+        with open("GenBank/NC_005816.fna", "rb") as handle:
+            data = handle.read()
+        with bgzf.BgzfWriter(fasta) as handle:
+            for i in range(0, len(data), 1000):
+                handle.write(data[i : i + 1000])
+                handle.flush()
+        with bgzf.BgzfReader(fasta, "rb") as handle:
+            entries = build_faidx(handle)
+        self.assertEqual(entries, build_faidx("GenBank/NC_005816.fna"))
+        seq = SeqIO.read("GenBank/NC_005816.fna", "fasta").seq
+        with IndexedFasta(fasta) as records:
+            record = records["gi|45478711|ref|NC_005816.1|"]
+            self.assertEqual(record.seq, seq)
+            for start, end in [(0, 5), (900, 1100), (4000, 7000), (-10, None)]:
+                self.assertEqual(record.seq[start:end], seq[start:end])
+
+    def test_existing_index(self):
+        # Use a deliberately wrong existing index, to confirm that it is used
+        fasta = os.path.join(self.directory, "example.fasta")
+        with open(fasta, "wb") as handle:
+            handle.write(b">alpha\r\nACGTA\r\nCGT\r\n>beta one\r\nGGGCC\r\n")
+        self.assertEqual(
+            build_faidx(fasta),
+            [FaidxEntry("alpha", 8, 8, 5, 7), FaidxEntry("beta", 5, 31, 5, 7)],
+        )
+        with open(fasta + ".fai", "w") as handle:
+            handle.write("beta\t3\t33\t5\t7\n")
+        with IndexedFasta(fasta) as records:
+            self.assertEqual(list(records), ["beta"])
+            self.assertEqual(records["beta"].seq, "GCC")
+            self.assertEqual(records.lengths(), {"beta": 3})
+        self.check_sequences(fasta, os.path.join(self.directory, "missing.fai"))
+
+    def test_errors(self):
+        fasta = os.path.join(self.directory, "ragged.fasta")
+        with open(fasta, "w") as handle:
+            handle.write(">alpha\nACGT\nACG\nACGT\n")
+        self.assertRaises(ValueError, build_faidx, fasta)
+        with open(fasta, "w") as handle:
+            handle.write(">alpha\nACGT\nACGTA\n")
+        self.assertRaises(ValueError, build_faidx, fasta)
+        self.assertRaises(ValueError, build_faidx, "Fasta/dups.fasta")
+        with open("Fasta/f001") as handle:
+            self.assertRaises(StreamModeError, build_faidx, handle)
+        fasta = IndexedFasta("Fasta/f001")
+        record = fasta["gi|3318709|pdb|1A91|"]
+        fasta.close()
+        with self.assertRaises(ValueError):
+            record.seq[10:20]
+        with self.assertRaisesRegex(ValueError, "file is closed"):
+            record.seq.count("A")
+
+    def check_search(self, seq, expected):
+        queries = ["A", "G", "X", "TT", "GATC", "CTCGAG", b"AC", expected[20:30]]
+        ranges = [(None, None), (5, None), (100, 2000), (-500, -3), (70, 71)]
+        for query in queries:
+            self.assertEqual(seq.count(query), expected.count(query))
+            self.assertEqual(query in seq, query in expected)
+            for start, end in ranges:
+                self.assertEqual(
+                    seq.count(query, start, end), expected.count(query, start, end)
+                )
+                self.assertEqual(
+                    seq.find(query, start, end), expected.find(query, start, end)
+                )
+                self.assertEqual(
+                    seq.rfind(query, start, end), expected.rfind(query, start, end)
+                )
+        self.assertEqual(seq.index("G", 100), expected.index("G", 100))
+        self.assertEqual(seq.rindex("G", 0, 100), expected.rindex("G", 0, 100))
+        with self.assertRaisesRegex(ValueError, "subsection not found"):
+            seq.index("X")
+
+    def test_mmap(self):
+        # Compare with the sequence in memory, for line wrapped and single
+        # line files, with both Unix and Windows line endings
+        expected = SeqIO.read("GenBank/NC_005816.fna", "fasta").seq
+        record = SeqRecord(expected, id="example", description="")
+        fasta = os.path.join(self.directory, "example.fasta")
+        for fmt in ("fasta", "fasta-2line"):
+            for newline in ("\n", "\r\n"):
+                with open(fasta, "w", newline=newline) as handle:
+                    SeqIO.write(record, handle, fmt)
+                self.check_mmap(fasta, expected)
+
+    def check_mmap(self, fasta, expected):
+        with IndexedFasta(fasta) as records:
+            self.assertIsNotNone(records._mapping)
+            seq = records["example"].seq
+            self.assertEqual(seq, expected)
+            self.check_search(seq, expected)
+
+
 class TestFastaWithComments(unittest.TestCase):
     """Test FastaBlastIterator and FastaPearsonIterator."""
 
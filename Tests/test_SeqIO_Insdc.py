@@ -4,6 +4,8 @@
 # as part of this package.
 """Tests for SeqIO Insdc module."""
 
+import copy
+import pickle
 import unittest
 import warnings
 from io import StringIO
@@ -17,6 +19,8 @@ from Bio import SeqIO
 from Bio.Seq import Seq
 from Bio.SeqFeature import SeqFeature
 from Bio.SeqFeature import SimpleLocation
+from Bio.SeqIO.InsdcIO import EmblIterator
+from Bio.SeqIO.InsdcIO import GenBankIterator
 from Bio.SeqRecord import SeqRecord
 
 
@@ -134,6 +138,68 @@ class TestEmblRewrite(SeqRecordTestBaseClass):
             self.check_rewrite("EMBL/AE017046.embl")
 
 
+class TestLazyFeatures(unittest.TestCase):
+    def check_file(self, filename, iterator):
+        records = list(iterator(filename))
+        lazy_records = list(iterator(filename, lazy_features=True))
+        self.assertEqual(len(records), len(lazy_records))
+        for record, lazy_record in zip(records, lazy_records):
+            self.assertEqual(record.id, lazy_record.id)
+            self.assertEqual(record.seq, lazy_record.seq)
+            features = record.features
+            lazy_features = lazy_record.features
+            self.assertEqual(len(features), len(lazy_features))
+            if features:
+                self.assertEqual(features[-1], lazy_features[-1])
+                self.assertEqual(features[1:3], lazy_features[1:3])
+            self.assertEqual(features, list(lazy_features))
+            for feature, lazy_feature in zip(features, lazy_features):
+                self.assertEqual(repr(feature), repr(lazy_feature))
+                self.assertEqual(feature.qualifiers, lazy_feature.qualifiers)
+
+    def test_files(self):
+        """Check parsing features on demand gives the same features."""
+        for filename in (
+            "GenBank/NC_005816.gb",
+            "GenBank/cor6_6.gb",
+            "GenBank/arab1.gb",
+            "GenBank/origin_line.gb",
+        ):
+            self.check_file(filename, GenBankIterator)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", BiopythonParserWarning)
+            self.check_file("GenBank/negative_location.gb", GenBankIterator)
+        for filename in ("EMBL/TRBG361.embl", "EMBL/AE017046.embl", "EMBL/U87107.embl"):
+            self.check_file(filename, EmblIterator)
+
+    def test_list(self):
+        """Check the features list parsed on demand acts as a list."""
+        expected = SeqIO.read("GenBank/NC_005816.gb", "gb").features
+        record = next(GenBankIterator("GenBank/NC_005816.gb", lazy_features=True))
+        features = record.features
+        self.assertEqual(features[3], expected[3])
+        self.assertEqual(features[-2], expected[-2])
+        self.assertEqual(features._pending, len(expected) - 2)
+        self.assertIs(features[3], features[3])
+        self.assertEqual(pickle.loads(pickle.dumps(features)), expected)
+        self.assertEqual(copy.copy(features), expected)
+        self.assertEqual(features._pending, 0)
+        record = next(GenBankIterator("GenBank/NC_005816.gb", lazy_features=True))
+        self.assertEqual(expected[:1] + record.features, expected[:1] + expected)
+        record = next(GenBankIterator("GenBank/NC_005816.gb", lazy_features=True))
+        record.features.insert(0, expected[5])
+        self.assertEqual(record.features, expected[5:6] + expected)
+        record = next(GenBankIterator("GenBank/NC_005816.gb", lazy_features=True))
+        part = SeqIO.read("GenBank/NC_005816.gb", "gb")[100:2000]
+        self.assertEqual(record[100:2000].features, part.features)
+        self.assertIn(expected[7], record.features)
+        # A feature which cannot be parsed only fails when used
+        record = next(GenBankIterator("GenBank/invalid_product.gb", lazy_features=True))
+        self.assertGreater(len(record.features), 1)
+        with self.assertRaises(ValueError):
+            list(record.features)
+
+
 class ConvertTestsInsdc(SeqIOConverterTestBaseClass):
     def test_conversion(self):
         """Test format conversion by SeqIO.write/SeqIO.parse and SeqIO.convert."""
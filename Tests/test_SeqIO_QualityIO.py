@@ -10,12 +10,15 @@ import warnings
 from io import BytesIO
 from io import StringIO
 
+import numpy as np
+
 from test_SeqIO import SeqIOConverterTestBaseClass
 from test_SeqIO import SeqIOTestBaseClass
 
 from Bio import BiopythonParserWarning
 from Bio import BiopythonWarning
 from Bio import SeqIO
+from Bio import StreamModeError
 from Bio.Data.IUPACData import ambiguous_dna_letters
 from Bio.Data.IUPACData import ambiguous_rna_letters
 from Bio.Seq import MutableSeq
@@ -158,6 +161,315 @@ class TestFastqErrors(unittest.TestCase):
             self.check_general_passes(path, full_count)
 
 
+class TestFastqBatch(unittest.TestCase):
+    """Test the NumPy based batch FASTQ reader."""
+
+    def compare_with_records(self, filename, fmt, offset):
+        expected = list(SeqIO.parse(filename, fmt))
+        for batch_size, chunk_size in [(1, 7), (2, 64), (1000, 1 << 20)]:
+            batches = list(
+                QualityIO.FastqBatchIterator(
+                    filename,
+                    batch_size=batch_size,
+                    offset=offset,
+                    chunk_size=chunk_size,
+                )
+            )
+            self.assertEqual(sum(len(batch) for batch in batches), len(expected))
+            for batch in batches[:-1]:
+                self.assertEqual(len(batch), batch_size)
+            records = [record for batch in batches for record in batch]
+            for old, new in zip(expected, records):
+                self.assertEqual(old.id, new.id)
+                self.assertEqual(old.description, new.description)
+                self.assertEqual(old.seq, new.seq)
+                self.assertEqual(
+                    old.letter_annotations["phred_quality"],
+                    new.letter_annotations["phred_quality"],
+                )
+
+    def test_sanger(self):
+        for filename in (
+            "Quality/example.fastq",
+            "Quality/example_dos.fastq",
+            "Quality/tricky.fastq",
+            "Quality/zero_length.fastq",
+            "Quality/wrapping_original_sanger.fastq",
+            "Quality/sanger_full_range_original_sanger.fastq",
+        ):
+            self.compare_with_records(filename, "fastq", 33)
+
+    def test_illumina(self):
+        self.compare_with_records(
+            "Quality/illumina_full_range_original_illumina.fastq",
+            "fastq-illumina",
+            64,
+        )
+
+    def test_arrays(self):
+        with open("Quality/example.fastq", "rb") as handle:
+            (batch,) = QualityIO.FastqBatchIterator(handle)
+        self.assertEqual(batch.sequences.dtype, np.uint8)
+        self.assertEqual(batch.qualities.dtype, np.uint8)
+        self.assertEqual(list(batch.offsets), [0, 25, 50, 75])
+        self.assertEqual(list(batch.lengths), [25, 25, 25])
+        self.assertEqual(batch.title(1), "EAS54_6_R1_2_1_540_792")
+        self.assertEqual(batch.sequence(1), b"TTGGCAGGCCAAGGCCGATGGATCA")
+        self.assertEqual(
+            bytes(batch.quality(1) + 33), b";;;;;;;;;;;7;;;;;-;;;3;83"
+        )
+        self.assertEqual(
+            list(batch.tuples()),
+            list(QualityIO.FastqGeneralIterator("Quality/example.fastq")),
+        )
+        tail = batch[1:]
+        self.assertEqual(len(tail), 2)
+        self.assertEqual(list(tail.offsets), [0, 25, 50])
+        self.assertEqual(tail[0].id, "EAS54_6_R1_2_1_540_792")
+        self.assertEqual(batch[-1].id, "EAS54_6_R1_2_1_443_348")
+        self.assertRaises(IndexError, batch.__getitem__, 3)
+
+    def test_white_space(self):
+        """Check trailing blank lines and white space are handled as before."""
+        for data in [
+            b"@a\nACGT\n+\nIIII\n\n",
+            b"@a\nACGT\n+\nIIII\n\n\n@b\nA\n+\nI\n",
+            b"@a x \nACGT \n+a x\t\nIIII  \r\n\r\n",
+            b"@a\r\nAC\r\n+\r\nII\r\n",
+        ]:
+            expected = list(QualityIO.FastqGeneralIterator(StringIO(data.decode())))
+            for chunk_size in (1, 5, 1000):
+                batches = QualityIO.FastqBatchIterator(
+                    BytesIO(data), chunk_size=chunk_size
+                )
+                tuples = [values for batch in batches for values in batch.tuples()]
+                self.assertEqual(tuples, expected, msg=data)
+        # As with FastqGeneralIterator, the file cannot start with a blank line
+        with self.assertRaisesRegex(ValueError, "should start with '@'"):
+            list(QualityIO.FastqBatchIterator(BytesIO(b"\n@a\nAC\n+\nII\n")))
+
+    def test_text_mode(self):
+        with open("Quality/example.fastq") as handle:
+            with self.assertRaises(StreamModeError):
+                next(QualityIO.FastqBatchIterator(handle))
+
+    def test_errors(self):
+        tests = [
+            "Quality/error_diff_ids.fastq",
+            "Quality/error_long_qual.fastq",
+            "Quality/error_short_qual.fastq",
+            "Quality/error_double_seq.fastq",
+            "Quality/error_double_qual.fastq",
+            "Quality/error_tabs.fastq",
+            "Quality/error_spaces.fastq",
+            "Quality/error_trunc_in_title.fastq",
+            "Quality/error_trunc_in_qual.fastq",
+            "Quality/error_trunc_at_plus.fastq",
+            "Quality/error_qual_del.fastq",
+            "Quality/error_qual_space.fastq",
+            "Quality/error_qual_null.fastq",
+        ]
+        for filename in tests:
+            with self.assertRaises(ValueError, msg=filename):
+                list(QualityIO.FastqBatchIterator(filename))
+
+
+class TestQualityArrays(unittest.TestCase):
+    """Test storing the qualities as NumPy arrays."""
+
+    def test_fastq_phred(self):
+        filename = "Quality/sanger_full_range_original_sanger.fastq"
+        with open(filename) as handle:
+            expected = list(QualityIO.FastqPhredIterator(handle))
+        with open(filename) as handle:
+            records = list(QualityIO.FastqPhredIterator(handle, as_array=True))
+        self.assertEqual(len(records), len(expected))
+        for old, new in zip(expected, records):
+            qualities = new.letter_annotations["phred_quality"]
+            self.assertIsInstance(qualities, np.ndarray)
+            self.assertEqual(qualities.dtype, np.uint8)
+            self.assertEqual(
+                qualities.tolist(), old.letter_annotations["phred_quality"]
+            )
+            for fmt in ("fastq", "fastq-illumina", "fastq-solexa", "qual"):
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", BiopythonWarning)
+                    self.assertEqual(old.format(fmt), new.format(fmt), msg=fmt)
+
+    def test_fastq_solexa(self):
+        filename = "Quality/solexa_full_range_original_solexa.fastq"
+        with open(filename) as handle:
+            expected = list(QualityIO.FastqSolexaIterator(handle))
+        with open(filename) as handle:
+            records = list(QualityIO.FastqSolexaIterator(handle, as_array=True))
+        for old, new in zip(expected, records):
+            qualities = new.letter_annotations["solexa_quality"]
+            self.assertEqual(qualities.dtype, np.int8)
+            self.assertEqual(
+                qualities.tolist(), old.letter_annotations["solexa_quality"]
+            )
+            for fmt in ("fastq", "fastq-illumina", "fastq-solexa", "qual"):
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", BiopythonWarning)
+                    self.assertEqual(old.format(fmt), new.format(fmt), msg=fmt)
+
+    def test_qual(self):
+        with open("Quality/example.qual") as handle:
+            expected = list(QualityIO.QualPhredIterator(handle))
+        with open("Quality/example.qual") as handle:
+            records = list(QualityIO.QualPhredIterator(handle, as_array=True))
+        for old, new in zip(expected, records):
+            qualities = new.letter_annotations["phred_quality"]
+            self.assertEqual(qualities.dtype, np.uint8)
+            self.assertEqual(
+                qualities.tolist(), old.letter_annotations["phred_quality"]
+            )
+            self.assertEqual(old.format("qual"), new.format("qual"))
+
+    def test_record_methods(self):
+        with open("Quality/example.fastq") as handle:
+            first, second, third = QualityIO.FastqPhredIterator(handle, as_array=True)
+        qualities = third.letter_annotations["phred_quality"]
+        sub = third[5:15]
+        self.assertIsInstance(sub.letter_annotations["phred_quality"], np.ndarray)
+        self.assertEqual(
+            sub.letter_annotations["phred_quality"].tolist(), qualities[5:15].tolist()
+        )
+        rc = third.reverse_complement()
+        self.assertIsInstance(rc.letter_annotations["phred_quality"], np.ndarray)
+        self.assertEqual(
+            rc.letter_annotations["phred_quality"].tolist(), qualities.tolist()[::-1]
+        )
+        both = first + second
+        self.assertEqual(len(both.letter_annotations["phred_quality"]), 50)
+        self.assertEqual(
+            both.letter_annotations["phred_quality"].tolist(),
+            first.letter_annotations["phred_quality"].tolist()
+            + second.letter_annotations["phred_quality"].tolist(),
+        )
+        self.assertIs(QualityIO._get_phred_quality(third), qualities)
+
+
+class TestBulkFastqWriter(unittest.TestCase):
+    """Test writing FASTQ records in blocks."""
+
+    def write_one_by_one(self, records):
+        handle = StringIO()
+        writer = QualityIO.FastqPhredWriter(handle)
+        for record in records:
+            writer.write_record(record)
+        return handle.getvalue()
+
+    def compare(self, records):
+        expected = self.write_one_by_one(records)
+        for block_size in (1, 50, 1 << 22):
+            handle = StringIO()
+            writer = QualityIO.FastqPhredWriter(handle)
+            writer._block_size = block_size
+            self.assertEqual(writer.write_records(records), len(records))
+            self.assertEqual(handle.getvalue(), expected)
+
+    def test_files(self):
+        """Compare writing records from files in blocks and one by one."""
+        for filename, fmt in [
+            ("Quality/example.fastq", "fastq"),
+            ("Quality/tricky.fastq", "fastq"),
+            ("Quality/zero_length.fastq", "fastq"),
+            ("Quality/sanger_full_range_original_sanger.fastq", "fastq"),
+            ("Quality/solexa_faked.fastq", "fastq-solexa"),
+            ("Quality/illumina_full_range_original_illumina.fastq", "fastq-illumina"),
+        ]:
+            self.compare(list(SeqIO.parse(filename, fmt)))
+
+    def test_qualities(self):
+        """Compare writing unusual quality scores in blocks and one by one."""
+        records = [
+            SeqRecord(
+                Seq("ACGT"),
+                id="floats",
+                letter_annotations={"phred_quality": [0.2, 10.6, 30, 40.4]},
+            ),
+            SeqRecord(
+                Seq("ACG"),
+                id="array",
+                description="array of scores",
+                letter_annotations={"phred_quality": np.array([1, 20, 60])},
+            ),
+            SeqRecord(
+                Seq("ACG"),
+                id="tuple",
+                letter_annotations={"phred_quality": (1, 20, 60)},
+            ),
+            SeqRecord(
+                Seq("ACG"),
+                id="solexa",
+                letter_annotations={"solexa_quality": [-5, 20, 40]},
+            ),
+        ]
+        self.compare(records)
+
+    def test_truncation(self):
+        """Check high qualities are truncated with a warning."""
+        record = SeqRecord(
+            Seq("ACG"),
+            id="high",
+            description="",
+            letter_annotations={"phred_quality": [1, 94, 200]},
+        )
+        handle = StringIO()
+        with self.assertWarns(BiopythonWarning):
+            QualityIO.FastqPhredWriter(handle).write_records([record])
+        self.assertEqual(handle.getvalue(), "@high\nACG\n+\n\"~~\n")
+
+    def test_errors(self):
+        """Check errors are raised as when writing one by one."""
+        records = [
+            SeqRecord(Seq("ACG"), id="none"),
+            SeqRecord(
+                Seq("ACG"),
+                id="None",
+                letter_annotations={"phred_quality": [1, None, 2]},
+            ),
+            SeqRecord(
+                Seq(None, 3),
+                id="undefined",
+                letter_annotations={"phred_quality": [1, 2, 3]},
+            ),
+        ]
+        for record in records:
+            with self.assertRaises((ValueError, TypeError), msg=record.id) as cm:
+                QualityIO.FastqPhredWriter(StringIO()).write_record(record)
+            with self.assertRaises(type(cm.exception), msg=record.id):
+                QualityIO.FastqPhredWriter(StringIO()).write_records([record])
+
+    def test_batch(self):
+        """Write a FastqBatch and reads given as columns."""
+        filename = "Quality/tricky.fastq"
+        expected = self.write_one_by_one(list(SeqIO.parse(filename, "fastq")))
+        with open(filename, "rb") as handle:
+            (batch,) = QualityIO.FastqBatchIterator(handle)
+        handle = StringIO()
+        writer = QualityIO.FastqPhredWriter(handle)
+        self.assertEqual(writer.write_batch(batch[:2]), 2)
+        self.assertEqual(writer.write_batch(batch[2:]), len(batch) - 2)
+        self.assertEqual(writer.write_batch(batch[:0]), 0)
+        self.assertEqual(handle.getvalue(), expected)
+        titles, sequences, qualities = zip(
+            *(
+                (batch.title(i), batch.sequence(i), batch.quality(i))
+                for i in range(len(batch))
+            )
+        )
+        handle = StringIO()
+        writer = QualityIO.FastqPhredWriter(handle)
+        self.assertEqual(writer.write_columns(titles, sequences, qualities), len(batch))
+        self.assertEqual(handle.getvalue(), expected)
+        with self.assertRaises(ValueError):
+            writer.write_columns(["short"], [b"ACGT"], [[1, 2, 3]])
+        with self.assertRaises(ValueError):
+            writer.write_columns(["floats"], [b"ACG"], [[1.5, 2, 3]])
+
+
 class TestReferenceSffConversions(unittest.TestCase):
     def check(self, sff_name, sff_format, out_name, fmt):
         wanted = list(SeqIO.parse(out_name, fmt))
@@ -1,11 +1,16 @@
 """Tests for SeqIO TwoBitIO module."""
 
+import random
 import unittest
+import warnings
 
+from Bio import BiopythonWarning
 from Bio import SeqIO
+from Bio.Data.CodonTable import TranslationError
 from Bio.Seq import MutableSeq
 from Bio.Seq import Seq
 from Bio.Seq import UndefinedSequenceError
+from Bio.SeqIO import TwoBitIO
 from Bio.SeqRecord import SeqRecord
 
 
@@ -51,6 +56,28 @@ class Parsing(unittest.TestCase):
                         self.assertEqual(seq1[i:j], seq2[i:j])
                         self.assertEqual(repr(seq1[i:j]), repr(seq2[i:j]))
 
+    def test_mmap(self):
+        path = "TwoBit/sequence.bigendian.2bit"
+        with open(path, "rb") as stream:
+            records = list(SeqIO.parse(stream, "twobit"))
+            for record1, record2 in zip(self.records, records):
+                # The file is memory mapped
+                self.assertIsNotNone(record2.seq._data.mapping)
+                self.assertEqual(record1.seq, record2.seq)
+                self.assertEqual(record1.seq[3:-7], record2.seq[3:-7])
+                self.assertEqual(record1.seq.upper(), record2.seq.upper())
+        with self.assertRaisesRegex(ValueError, "file is closed"):
+            records[0].seq[10:20]
+        self.assertTrue(records[0].seq._data.mapping.closed)
+        with open(path, "rb") as stream:
+            with TwoBitIO.TwoBitIterator(stream) as records:
+                record = next(records)
+                mapping = record.seq._data.mapping
+                self.assertFalse(mapping.closed)
+            self.assertTrue(mapping.closed)
+            # The file is still open, so the sequence is read from it
+            self.assertEqual(record.seq, self.records[0].seq)
+
     def test_sequence_long(self):
         path = "TwoBit/sequence.long.2bit"
         with open(path, "rb") as stream:
@@ -521,6 +548,99 @@ class TestBaseClassMethods(unittest.TestCase):
         self.assertEqual(self.seq2_twobit.defined_ranges, ((0, len(self.seq2_twobit)),))
 
 
+class PackedSequences(unittest.TestCase):
+    """Test nucleotide sequences packed to two bits per base."""
+
+    def check(self, plain):
+        packed = TwoBitIO.pack(plain)
+        self.assertIsInstance(packed._data, TwoBitIO._PackedSequenceData)
+        self.assertEqual(packed, plain)
+        self.assertEqual(len(packed), len(plain))
+        n = len(plain)
+        for start, end in [(0, n), (1, n - 2), (5, 23), (n // 2, n), (7, 7)]:
+            for step in (1, -1, 2, -3, 5):
+                self.assertEqual(packed[start:end:step], plain[start:end:step])
+            self.assertEqual(packed[start:end][::-1], plain[start:end][::-1])
+            subsequence = packed[start:end]
+            expected = plain[start:end]
+            for method in ("complement", "reverse_complement", "upper", "lower"):
+                self.assertEqual(
+                    getattr(subsequence, method)(), getattr(expected, method)()
+                )
+            self.assertEqual(
+                subsequence.reverse_complement()[2:-1],
+                expected.reverse_complement()[2:-1],
+            )
+            for letter in "ACGTNacgtn":
+                self.assertEqual(subsequence.count(letter), expected.count(letter))
+                self.assertEqual(
+                    packed.count(letter, start, end), plain.count(letter, start, end)
+                )
+            self.assertEqual(subsequence.count("GC"), expected.count("GC"))
+        self.assertEqual(packed[-1], plain[-1])
+        self.assertEqual(packed[3], plain[3])
+        for frame in range(3):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", BiopythonWarning)
+                for table in (1, 2, "Vertebrate Mitochondrial"):
+                    self.assertEqual(
+                        packed[frame:].translate(table), plain[frame:].translate(table)
+                    )
+                    self.assertEqual(
+                        packed[frame:][::-1].translate(table, to_stop=True),
+                        plain[frame:][::-1].translate(table, to_stop=True),
+                    )
+                self.assertEqual(
+                    packed[frame:].translate(stop_symbol="@"),
+                    plain[frame:].translate(stop_symbol="@"),
+                )
+
+    def test_unambiguous(self):
+        rng = random.Random(1234)
+        self.check(Seq("".join(rng.choices("ACGT", k=1001))))
+
+    def test_masked(self):
+        rng = random.Random(5678)
+        sequence = "".join(
+            rng.choice(["ACGT", "acgt", "N", "n"])[rng.randrange(4) :] * rng.randint(1, 9)
+            for i in range(200)
+        )
+        self.check(Seq(sequence))
+
+    def test_ambiguous(self):
+        rng = random.Random(91011)
+        sequence = "".join(
+            rng.choice(["ACGTACGTACGT", "acgt", "NNNN", "RYKM", "nnwsb"])
+            for i in range(200)
+        )
+        self.check(Seq(sequence))
+
+    def test_translate_errors(self):
+        packed = TwoBitIO.pack("ATGAAA?CCTAG")
+        with self.assertRaisesRegex(TranslationError, "Codon '[?]CC' is invalid"):
+            packed.translate()
+        self.assertEqual(TwoBitIO.pack("ATGTAA?CCTAG").translate(to_stop=True), "M")
+        self.assertEqual(TwoBitIO.pack("ATGAAACCCTAG").translate(cds=True), "MKP")
+        with self.assertWarns(BiopythonWarning):
+            self.assertEqual(TwoBitIO.pack("ATGAAACC").translate(), "MK")
+
+    def test_twobit(self):
+        path = "TwoBit/sequence.bigendian.2bit"
+        with open(path, "rb") as stream:
+            records = list(TwoBitIO.TwoBitIterator(stream, packed=True))
+        expected = SeqIO.parse("TwoBit/sequence.fa", "fasta")
+        for record1, record2 in zip(expected, records):
+            self.assertIsInstance(record2.seq._data, TwoBitIO._PackedSequenceData)
+            self.assertEqual(record1.id, record2.id)
+            self.check(record1.seq)
+            self.assertEqual(record1.seq, record2.seq)
+            self.assertEqual(record1.seq[5:-5], record2.seq[5:-5])
+            self.assertEqual(
+                record1.seq.reverse_complement(), record2.seq.reverse_complement()
+            )
+            self.assertEqual(record1.seq.count("A"), record2.seq.count("A"))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
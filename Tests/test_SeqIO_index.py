@@ -23,8 +23,10 @@ from pathlib import Path
 from seq_tests_common import SeqRecordTestBaseClass
 from test_SeqIO import SeqIOTestBaseClass
 
+from Bio import bgzf
 from Bio import BiopythonParserWarning
 from Bio import SeqIO
+from Bio.SeqIO import FastaIO
 from Bio.SeqIO._index import _FormatToRandomAccess
 from Bio.SeqRecord import SeqRecord
 
@@ -764,6 +766,91 @@ class IndexDictTests(SeqRecordTestBaseClass, SeqIOTestBaseClass):
                 self.get_raw_check(Path(filename2), fmt, comp)
 
 
+class IndexBgzfFasta(unittest.TestCase):
+    """Check fetching subsequences from an indexed BGZF compressed FASTA file."""
+
+    def setUp(self):
+        self.records = list(SeqIO.parse("GenBank/NC_000932.faa", "fasta"))
+        self.records.append(SeqIO.read("GenBank/NC_000932.gb", "genbank"))
+        # One record with ragged lines, which has to be parsed
+        self.records.append(SeqRecord(self.records[0].seq, id="ragged"))
+        h, self.filename = tempfile.mkstemp(suffix=".fasta.bgz")
+        os.close(h)
+        with bgzf.open(self.filename, "wt") as handle:
+            SeqIO.write(self.records[:-1], handle, "fasta")
+            handle.write(">ragged\n")
+            seq = str(self.records[-1].seq)
+            handle.write(seq[:10] + "\n" + seq[10:] + "\n")
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_subsequences(self):
+        """Check subsequences match the full parsed records."""
+        with gzip.open(self.filename, "rt") as handle:
+            records = list(SeqIO.parse(handle, "fasta"))
+        index = SeqIO.index(self.filename, "fasta")
+        self.assertEqual(len(index), len(records))
+        for old in records:
+            new = index[old.id]
+            self.assertEqual(new.id, old.id)
+            self.assertEqual(new.description, old.description)
+            self.assertEqual(len(new), len(old))
+            self.assertEqual(new.seq[5:15], old.seq[5:15])
+            self.assertEqual(new.seq[-20:], old.seq[-20:])
+            self.assertEqual(new.seq[1:100:7], old.seq[1:100:7])
+            self.assertEqual(new.seq, old.seq)
+        record = index["NC_000932.1"]
+        index.close()
+        # The records do not depend on the file remaining open
+        self.assertEqual(record.seq, records[-2].seq)
+
+    def test_indexed_fasta(self):
+        """Check fetching regions with IndexedFasta instead."""
+        # Without the ragged record, which cannot be indexed by faidx
+        with bgzf.open(self.filename, "wt") as handle:
+            SeqIO.write(self.records[:-1], handle, "fasta")
+        with FastaIO.IndexedFasta(self.filename) as index:
+            self.assertEqual(len(index), len(self.records) - 1)
+            for old in self.records[:-1]:
+                new = index[old.id]
+                self.assertEqual(new.seq[5:15], old.seq[5:15])
+                self.assertEqual(new.seq[-20:], old.seq[-20:])
+            record = index["NC_000932.1"]
+            self.assertEqual(
+                record.seq[100000:100060], self.records[-2].seq[100000:100060]
+            )
+
+
+class IndexGzip(unittest.TestCase):
+    """Check indexing ordinary gzip compressed files."""
+
+    def check(self, filename, fmt):
+        with gzip.open(filename, "rb") as handle:
+            data = handle.read()
+        with gzip.open(filename, "rt") as handle:
+            records = list(SeqIO.parse(handle, fmt))
+        index = SeqIO.index(filename, fmt)
+        self.assertEqual(list(index), [record.id for record in records])
+        for record in records[::-1]:
+            self.assertIn(index.get_raw(record.id), data)
+            self.assertEqual(index[record.id].seq, record.seq)
+        index.close()
+        if sqlite3:
+            index = SeqIO.index_db(":memory:", [filename], fmt)
+            self.assertEqual(len(index), len(records))
+            self.assertEqual(index[records[-1].id].seq, records[-1].seq)
+            index.close()
+
+    def test_fastq(self):
+        """Check indexing a gzip compressed FASTQ file."""
+        self.check("Quality/example.fastq.gz", "fastq")
+
+    def test_fasta(self):
+        """Check indexing a gzip compressed FASTA file."""
+        self.check("Fasta/flowers.pro.gz", "fasta")
+
+
 class IndexOrderingSingleFile(unittest.TestCase):
     f = "GenBank/NC_000932.faa"
     ids = [r.id for r in SeqIO.parse(f, "fasta")]
@@ -798,6 +885,80 @@ if sqlite3:
             d = SeqIO.index_db(":memory:", files, "fasta")
             self.assertEqual(ids, list(d))
 
+    def gi_key(name):
+        """Extract the GI number from a FASTA identifier."""
+        return name.split("|")[1]
+
+    class IndexProcesses(unittest.TestCase):
+        """Check index_db using worker processes to scan the files."""
+
+        files = [
+            "GenBank/NC_000932.faa",
+            "GenBank/NC_005816.faa",
+            "Fasta/flowers.pro.gz",
+            "Fasta/aster.pro",
+        ]
+
+        def setUp(self):
+            self.directory = tempfile.mkdtemp()
+
+        def tearDown(self):
+            for name in os.listdir(self.directory):
+                os.remove(os.path.join(self.directory, name))
+            os.rmdir(self.directory)
+
+        def dump(self, index_filename):
+            con = sqlite3.dbapi2.connect(index_filename)
+            (journal_mode,) = con.execute("PRAGMA journal_mode;").fetchone()
+            self.assertEqual(journal_mode, "delete")
+            tables = [
+                con.execute(f"SELECT * FROM {table};").fetchall()
+                for table in ("meta_data", "file_data", "offset_data")
+            ]
+            con.close()
+            return tables
+
+        def test_processes(self):
+            """Check index_db gives the same database with processes."""
+            serial = os.path.join(self.directory, "serial.idx")
+            parallel = os.path.join(self.directory, "parallel.idx")
+            for index_filename, processes in ((serial, 1), (parallel, 3)):
+                d = SeqIO.index_db(
+                    index_filename,
+                    self.files,
+                    "fasta",
+                    key_function=gi_key,
+                    processes=processes,
+                )
+                self.assertEqual(len(d), 95 + 3 + 1)
+                self.assertEqual(d["45478717"].id, "gi|45478717|ref|NP_995572.1|")
+                d.close()
+            # No left over journal files
+            names = sorted(os.listdir(self.directory))
+            self.assertEqual(names, ["parallel.idx", "serial.idx"])
+            self.assertEqual(self.dump(serial), self.dump(parallel))
+            # Reloading is unaffected by the processes argument
+            d = SeqIO.index_db(parallel, processes=2)
+            self.assertEqual(len(d), 95 + 3 + 1)
+            d.close()
+
+        def test_duplicates(self):
+            """Check index_db with processes rejects duplicate keys."""
+            with self.assertRaisesRegex(ValueError, "Duplicate key"):
+                SeqIO.index_db(":memory:", self.files * 2, "fasta", processes=2)
+
+        def test_missing_file(self):
+            """Check index_db with processes raises errors from the workers."""
+            files = self.files[:2] + ["Fasta/missing.fasta"] + self.files[2:]
+            with self.assertRaises(FileNotFoundError):
+                SeqIO.index_db(":memory:", files, "fasta", processes=2)
+
+        def test_processes_ValueError(self):
+            """Check index_db rejects less than one process."""
+            msg = "^Use processes with a minimum of 1$"
+            with self.assertRaisesRegex(ValueError, msg):
+                SeqIO.index_db(":memory:", self.files, "fasta", processes=0)
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
@@ -0,0 +1,102 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for parsing sequence files in parallel with Bio.SeqIO.parse_parallel."""
+
+import unittest
+from io import BytesIO
+from io import StringIO
+
+from Bio import SeqIO
+from Bio.SeqIO._parallel import _blocks
+
+
+class ParallelTests(unittest.TestCase):
+    def compare(self, records, expected):
+        records = list(records)
+        self.assertEqual(len(records), len(expected))
+        for record, old in zip(records, expected):
+            self.assertEqual(record.id, old.id)
+            self.assertEqual(record.description, old.description)
+            self.assertEqual(record.seq, old.seq)
+            self.assertEqual(record.annotations, old.annotations)
+            self.assertEqual(
+                [(f.type, str(f.location), f.qualifiers) for f in record.features],
+                [(f.type, str(f.location), f.qualifiers) for f in old.features],
+            )
+
+    def check(self, filename, format):
+        expected = list(SeqIO.parse(filename, format))
+        for processes in (1, 2):
+            for block_size in (1, 100, 5000, 4194304):
+                records = SeqIO.parse_parallel(
+                    filename, format, processes=processes, block_size=block_size
+                )
+                self.compare(records, expected)
+
+    def test_genbank(self):
+        """Check parsing GenBank files."""
+        self.check("GenBank/cor6_6.gb", "genbank")
+        self.check("GenBank/NC_000932.gb", "gb")
+
+    def test_embl(self):
+        """Check parsing EMBL and IMGT files."""
+        self.check("EMBL/epo_prt_selection.embl", "embl")
+        self.check("EMBL/hla_3260_sample.imgt", "imgt")
+
+    def test_swiss(self):
+        """Check parsing a SwissProt file."""
+        self.check("SwissProt/multi_ex.txt", "swiss")
+
+    def test_compressed(self):
+        """Check parsing a BGZF compressed file."""
+        expected = list(SeqIO.parse("GenBank/cor6_6.gb", "genbank"))
+        records = SeqIO.parse_parallel(
+            "GenBank/cor6_6.gb.bgz", "genbank", processes=2, block_size=1000
+        )
+        self.compare(records, expected)
+
+    def test_handles(self):
+        """Check parsing handles in text and binary mode."""
+        expected = list(SeqIO.parse("SwissProt/multi_ex.txt", "swiss"))
+        with open("SwissProt/multi_ex.txt") as handle:
+            records = SeqIO.parse_parallel(handle, "swiss", block_size=1000)
+            self.compare(records, expected)
+        with open("SwissProt/multi_ex.txt", "rb") as handle:
+            records = SeqIO.parse_parallel(handle, "swiss", processes=2)
+            self.compare(records, expected)
+
+    def test_function(self):
+        """Check applying a function to each record."""
+        expected = [len(r) for r in SeqIO.parse("GenBank/cor6_6.gb", "genbank")]
+        for processes in (1, 2):
+            lengths = SeqIO.parse_parallel(
+                "GenBank/cor6_6.gb", "genbank", len, processes, block_size=100
+            )
+            self.assertEqual(list(lengths), expected)
+
+    def test_blocks(self):
+        """Check splitting the file at the // lines."""
+        data = "A\n//\nB\nB\n//\r\nC\n// \n"
+        blocks = ["A\n//\n", "B\nB\n//\r\n", "C\n// \n"]
+        self.assertEqual(list(_blocks(StringIO(data), 1)), blocks)
+        self.assertEqual(list(_blocks(StringIO(data), 100)), [data])
+        data = b"A\n//\nB\n"
+        self.assertEqual(list(_blocks(BytesIO(data), 3)), [b"A\n//\n", b"B\n"])
+        self.assertEqual(list(_blocks(BytesIO(b"A\n//\n\n"), 3)), [b"A\n//\n"])
+
+    def test_errors(self):
+        """Check the errors for invalid arguments."""
+        with self.assertRaisesRegex(ValueError, "not supported"):
+            SeqIO.parse_parallel("Fasta/f002", "fasta")
+        with self.assertRaisesRegex(ValueError, "minimum of 1"):
+            SeqIO.parse_parallel("GenBank/cor6_6.gb", "genbank", processes=0)
+        with self.assertRaises(ValueError):
+            SeqIO.parse_parallel("GenBank/cor6_6.gb", "genbank", block_size=0)
+        with self.assertRaises(TypeError):
+            SeqIO.parse_parallel("GenBank/cor6_6.gb", None)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -8,7 +8,9 @@ Initially this takes matched tests of GenBank and FASTA files from the NCBI
 and confirms they are consistent using our different parsers.
 """
 
+import random
 import unittest
+import warnings
 
 try:
     import numpy as np
@@ -20,10 +22,12 @@ from Bio.Seq import MutableSeq
 from Bio.Seq import Seq
 from Bio.SeqFeature import AfterPosition
 from Bio.SeqFeature import BeforePosition
+from Bio.SeqFeature import CompoundLocation
 from Bio.SeqFeature import ExactPosition
 from Bio.SeqFeature import OneOfPosition
 from Bio.SeqFeature import SeqFeature
 from Bio.SeqFeature import SimpleLocation
+from Bio.SeqFeature import UnknownPosition
 from Bio.SeqFeature import WithinPosition
 from Bio.SeqRecord import SeqRecord
 
@@ -625,6 +629,111 @@ class TestTranslation(unittest.TestCase):
         self.assertEqual(t.letter_annotations, {"aa": ["Met", "Val"]})
 
 
+class FeatureIndexTests(unittest.TestCase):
+    """Test finding the features overlapping a region."""
+
+    def setUp(self):
+        rng = random.Random(1234)
+        features = []
+        for i in range(300):
+            parts = []
+            for j in range(rng.choice((1, 1, 2, 3))):
+                start = rng.randrange(1000)
+                end = start + rng.randrange(60)
+                parts.append(SimpleLocation(start, end, rng.choice((1, -1, None))))
+            if len(parts) == 1:
+                location = parts[0]
+            else:
+                location = CompoundLocation(parts)
+            features.append(SeqFeature(location, type="misc_feature"))
+        features.append(SeqFeature(SimpleLocation(0, 1000, 1), type="source"))
+        self.record = SeqRecord(Seq("N" * 1000), id="test", features=features)
+
+    def overlapping(self, start, end, strand=None):
+        return [
+            feature
+            for feature in self.record.features
+            if any(
+                part.start < end
+                and part.end > start
+                and (strand is None or part.strand == strand)
+                for part in feature.location.parts
+            )
+        ]
+
+    def test_overlapping(self):
+        """Check features_overlapping against checking each feature."""
+        for start in range(-10, 1010, 7):
+            for end in (start, start + 1, start + 50, start + 500):
+                for strand in (None, 1, -1):
+                    self.assertEqual(
+                        self.record.features_overlapping(start, end, strand),
+                        self.overlapping(start, end, strand),
+                    )
+
+    def test_at(self):
+        """Check features_at against checking each feature."""
+        for position in range(-1, 1001):
+            self.assertEqual(
+                self.record.features_at(position),
+                self.overlapping(position, position + 1),
+            )
+        self.assertEqual(self.record.features_at(5, strand=-1), [])
+
+    def test_changes(self):
+        """Check the features are found again after changing them."""
+        record = self.record
+        self.assertEqual(len(record.features_at(0)), len(self.overlapping(0, 1)))
+        feature = SeqFeature(SimpleLocation(2000, 2010), type="gene")
+        record.features.append(feature)
+        self.assertEqual(record.features_at(2005), [feature])
+        # Replacing or reordering features in place needs a new list
+        record.features[-1] = SeqFeature(SimpleLocation(2001, 2005), type="gene")
+        record.features = record.features[:]
+        self.assertEqual(record.features_at(2005), [])
+        del record.features[-1]
+        record.features.reverse()
+        record.features = record.features[:]
+        self.assertEqual(record.features_at(100), self.overlapping(100, 101))
+        record.features = []
+        self.assertEqual(record.features_at(100), [])
+
+    def test_slicing(self):
+        """Check slicing sees features changed in place after queries."""
+        record = self.record
+        self.assertEqual(record.features_at(125), self.overlapping(125, 126))
+        record[100:200]
+        record[100:200]
+        record.features[6] = SeqFeature(SimpleLocation(120, 130), type="new")
+        self.assertIn("new", [f.type for f in record[100:200].features])
+        for start in range(0, 1000, 37):
+            for end in (start, start + 20, start + 200, 1000):
+                self.assertEqual(
+                    [str(f.location) for f in record[start:end].features],
+                    [
+                        str(f.location._shift(-start))
+                        for f in record.features
+                        if start <= f.location.start
+                        and f.location.end <= min(end, len(record))
+                    ],
+                )
+
+    def test_ignored(self):
+        """Check features on other sequences or unknown positions are ignored."""
+        features = [
+            SeqFeature(SimpleLocation(5, 10, ref="other")),
+            SeqFeature(SimpleLocation(UnknownPosition(), 10)),
+            SeqFeature(SimpleLocation(6, 8)),
+        ]
+        record = SeqRecord(Seq("ACGT" * 5), features=features)
+        self.assertEqual(record.features_overlapping(0, 20), features[2:])
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(len(record[4:12].features), 1)
+            self.assertEqual(len(record[4:12].features), 1)
+        self.assertEqual(len(caught), 2)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
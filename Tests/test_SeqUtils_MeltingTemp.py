@@ -0,0 +1,101 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for the batch melting temperatures in Bio.SeqUtils.MeltingTemp."""
+
+import random
+import unittest
+import warnings
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Install NumPy if you want to use Tm_NN_many."
+    ) from None
+
+from Bio import BiopythonWarning
+from Bio.Seq import Seq
+from Bio.SeqUtils import MeltingTemp as mt
+
+
+class TmNNManyTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(1234)
+        cls.primers = [
+            "".join(rng.choices("ACGT", k=rng.randint(2, 40))) for i in range(300)
+        ]
+        cls.primers += ["AA", "GC", "TTTTTTTTTT", "ATATATAT", "CG"]
+
+    def check(self, primers, **kwargs):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", BiopythonWarning)
+            tm, dh, ds = mt.Tm_NN_many(primers, **kwargs)
+            expected = [mt.Tm_NN(primer, **kwargs) for primer in primers]
+        self.assertIsInstance(tm, np.ndarray)
+        self.assertEqual(tm.tolist(), expected)
+        self.assertEqual(len(dh), len(primers))
+        self.assertEqual(len(ds), len(primers))
+
+    def test_tables(self):
+        """Check the same Tm as Tm_NN for all nearest neighbor tables."""
+        for table in (
+            mt.DNA_NN1,
+            mt.DNA_NN2,
+            mt.DNA_NN3,
+            mt.DNA_NN4,
+            mt.RNA_NN1,
+            mt.RNA_NN2,
+            mt.RNA_NN3,
+            mt.R_DNA_NN1,
+        ):
+            self.check(self.primers, nn_table=table)
+            self.check(self.primers, nn_table=table, selfcomp=True)
+
+    def test_salt_corrections(self):
+        """Check the same Tm as Tm_NN for all salt correction methods."""
+        for saltcorr in range(8):
+            self.check(self.primers, saltcorr=saltcorr)
+            self.check(
+                self.primers, saltcorr=saltcorr, Na=10, K=20, Tris=5, Mg=1.5, dNTPs=0.8
+            )
+        self.check(self.primers, dnac1=100, dnac2=5)
+
+    def test_sequences(self):
+        """Check the same Tm as Tm_NN for sequences needing clean up."""
+        primers = ["acgtTGCA", "ACG TU\nGCAT", "AICCG", "GGNNCCAA", "A", "AT"]
+        primers += [Seq("ACGTTGCA"), "AAAAAAAAAAAAAAAC", "CCCCCCCCCCCCCA"]
+        self.check(primers)
+        self.check(self.primers, check=False)
+        # Inosine pairs are taken from the internal mismatch table
+        self.check(["ACGTICGTA", "IACGT", "ACGTI"], imm_table=mt.DNA_IMM1)
+
+    def test_fallback(self):
+        """Check sequences with terminal mismatches use Tm_NN."""
+        tmm_table = {"AA/TT": (-5.0, -12.0), "init": (0, 0)}
+        self.check(self.primers[:50], tmm_table=tmm_table)
+        self.check(["TTACG", "ACGAA", "CACAC"], tmm_table={"TT/AA": (-5.0, -12.0)})
+
+    def test_errors(self):
+        """Check errors for unknown neighbors when strict."""
+        with self.assertRaises(ValueError):
+            mt.Tm_NN_many(["ACGT", "AIIA"], imm_table={})
+        tm, dh, ds = mt.Tm_NN_many([])
+        self.assertEqual(tm.tolist(), [])
+
+    def test_chem_correction(self):
+        """Check correcting an array of melting temperatures."""
+        tm, dh, ds = mt.Tm_NN_many(self.primers[:20])
+        for kwargs in ({"DMSO": 3}, {"fmd": 1.25}, {"fmd": 1.25, "fmdmethod": 2}):
+            corrected = mt.chem_correction(tm, GC=40, **kwargs)
+            expected = [mt.chem_correction(value, GC=40, **kwargs) for value in tm]
+            self.assertTrue(np.allclose(corrected, expected))
+        self.assertEqual(tm.tolist(), mt.Tm_NN_many(self.primers[:20])[0].tolist())
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -0,0 +1,180 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for the k-mer counting in Bio.SeqUtils.kmers."""
+
+import random
+import unittest
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Install NumPy if you want to use Bio.SeqUtils.kmers."
+    ) from None
+
+from Bio import SeqIO
+from Bio.Seq import MutableSeq
+from Bio.Seq import reverse_complement
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+from Bio.SeqUtils import kmers
+
+
+def count_kmers(sequences, k, canonical=False):
+    """Count k-mers the slow way, for comparison."""
+    counts = Counter()
+    for sequence in sequences:
+        sequence = str(sequence).upper().replace("U", "T")
+        for i in range(len(sequence) - k + 1):
+            kmer = sequence[i : i + k]
+            if set(kmer) <= set("ACGT"):
+                if canonical:
+                    kmer = min(kmer, reverse_complement(kmer))
+                counts[kmer] += 1
+    return counts
+
+
+class KmerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(1234)
+        cls.sequences = [
+            "".join(rng.choices("ACGTacgtuN", k=rng.randint(0, 200)))
+            for i in range(200)
+        ]
+
+    def test_encode(self):
+        """Check encoding and decoding k-mers."""
+        sequence = "".join(self.sequences)
+        for k in (1, 2, 3, 7, 8, 16, 31):
+            for canonical in (False, True):
+                positions, codes = kmers.encode(sequence, k, canonical)
+                self.assertEqual(len(positions), len(codes))
+                self.assertEqual(codes.dtype, np.uint64)
+                for position, code in zip(positions, codes):
+                    kmer = sequence[position : position + k].upper()
+                    kmer = kmer.replace("U", "T")
+                    if canonical:
+                        kmer = min(kmer, reverse_complement(kmer))
+                    self.assertEqual(kmers.decode(code, k), kmer)
+                expected = count_kmers([sequence], k)
+                self.assertEqual(len(positions), sum(expected.values()))
+        self.assertEqual(kmers.decode(4**31 - 1, 31), "T" * 31)
+        positions, codes = kmers.encode("ACG", 4)
+        self.assertEqual(len(positions), 0)
+        self.assertEqual(len(codes), 0)
+        for sequence in (Seq("GATTACA"), MutableSeq("GATTACA"), b"GATTACA"):
+            positions, codes = kmers.encode(sequence, 4)
+            self.assertEqual(codes.tolist(), [143, 60, 241, 196])
+        record = SeqRecord(Seq("GATTACA"))
+        positions, codes = kmers.encode(record, 4)
+        self.assertEqual(codes.tolist(), [143, 60, 241, 196])
+        with self.assertRaisesRegex(ValueError, "^k must be between 1 and 31"):
+            kmers.encode("ACGT", 32)
+        with self.assertRaisesRegex(ValueError, "^k must be between 1 and 31"):
+            kmers.encode("ACGT", 0)
+
+    def check_counter(self, counter, expected):
+        self.assertEqual(counter.total, sum(expected.values()))
+        self.assertEqual(len(counter), len(expected))
+        self.assertEqual(list(counter.items()), sorted(expected.items()))
+        most_common = sorted(expected.items(), key=lambda item: (-item[1], item[0]))
+        self.assertEqual(counter.most_common(), most_common)
+        self.assertEqual(counter.most_common(5), most_common[:5])
+        for kmer, count in list(expected.items())[:20]:
+            self.assertEqual(counter[kmer], count)
+        codes, counts = counter.sparse()
+        decoded = [kmers.decode(code, counter.k) for code in codes]
+        self.assertEqual(decoded, sorted(expected))
+        spectrum = np.bincount(list(expected.values()), minlength=1)
+        self.assertEqual(counter.spectrum().tolist(), spectrum.tolist())
+        if counter.k <= 8:
+            dense = counter.counts()
+            self.assertEqual(len(dense), 4**counter.k)
+            self.assertEqual(dense[codes.astype(np.intp)].tolist(), counts.tolist())
+            self.assertEqual(dense.sum(), counter.total)
+
+    def test_counter(self):
+        """Check counting k-mers in dense and sparse mode."""
+        for k in (1, 3, 5, 12):
+            for canonical in (False, True):
+                expected = count_kmers(self.sequences, k, canonical)
+                for dense in (True, False):
+                    if dense and k > 8:
+                        continue
+                    counter = kmers.KmerCounter(k, canonical, dense)
+                    counter.update(self.sequences)
+                    self.check_counter(counter, expected)
+
+    def test_streaming(self):
+        """Check accumulating counts in small batches."""
+        expected = count_kmers(self.sequences, 4, canonical=True)
+        counter = kmers.KmerCounter(4, canonical=True, dense=False)
+        counter._batch = 500
+        counter._pending_limit = 300
+        records = (SeqRecord(Seq(sequence)) for sequence in self.sequences)
+        counter.update(records)
+        self.check_counter(counter, expected)
+        # Adding more sequences after reading the counts
+        counter.update(self.sequences[0])
+        expected += count_kmers(self.sequences[:1], 4, canonical=True)
+        self.check_counter(counter, expected)
+
+    def test_fasta(self):
+        """Check counting k-mers in a FASTA file."""
+        records = list(SeqIO.parse("Fasta/f002", "fasta"))
+        counter = kmers.KmerCounter(6)
+        counter.update(SeqIO.parse("Fasta/f002", "fasta"))
+        sequences = [record.seq for record in records]
+        self.check_counter(counter, count_kmers(sequences, 6))
+        self.assertEqual(repr(counter), "KmerCounter(6, canonical=False, dense=True)")
+
+    def test_lookup(self):
+        """Check looking up counts of k-mers."""
+        counter = kmers.KmerCounter(3, canonical=True, dense=False)
+        counter.update("AAAGGG")
+        self.assertEqual(counter["AAA"], 1)
+        self.assertEqual(counter["TTT"], 1)
+        self.assertEqual(counter["CCC"], 1)
+        self.assertEqual(counter["ACG"], 0)
+        self.assertEqual(counter[Seq("aag")], 1)
+        for kmer in ("AA", "AAAA", "ANA"):
+            with self.assertRaisesRegex(ValueError, "^expected a k-mer of 3"):
+                counter[kmer]
+
+    def test_profile(self):
+        """Check windowed k-mer profiles."""
+        sequence = "".join(self.sequences)
+        for k, window, step in ((1, 100, None), (2, 50, 50), (3, 80, 20), (2, 30, 45)):
+            for canonical in (False, True):
+                profile = kmers.profile(sequence, k, window, step, canonical)
+                if step is None:
+                    step = window
+                starts = range(0, len(sequence) - window + 1, step)
+                self.assertEqual(profile.shape, (len(starts), 4**k))
+                for start, row in zip(starts, profile):
+                    expected = count_kmers(
+                        [sequence[start : start + window]], k, canonical
+                    )
+                    for kmer, count in expected.items():
+                        code = kmers.encode(kmer, k)[1][0]
+                        self.assertEqual(row[code], count)
+                    self.assertEqual(row.sum(), sum(expected.values()))
+        self.assertEqual(kmers.profile("ACGT", 2, 10).shape, (0, 16))
+        with self.assertRaisesRegex(ValueError, "^window must be at least k"):
+            kmers.profile(sequence, 5, 4)
+        with self.assertRaisesRegex(ValueError, "^step must be positive"):
+            kmers.profile(sequence, 2, 4, 0)
+        # 4**14 counts per window would need 2 GiB for one window
+        with self.assertRaisesRegex(ValueError, "^profile of 1 windows for k=14"):
+            kmers.profile(sequence, 14, 20, len(sequence))
+        self.assertEqual(kmers.profile(sequence[:60], 10, 20).shape, (3, 4**10))
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -0,0 +1,218 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for the MinHash sketches in Bio.SeqUtils.minhash."""
+
+import io
+import math
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Install NumPy if you want to use Bio.SeqUtils.minhash."
+    ) from None
+
+from Bio.Phylo.TreeConstruction import DistanceTreeConstructor
+from Bio.Seq import reverse_complement
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+from Bio.SeqUtils import minhash
+
+
+def kmer_set(sequence, k):
+    """Return the set of canonical k-mers, for comparison."""
+    kmers = set()
+    for i in range(len(sequence) - k + 1):
+        kmer = sequence[i : i + k]
+        if set(kmer) <= set("ACGT"):
+            kmers.add(min(kmer, reverse_complement(kmer)))
+    return kmers
+
+
+class SketchTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(1234)
+        genome = rng.choices("ACGT", k=50000)
+        cls.genomes = ["".join(genome)]
+        # Related genomes with increasing numbers of substitutions
+        for rate in (0.001, 0.01, 0.05, 0.2):
+            mutant = list(genome)
+            for i in range(len(mutant)):
+                if rng.random() < rate:
+                    mutant[i] = rng.choice("ACGT".replace(mutant[i], ""))
+            cls.genomes.append("".join(mutant))
+
+    def make_sketches(self, **kwargs):
+        sketches = []
+        for i, genome in enumerate(self.genomes):
+            sketch = minhash.Sketch(name=f"genome{i}", **kwargs)
+            sketch.update(genome)
+            sketches.append(sketch)
+        return sketches
+
+    def test_bottom_k(self):
+        """Check bottom-k sketches against the exact Jaccard index."""
+        sketches = self.make_sketches(k=15, size=2000)
+        exact = [kmer_set(genome, 15) for genome in self.genomes]
+        for sketch in sketches:
+            self.assertEqual(len(sketch), 2000)
+            self.assertTrue(np.all(np.diff(sketch.hashes) > 0))
+        for i in range(1, len(sketches)):
+            jaccard = len(exact[0] & exact[i]) / len(exact[0] | exact[i])
+            estimate = sketches[0].jaccard(sketches[i])
+            self.assertAlmostEqual(estimate, jaccard, delta=0.05)
+            self.assertEqual(
+                sketches[0].jaccard(sketches[i]), sketches[i].jaccard(sketches[0])
+            )
+        # Mash distance approximates the substitution rate
+        self.assertAlmostEqual(sketches[0].distance(sketches[2]), 0.01, delta=0.003)
+        self.assertAlmostEqual(sketches[0].distance(sketches[3]), 0.05, delta=0.01)
+        self.assertEqual(sketches[0].distance(sketches[0]), 0.0)
+        self.assertEqual(sketches[0].jaccard(sketches[0]), 1.0)
+
+    def test_scaled(self):
+        """Check FracMinHash sketches against the exact Jaccard index."""
+        sketches = self.make_sketches(k=21, scaled=20)
+        exact = [kmer_set(genome, 21) for genome in self.genomes]
+        self.assertAlmostEqual(len(sketches[0]), len(exact[0]) / 20, delta=150)
+        for i in range(1, len(sketches)):
+            jaccard = len(exact[0] & exact[i]) / len(exact[0] | exact[i])
+            estimate = sketches[0].jaccard(sketches[i])
+            self.assertAlmostEqual(estimate, jaccard, delta=0.05)
+        # A sketch of part of a genome is contained in the whole genome
+        part = minhash.Sketch(k=21, scaled=20)
+        part.update(self.genomes[0][10000:30000])
+        self.assertEqual(part.containment(sketches[0]), 1.0)
+        self.assertAlmostEqual(sketches[0].containment(part), 0.4, delta=0.05)
+
+    def test_scaled_one(self):
+        """Check a FracMinHash sketch with scaled=1 keeps every k-mer."""
+        sequence = self.genomes[0][:5000]
+        sketch = minhash.Sketch(k=21, scaled=1)
+        sketch.update(sequence)
+        self.assertEqual(len(sketch), len(kmer_set(sequence, 21)))
+        self.assertEqual(sketch.jaccard(sketch), 1.0)
+
+    def test_streaming(self):
+        """Check sketching records in several batches."""
+        for scaled in (None, 50):
+            kwargs = {"k": 11, "size": 500} if scaled is None else {"scaled": 50}
+            expected = minhash.Sketch(**kwargs)
+            expected.update(self.genomes[:3])
+            sketch = minhash.Sketch(**kwargs)
+            sketch._batch = 20000
+            sketch.update(SeqRecord(Seq(genome)) for genome in self.genomes[:3])
+            self.assertEqual(sketch.hashes.tolist(), expected.hashes.tolist())
+        # Both strands give the same sketch
+        forward = minhash.Sketch()
+        forward.update(self.genomes[0])
+        reverse = minhash.Sketch()
+        reverse.update(reverse_complement(self.genomes[0]))
+        self.assertEqual(forward.hashes.tolist(), reverse.hashes.tolist())
+        reverse = minhash.Sketch(canonical=False)
+        reverse.update(reverse_complement(self.genomes[0]))
+        self.assertNotEqual(forward.hashes.tolist(), reverse.hashes.tolist())
+
+    def test_matrices(self):
+        """Check the pairwise matrices agree with comparing pairs."""
+        for kwargs in ({"k": 13, "size": 300}, {"k": 13, "scaled": 100}):
+            sketches = self.make_sketches(**kwargs)
+            # sketches of short sequences, and an empty sketch
+            for sequence in (self.genomes[1][:2000], self.genomes[4][:500], "NNN"):
+                sketch = minhash.Sketch(name=f"short{len(sketches)}", **kwargs)
+                sketch.update(sequence)
+                sketches.append(sketch)
+            jaccard = minhash.jaccard_matrix(sketches)
+            containment = minhash.containment_matrix(sketches)
+            dm = minhash.distance_matrix(sketches)
+            self.assertEqual(dm.names, [sketch.name for sketch in sketches])
+            for i, sketch1 in enumerate(sketches):
+                for j, sketch2 in enumerate(sketches):
+                    self.assertAlmostEqual(jaccard[i, j], sketch1.jaccard(sketch2))
+                    self.assertAlmostEqual(
+                        containment[i, j], sketch1.containment(sketch2)
+                    )
+                    if i == j:
+                        self.assertEqual(dm[i, j], 0)
+                    else:
+                        self.assertAlmostEqual(dm[i, j], sketch1.distance(sketch2))
+            DistanceTreeConstructor().nj(dm)
+
+    def test_many(self):
+        """Check the pairwise matrices for many partly overlapping sketches."""
+        rng = random.Random(5678)
+        sketches = []
+        for i in range(100):
+            sketch = minhash.Sketch(k=9, size=100, name=str(i))
+            start = rng.randrange(40000)
+            sketch.update(self.genomes[i % 5][start : start + rng.randint(50, 5000)])
+            sketches.append(sketch)
+        jaccard = minhash.jaccard_matrix(sketches)
+        self.assertGreater(np.count_nonzero(jaccard), 200)
+        for i, sketch1 in enumerate(sketches):
+            for j, sketch2 in enumerate(sketches):
+                self.assertAlmostEqual(jaccard[i, j], sketch1.jaccard(sketch2))
+
+    def test_distance(self):
+        """Check the Mash distance formula."""
+        sketch1 = minhash.Sketch(k=11, size=100)
+        sketch1.update(self.genomes[0])
+        sketch2 = minhash.Sketch(k=11, size=100)
+        sketch2.update(self.genomes[3])
+        jaccard = sketch1.jaccard(sketch2)
+        self.assertAlmostEqual(
+            sketch1.distance(sketch2), -math.log(2 * jaccard / (1 + jaccard)) / 11
+        )
+        sketch2 = minhash.Sketch(k=11, size=100)
+        self.assertEqual(sketch1.distance(sketch2), 1.0)
+        self.assertEqual(sketch1.jaccard(sketch2), 0.0)
+
+    def test_save_load(self):
+        """Check saving and loading sketches."""
+        for kwargs in ({"k": 15, "size": 200}, {"scaled": 500, "canonical": False}):
+            sketches = self.make_sketches(**kwargs)
+            sketches[1].name = None
+            handle = io.BytesIO()
+            minhash.save(sketches, handle)
+            self.assertLess(len(handle.getvalue()), 10000 + 8 * sum(map(len, sketches)))
+            handle.seek(0)
+            loaded = minhash.load(handle)
+            self.assertEqual(len(loaded), len(sketches))
+            for sketch, copy in zip(sketches, loaded):
+                self.assertEqual(repr(sketch), repr(copy))
+                self.assertEqual(sketch.hashes.tolist(), copy.hashes.tolist())
+        handle = io.BytesIO()
+        minhash.save([], handle)
+        handle.seek(0)
+        self.assertEqual(minhash.load(handle), [])
+
+    def test_errors(self):
+        """Check errors for invalid arguments and incompatible sketches."""
+        with self.assertRaisesRegex(ValueError, "^size and scaled cannot both be"):
+            minhash.Sketch(size=100, scaled=100)
+        with self.assertRaisesRegex(ValueError, "^size must be positive"):
+            minhash.Sketch(size=0)
+        with self.assertRaisesRegex(ValueError, "^scaled must be positive"):
+            minhash.Sketch(scaled=0)
+        with self.assertRaisesRegex(ValueError, "^k must be between 1 and 31"):
+            minhash.Sketch(k=32)
+        sketch1 = minhash.Sketch(k=21)
+        sketch2 = minhash.Sketch(k=15)
+        with self.assertRaisesRegex(ValueError, "^sketches with different param"):
+            sketch1.jaccard(sketch2)
+        with self.assertRaisesRegex(ValueError, "^sketches with different param"):
+            minhash.distance_matrix([sketch1, sketch2])
+        self.assertEqual(
+            repr(sketch1), "Sketch(k=21, size=1000, seed=42, canonical=True, name=None)"
+        )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -0,0 +1,151 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for the open reading frame finder in Bio.SeqUtils.orfs."""
+
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Install NumPy if you want to use Bio.SeqUtils.orfs."
+    ) from None
+
+from Bio import SeqIO
+from Bio.Data import CodonTable
+from Bio.Seq import reverse_complement
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+from Bio.SeqUtils import orfs
+
+
+def find_orfs(sequence, table, min_length, require_start, partial, start_codons=None):
+    """Find the ORFs one codon at a time, for comparison."""
+    table = CodonTable.unambiguous_dna_by_id[table]
+    if start_codons is None:
+        start_codons = table.start_codons
+    results = set()
+    length = len(sequence)
+    for strand, strand_sequence in ((1, sequence), (-1, reverse_complement(sequence))):
+        strand_sequence = strand_sequence.upper().replace("U", "T")
+        for frame in range(3):
+            begin = None if require_start else frame
+            orf_ends = []
+            for i in range(frame, length - 2, 3):
+                codon = strand_sequence[i : i + 3]
+                if codon in table.stop_codons:
+                    if begin is not None and begin < i:
+                        orf_ends.append((begin, i + 3))
+                    begin = None if require_start else i + 3
+                elif require_start and begin is None and codon in start_codons:
+                    begin = i
+            last = frame + (length - frame) // 3 * 3
+            if partial and begin is not None and begin <= last - 3:
+                orf_ends.append((begin, last))
+            for start, end in orf_ends:
+                if end - start < min_length:
+                    continue
+                if strand == 1:
+                    results.add((start, end, strand))
+                else:
+                    results.add((length - end, length - start, strand))
+    return sorted(results)
+
+
+class OrfTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(1234)
+        # Few stop codons, so that there are some long ORFs
+        cls.sequences = [
+            "".join(rng.choices("ACGTACGTGCGCcn", k=rng.randint(0, 2000)))
+            for i in range(20)
+        ]
+
+    def check(self, result, expected):
+        self.assertEqual(
+            list(zip(result.starts.tolist(), result.ends.tolist(), result.strands)),
+            expected,
+        )
+
+    def test_find(self):
+        """Check the ORFs found against a codon by codon search."""
+        for sequence in self.sequences:
+            for table in (1, 11, 2, 4):
+                for min_length in (0, 30, 100):
+                    for require_start in (True, False):
+                        for partial in (False, True):
+                            result = orfs.find(
+                                sequence,
+                                table,
+                                min_length,
+                                require_start=require_start,
+                                partial=partial,
+                            )
+                            expected = find_orfs(
+                                sequence, table, min_length, require_start, partial
+                            )
+                            self.check(result, expected)
+
+    def test_options(self):
+        """Check the start codons, strand and table arguments."""
+        sequence = "".join(self.sequences)
+        result = orfs.find(sequence, 11, start_codons=["ATG"])
+        self.check(result, find_orfs(sequence, 11, 30, True, False, ["ATG"]))
+        self.assertLess(len(result), len(orfs.find(sequence, 11)))
+        for strand in (1, -1):
+            result = orfs.find(sequence, "Bacterial", strand=strand)
+            expected = find_orfs(sequence, 11, 30, True, False)
+            self.check(result, [orf for orf in expected if orf[2] == strand])
+        table = CodonTable.unambiguous_rna_by_id[2]
+        result = orfs.find(sequence.replace("T", "U"), table)
+        self.check(result, find_orfs(sequence, 2, 30, True, False))
+        self.assertEqual(len(orfs.find("ATG", min_length=0)), 0)
+        self.assertEqual(len(orfs.find("", partial=True)), 0)
+        with self.assertRaisesRegex(ValueError, "^strand should be"):
+            orfs.find(sequence, strand=0)
+
+    def test_features(self):
+        """Check the ORFs as SeqFeature objects."""
+        sequence = Seq("".join(self.sequences))
+        record = SeqRecord(sequence, id="test", description="example")
+        result = orfs.find(record, 11, min_length=60)
+        self.assertEqual(result.id, "test")
+        self.assertEqual(result.description, "example")
+        self.assertEqual(result.length, len(sequence))
+        self.assertEqual(
+            repr(result), "<ORFs for test with %i ORFs using table 11>" % len(result)
+        )
+        features = result.features()
+        self.assertEqual(len(features), len(result))
+        for feature, frame in zip(features, result.frames):
+            self.assertEqual(feature.type, "CDS")
+            protein = feature.translate(sequence, cds=False)
+            self.assertEqual(protein.find("*"), len(protein) - 1)
+            self.assertIn(
+                str(feature.extract(sequence)[:3]).upper(),
+                CodonTable.unambiguous_dna_by_id[11].start_codons,
+            )
+            if feature.location.strand == 1:
+                self.assertEqual(frame, feature.location.start % 3 + 1)
+            else:
+                self.assertEqual(-frame, (len(sequence) - feature.location.end) % 3 + 1)
+
+    def test_parse(self):
+        """Check finding the ORFs in each record of a file."""
+        records = list(SeqIO.parse("Fasta/f002", "fasta"))
+        results = list(orfs.parse("Fasta/f002", min_length=90))
+        self.assertEqual(len(results), len(records))
+        for result, record in zip(results, records):
+            self.assertEqual(result.id, record.id)
+            self.check(result, find_orfs(str(record.seq), 1, 90, True, False))
+        self.assertTrue(np.all(np.diff(results[0].starts) >= 0))
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
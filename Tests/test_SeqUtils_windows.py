@@ -0,0 +1,165 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for the sliding window composition in Bio.SeqUtils.windows."""
+
+import io
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Install NumPy if you want to use Bio.SeqUtils.windows."
+    ) from None
+
+from Bio import SeqIO
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+from Bio.SeqUtils import GC_skew
+from Bio.SeqUtils import windows
+
+
+class WindowTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(1234)
+        cls.sequences = [
+            "".join(rng.choices("ACGTacgtNNS", k=rng.randint(0, 3000)))
+            for i in range(10)
+        ]
+
+    def check_counts(self, counts, sequence, window, step, letters):
+        starts = list(range(0, len(sequence) - window + 1, step))
+        self.assertEqual(counts.starts.tolist(), starts)
+        self.assertEqual(counts.counts.shape, (len(starts), len(letters)))
+        self.assertEqual(counts.length, len(sequence))
+        for start, row in zip(starts, counts.counts):
+            part = sequence[start : start + window].upper()
+            self.assertEqual(row.tolist(), [part.count(letter) for letter in letters])
+
+    def test_count(self):
+        """Check counting letters in windows of a sequence."""
+        sequence = "".join(self.sequences)
+        for window, step in ((1, None), (100, None), (100, 30), (37, 100), (64, 1)):
+            counts = windows.count(sequence, window, step)
+            self.check_counts(counts, sequence, window, step or window, "ACGTN")
+            counts = windows.count(Seq(sequence), window, step, letters="gcS")
+            self.check_counts(counts, sequence, window, step or window, "GCS")
+        counts = windows.count("ACGT", 10)
+        self.assertEqual(len(counts), 0)
+        self.assertEqual(counts.counts.shape, (0, 5))
+        self.assertEqual(counts.fraction("GC").tolist(), [])
+
+    def test_small_chunks(self):
+        """Check counting letters with the data split into small pieces."""
+        self.addCleanup(setattr, windows._WindowCounter, "chunk", 1 << 22)
+        sequence = "".join(self.sequences)
+        for chunk in (1, 7, 1000):
+            windows._WindowCounter.chunk = chunk
+            for window, step in ((90, 60), (100, 99), (37, 80)):
+                counts = windows.count(sequence, window, step)
+                self.check_counts(counts, sequence, window, step, "ACGTN")
+
+    def test_values(self):
+        """Check the fractions and skews calculated."""
+        sequence = self.sequences[0]
+        counts = windows.count(sequence, 200, 50)
+        for start, gc, fraction, skew in zip(
+            counts.starts,
+            counts.fraction("GC"),
+            counts.fraction("GC", of="ACGT"),
+            counts.skew(),
+        ):
+            part = sequence[start : start + 200].upper()
+            g = part.count("G")
+            c = part.count("C")
+            self.assertAlmostEqual(gc, (g + c) / 200)
+            total = sum(part.count(letter) for letter in "ACGT")
+            self.assertAlmostEqual(fraction, (g + c) / total)
+            self.assertAlmostEqual(skew, (g - c) / (g + c))
+        self.assertTrue(
+            np.allclose(counts.cumulative_skew(), np.cumsum(counts.skew()))
+        )
+        at_skew = counts.skew("A", "T")
+        a = counts.count("A")
+        t = counts.count("T")
+        self.assertTrue(np.allclose(at_skew, (a - t) / (a + t)))
+        # GC_skew gives the same values for complete windows
+        counts = windows.count(sequence, 100)
+        expected = GC_skew(sequence, 100)[: len(counts)]
+        self.assertTrue(np.allclose(counts.skew(), expected))
+        counts = windows.count("AAAATTTTNN", 5)
+        self.assertEqual(counts.skew().tolist(), [0.0, 0.0])
+        self.assertEqual(counts.fraction("GC", of="GC").tolist(), [0.0, 0.0])
+        with self.assertRaisesRegex(ValueError, "^letter 'U' was not counted"):
+            counts.count("U")
+
+    def test_record(self):
+        """Check the identifier of a SeqRecord is used."""
+        record = SeqRecord(Seq("ACGT" * 100), id="test", description="example")
+        counts = windows.count(record, 50, 25)
+        self.assertEqual(counts.id, "test")
+        self.assertEqual(counts.description, "example")
+        self.assertEqual(len(counts), 15)
+        self.assertEqual(
+            repr(counts),
+            "<WindowCounts for test with 15 windows of 50 (step 25) over 'ACGTN'>",
+        )
+
+    def test_parse(self):
+        """Check counting letters along each record in a FASTA file."""
+        self.addCleanup(setattr, windows._WindowCounter, "chunk", 1 << 22)
+        lines = ["Some text before the first record\n"]
+        for i, sequence in enumerate(self.sequences):
+            lines.append(f">seq{i} sequence number {i}\n")
+            width = 60 + i
+            for start in range(0, len(sequence), width):
+                lines.append(sequence[start : start + width] + "\n")
+        text = "".join(lines)
+        for chunk in (3, 100, 1 << 22):
+            windows._WindowCounter.chunk = chunk
+            for data in (text, text.replace("\n", "\r\n"), text.rstrip("\n")):
+                for handle in (io.StringIO(data), io.BytesIO(data.encode())):
+                    results = list(windows.parse(handle, 50, 20, letters="GCN"))
+                    self.assertEqual(len(results), len(self.sequences))
+                    for i, counts in enumerate(results):
+                        self.assertEqual(counts.id, f"seq{i}")
+                        description = f"seq{i} sequence number {i}"
+                        self.assertEqual(counts.description, description)
+                        sequence = self.sequences[i]
+                        self.check_counts(counts, sequence, 50, 20, "GCN")
+        # Empty records, and a record without a title line end
+        handle = io.StringIO(">a\n>b\nACGTACGT\n>c")
+        results = list(windows.parse(handle, 2))
+        self.assertEqual([counts.id for counts in results], ["a", "b", "c"])
+        self.assertEqual([counts.length for counts in results], [0, 8, 0])
+        self.assertEqual(results[1].count("GC").tolist(), [1, 1, 1, 1])
+
+    def test_fasta_file(self):
+        """Check parsing a FASTA file agrees with SeqIO."""
+        records = list(SeqIO.parse("Fasta/f002", "fasta"))
+        results = list(windows.parse("Fasta/f002", 40, 15))
+        self.assertEqual(len(results), len(records))
+        for counts, record in zip(results, records):
+            self.assertEqual(counts.id, record.id)
+            self.assertEqual(counts.description, record.description)
+            expected = windows.count(record, 40, 15)
+            self.assertEqual(counts.counts.tolist(), expected.counts.tolist())
+
+    def test_errors(self):
+        """Check errors for invalid arguments."""
+        with self.assertRaisesRegex(ValueError, "^window must be positive"):
+            windows.count("ACGT", 0)
+        with self.assertRaisesRegex(ValueError, "^step must be positive"):
+            windows.count("ACGT", 2, 0)
+        with self.assertRaisesRegex(ValueError, "^letters should not be repeated"):
+            windows.count("ACGT", 2, letters="GCg")
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
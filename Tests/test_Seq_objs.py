@@ -5,6 +5,9 @@
 """Unittests for the Seq objects."""
 
 import array
+import pickle
+import random
+import re
 import unittest
 import warnings
 
@@ -14,11 +17,14 @@ from Bio.Data.CodonTable import CodonTable
 from Bio.Data.CodonTable import TranslationError
 from Bio.Data.IUPACData import ambiguous_dna_values
 from Bio.Data.IUPACData import ambiguous_rna_values
+from Bio.Seq import _SequenceDataView
 from Bio.Seq import _UndefinedSequenceData
 from Bio.Seq import MutableSeq
 from Bio.Seq import Seq
+from Bio.Seq import SubstringSearcher
 from Bio.Seq import translate
 from Bio.Seq import UndefinedSequenceError
+from Bio.SeqIO import TwoBitIO
 from Bio.SeqRecord import SeqRecord
 
 try:
@@ -635,6 +641,126 @@ class StringMethodTests(unittest.TestCase):
         self.assertEqual(next(matches), (5, "CGT"))
         self.assertEqual(next(matches), (5, "CG"))
         self.assertRaises(StopIteration, next, matches)
+        # The last position should be included
+        self.assertEqual(list(s.search(["T", "GTA"])), [(2, "GTA"), (3, "T"), (7, "T")])
+        self.assertEqual(list(Seq("").search(["A"])), [])
+        with self.assertRaises(TypeError):
+            s.search([1])
+        with self.assertRaisesRegex(ValueError, r"subs\[1\]: empty substrings"):
+            s.search(["A", ""])
+
+    def test_search_searcher(self):
+        """Check reusing a SubstringSearcher for many sequences."""
+        searcher = SubstringSearcher(["CGT", Seq("CG"), b"ACGT", bytearray(b"GTA")])
+        self.assertEqual(
+            repr(searcher),
+            "SubstringSearcher(['CGT', 'CG', 'ACGT', 'GTA'], "
+            "reverse_complement=False, ambiguous=False)",
+        )
+        expected = [
+            (0, "ACGT"),
+            (1, "CGT"),
+            (1, "CG"),
+            (2, "GTA"),
+            (4, "ACGT"),
+            (5, "CGT"),
+            (5, "CG"),
+        ]
+        for sequence in (
+            Seq("ACGTACGT"),
+            MutableSeq("ACGTACGT"),
+            "ACGTACGT",
+            b"ACGTACGT",
+            bytearray(b"ACGTACGT"),
+        ):
+            self.assertEqual(list(searcher.search(sequence)), expected)
+            self.assertEqual(list(Seq(sequence).search(searcher)), expected)
+        self.assertEqual(list(searcher.search(Seq("acgtacgt"))), [])
+        searcher = pickle.loads(pickle.dumps(searcher))
+        self.assertEqual(list(searcher.search("ACGTACGT")), expected)
+
+    def check_search(self, sequence, subs, reverse_complement, ambiguous):
+        searcher = SubstringSearcher(subs, reverse_complement, ambiguous)
+        # Same order as the original Seq.search implementation
+        lengths = {}
+        for sub in subs:
+            lengths.setdefault(len(sub), len(lengths))
+        order = sorted(set(subs), key=lambda sub: (lengths[len(sub)], subs.index(sub)))
+        strands = (1, -1) if reverse_complement else (1,)
+        values = dict(ambiguous_dna_values) if ambiguous else {}
+        text = str(sequence)
+        expected = []
+        for start in range(len(text)):
+            for sub in order:
+                for strand in strands:
+                    if strand == 1:
+                        word = sub
+                    else:
+                        word = str(Seq(sub).reverse_complement())
+                    if len(text) - start < len(word):
+                        continue
+                    for letter1, letter2 in zip(word, text[start:]):
+                        if letter2 not in values.get(letter1, letter1):
+                            break
+                    else:
+                        if reverse_complement:
+                            expected.append((start, sub, strand))
+                        else:
+                            expected.append((start, sub))
+        self.assertEqual(list(searcher.search(sequence)), expected)
+
+    def test_search_random(self):
+        """Check searching against a simple implementation."""
+        rng = random.Random(1234)
+        for trial in range(60):
+            sequence = Seq("".join(rng.choices("ACGT", k=rng.randint(0, 500))))
+            letters = "ACGTRYN" if trial % 2 else "ACGT"
+            subs = [
+                "".join(rng.choices(letters, k=rng.randint(1, 8)))
+                for i in range(rng.randint(1, 40))
+            ]
+            self.check_search(sequence, subs, trial % 3 == 0, trial % 2 == 1)
+
+    def test_search_reverse_complement(self):
+        """Check searching both strands, and ambiguous RNA substrings."""
+        searcher = SubstringSearcher(["ACCG", "aN"], reverse_complement=True)
+        self.assertEqual(
+            list(searcher.search("TTCGGTACCGGaN")),
+            [(2, "ACCG", -1), (6, "ACCG", 1), (11, "aN", 1)],
+        )
+        searcher = SubstringSearcher(["ACCG", "an"], True, ambiguous=True)
+        self.assertEqual(
+            list(searcher.search("TTCGGTACCGGaNat")),
+            [(2, "ACCG", -1), (6, "ACCG", 1), (13, "an", 1), (13, "an", -1)],
+        )
+        searcher = SubstringSearcher(["UYG"], reverse_complement=True, ambiguous=True)
+        self.assertEqual(
+            list(searcher.search(Seq("AUGCGAUUG"))),
+            [(3, "UYG", -1), (6, "UYG", 1)],
+        )
+        with self.assertRaisesRegex(ValueError, "matches more than 100000 sequences"):
+            SubstringSearcher(["N" * 10], ambiguous=True)
+
+    def test_search_long(self):
+        """Check searching across the chunks of a long sequence."""
+        rng = random.Random(5678)
+        text = "".join(rng.choices("ACGT", k=3000000))
+        subs = ["ACGTACGTAC", "GGGGGGGG", "TATATATAT", "CATCATCAT"]
+        expected = []
+        for start in range(len(text) - 7):
+            for sub in subs:
+                if text.startswith(sub, start):
+                    expected.append((start, sub))
+        expected.sort(key=lambda match: (match[0], len(match[1]) != 10))
+        # Matches across the boundary of the first chunk
+        text = text[:1048570] + "ACGTACGTAC" + text[1048580:]
+        expected.append((1048570, "ACGTACGTAC"))
+        expected.sort(key=lambda match: match[0])
+        searcher = SubstringSearcher(subs)
+        self.assertEqual(list(searcher.search(Seq(text))), expected)
+        # Lazily loaded sequence data is searched in chunks
+        sequence = TwoBitIO.pack(text)
+        self.assertEqual(list(searcher.search(sequence)), expected)
 
     def test_MutableSeq_setitem(self):
         """Check setting sequence contents of a MutableSeq object."""
@@ -1781,6 +1907,48 @@ class PartialSequenceTests(unittest.TestCase):
             "Seq({0: 'PQRST', 8: 'HIJPQRST', 19: 'HIJPQRST', 30: 'HIJ'}, length=33)",
         )
 
+    def check_partial(self, seq, text):
+        # The undefined positions are shown as "?" in text
+        self.assertEqual(len(seq), len(text))
+        ranges = []
+        for start, end in seq.defined_ranges:
+            self.assertEqual(str(seq[start:end]), text[start:end])
+            ranges.append(range(start, end))
+        for match in re.finditer("[^?]+", text):
+            self.assertIn(range(*match.span()), ranges)
+
+    def test_many_segments(self):
+        """Check slicing and adding sequences with many defined segments."""
+        rng = random.Random(1234)
+        data = {}
+        text = ""
+        while len(data) < 2000:
+            text += "?" * rng.randint(1, 10)
+            data[len(text)] = "".join(rng.choices("ACGT", k=rng.randint(1, 10)))
+            text += data[len(text)]
+        text += "?" * 5
+        seq = Seq(data, length=len(text))
+        self.check_partial(seq, text)
+        for i in range(500):
+            start = rng.randint(-len(text) - 5, len(text) + 5)
+            end = rng.randint(-len(text) - 5, len(text) + 5)
+            step = rng.choice([None, 1, 2, 3, -1, -2, -7])
+            self.check_partial(seq[start:end:step], text[start:end:step])
+            index = rng.randrange(-len(text), len(text))
+            if text[index] == "?":
+                with self.assertRaises(UndefinedSequenceError):
+                    seq[index]
+            else:
+                self.assertEqual(seq[index], text[index])
+        self.check_partial(seq + seq, text + text)
+        self.check_partial(seq[3:] + seq, text[3:] + text)
+        self.check_partial(seq + "ACGT", text + "ACGT")
+        self.check_partial("ACGT" + seq, "ACGT" + text)
+        self.check_partial(seq[:-5] + "ACGT", text[:-5] + "ACGT")
+        self.check_partial("ACGT" + seq[1:], "ACGT" + text[1:])
+        self.check_partial(Seq(None, length=4) + seq, "????" + text)
+        self.check_partial(seq + Seq(None, length=4), text + "????")
+
     def test_lower_upper(self):
         u = Seq({3: "KLM", 11: "XYZ"}, length=17)
         l = Seq({0: "pqrst", 8: "hij"}, length=13)  # noqa: E741
@@ -1835,6 +2003,118 @@ class PartialSequenceTests(unittest.TestCase):
         self.assertEqual(repr(s), "Seq({3: 'acgt', 11: 'ACGT'}, length=20)")
 
 
+class SequenceViewTests(unittest.TestCase):
+    """Test long slices of Seq objects sharing the memory of the original."""
+
+    def setUp(self):
+        rng = random.Random(1234)
+        self.text = "".join(rng.choices("ACGTacgtN", k=20000))
+        self.seq = Seq(self.text)
+
+    def test_views(self):
+        seq = self.seq
+        view = seq[1000:15000]
+        self.assertIsInstance(view._data, _SequenceDataView)
+        self.assertIs(view._data._parent, seq._data)
+        # Short slices, and other steps, are copies
+        self.assertIsInstance(seq[1000:1100]._data, bytes)
+        self.assertIsInstance(seq[1000:15000:2]._data, bytes)
+        self.assertIs(seq[:]._data, seq._data)
+        self.assertIsInstance(MutableSeq(self.text)[1000:15000]._data, bytearray)
+        # Nested slices refer to the original
+        nested = view[500:-500]
+        self.assertIsInstance(nested._data, _SequenceDataView)
+        self.assertIs(nested._data._parent, seq._data)
+        self.assertEqual(nested, self.text[1500:14500])
+        for key in (
+            slice(None, 100),
+            slice(-100, None),
+            slice(5, 6000),
+            slice(None, None, -1),
+            slice(9000, 10, -3),
+            slice(20000, 30000),
+        ):
+            self.assertEqual(view[key], self.text[1000:15000][key])
+        for index in (0, 1, -1, -14000, 13999):
+            self.assertEqual(view[index], self.text[1000:15000][index])
+        for index in (14000, -14001):
+            with self.assertRaises(IndexError):
+                view[index]
+
+    def test_methods(self):
+        text = self.text[2000:17000]
+        view = self.seq[2000:17000]
+        self.assertIsInstance(view._data, _SequenceDataView)
+        self.assertEqual(len(view), len(text))
+        self.assertEqual(str(view), text)
+        self.assertEqual(bytes(view), text.encode())
+        self.assertEqual(hash(view), hash(Seq(text)))
+        self.assertEqual(view, Seq(text))
+        self.assertEqual(view, MutableSeq(text))
+        self.assertEqual(view, text)
+        self.assertLess(view, self.seq[2000:17001])
+        self.assertGreater(view, text[:-1])
+        self.assertEqual(repr(view), repr(Seq(text)))
+        self.assertEqual(view + view, text + text)
+        self.assertEqual(Seq("AC") + view, "AC" + text)
+        self.assertEqual(view.upper(), text.upper())
+        self.assertEqual(view.reverse_complement(), Seq(text).reverse_complement())
+        self.assertEqual(MutableSeq(view), text)
+        self.assertIn("ACGTA", view)
+        self.assertNotIn(self.text[1990:2010], view)
+        for sub in ("A", "ACG", "acg", "N", "", self.text[1995:2005]):
+            for start, end in (
+                (None, None),
+                (10, None),
+                (-20, None),
+                (None, -20),
+                (100, 50),
+                (-100000, 100000),
+                (14990, 100000),
+                (15001, None),
+                (15000, None),
+            ):
+                for method in ("count", "find", "rfind", "startswith", "endswith"):
+                    self.assertEqual(
+                        getattr(view, method)(sub, start, end),
+                        getattr(text, method)(sub, start, end),
+                        msg=f"{method}({sub!r}, {start}, {end})",
+                    )
+                for method in ("index", "rindex"):
+                    try:
+                        expected = getattr(text, method)(sub, start, end)
+                    except ValueError:
+                        with self.assertRaises(ValueError):
+                            getattr(view, method)(sub, start, end)
+                    else:
+                        result = getattr(view, method)(sub, start, end)
+                        self.assertEqual(result, expected)
+        self.assertEqual(view.count_overlap("AA"), Seq(text).count_overlap("AA"))
+        searcher = SubstringSearcher(["ACGT", "NN"])
+        self.assertEqual(
+            list(searcher.search(view)), list(searcher.search(Seq(text)))
+        )
+
+    def test_compact(self):
+        view = self.seq[3000:9000]
+        compact = view.compact()
+        self.assertIsInstance(compact._data, bytes)
+        self.assertEqual(compact, view)
+        self.assertIs(compact.compact(), compact)
+        self.assertIs(self.seq.compact(), self.seq)
+        # Pickling a view should not include the original sequence
+        data = pickle.dumps(view)
+        self.assertLess(len(data), 7000)
+        self.assertEqual(pickle.loads(data), view)
+        self.assertIsInstance(pickle.loads(data)._data, bytes)
+
+    def test_seqrecord(self):
+        record = SeqRecord(self.seq, id="test")
+        fragment = record[5000:12000][1000:6000]
+        self.assertIs(fragment.seq._data._parent, self.seq._data)
+        self.assertEqual(fragment.seq, self.text[6000:11000])
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -168,7 +168,7 @@ class BgzfTests(unittest.TestCase):
                 )
                 self.assertEqual(old, new)
 
-    def check_random(self, filename):
+    def check_random(self, filename, threads=1):
         """Check BGZF random access by reading blocks in forward & reverse order."""
         with gzip.open(filename, "rb") as h:
             old = h.read()
@@ -178,7 +178,7 @@ class BgzfTests(unittest.TestCase):
 
         # Forward, using explicit open/close
         new = b""
-        h = bgzf.BgzfReader(filename, "rb")
+        h = bgzf.BgzfReader(filename, "rb", threads=threads)
         self.assertTrue(h.seekable())
         self.assertFalse(h.isatty())
         self.assertEqual(h.fileno(), h._handle.fileno())
@@ -195,7 +195,7 @@ class BgzfTests(unittest.TestCase):
 
         # Reverse, using with statement
         new = b""
-        with bgzf.BgzfReader(filename, "rb") as h:
+        with bgzf.BgzfReader(filename, "rb", threads=threads) as h:
             for start, raw_len, data_start, data_len in blocks[::-1]:
                 h.seek(bgzf.make_virtual_offset(start, 0))
                 data = h.read(data_len)
@@ -207,7 +207,7 @@ class BgzfTests(unittest.TestCase):
 
         # Jump back - non-sequential seeking
         if len(blocks) >= 3:
-            h = bgzf.BgzfReader(filename, "rb", max_cache=1)
+            h = bgzf.BgzfReader(filename, "rb", max_cache=1, threads=threads)
             # Seek to a late block in the file,
             # half way into the third last block
             start, raw_len, data_start, data_len = blocks[-3]
@@ -240,7 +240,7 @@ class BgzfTests(unittest.TestCase):
                 real_offset = data_start + within_offset
                 v_offsets.append((voffset, real_offset))
         shuffle(v_offsets)
-        h = bgzf.BgzfReader(filename, "rb", max_cache=1)
+        h = bgzf.BgzfReader(filename, "rb", max_cache=1, threads=threads)
         for voffset, real_offset in v_offsets:
             h.seek(0)
             self.assertTrue(voffset >= 0 and real_offset >= 0)
@@ -263,6 +263,14 @@ class BgzfTests(unittest.TestCase):
         """Check random access to SamBam/ex1_header.bam."""
         self.check_random("SamBam/ex1_header.bam")
 
+    def test_random_bam_ex1_threads(self):
+        """Check random access to SamBam/ex1.bam using threads."""
+        self.check_random("SamBam/ex1.bam", threads=3)
+
+    def test_random_example_cor6_threads(self):
+        """Check random access to GenBank/cor6_6.gb.bgz using threads."""
+        self.check_random("GenBank/cor6_6.gb.bgz", threads=2)
+
     def test_random_wnts_xml(self):
         """Check random access to Blast/wnts.xml.bgz."""
         self.check_random("Blast/wnts.xml.bgz")
@@ -400,6 +408,34 @@ class BgzfTests(unittest.TestCase):
             self.assertEqual(offset1, h.tell())
             self.assertEqual(h.read(5), "Magic")
 
+    def test_write_threads(self):
+        """Check writing with threads gives the same file and offsets."""
+        with gzip.open("GenBank/NC_000932.gb.bgz", "rb") as h:
+            data = h.read()
+        chunks = [data[i : i + 25000] for i in range(0, len(data), 25000)]
+        outputs = []
+        for threads in (1, 3):
+            offsets = []
+            with bgzf.open(self.temp_file, "wb", threads=threads) as h:
+                for chunk in chunks:
+                    h.write(chunk)
+                    offsets.append(h.tell())
+                h.flush()
+                offsets.append(h.tell())
+                h.write(data)
+            with open(self.temp_file, "rb") as h:
+                outputs.append((offsets, h.read()))
+        self.assertEqual(outputs[0], outputs[1])
+        with bgzf.open(self.temp_file, "rb") as h:
+            for chunk, offset in zip(chunks[1:], offsets):
+                h.seek(offset)
+                self.assertEqual(h.read(len(chunk)), chunk)
+
+    def test_writer_threads_ValueError(self):
+        """Check get expected ValueError from a BgzfWriter with zero threads."""
+        with self.assertRaisesRegex(ValueError, "^Use threads with a minimum of 1$"):
+            bgzf.BgzfWriter(fileobj=io.BytesIO(), threads=0)
+
     def test_append_mode(self):
         with bgzf.open(self.temp_file, "wb") as h:
             h.write(b">hello\n")
@@ -475,6 +511,118 @@ class BgzfTests(unittest.TestCase):
             self.assertEqual(data[:4], b"\x01\x02\x03\x04")
             self.assertEqual(data[-5:], b"\x01\x02\x03\x04\n")
 
+    def test_many_blocks_threads(self):
+        """Check reading many small blocks using threads."""
+        with bgzf.open(self.temp_file, "wb") as h:
+            for i in range(1000):
+                h.write(b"%i\n" % i)
+                h.flush()
+
+        with bgzf.BgzfReader(self.temp_file, "rb") as h:
+            lines = list(h)
+            self.assertEqual(len(lines), 1000)
+            offset = h.tell()
+        for mode in ("r", "rb"):
+            with bgzf.BgzfReader(self.temp_file, mode, threads=4) as h:
+                new = list(h)
+                self.assertEqual(h.tell(), offset)
+                h.seek(0)
+                self.assertEqual(h.readline(), new[0])
+                # Seek forwards past the blocks read ahead
+                h.seek(offset)
+                self.assertEqual(h.read(1), new[0][:0])
+            if mode == "rb":
+                self.assertEqual(new, lines)
+            else:
+                self.assertEqual(new, [line.decode() for line in lines])
+
+    def test_cache_threads(self):
+        """Check the block cache is filled the same way using threads."""
+        with bgzf.open(self.temp_file, "wb") as h:
+            for i in range(100):
+                h.write(b"%i\n" % i)
+                h.flush()
+
+        caches = []
+        for threads in (1, 4):
+            with bgzf.BgzfReader(
+                self.temp_file, "rb", max_cache=5, threads=threads
+            ) as h:
+                lines = list(h)
+                self.assertEqual(len(lines), 100)
+                self.assertLessEqual(len(h._buffers), 5)
+                self.assertIn(h._block_start_offset, h._buffers)
+                # Going back to a cached block uses the cache
+                offset = next(iter(h._buffers))
+                data, size = h._buffers[offset]
+                h.seek(bgzf.make_virtual_offset(offset, 0))
+                self.assertEqual(h.read(len(data)), data)
+                caches.append(dict(h._buffers))
+        self.assertEqual(caches[0], caches[1])
+
+    def test_reader_threads_ValueError(self):
+        """Check get expected ValueError from a BgzfReader with zero threads."""
+        with self.assertRaisesRegex(ValueError, "^Use threads with a minimum of 1$"):
+            bgzf.BgzfReader("GenBank/cor6_6.gb.bgz", threads=0)
+
+    def test_gzi(self):
+        """Check building, writing and reading GZI indexes."""
+        for filename in ("SamBam/ex1.bam", "GenBank/NC_000932.gb.bgz"):
+            with open(filename, "rb") as handle:
+                blocks = list(bgzf.BgzfBlocks(handle))
+            index = bgzf.build_gzi(filename)
+            self.assertEqual(index, [(block[0], block[2]) for block in blocks])
+            bgzf.write_gzi(index, self.temp_file)
+            with open(self.temp_file, "rb") as handle:
+                data = handle.read()
+            self.assertEqual(len(data), 8 + 16 * (len(blocks) - 1))
+            self.assertEqual(bgzf.read_gzi(self.temp_file), index)
+        with open(self.temp_file, "wb") as handle:
+            handle.write(data[:-1])
+        with self.assertRaisesRegex(ValueError, "^GZI index should have"):
+            bgzf.read_gzi(self.temp_file)
+
+    def check_seek_uncompressed(self, filename, gzi=None):
+        with gzip.open(filename, "rb") as handle:
+            old = handle.read()
+        offsets = list(range(0, len(old), 9973)) + [len(old) - 1, len(old)]
+        shuffle(offsets)
+        for threads in (1, 2):
+            with bgzf.BgzfReader(filename, "rb", threads=threads) as handle:
+                if gzi is not None:
+                    handle.load_gzi(gzi)
+                for offset in offsets:
+                    voffset = handle.seek_uncompressed(offset)
+                    self.assertEqual(handle.tell(), voffset)
+                    self.assertEqual(handle.read(100), old[offset : offset + 100])
+                with self.assertRaisesRegex(ValueError, "^Offset .* beyond the end"):
+                    handle.seek_uncompressed(len(old) + 1)
+            with self.assertRaisesRegex(ValueError, "^seek of closed file$"):
+                handle.seek_uncompressed(0)
+
+    def test_seek_uncompressed(self):
+        """Check seek_uncompressed with and without an existing GZI file."""
+        self.check_seek_uncompressed("SamBam/ex1.bam")
+        self.check_seek_uncompressed("GenBank/NC_000932.gb.bgz")
+        self.check_seek_uncompressed(
+            "GenBank/NC_000932.gb.bgz", bgzf.build_gzi("GenBank/NC_000932.gb.bgz")
+        )
+        filename = self.temp_file + ".bgz"
+        with open("SamBam/ex1_refresh.bam", "rb") as old:
+            with open(filename, "wb") as new:
+                new.write(old.read())
+        try:
+            bgzf.write_gzi(bgzf.build_gzi(filename), filename + ".gzi")
+            self.check_seek_uncompressed(filename)
+            # Check the .gzi file is used rather than scanning the blocks
+            bgzf.write_gzi([(0, 0)], filename + ".gzi")
+            with bgzf.BgzfReader(filename) as handle:
+                with self.assertRaisesRegex(ValueError, "^Offset .* beyond the end"):
+                    handle.seek_uncompressed(65472)
+        finally:
+            os.remove(filename)
+            os.remove(filename + ".gzi")
+
     def test_BgzfBlocks_TypeError(self):
         """Check get expected TypeError from BgzfBlocks."""
         for mode in ("r", "rb"):
@@ -0,0 +1,158 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Test code for random access to gzip files via Bio.gzindex."""
+
+import gzip
+import io
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from Bio import gzindex
+
+
+class GzindexTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Semi-random FASTQ like data, which compresses into many blocks
+        rng = random.Random(1234)
+        lines = []
+        for i in range(12000):
+            seq = "".join(rng.choices("ACGT", k=rng.randint(40, 80)))
+            qual = "".join(rng.choices("ABCDEFGHI", k=len(seq)))
+            lines.append(f"@read{i}\n{seq}\n+\n{qual}\n")
+        cls.data = "".join(lines).encode()
+        cls.compressed = gzip.compress(cls.data)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "example.fastq.gz")
+        with open(self.filename, "wb") as handle:
+            handle.write(self.compressed)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check_random_access(self, handle, data):
+        rng = random.Random(5678)
+        offsets = [rng.randrange(len(data)) for i in range(100)]
+        offsets += [0, len(data) - 1, len(data)]
+        for offset in offsets:
+            self.assertEqual(handle.seek(offset), offset)
+            self.assertEqual(handle.tell(), offset)
+            self.assertEqual(handle.read(500), data[offset : offset + 500])
+        # Forward seeks, and reading a line
+        handle.seek(0)
+        for offset in sorted(offsets):
+            handle.seek(offset)
+            line = data[offset:].split(b"\n", 1)[0]
+            self.assertEqual(handle.readline().rstrip(b"\n"), line)
+        handle.seek(0)
+        self.assertEqual(handle.read(), data)
+        self.assertEqual(handle.seek(-10, io.SEEK_END), len(data) - 10)
+        self.assertEqual(handle.read(), data[-10:])
+
+    def test_build(self):
+        """Check building seek points."""
+        points = gzindex.build_seek_points(self.filename, spacing=100000)
+        self.assertGreater(len(points), 5)
+        self.assertEqual(points[0].uncompressed, 0)
+        self.assertEqual(points[0].window, b"")
+        self.assertEqual(points[-1].uncompressed, len(self.data))
+        self.assertEqual(points[-1].compressed, os.path.getsize(self.filename))
+        for before, after in zip(points[1:-1], points[2:-1]):
+            self.assertGreater(after.uncompressed, before.uncompressed)
+            self.assertGreaterEqual(after.uncompressed - before.uncompressed, 100000)
+            self.assertEqual(
+                after.window, self.data[after.uncompressed - 32768 : after.uncompressed]
+            )
+        with gzindex.open(self.filename, points=points) as handle:
+            self.check_random_access(handle, self.data)
+
+    def test_compression_levels(self):
+        """Check random access with different compression levels."""
+        for level in (1, 9):
+            with open(self.filename, "wb") as handle:
+                handle.write(gzip.compress(self.data, compresslevel=level))
+            points = gzindex.build_seek_points(self.filename, spacing=200000)
+            self.assertGreater(len(points), 5)
+            with gzindex.open(self.filename, points=points) as handle:
+                self.check_random_access(handle, self.data)
+
+    def test_members(self):
+        """Check random access with several gzip members and zero padding."""
+        with open(self.filename, "wb") as handle:
+            handle.write(gzip.compress(self.data[:600000], compresslevel=1))
+            handle.write(gzip.compress(b""))
+            handle.write(gzip.compress(self.data[600000:], compresslevel=1))
+            handle.write(b"\x00" * 10)
+        points = gzindex.build_seek_points(self.filename, spacing=100000)
+        starts = [point.uncompressed for point in points if not point.window]
+        self.assertEqual(starts, [0, 600000, 600000, len(self.data)])
+        with gzindex.open(self.filename, points=points) as handle:
+            self.check_random_access(handle, self.data)
+
+    def test_index_file(self):
+        """Check saving and loading the seek points."""
+        points = gzindex.build_seek_points(self.filename, spacing=100000)
+        index = self.filename + ".gzindex"
+        gzindex.write_seek_points(points, index)
+        self.assertEqual(gzindex.read_seek_points(index), points)
+        self.assertLess(os.path.getsize(index), 32768 * len(points))
+        # This should be used by default
+        with gzindex.open(self.filename) as handle:
+            self.assertEqual(handle.raw.points, points)
+            self.check_random_access(handle, self.data)
+        # But not if out of date
+        with open(self.filename, "ab") as handle:
+            handle.write(gzip.compress(b"extra"))
+        with self.assertRaisesRegex(ValueError, "index may be out of date"):
+            gzindex.open(self.filename)
+        with open(index, "wb") as handle:
+            handle.write(b"nonsense")
+        with self.assertRaisesRegex(ValueError, "^Not a gzip seek point index file$"):
+            gzindex.read_seek_points(index)
+
+    def test_confirm_seek_point(self):
+        """Check a candidate seek point needs the same output as the real data."""
+        expected = self.data[: gzindex._CHECK]
+        self.assertTrue(gzindex._confirmed(expected, expected, False, False))
+        # A short or empty output cannot confirm a candidate, even at the end
+        self.assertFalse(gzindex._confirmed(expected[:5], expected, False, True))
+        self.assertFalse(gzindex._confirmed(b"", expected, False, True))
+        self.assertFalse(gzindex._confirmed(b"", b"ACGT", True, True))
+        # Fewer bytes than checked, so both must agree on the end of the stream
+        self.assertTrue(gzindex._confirmed(b"ACGT", b"ACGT", True, True))
+        self.assertFalse(gzindex._confirmed(b"ACGT", b"ACGT", False, True))
+        self.assertFalse(gzindex._confirmed(b"ACGT", b"ACGT", True, False))
+
+    def test_errors(self):
+        """Check errors for invalid files and arguments."""
+        with self.assertRaisesRegex(ValueError, "spacing of at least"):
+            gzindex.build_seek_points(self.filename, spacing=1000)
+        with self.assertRaisesRegex(ValueError, "^Only binary read mode"):
+            gzindex.open(self.filename, "r")
+        with self.assertRaisesRegex(ValueError, "^Not a gzipped file"):
+            gzindex.build_seek_points("Quality/example.fastq")
+        with open(self.filename, "rb") as handle:
+            data = handle.read()
+        with open(self.filename, "wb") as handle:
+            handle.write(data[:-20])
+        with self.assertRaisesRegex(ValueError, "ended before the end-of-stream"):
+            gzindex.build_seek_points(self.filename)
+        with open(self.filename, "wb") as handle:
+            handle.write(data[:-8] + b"\x00\x00\x00\x00" + data[-4:])
+        with self.assertRaisesRegex(ValueError, "^CRC check failed"):
+            gzindex.build_seek_points(self.filename)
+        handle = gzindex.open("Quality/example.fastq.gz")
+        handle.close()
+        with self.assertRaises(ValueError):
+            handle.seek(0)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
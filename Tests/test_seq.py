@@ -5,6 +5,7 @@
 """Tests for seq module."""
 
 import copy
+import random
 import unittest
 import warnings
 
@@ -1242,6 +1243,79 @@ class TestStopCodons(unittest.TestCase):
         self.assertEqual(Seq.translate("nnn"), "X")
 
 
+class TestTranslateMany(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(1234)
+        letters = ["ACGT", "ACGT", "acgt", "ACGTN", "ACGU", "ACGTRYK"]
+        self.test_seqs = []
+        for i in range(100):
+            sequence = "".join(rng.choices(rng.choice(letters), k=rng.randint(0, 900)))
+            self.test_seqs.append(sequence[: len(sequence) - len(sequence) % 3])
+
+    def test_long_sequences(self):
+        """Check translating long sequences against single codons."""
+        for table in (1, 2, 11, "Vertebrate Mitochondrial"):
+            for sequence in self.test_seqs:
+                codons = [sequence[i : i + 3] for i in range(0, len(sequence), 3)]
+                expected = "".join(Seq.translate(codon, table) for codon in codons)
+                self.assertEqual(Seq.translate(sequence, table), expected)
+                self.assertEqual(
+                    Seq.translate(sequence, table, to_stop=True),
+                    expected.split("*")[0],
+                )
+                self.assertEqual(
+                    Seq.translate(sequence, table, stop_symbol="@"),
+                    expected.replace("*", "@"),
+                )
+        sequence = "ATG" * 100 + "---" + "TGA" + "AAA" * 100
+        self.assertEqual(
+            Seq.translate(sequence, gap="-"), "M" * 100 + "-" + "*" + "K" * 100
+        )
+        with self.assertRaisesRegex(TranslationError, "Codon '---' is invalid"):
+            Seq.translate(sequence)
+        with self.assertRaisesRegex(TranslationError, "Codon '---' is invalid"):
+            Seq.translate(sequence[::-1], gap="*")
+        self.assertEqual(
+            Seq.translate(sequence, to_stop=True, gap="-"), "M" * 100 + "-"
+        )
+        sequence = "ATG" + "CCC" * 200 + "TAA"
+        self.assertEqual(Seq.translate(sequence, cds=True), "M" + "P" * 200)
+        with self.assertRaisesRegex(TranslationError, "Extra in frame stop codon"):
+            Seq.translate(sequence[:300] + "TAG" + sequence[300:], cds=True)
+
+    def test_translate_many(self):
+        """Check translating many sequences at once."""
+        for table in (1, 2, 11):
+            for kwargs in ({}, {"to_stop": True}, {"stop_symbol": "@"}):
+                expected = [Seq.translate(s, table, **kwargs) for s in self.test_seqs]
+                self.assertEqual(
+                    Seq.translate_many(self.test_seqs, table, **kwargs), expected
+                )
+        sequences = [
+            Seq.Seq("ATGAAATAA"),
+            "GTGCCCTGA",
+            Seq.MutableSeq("ATGTAG"),
+            Seq.Seq(None, length=6),
+        ]
+        proteins = Seq.translate_many(sequences)
+        self.assertEqual(proteins[:3], ["MK*", "VP*", "M*"])
+        self.assertEqual(len(proteins[3]), 2)
+        self.assertEqual(
+            [type(protein) for protein in proteins], [Seq.Seq, str, Seq.Seq, Seq.Seq]
+        )
+        self.assertEqual(
+            Seq.translate_many(sequences[:3], table=11, cds=True), ["MK", "MP", "M"]
+        )
+        self.assertEqual(
+            Seq.translate_many(iter(sequences[:3]), to_stop=True), ["MK", "VP", "M"]
+        )
+        self.assertEqual(Seq.translate_many([]), [])
+        with self.assertRaisesRegex(TranslationError, "Codon 'CC[?]' is invalid"):
+            Seq.translate_many(["ATGAAA", "ATGCC?"])
+        with self.assertRaisesRegex(TranslationError, "is not a start codon"):
+            Seq.translate_many(["ATGAAATAA", "AAAAAATAA"], cds=True)
+
+
 class TestAttributes(unittest.TestCase):
     def test_seq(self):
         s = Seq.Seq("ACGT")
@@ -203,6 +203,7 @@ EXTENSIONS = [
     Extension("Bio.PDB.kdtrees", ["Bio/PDB/kdtrees.c"]),
     Extension("Bio.PDB._bcif_helper", ["Bio/PDB/bcifhelpermodule.c"]),
     Extension("Bio.SeqIO._twoBitIO", ["Bio/SeqIO/_twoBitIO.c"]),
+    Extension("Bio._seqsearch", ["Bio/_seqsearch.c"]),
 ]
 
 